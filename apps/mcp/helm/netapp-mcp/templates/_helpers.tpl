@@ -228,6 +228,21 @@ Generate environment variables for NetApp configuration
 {{- end }}
 {{- end }}
 
+{{/*
+Host headers the MCP endpoint accepts: the in-cluster service names, the
+ingress hosts and app.allowedHosts
+*/}}
+{{- define "netapp-mcp-server.allowedHosts" -}}
+{{- $service := printf "%s.%s" (include "netapp-mcp-server.fullname" .) .Release.Namespace }}
+{{- $hosts := list $service (printf "%s.svc" $service) (printf "%s.svc.cluster.local" $service) }}
+{{- if .Values.ingress.enabled }}
+{{- range .Values.ingress.hosts }}
+{{- $hosts = append $hosts .host }}
+{{- end }}
+{{- end }}
+{{- join "," (concat $hosts (.Values.app.allowedHosts | default list)) }}
+{{- end }}
+
 {{/*
 Generate standard application environment variables
 */}}
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark for the NetApp ActiveIQ MCP Server
+
+Replays what a new Knative pod goes through: process start until the port
+listens, until /readyz answers 200, and until a fresh session gets its first
+tool response. Every run starts a new server process against a local ActiveIQ
+stand-in whose first request per connection costs --connect-ms, like the TLS
+handshake and login of a real Unified Manager.
+
+    python cold_start_benchmark.py --runs 5 --connect-ms 300 --latency-ms 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import urllib.error
+import urllib.request
+
+from mcp import ClientSession
+
+try:
+    from netapp_mcp_server.load_test import ActiveIQStandIn, connect, free_port, start_mcp_server, wait_for_port
+except ImportError:
+    from load_test import ActiveIQStandIn, connect, free_port, start_mcp_server, wait_for_port
+
+PHASES = ("listening", "ready", "first_call", "first_response")
+
+def wait_for_ready(port: int, process, timeout: float = 60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"MCP server exited with status {process.returncode}")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/readyz", timeout=1):
+                return
+        except (urllib.error.URLError, OSError):
+            time.sleep(0.02)
+    raise RuntimeError("MCP server did not become ready")
+
+async def first_tool_call(url: str, tool: str) -> float:
+    async with connect(url) as (read_stream, write_stream, _):
+        async with ClientSession(read_stream, write_stream) as session:
+            await session.initialize()
+            started = time.perf_counter()
+            result = await session.call_tool(tool, {})
+            if result.isError:
+                raise RuntimeError(result.content[0].text if result.content else "tool error")
+            return time.perf_counter() - started
+
+def run_once(args: argparse.Namespace, upstream_port: int, warm_up: bool) -> dict:
+    port = free_port()
+    started = time.perf_counter()
+    process = start_mcp_server(port, upstream_port, args, "--warm-up" if warm_up else "--no-warm-up")
+    try:
+        wait_for_port(port, process)
+        listening = time.perf_counter() - started
+        wait_for_ready(port, process)
+        ready = time.perf_counter() - started
+        first_call = asyncio.run(first_tool_call(f"http://127.0.0.1:{port}/mcp", args.tool))
+        first_response = time.perf_counter() - started
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+    return {"listening": listening, "ready": ready, "first_call": first_call, "first_response": first_response}
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure MCP server time-to-first-tool-response")
+    parser.add_argument("--runs", type=int, default=5, help="Server starts per mode (default: 5)")
+    parser.add_argument("--tool", default="get_clusters", help="First tool to call (default: get_clusters)")
+    parser.add_argument("--connect-ms", type=float, default=300, help="Stand-in cost of a new connection")
+    parser.add_argument("--latency-ms", type=float, default=50, help="Stand-in API latency per request")
+    parser.add_argument("--stateless", action="store_true", help="Run the server stateless with JSON responses")
+    args = parser.parse_args()
+    # Settings start_mcp_server() reads from the load test options
+    args.upstream_concurrency, args.max_concurrent_requests = 16, 100
+
+    stand_in = ActiveIQStandIn(100, args.latency_ms / 1000, args.connect_ms / 1000)
+    upstream_port = free_port()
+    upstream = stand_in.serve(upstream_port)
+    results = {}
+    try:
+        for mode, warm_up in (("warm-up", True), ("no warm-up", False)):
+            results[mode] = [run_once(args, upstream_port, warm_up) for _ in range(args.runs)]
+    finally:
+        upstream.should_exit = True
+
+    print(f"Median of {args.runs} cold starts, ms (connect {args.connect_ms:g}, latency {args.latency_ms:g}):")
+    print(f"{'mode':<12}" + "".join(f"{phase:>16}" for phase in PHASES))
+    for mode, runs in results.items():
+        print(f"{mode:<12}" + "".join(f"{statistics.median(r[phase] for r in runs) * 1000:>16.1f}" for phase in PHASES))
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Load test for the NetApp ActiveIQ MCP Server HTTP transport
+
+Starts a local ActiveIQ stand-in, runs start_mcp_server.py against it on the
+streamable HTTP transport and drives many concurrent MCP sessions. Reports
+tool-call latency, throughput and how many upstream connections the shared
+pool opened for all sessions.
+
+    python load_test.py --sessions 100 --calls 5 --latency-ms 50
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import uvicorn
+from mcp import ClientSession
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+try:
+    from mcp.client.streamable_http import streamable_http_client as connect
+except ImportError:
+    from mcp.client.streamable_http import streamablehttp_client as connect
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+class ActiveIQStandIn:
+    """Minimal Unified Manager API: paged list endpoints with a fixed latency.
+
+    connect_latency is added to the first request of every connection, as
+    the TLS handshake and login of a real instance would be.
+    """
+
+    def __init__(self, records: int, latency: float, connect_latency: float = 0):
+        self.latency = latency
+        self.connect_latency = connect_latency
+        self.records = [
+            {
+                "key": f"key-{i}",
+                "name": f"vol{i}",
+                "cluster": {"name": f"cluster{i % 4}"},
+                "svm": {"name": f"svm{i % 16}"},
+                "state": "online",
+                "space": {"size": (i % 100 + 1) * 1024 ** 3, "used": (i % 97) * 1024 ** 3},
+            }
+            for i in range(records)
+        ]
+        self.requests = 0
+        self.connections = set()
+        self.app = Starlette(routes=[Route("/api/{path:path}", self.handle)])
+
+    async def handle(self, request: Request) -> JSONResponse:
+        self.requests += 1
+        client = request.scope.get("client")
+        if client not in self.connections:
+            self.connections.add(client)
+            await asyncio.sleep(self.connect_latency)
+        await asyncio.sleep(self.latency)
+        offset = int(request.query_params.get("offset", 0))
+        page = self.records[offset:offset + int(request.query_params.get("max_records", 20))]
+        return JSONResponse({"records": page, "num_records": len(page), "total_records": len(self.records)})
+
+    def serve(self, port: int) -> uvicorn.Server:
+        server = uvicorn.Server(uvicorn.Config(self.app, host="127.0.0.1", port=port, log_level="warning"))
+        threading.Thread(target=server.run, daemon=True).start()
+        while not server.started:
+            time.sleep(0.05)
+        return server
+
+def start_mcp_server(port: int, upstream_port: int, args: argparse.Namespace, *options: str) -> subprocess.Popen:
+    env = dict(
+        os.environ,
+        NETAPP_BASE_URL=f"http://127.0.0.1:{upstream_port}/api",
+        NETAPP_USERNAME="loadtest",
+        NETAPP_PASSWORD="loadtest",
+        NETAPP_MAX_CONCURRENCY=str(args.upstream_concurrency),
+        LOG_LEVEL="WARNING",
+    )
+    command = [
+        sys.executable, str(Path(__file__).with_name("start_mcp_server.py")),
+        "--transport", "streamable-http", "--host", "127.0.0.1", "--port", str(port),
+        "--max-concurrent-requests", str(args.max_concurrent_requests),
+    ]
+    if args.stateless:
+        command += ["--stateless", "--json-response"]
+    return subprocess.Popen([*command, *options], env=env)
+
+def wait_for_port(port: int, process: subprocess.Popen, timeout: float = 30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"MCP server exited with status {process.returncode}")
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.02)
+    raise RuntimeError("MCP server did not start listening")
+
+async def run_session(url: str, args: argparse.Namespace, latencies: list, errors: list):
+    try:
+        async with connect(url) as (read_stream, write_stream, _):
+            async with ClientSession(read_stream, write_stream) as session:
+                await session.initialize()
+                for _ in range(args.calls):
+                    started = time.perf_counter()
+                    result = await session.call_tool(args.tool, {"max_records": args.max_records})
+                    latencies.append(time.perf_counter() - started)
+                    if result.isError:
+                        errors.append(result.content[0].text if result.content else "tool error")
+    except Exception as e:
+        errors.append(f"{type(e).__name__}: {e}")
+
+def percentile(values: list, p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+
+async def drive(url: str, args: argparse.Namespace) -> dict:
+    latencies, errors = [], []
+    started = time.perf_counter()
+    await asyncio.gather(*(run_session(url, args, latencies, errors) for _ in range(args.sessions)))
+    elapsed = time.perf_counter() - started
+    return {"latencies": latencies, "errors": errors, "elapsed": elapsed}
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the MCP server HTTP transport")
+    parser.add_argument("--sessions", type=int, default=100, help="Concurrent MCP sessions (default: 100)")
+    parser.add_argument("--calls", type=int, default=5, help="Tool calls per session (default: 5)")
+    parser.add_argument("--tool", default="get_volumes", help="Tool to call (default: get_volumes)")
+    parser.add_argument("--max-records", type=int, default=20, help="max_records argument of the tool")
+    parser.add_argument("--latency-ms", type=float, default=50, help="Stand-in API latency per request")
+    parser.add_argument("--records", type=int, default=1000, help="Records served by the stand-in")
+    parser.add_argument("--max-concurrent-requests", type=int, default=100, help="Server concurrency limit")
+    parser.add_argument("--upstream-concurrency", type=int, default=16, help="NETAPP_MAX_CONCURRENCY of the server")
+    parser.add_argument("--stateless", action="store_true", help="Run the server stateless with JSON responses")
+    args = parser.parse_args()
+
+    stand_in = ActiveIQStandIn(args.records, args.latency_ms / 1000)
+    upstream_port, port = free_port(), free_port()
+    upstream = stand_in.serve(upstream_port)
+    process = start_mcp_server(port, upstream_port, args)
+    try:
+        wait_for_port(port, process)
+        result = asyncio.run(drive(f"http://127.0.0.1:{port}/mcp", args))
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+        upstream.should_exit = True
+
+    latencies, errors = result["latencies"], result["errors"]
+    print(f"Sessions: {args.sessions}, calls: {len(latencies)}, errors: {len(errors)}")
+    if latencies:
+        print(f"Throughput: {len(latencies) / result['elapsed']:.1f} calls/s over {result['elapsed']:.2f}s")
+        print(
+            "Latency ms: "
+            f"p50 {statistics.median(latencies) * 1000:.1f}, "
+            f"p95 {percentile(latencies, 95) * 1000:.1f}, "
+            f"p99 {percentile(latencies, 99) * 1000:.1f}, "
+            f"max {max(latencies) * 1000:.1f}"
+        )
+    print(f"Upstream: {stand_in.requests} requests over {len(stand_in.connections)} connections")
+    for error in errors[:5]:
+        print(f"  error: {error}")
+    sys.exit(1 if errors else 0)
+
+if __name__ == "__main__":
+    main()
@@ -14,18 +14,32 @@ Based on NetApp ActiveIQ Unified Manager API v2
 """
 
 import asyncio
+import codecs
+import email.utils
+import heapq
+import importlib.util
 import json
 import logging
+import math
 import os
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union
-from urllib.parse import urljoin, urlencode
+import random
+import time
+import weakref
+from collections import OrderedDict
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+from urllib.parse import urljoin
 
 import httpx
 from mcp.server.fastmcp import FastMCP
-from mcp.types import TextContent, Tool
+from mcp.server.lowlevel.server import request_ctx
 from pydantic import BaseModel, Field
 
+try:
+    import orjson  # Optional fast JSON backend ("fast-json" extra)
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -33,6 +47,16 @@ logger = logging.getLogger(__name__)
 # MCP Server initialization
 mcp = FastMCP("NetApp ActiveIQ MCP Server")
 
+def loads_json(data: Union[bytes, str]) -> Any:
+    """Decode JSON with orjson when available"""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def dumps_json(result: Any) -> str:
+    """Encode a tool result as indented JSON with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(result, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(result, indent=2)
+
 # Configuration models
 class NetAppConfig(BaseModel):
     """Configuration for NetApp ActiveIQ connection"""
@@ -41,6 +65,416 @@ class NetAppConfig(BaseModel):
     password: str = Field(..., description="Password for authentication")
     verify_ssl: bool = Field(default=True, description="Whether to verify SSL certificates")
     timeout: int = Field(default=30, description="Request timeout in seconds")
+    rate_limit: Optional[float] = Field(default=None, description="Maximum requests per second (unlimited if unset)")
+    max_concurrency: int = Field(default=16, description="Maximum concurrent requests to the API")
+    http_cache_entries: int = Field(default=256, description="GET responses kept for ETag revalidation (0 disables)")
+
+# Client-side rate limiting
+THROTTLE_STATUSES = (429, 503)
+THROTTLE_RETRIES = 5
+MAX_RETRY_AFTER = 120
+BACKOFF_BASE = 0.5
+MAX_BACKOFF = 30
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta seconds or HTTP date) into seconds"""
+    if not value or not value.strip():
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = email.utils.parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(0.0, seconds), MAX_RETRY_AFTER)
+
+class AdaptiveLimiter:
+    """Token bucket plus AIMD concurrency limit shared by all tool calls.
+
+    The number of requests in flight grows by about one per round trip
+    while the API answers normally and is halved on 429/503; Retry-After
+    pauses all new requests, and without one a capped exponential backoff
+    with jitter does. Mirrors netapp_cli.utils.ratelimit.
+    """
+
+    def __init__(self, rate_limit: Optional[float] = None, max_concurrency: int = 16):
+        self.rate_limit = rate_limit if rate_limit and rate_limit > 0 else None
+        self.max_concurrency = max(1, max_concurrency)
+        self.limit = float(self.max_concurrency)
+        self.in_flight = 0
+        self.epoch = 0
+        self.blocked_until = 0.0
+        self.backoffs = 0
+        self._burst = max(1.0, self.rate_limit or 1.0)
+        self._tokens = self._burst
+        self._refilled = time.monotonic()
+        self._cond = asyncio.Condition()
+
+    def _wait_time(self, now: float) -> float:
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if self.rate_limit:
+            self._tokens = min(self._burst, self._tokens + (now - self._refilled) * self.rate_limit)
+            self._refilled = now
+            if self._tokens < 1:
+                return (1 - self._tokens) / self.rate_limit
+        return 0.0
+
+    def backoff(self) -> float:
+        """Pause after a throttle without Retry-After; the cap doubles per throttled window"""
+        cap = min(MAX_BACKOFF, BACKOFF_BASE * 2 ** self.backoffs)
+        return cap / 2 + random.uniform(0, cap / 2)
+
+    async def acquire(self) -> int:
+        """Wait for a slot; return the epoch to pass to release()"""
+        async with self._cond:
+            while True:
+                delay = self._wait_time(time.monotonic())
+                if delay <= 0 and self.in_flight < int(self.limit):
+                    break
+                try:
+                    await asyncio.wait_for(self._cond.wait(), timeout=delay if delay > 0 else None)
+                except asyncio.TimeoutError:
+                    pass
+            self.in_flight += 1
+            if self.rate_limit:
+                self._tokens -= 1
+            return self.epoch
+
+    async def release(self, epoch: int, status_code: Optional[int], retry_after: Optional[float] = None):
+        """Release a slot and adapt the limit to the response status"""
+        async with self._cond:
+            self.in_flight -= 1
+            if status_code in THROTTLE_STATUSES:
+                self.blocked_until = max(self.blocked_until, time.monotonic() + (retry_after or self.backoff()))
+                # Decrease once per window, ignoring requests started before the last decrease
+                if epoch == self.epoch:
+                    self.limit = max(1.0, self.limit / 2)
+                    self.epoch += 1
+                    if not retry_after:
+                        self.backoffs += 1
+                    logger.warning(f"API throttled ({status_code}), concurrency limit now {int(self.limit)}")
+            elif status_code is not None and status_code < 500:
+                self.limit = min(float(self.max_concurrency), self.limit + 1 / self.limit)
+                self.backoffs = 0
+            self._cond.notify_all()
+
+def accept_encoding() -> str:
+    """Content codings httpx can decode here (br only with brotli installed)"""
+    codings = ["gzip", "deflate"]
+    if importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi"):
+        codings.insert(0, "br")
+    return ", ".join(codings)
+
+class ResponseCache:
+    """In-memory LRU of GET responses revalidated with ETag/Last-Modified.
+
+    A 304 answer is served from the stored body, so repeated tool calls
+    do not download unchanged payloads again.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]]) -> str:
+        return f"{url}?{json.dumps(params or {}, sort_keys=True, default=str)}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    @staticmethod
+    def is_fresh(entry: Dict[str, Any]) -> bool:
+        return entry["fresh_until"] > time.monotonic()
+
+    def store(self, key: str, response: httpx.Response, ttl: float = 0):
+        """Keep a response for revalidation; with a ttl it is served as is until then"""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if self.max_entries <= 0 or not (etag or last_modified or ttl > 0):
+            return
+        self._entries[key] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": response.content,
+            "fresh_until": time.monotonic() + ttl if ttl > 0 else 0.0
+        }
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    @staticmethod
+    def conditional_headers(entry: Dict[str, Any]) -> Dict[str, str]:
+        headers = {}
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+class RecordParser:
+    """Incremental parser for ``{"records": [...], ...}`` list responses.
+
+    feed() returns each record as soon as its bytes have arrived; other
+    top-level members end up in ``meta``. Mirrors netapp_cli.utils.jsonstream.
+    """
+
+    _decoder = json.JSONDecoder()
+
+    def __init__(self, key: str = "records"):
+        self.key = key
+        self.meta: Dict[str, Any] = {}
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = "start"
+        self._member = None
+        self._first = True
+        self._eof = False
+
+    def feed(self, chunk: bytes) -> List[Dict[str, Any]]:
+        self._buffer = self._buffer[self._pos:] + self._text.decode(chunk)
+        self._pos = 0
+        return self._parse()
+
+    def close(self) -> List[Dict[str, Any]]:
+        self._buffer = self._buffer[self._pos:] + self._text.decode(b"", final=True)
+        self._pos = 0
+        self._eof = True
+        records = self._parse()
+        if self._state != "end":
+            raise ValueError("Truncated JSON response")
+        return records
+
+    def _decode(self):
+        # A number cut by a chunk boundary still decodes ("12" of "12.5"), so
+        # a scalar only counts once a delimiter follows it or the body ended
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if self._eof:
+                raise
+            return False, None
+        if (
+            not self._eof
+            and not isinstance(value, (str, dict, list))
+            and (end == len(self._buffer) or self._buffer[end] not in " \t\n\r,]}")
+        ):
+            return False, None
+        self._pos = end
+        return True, value
+
+    def _expect(self, char: str):
+        if self._buffer[self._pos] != char:
+            raise ValueError(f"Expected {char!r} at offset {self._pos} of JSON response")
+        self._pos += 1
+
+    def _parse(self) -> List[Dict[str, Any]]:
+        records = []
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in " \t\n\r":
+                self._pos += 1
+            if self._pos >= len(self._buffer):
+                return records
+            char = self._buffer[self._pos]
+
+            if self._state == "start":
+                self._expect("{")
+                self._state = "key"
+            elif self._state in ("key", "comma") and char == "}":
+                self._pos += 1
+                self._state = "end"
+            elif self._state == "key":
+                complete, self._member = self._decode()
+                if not complete:
+                    return records
+                self._state = "colon"
+            elif self._state == "colon":
+                self._expect(":")
+                self._state = "value"
+            elif self._state == "value" and self._member == self.key and char == "[":
+                self._pos += 1
+                self._state = "in_array"
+            elif self._state == "value":
+                complete, value = self._decode()
+                if not complete:
+                    return records
+                self.meta[self._member] = value
+                self._state = "comma"
+            elif self._state == "in_array" and char == "]":
+                self._pos += 1
+                self._state = "comma"
+            elif self._state == "in_array" and not self._first:
+                self._expect(",")
+                self._first = True
+            elif self._state == "in_array":
+                complete, record = self._decode()
+                if not complete:
+                    return records
+                records.append(record)
+                self._first = False
+            elif self._state == "comma":
+                self._expect(",")
+                self._state = "key"
+            else:
+                raise ValueError("Unexpected data after JSON response")
+
+class TDigest:
+    """Merging t-digest: streaming percentile estimates in bounded memory.
+
+    Values are buffered and merged into roughly ``compression`` centroids
+    whose size shrinks towards the tails, so p99 stays close to exact
+    while the whole distribution fits in a few kilobytes.
+    """
+
+    def __init__(self, compression: int = 100):
+        self.compression = compression
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._centroids: List[List[float]] = []  # [mean, weight], sorted by mean
+        self._buffer: List[float] = []
+
+    def add(self, value: float):
+        self._buffer.append(value)
+        self.count += 1
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if len(self._buffer) >= 5 * self.compression:
+            self._compress()
+
+    def _compress(self):
+        if not self._buffer:
+            return
+        points = sorted(self._centroids + [[value, 1.0] for value in self._buffer])
+        self._buffer = []
+        merged = [points[0]]
+        cumulative = 0.0
+        for mean, weight in points[1:]:
+            current = merged[-1]
+            # A centroid may hold at most 4 * n * q * (1 - q) / compression values
+            q = (cumulative + (current[1] + weight) / 2) / self.count
+            if current[1] + weight <= max(1.0, 4 * self.count * q * (1 - q) / self.compression):
+                current[1] += weight
+                current[0] += (mean - current[0]) * weight / current[1]
+            else:
+                cumulative += current[1]
+                merged.append([mean, weight])
+        self._centroids = merged
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate the value below which a fraction q (0..1) of the values fall"""
+        self._compress()
+        if not self.count:
+            return None
+        target = q * self.count
+        cumulative = 0.0
+        previous_mean, previous_center = self.min, 0.0
+        # Interpolate between centroid centers, anchored at the exact min and max
+        for mean, weight in self._centroids:
+            center = cumulative + weight / 2
+            if target < center:
+                return previous_mean + (mean - previous_mean) * (target - previous_center) / (center - previous_center)
+            previous_mean, previous_center = mean, center
+            cumulative += weight
+        if self.count <= previous_center:
+            return self.max
+        return previous_mean + (self.max - previous_mean) * (target - previous_center) / (self.count - previous_center)
+
+class TopK:
+    """The k items with the largest (or smallest) values, kept in a heap of size k"""
+
+    def __init__(self, k: int, largest: bool = True):
+        self.k = k
+        self.sign = 1 if largest else -1
+        self._heap: List[tuple] = []
+        self._seq = 0
+
+    def accepts(self, value: float) -> bool:
+        """Whether push() would keep the value; lets callers skip building the item"""
+        return self.k > 0 and (len(self._heap) < self.k or self.sign * value > self._heap[0][0])
+
+    def push(self, value: float, item: Any):
+        if not self.accepts(value):
+            return
+        # The sequence number keeps the first of equal values and never compares items
+        self._seq += 1
+        entry = (self.sign * value, -self._seq, item)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        else:
+            heapq.heapreplace(self._heap, entry)
+
+    def items(self) -> List[Any]:
+        return [item for _, _, item in sorted(self._heap, reverse=True)]
+
+class GroupStats:
+    """Count, sum, min, max, top records and percentiles of one group in one pass"""
+
+    def __init__(self, top_n: int, largest: bool, track_percentiles: bool):
+        self.count = 0
+        self.values = 0
+        self.total = 0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.top = TopK(top_n, largest)
+        self.digest = TDigest() if track_percentiles else None
+
+    def add(self, value: Optional[float]):
+        self.count += 1
+        if value is None:
+            return
+        self.values += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        if self.digest is not None:
+            self.digest.add(value)
+
+    def summary(self, percentiles: List[float]) -> Dict[str, Any]:
+        result: Dict[str, Any] = {"count": self.count}
+        if self.values:
+            result.update(sum=self.total, min=self.min, max=self.max, mean=round(self.total / self.values, 3))
+            if self.digest is not None:
+                result["percentiles"] = {f"p{p:g}": round(self.digest.quantile(p / 100), 3) for p in percentiles}
+        if self.top.k:
+            result["top"] = self.top.items()
+        return result
+
+def field_value(record: Dict[str, Any], path: str) -> Any:
+    """Value of a dotted field; a list continues with its first element"""
+    value: Any = record
+    for part in path.split("."):
+        if isinstance(value, list):
+            value = value[0] if value else None
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+def numeric_value(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return value
+
+# Collections the aggregate_records tool can page through
+AGGREGATE_RESOURCES = {
+    "clusters": "/datacenter/cluster/clusters",
+    "nodes": "/datacenter/cluster/nodes",
+    "svms": "/datacenter/svm/svms",
+    "volumes": "/datacenter/storage/volumes",
+    "volume_analytics": "/datacenter/storage/volumes/analytics",
+    "aggregates": "/datacenter/storage/aggregates",
+    "workloads": "/storage-provider/workloads",
+    "events": "/management-server/events",
+    "jobs": "/management-server/jobs",
+}
+AGGREGATE_PAGE_SIZE = 1000
 
 class NetAppClient:
     """Client for NetApp ActiveIQ Unified Manager API"""
@@ -49,55 +483,342 @@ class NetAppClient:
         self.config = config
         self.base_url = config.base_url.rstrip('/')
         self.timeout = httpx.Timeout(config.timeout)
+        self.limiter = AdaptiveLimiter(config.rate_limit, config.max_concurrency)
+        self.cache = ResponseCache(config.http_cache_entries)
+        self.accept_encoding = accept_encoding()
+        # Bytes received on the wire versus after decoding, for debugging
+        self.transfer_stats = {"responses": 0, "wire_bytes": 0, "decoded_bytes": 0}
+        self._http: Optional[httpx.AsyncClient] = None
+
+    @property
+    def auth(self) -> tuple:
+        # Read per request so a changed password applies without a new pool
+        return (self.config.username, self.config.password)
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Connection pool shared by all requests of this client, opened on first use"""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                verify=self.config.verify_ssl,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.config.max_concurrency,
+                    max_keepalive_connections=self.config.max_concurrency
+                )
+            )
+        return self._http
+
+    async def aclose(self):
+        """Close the pooled connections"""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     async def _make_request(
         self,
         method: str,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
-        data: Optional[Dict[str, Any]] = None
+        data: Optional[Dict[str, Any]] = None,
+        cache_ttl: float = 0
     ) -> Dict[str, Any]:
-        """Make HTTP request to NetApp API"""
+        """Make HTTP request to NetApp API
+
+        A GET with cache_ttl is answered from memory for that many seconds
+        without contacting the API (used to pre-warm answers at startup).
+        """
         url = urljoin(f"{self.base_url}/", endpoint.lstrip('/'))
 
-        auth = (self.config.username, self.config.password)
         headers = {
             "Accept": "application/json",
+            "Accept-Encoding": self.accept_encoding,
             "Content-Type": "application/json"
         }
 
-        async with httpx.AsyncClient(
-            verify=self.config.verify_ssl,
-            timeout=self.timeout,
-            auth=auth
-        ) as client:
+        # Revalidate cached GET responses instead of downloading them again
+        cache_key = self.cache.make_key(url, params) if method.upper() == "GET" else None
+        cached = self.cache.get(cache_key) if cache_key else None
+        if cached and self.cache.is_fresh(cached):
+            return loads_json(cached["body"]) if cached["body"] else {}
+        if cached:
+            headers.update(self.cache.conditional_headers(cached))
+
+        client = self.http
+        try:
+            for attempt in range(THROTTLE_RETRIES + 1):
+                epoch = await self.limiter.acquire()
+                status_code, retry_after = None, None
+                try:
+                    response = await client.request(
+                        method=method,
+                        url=url,
+                        params=params,
+                        json=data,
+                        headers=headers,
+                        auth=self.auth
+                    )
+                    status_code = response.status_code
+                    self._record_transfer(method, url, response)
+                    if status_code in THROTTLE_STATUSES:
+                        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                finally:
+                    await self.limiter.release(epoch, status_code, retry_after)
+
+                # 429 means the request was not processed; 503 is only safe to repeat for reads
+                retry = status_code == 429 or (status_code == 503 and method.upper() == "GET")
+                if not retry or attempt == THROTTLE_RETRIES:
+                    break
+
+            if cached and response.status_code == 304:
+                return loads_json(cached["body"]) if cached["body"] else {}
+
+            response.raise_for_status()
+            if cache_key:
+                self.cache.store(cache_key, response, cache_ttl)
+            return loads_json(response.content) if response.content else {}
+
+        except httpx.HTTPStatusError as e:
+            logger.error(f"HTTP error {e.response.status_code}: {e.response.text}")
+            raise
+        except Exception as e:
+            logger.error(f"Request failed: {e}")
+            raise
+
+    async def stream_records(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        meta: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the records of a list response while it downloads.
+
+        Unlike _make_request, the page is never held in memory as a whole.
+        Other top-level members (num_records, _links) are copied into
+        ``meta`` once the page has been read.
+        """
+        url = urljoin(f"{self.base_url}/", endpoint.lstrip('/'))
+        headers = {"Accept": "application/json", "Accept-Encoding": self.accept_encoding}
+        parser = RecordParser()
+
+        client = self.http
+        for attempt in range(THROTTLE_RETRIES + 1):
+            epoch = await self.limiter.acquire()
+            status_code, retry_after = None, None
             try:
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    json=data,
-                    headers=headers
-                )
+                response = await client.send(client.build_request("GET", url, params=params, headers=headers), auth=self.auth, stream=True)
+                status_code = response.status_code
+                if status_code in THROTTLE_STATUSES:
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            finally:
+                await self.limiter.release(epoch, status_code, retry_after)
+            if status_code not in THROTTLE_STATUSES or attempt == THROTTLE_RETRIES:
+                break
+            await response.aclose()
+
+        try:
+            if response.status_code >= 400:
+                await response.aread()
+                logger.error(f"HTTP error {response.status_code}: {response.text}")
                 response.raise_for_status()
-                return response.json() if response.content else {}
 
-            except httpx.HTTPStatusError as e:
-                logger.error(f"HTTP error {e.response.status_code}: {e.response.text}")
-                raise
-            except Exception as e:
-                logger.error(f"Request failed: {e}")
-                raise
+            decoded_bytes = 0
+            async for chunk in response.aiter_bytes():
+                decoded_bytes += len(chunk)
+                for record in parser.feed(chunk):
+                    yield record
+            for record in parser.close():
+                yield record
+            self.transfer_stats["responses"] += 1
+            self.transfer_stats["wire_bytes"] += response.num_bytes_downloaded
+            self.transfer_stats["decoded_bytes"] += decoded_bytes
+        finally:
+            await response.aclose()
+
+        if meta is not None:
+            meta.update(parser.meta)
+
+    async def iter_records(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: int = AGGREGATE_PAGE_SIZE
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield every record of a collection, fetching one page at a time.
+
+        Pages are requested with max_records/offset until total_records is
+        reached or, without it, until a page has no _links.next. The API may
+        return fewer records than asked for, so a short page only ends the
+        collection when the response carries neither.
+        """
+        offset = 0
+        while True:
+            meta: Dict[str, Any] = {}
+            count = 0
+            page_params = {**(params or {}), "max_records": page_size, "offset": offset}
+            async with aclosing(self.stream_records(endpoint, page_params, meta)) as records:
+                async for record in records:
+                    count += 1
+                    yield record
+            offset += count
+            total = meta.get("total_records")
+            links = meta.get("_links")
+            if not count:
+                return
+            if isinstance(total, int):
+                if offset >= total:
+                    return
+            elif isinstance(links, dict):
+                if not links.get("next"):
+                    return
+            elif count < page_size:
+                return
+
+    def _record_transfer(self, method: str, url: str, response: httpx.Response):
+        """Count wire and decoded bytes of a response (httpx decodes while reading)"""
+        wire_bytes, decoded_bytes = response.num_bytes_downloaded, len(response.content)
+        self.transfer_stats["responses"] += 1
+        self.transfer_stats["wire_bytes"] += wire_bytes
+        self.transfer_stats["decoded_bytes"] += decoded_bytes
+        if logger.isEnabledFor(logging.DEBUG):
+            encoding = response.headers.get("Content-Encoding", "identity")
+            logger.debug(f"{method} {url}: {wire_bytes} bytes on the wire, {decoded_bytes} decoded ({encoding})")
+
+# Clients shared by sessions and backends
+CLIENT_IDLE_TIMEOUT = float(os.getenv("NETAPP_CLIENT_IDLE_TIMEOUT", "300"))
+
+class ClientRegistry:
+    """Pooled NetApp clients shared across sessions, keyed by (base_url, username).
+
+    acquire() returns the existing client when the settings match, so a
+    session connecting to an instance another session already uses gets its
+    warm connection pool and response cache. A session asking for other
+    settings (or another password) while the pooled client is in use gets a
+    client of its own instead. Every acquire() is paired with a release(); a
+    pooled client nobody holds is closed after idle_timeout seconds, an
+    unshared one as soon as it is released.
+    """
 
-# Global client instance
-_netapp_client: Optional[NetAppClient] = None
+    def __init__(self, idle_timeout: float = CLIENT_IDLE_TIMEOUT):
+        self.idle_timeout = idle_timeout
+        self._clients: Dict[Tuple[str, str], NetAppClient] = {}
+        self._refs: Dict[Tuple[str, str], int] = {}
+        self._idle_since: Dict[Tuple[str, str], float] = {}
+        self._unshared: set = set()
+        self._closing: set = set()
+
+    @staticmethod
+    def key_for(config: NetAppConfig) -> Tuple[str, str]:
+        return (config.base_url.rstrip('/'), config.username)
+
+    @staticmethod
+    def normalized(config: NetAppConfig) -> NetAppConfig:
+        return config.model_copy(update={"base_url": config.base_url.rstrip('/')})
+
+    def acquire(self, config: NetAppConfig) -> NetAppClient:
+        """Take a reference to the client for config, creating it if needed"""
+        self.evict_idle()
+        config = self.normalized(config)
+        key = self.key_for(config)
+        client = self._clients.get(key)
+        if client is not None and client.config != config:
+            # Never hand a pool (and its cached responses) to different credentials
+            if self._refs.get(key):
+                client = NetAppClient(config)
+                self._unshared.add(client)
+                return client
+            if client.config.model_copy(update={"password": config.password}) == config:
+                client.config = config
+            else:
+                self._close(key)
+                client = None
+        if client is None:
+            client = self._clients[key] = NetAppClient(config)
+        self._refs[key] = self._refs.get(key, 0) + 1
+        self._idle_since.pop(key, None)
+        return client
+
+    def release(self, client: NetAppClient):
+        """Drop a reference taken with acquire()"""
+        if client in self._unshared:
+            self._unshared.discard(client)
+            self._schedule_close(client)
+            return
+        key = self.key_for(client.config)
+        if self._clients.get(key) is not client or not self._refs.get(key):
+            return
+        self._refs[key] -= 1
+        if not self._refs[key]:
+            self._idle_since[key] = time.monotonic()
+            try:
+                asyncio.get_running_loop().call_later(self.idle_timeout, self.evict_idle)
+            except RuntimeError:
+                pass  # No event loop (e.g. garbage collection); the next acquire() evicts it
+
+    def evict_idle(self):
+        """Close clients nobody has held for idle_timeout seconds"""
+        now = time.monotonic()
+        for key, since in [*self._idle_since.items()]:
+            if now - since >= self.idle_timeout:
+                logger.info(f"Closing idle NetApp client for {key[1]} at {key[0]}")
+                self._close(key)
+
+    def _close(self, key: Tuple[str, str]):
+        client = self._clients.pop(key)
+        self._refs.pop(key, None)
+        self._idle_since.pop(key, None)
+        self._schedule_close(client)
+
+    def _schedule_close(self, client: NetAppClient):
+        try:
+            task = asyncio.get_running_loop().create_task(client.aclose())
+        except RuntimeError:
+            return
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+registry = ClientRegistry()
+
+class LocalSession:
+    """Stands in for the MCP session when tools are called outside a request"""
+
+_local_session = LocalSession()
+
+# Connection bound by configure_netapp_connection, per session: (client, release finalizer)
+_session_clients: "weakref.WeakKeyDictionary[Any, Tuple[NetAppClient, weakref.finalize]]" = weakref.WeakKeyDictionary()
+
+# Connection configured from environment variables, shared by sessions that bind none
+_env_client: Optional[NetAppClient] = None
+
+def current_session() -> Any:
+    """The MCP session of the running tool call"""
+    try:
+        return request_ctx.get().session
+    except LookupError:
+        return _local_session
+
+def bind_client(client: NetAppClient):
+    """Bind the current session to an acquired client, releasing its previous one.
+
+    The reference is also released when the session object goes away.
+    """
+    session = current_session()
+    previous = _session_clients.pop(session, None)
+    if previous:
+        previous[1].detach()
+        registry.release(previous[0])
+    _session_clients[session] = (client, weakref.finalize(session, registry.release, client))
+
+def default_client() -> Optional[NetAppClient]:
+    """The connection bound to the current session, else the one from environment variables"""
+    global _env_client
 
-def get_client() -> NetAppClient:
-    """Get the NetApp client instance"""
-    global _netapp_client
+    binding = _session_clients.get(current_session())
+    if binding:
+        return binding[0]
 
     # Auto-configure from environment variables if not already configured
-    if _netapp_client is None:
+    if _env_client is None:
         base_url = os.getenv("NETAPP_BASE_URL")
         username = os.getenv("NETAPP_USERNAME")
         password = os.getenv("NETAPP_PASSWORD")
@@ -109,13 +830,217 @@ def get_client() -> NetAppClient:
                 username=username,
                 password=password,
                 verify_ssl=os.getenv("NETAPP_VERIFY_SSL", "true").lower() == "true",
-                timeout=int(os.getenv("NETAPP_TIMEOUT", "30"))
+                timeout=int(os.getenv("NETAPP_TIMEOUT", "30")),
+                rate_limit=float(os.getenv("NETAPP_RATE_LIMIT")) if os.getenv("NETAPP_RATE_LIMIT") else None,
+                max_concurrency=int(os.getenv("NETAPP_MAX_CONCURRENCY", "16")),
+                http_cache_entries=int(os.getenv("NETAPP_HTTP_CACHE_ENTRIES", "256"))
             )
-            _netapp_client = NetAppClient(config)
+            _env_client = registry.acquire(config)
+
+    return _env_client
+
+def get_client(backend: Optional[str] = None) -> NetAppClient:
+    """Get the NetApp client for a single-object request.
+
+    That is the named backend when one is given, else the session's own
+    connection. A federated setup without one needs the backend name unless
+    it has a single backend.
+    """
+    if backend:
+        return get_backends([backend])[backend]
+    client = default_client()
+    if client is not None:
+        return client
+    backends = get_backends()
+    if len(backends) > 1:
+        raise ValueError(f"Several backends are configured; pass backend to pick one of: {', '.join(backends)}")
+    return next(iter(backends.values()))
+
+# Named Unified Manager backends for federated list tools
+_backends: Optional[Dict[str, NetAppClient]] = None
+FANOUT_TIMEOUT = float(os.getenv("NETAPP_FANOUT_TIMEOUT", "20"))
+
+# Backends added with register_netapp_backend, per session: (backends, release finalizer)
+_session_backends: "weakref.WeakKeyDictionary[Any, Tuple[Dict[str, NetAppClient], weakref.finalize]]" = weakref.WeakKeyDictionary()
+
+def backend_configs_from_env() -> Dict[str, NetAppConfig]:
+    """Parse NETAPP_BACKENDS, a JSON object of backend name to connection settings.
+
+    Example: {"emea": {"base_url": "https://um-emea/api", "username": "monitor",
+    "password_env": "UM_EMEA_PASSWORD"}}; password_env names the variable
+    holding the password so it can stay out of the JSON.
+    """
+    raw = os.getenv("NETAPP_BACKENDS")
+    if not raw:
+        return {}
+    configs = {}
+    for name, settings in json.loads(raw).items():
+        settings = dict(settings)
+        if "password_env" in settings:
+            settings["password"] = os.getenv(settings.pop("password_env"), "")
+        configs[name] = NetAppConfig(**settings)
+    return configs
+
+def named_backends() -> Dict[str, NetAppClient]:
+    """Backends from NETAPP_BACKENDS, shared by every session"""
+    global _backends
+
+    if _backends is None:
+        _backends = {name: registry.acquire(config) for name, config in backend_configs_from_env().items()}
+        if _backends:
+            logger.info(f"Configured NetApp backends: {', '.join(_backends)}")
+    return _backends
+
+def session_backends() -> Dict[str, NetAppClient]:
+    """Backends the current session added with register_netapp_backend"""
+    entry = _session_backends.get(current_session())
+    return entry[0] if entry else {}
+
+def release_clients(clients: Dict[str, NetAppClient]):
+    """Release the clients of a session that went away"""
+    for client in clients.values():
+        registry.release(client)
+    clients.clear()
+
+def get_backends(names: Optional[List[str]] = None) -> Dict[str, NetAppClient]:
+    """Backends to query, all of them unless names are given.
+
+    These are the NETAPP_BACKENDS ones and those the session registered.
+    A connection the session bound with configure_netapp_connection is
+    always one of them, called "default"; without named backends the
+    client configured from environment variables is the "default" one.
+    """
+    backends = {**named_backends(), **session_backends()}
+    binding = _session_clients.get(current_session())
+    if binding:
+        backends["default"] = binding[0]
+    elif not backends:
+        client = default_client()
+        if client is None:
+            raise RuntimeError("NetApp client not configured. Use configure_netapp_connection first or set environment variables (NETAPP_BASE_URL, NETAPP_USERNAME, NETAPP_PASSWORD or NETAPP_BACKENDS).")
+        backends["default"] = client
+    if not names:
+        return backends
+    unknown = [name for name in names if name not in backends]
+    if unknown:
+        raise ValueError(f"Unknown backend(s): {', '.join(unknown)}; available: {', '.join(backends)}")
+    return {name: backends[name] for name in names}
+
+def sort_records(records: List[Dict[str, Any]], order_by: Optional[str]) -> List[Dict[str, Any]]:
+    """Sort merged records by an API order_by expression such as "create_time desc" """
+    if not order_by:
+        return records
+    field, _, direction = order_by.partition(" ")
+    try:
+        # Records without the field go last either way
+        present = [r for r in records if field_value(r, field) is not None]
+        absent = [r for r in records if field_value(r, field) is None]
+        present.sort(key=lambda r: field_value(r, field), reverse=direction.strip().lower() == "desc")
+    except TypeError:
+        return records
+    return present + absent
+
+async def fan_out(
+    endpoint: str,
+    params: Optional[Dict[str, Any]] = None,
+    backends: Optional[List[str]] = None,
+    timeout: Optional[float] = None
+) -> Dict[str, Any]:
+    """GET a list endpoint from several backends concurrently and merge the records.
+
+    Every record gets a ``source`` member naming its backend. Each backend
+    has its own deadline; one that fails or times out is reported under
+    ``errors`` while the others still answer. With a single backend and no
+    explicit selection the plain API response is returned.
+    """
+    targets = get_backends(backends)
+    if len(targets) == 1 and not backends:
+        return await next(iter(targets.values()))._make_request("GET", endpoint, params)
+    deadline = timeout or FANOUT_TIMEOUT
+
+    async def fetch(client: NetAppClient):
+        started = time.monotonic()
+        result = await asyncio.wait_for(client._make_request("GET", endpoint, params), deadline)
+        return result, time.monotonic() - started
+
+    outcomes = await asyncio.gather(*(fetch(client) for client in targets.values()), return_exceptions=True)
+
+    records: List[Dict[str, Any]] = []
+    sources: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    for name, outcome in zip(targets, outcomes):
+        if isinstance(outcome, asyncio.TimeoutError):
+            errors[name] = f"timed out after {deadline:g}s"
+        elif isinstance(outcome, httpx.HTTPStatusError):
+            errors[name] = f"HTTP {outcome.response.status_code}"
+        elif isinstance(outcome, Exception):
+            errors[name] = str(outcome) or type(outcome).__name__
+        elif isinstance(outcome, BaseException):
+            raise outcome
         else:
-            raise RuntimeError("NetApp client not configured. Use configure_netapp_connection first or set environment variables (NETAPP_BASE_URL, NETAPP_USERNAME, NETAPP_PASSWORD).")
+            result, elapsed = outcome
+            page = result.get("records", [])
+            records.extend({"source": name, **record} for record in page)
+            sources[name] = {"num_records": len(page), "total_records": result.get("total_records"), "elapsed_ms": round(elapsed * 1000)}
+
+    # Each backend applied order_by and max_records; do the same for the merged list
+    params = params or {}
+    records = sort_records(records, params.get("order_by"))
+    if params.get("max_records"):
+        records = records[:params["max_records"]]
+    merged: Dict[str, Any] = {"records": records, "num_records": len(records), "sources": sources}
+    if errors:
+        merged["errors"] = errors
+    return merged
+
+# Startup warm-up: the answers first sessions ask for, fetched before the server reports ready
+WARMUP_REQUESTS = (
+    ("/admin/system", None),
+    ("/datacenter/cluster/clusters", {"max_records": 100, "order_by": "name"}),  # get_clusters defaults
+)
+WARMUP_CACHE_TTL = float(os.getenv("NETAPP_WARMUP_CACHE_TTL", "30"))
+
+async def warm_up(timeout: float = 10) -> Dict[str, str]:
+    """Open the connection pool of every configured backend and prime its cache.
+
+    The TLS handshake and authentication happen here instead of in the first
+    tool call, and the warm-up answers are served from memory for
+    NETAPP_WARMUP_CACHE_TTL seconds. Failures are reported per backend, not
+    raised, so an unreachable Unified Manager does not keep the server down.
+    """
+    try:
+        backends = get_backends()
+    except RuntimeError:
+        return {}
+
+    async def warm(client: NetAppClient):
+        # Concurrently, which also leaves more than one open connection in the pool
+        await asyncio.gather(*(
+            client._make_request("GET", endpoint, params, cache_ttl=WARMUP_CACHE_TTL)
+            for endpoint, params in WARMUP_REQUESTS
+        ))
+
+    outcomes = await asyncio.gather(
+        *(asyncio.wait_for(warm(client), timeout) for client in backends.values()),
+        return_exceptions=True
+    )
+    status = {}
+    for name, outcome in zip(backends, outcomes):
+        if isinstance(outcome, asyncio.TimeoutError):
+            status[name] = f"timed out after {timeout:g}s"
+        elif isinstance(outcome, Exception):
+            status[name] = str(outcome) or type(outcome).__name__
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            status[name] = "ok"
+    return status
 
-    return _netapp_client
+# Stateless HTTP keeps no session between requests, so a connection bound to one would be lost
+STATELESS_REFUSAL = (
+    "This server runs stateless HTTP, so a connection would only last for this request. "
+    "Configure it with NETAPP_BASE_URL or NETAPP_BACKENDS, or run it without --stateless."
+)
 
 @mcp.tool()
 async def configure_netapp_connection(
@@ -138,7 +1063,8 @@ async def configure_netapp_connection(
     Returns:
         Confirmation message
     """
-    global _netapp_client
+    if mcp.settings.stateless_http:
+        return STATELESS_REFUSAL
 
     config = NetAppConfig(
         base_url=base_url,
@@ -148,15 +1074,88 @@ async def configure_netapp_connection(
         timeout=timeout
     )
 
-    _netapp_client = NetAppClient(config)
+    # Only this session switches; other sessions keep their connection
+    client = registry.acquire(config)
 
     # Test connection
     try:
-        await _netapp_client._make_request("GET", "/datacenter/cluster/clusters", {"max_records": 1})
-        return f"Successfully connected to NetApp ActiveIQ at {base_url}"
+        await client._make_request("GET", "/datacenter/cluster/clusters", {"max_records": 1})
     except Exception as e:
-        _netapp_client = None
+        registry.release(client)
         return f"Failed to connect to NetApp ActiveIQ: {e}"
+    bind_client(client)
+    return f"Successfully connected to NetApp ActiveIQ at {base_url}"
+
+@mcp.tool()
+async def register_netapp_backend(
+    name: str,
+    base_url: str,
+    username: str,
+    password: str,
+    verify_ssl: bool = True,
+    timeout: int = 30
+) -> str:
+    """
+    Register a named Unified Manager backend for federated queries.
+
+    List tools query every registered backend concurrently unless their
+    backends argument selects some. The backend is only visible to the
+    calling session; shared backends are configured with NETAPP_BACKENDS.
+
+    Args:
+        name: Backend name used in the source member of merged records (e.g., emea)
+        base_url: Base URL for NetApp ActiveIQ API (e.g., https://netapp-aiqum.example.com/api)
+        username: Username for authentication
+        password: Password for authentication
+        verify_ssl: Whether to verify SSL certificates (default: True)
+        timeout: Request timeout in seconds (default: 30)
+
+    Returns:
+        Confirmation message
+    """
+    if mcp.settings.stateless_http:
+        return STATELESS_REFUSAL
+    if name == "default" or name in named_backends():
+        return f"Backend name {name} is reserved by the server configuration"
+
+    config = NetAppConfig(
+        base_url=base_url,
+        username=username,
+        password=password,
+        verify_ssl=verify_ssl,
+        timeout=timeout
+    )
+
+    client = registry.acquire(config)
+
+    try:
+        await client._make_request("GET", "/datacenter/cluster/clusters", {"max_records": 1})
+    except Exception as e:
+        registry.release(client)
+        return f"Failed to connect to backend {name} at {base_url}: {e}"
+
+    session = current_session()
+    if session not in _session_backends:
+        backends: Dict[str, NetAppClient] = {}
+        _session_backends[session] = (backends, weakref.finalize(session, release_clients, backends))
+    backends = _session_backends[session][0]
+    if name in backends:
+        registry.release(backends[name])
+    backends[name] = client
+    return f"Registered backend {name} at {base_url} for this session"
+
+@mcp.tool()
+async def list_netapp_backends() -> str:
+    """
+    List the Unified Manager backends that list tools fan out to.
+
+    Returns:
+        JSON string with the name, URL and user of each backend
+    """
+    return dumps_json([
+        {"name": name, "base_url": client.base_url, "username": client.config.username}
+        for name, client in get_backends().items()
+    ])
 
 @mcp.tool()
 async def get_clusters(
@@ -164,7 +1163,8 @@ async def get_clusters(
     location: Optional[str] = None,
     version_generation: Optional[int] = None,
     max_records: int = 100,
-    order_by: str = "name"
+    order_by: str = "name",
+    backends: Optional[List[str]] = None
 ) -> str:
     """
     Retrieve list of ONTAP clusters from NetApp ActiveIQ.
@@ -175,12 +1175,11 @@ async def get_clusters(
         version_generation: Filter by ONTAP version generation (e.g., 9)
         max_records: Maximum number of records to return (default: 100)
         order_by: Sort field (default: name)
+        backends: Names of the Unified Manager backends to query (default: all)
 
     Returns:
         JSON string containing cluster information
     """
-    client = get_client()
-
     params = {
         "max_records": max_records,
         "order_by": order_by
@@ -193,30 +1192,32 @@ async def get_clusters(
     if version_generation:
         params["version.generation"] = version_generation
 
-    result = await client._make_request("GET", "/datacenter/cluster/clusters", params)
-    return json.dumps(result, indent=2)
+    result = await fan_out("/datacenter/cluster/clusters", params, backends)
+    return dumps_json(result)
 
 @mcp.tool()
-async def get_cluster_details(cluster_key: str) -> str:
+async def get_cluster_details(cluster_key: str, backend: Optional[str] = None) -> str:
     """
     Get detailed information about a specific cluster.
 
     Args:
         cluster_key: Unique identifier of the cluster
+        backend: Unified Manager backend holding the cluster (the source member of get_clusters records)
 
     Returns:
         JSON string containing detailed cluster information
     """
-    client = get_client()
+    client = get_client(backend)
 
     endpoint = f"/datacenter/cluster/clusters/{cluster_key}"
     result = await client._make_request("GET", endpoint)
-    return json.dumps(result, indent=2)
+    return dumps_json(result)
 
 @mcp.tool()
 async def get_cluster_performance(
     cluster_key: str,
-    interval: str = "1h"
+    interval: str = "1h",
+    backend: Optional[str] = None
 ) -> str:
     """
     Get performance metrics for a specific cluster.
@@ -224,17 +1225,18 @@ async def get_cluster_performance(
     Args:
         cluster_key: Unique identifier of the cluster
         interval: Time range for metrics (1h, 12h, 1d, 2d, 3d, 15d, 1w, 1m, 2m, 3m, 6m)
+        backend: Unified Manager backend holding the cluster (the source member of get_clusters records)
 
     Returns:
         JSON string containing performance metrics
     """
-    client = get_client()
+    client = get_client(backend)
 
     endpoint = f"/datacenter/cluster/clusters/{cluster_key}/metrics"
     params = {"interval": interval}
 
     result = await client._make_request("GET", endpoint, params)
-    return json.dumps(result, indent=2)
+    return dumps_json(result)
 
 @mcp.tool()
 async def get_nodes(
@@ -243,7 +1245,8 @@ async def get_nodes(
     model: Optional[str] = None,
     health: Optional[bool] = None,
     max_records: int = 100,
-    order_by: str = "name"
+    order_by: str = "name",
+    backends: Optional[List[str]] = None
 ) -> str:
     """
     Retrieve list of nodes from NetApp clusters.
@@ -255,12 +1258,11 @@ async def get_nodes(
         health: Filter by node health status
         max_records: Maximum number of records to return
         order_by: Sort field
+        backends: Names of the Unified Manager backends to query (default: all)
 
     Returns:
         JSON string containing node information
     """
-    client = get_client()
-
     params = {
         "max_records": max_records,
         "order_by": order_by
@@ -275,8 +1277,8 @@ async def get_nodes(
     if health is not None:
         params["health"] = health
 
-    result = await client._make_request("GET", "/datacenter/cluster/nodes", params)
-    return json.dumps(result, indent=2)
+    result = await fan_out("/datacenter/cluster/nodes", params, backends)
+    return dumps_json(result)
 
 @mcp.tool()
 async def get_svms(
@@ -284,7 +1286,8 @@ async def get_svms(
     name: Optional[str] = None,
     state: Optional[str] = None,
     max_records: int = 100,
-    order_by: str = "name"
+    order_by: str = "name",
+    backends: Optional[List[str]] = None
 ) -> str:
     """
     Retrieve list of Storage Virtual Machines (SVMs).
@@ -295,12 +1298,11 @@ async def get_svms(
         state: Filter by SVM state (running, stopped, etc.)
         max_records: Maximum number of records to return
         order_by: Sort field
+        backends: Names of the Unified Manager backends to query (default: all)
 
     Returns:
         JSON string containing SVM information
     """
-    client = get_client()
-
     params = {
         "max_records": max_records,
         "order_by": order_by
@@ -313,8 +1315,8 @@ async def get_svms(
     if state:
         params["state"] = state
 
-    result = await client._make_request("GET", "/datacenter/svm/svms", params)
-    return json.dumps(result, indent=2)
+    result = await fan_out("/datacenter/svm/svms", params, backends)
+    return dumps_json(result)
 
 @mcp.tool()
 async def get_volumes(
@@ -324,7 +1326,8 @@ async def get_volumes(
     state: Optional[str] = None,
     style: Optional[str] = None,
     max_records: int = 100,
-    order_by: str = "name"
+    order_by: str = "name",
+    backends: Optional[List[str]] = None
 ) -> str:
     """
     Retrieve list of volumes.
@@ -337,12 +1340,11 @@ async def get_volumes(
         style: Filter by volume style (flexvol, flexgroup)
         max_records: Maximum number of records to return
         order_by: Sort field
+        backends: Names of the Unified Manager backends to query (default: all)
 
     Returns:
         JSON string containing volume information
     """
-    client = get_client()
-
     params = {
         "max_records": max_records,
         "order_by": order_by
@@ -359,8 +1361,8 @@ async def get_volumes(
     if style:
         params["style"] = style
 
-    result = await client._make_request("GET", "/datacenter/storage/volumes", params)
-    return json.dumps(result, indent=2)
+    result = await fan_out("/datacenter/storage/volumes", params, backends)
+    return dumps_json(result)
 
 @mcp.tool()
 async def get_volume_analytics(
@@ -369,7 +1371,8 @@ async def get_volume_analytics(
     volume_name: Optional[str] = None,
     period: Optional[int] = None,
     max_records: int = 100,
-    order_by: str = "iops desc"
+    order_by: str = "iops desc",
+    backends: Optional[List[str]] = None
 ) -> str:
     """
     Get volume performance analytics.
@@ -381,12 +1384,11 @@ async def get_volume_analytics(
         period: Duration of aggregation in hours
         max_records: Maximum number of records to return
         order_by: Sort field
+        backends: Names of the Unified Manager backends to query (default: all)
 
     Returns:
         JSON string containing volume analytics
     """
-    client = get_client()
-
     params = {
         "max_records": max_records,
         "order_by": order_by
@@ -401,8 +1403,8 @@ async def get_volume_analytics(
     if period:
         params["period"] = period
 
-    result = await client._make_request("GET", "/datacenter/storage/volumes/analytics", params)
-    return json.dumps(result, indent=2)
+    result = await fan_out("/datacenter/storage/volumes/analytics", params, backends)
+    return dumps_json(result)
 
 @mcp.tool()
 async def get_aggregates(
@@ -411,7 +1413,8 @@ async def get_aggregates(
     state: Optional[str] = None,
     type_filter: Optional[str] = None,
     max_records: int = 100,
-    order_by: str = "name"
+    order_by: str = "name",
+    backends: Optional[List[str]] = None
 ) -> str:
     """
     Retrieve list of aggregates.
@@ -423,12 +1426,11 @@ async def get_aggregates(
         type_filter: Filter by aggregate type
         max_records: Maximum number of records to return
         order_by: Sort field
+        backends: Names of the Unified Manager backends to query (default: all)
 
     Returns:
         JSON string containing aggregate information
     """
-    client = get_client()
-
     params = {
         "max_records": max_records,
         "order_by": order_by
@@ -443,15 +1445,16 @@ async def get_aggregates(
     if type_filter:
         params["type"] = type_filter
 
-    result = await client._make_request("GET", "/datacenter/storage/aggregates", params)
-    return json.dumps(result, indent=2)
+    result = await fan_out("/datacenter/storage/aggregates", params, backends)
+    return dumps_json(result)
 
 @mcp.tool()
 async def get_performance_service_levels(
     name: Optional[str] = None,
     system_defined: Optional[bool] = None,
     max_records: int = 100,
-    order_by: str = "name"
+    order_by: str = "name",
+    backends: Optional[List[str]] = None
 ) -> str:
     """
     Retrieve Performance Service Levels.
@@ -461,12 +1464,11 @@ async def get_performance_service_levels(
         system_defined: Filter by system-defined PSLs
         max_records: Maximum number of records to return
         order_by: Sort field
+        backends: Names of the Unified Manager backends to query (default: all)
 
     Returns:
         JSON string containing Performance Service Level information
     """
-    client = get_client()
-
     params = {
         "max_records": max_records,
         "order_by": order_by
@@ -477,15 +1479,16 @@ async def get_performance_service_levels(
     if system_defined is not None:
         params["system_defined"] = system_defined
 
-    result = await client._make_request("GET", "/storage-provider/performance-service-levels", params)
-    return json.dumps(result, indent=2)
+    result = await fan_out("/storage-provider/performance-service-levels", params, backends)
+    return dumps_json(result)
 
 @mcp.tool()
 async def get_storage_efficiency_policies(
     name: Optional[str] = None,
     system_defined: Optional[bool] = None,
     max_records: int = 100,
-    order_by: str = "name"
+    order_by: str = "name",
+    backends: Optional[List[str]] = None
 ) -> str:
     """
     Retrieve Storage Efficiency Policies.
@@ -495,12 +1498,11 @@ async def get_storage_efficiency_policies(
         system_defined: Filter by system-defined policies
         max_records: Maximum number of records to return
         order_by: Sort field
+        backends: Names of the Unified Manager backends to query (default: all)
 
     Returns:
         JSON string containing Storage Efficiency Policy information
     """
-    client = get_client()
-
     params = {
         "max_records": max_records,
         "order_by": order_by
@@ -511,8 +1513,8 @@ async def get_storage_efficiency_policies(
     if system_defined is not None:
         params["system_defined"] = system_defined
 
-    result = await client._make_request("GET", "/storage-provider/storage-efficiency-policies", params)
-    return json.dumps(result, indent=2)
+    result = await fan_out("/storage-provider/storage-efficiency-policies", params, backends)
+    return dumps_json(result)
 
 @mcp.tool()
 async def get_workloads(
@@ -521,7 +1523,8 @@ async def get_workloads(
     workload_type: Optional[str] = None,
     conformance_status: Optional[str] = None,
     max_records: int = 100,
-    order_by: str = "name"
+    order_by: str = "name",
+    backends: Optional[List[str]] = None
 ) -> str:
     """
     Retrieve workloads information.
@@ -533,12 +1536,11 @@ async def get_workloads(
         conformance_status: Filter by conformance status
         max_records: Maximum number of records to return
         order_by: Sort field
+        backends: Names of the Unified Manager backends to query (default: all)
 
     Returns:
         JSON string containing workload information
     """
-    client = get_client()
-
     params = {
         "max_records": max_records,
         "order_by": order_by
@@ -553,8 +1555,8 @@ async def get_workloads(
     if conformance_status:
         params["conformance_status"] = conformance_status
 
-    result = await client._make_request("GET", "/storage-provider/workloads", params)
-    return json.dumps(result, indent=2)
+    result = await fan_out("/storage-provider/workloads", params, backends)
+    return dumps_json(result)
 
 @mcp.tool()
 async def get_events(
@@ -562,7 +1564,8 @@ async def get_events(
     state: Optional[str] = None,
     source_type: Optional[str] = None,
     max_records: int = 100,
-    order_by: str = "create_time desc"
+    order_by: str = "create_time desc",
+    backends: Optional[List[str]] = None
 ) -> str:
     """
     Retrieve events from NetApp ActiveIQ.
@@ -573,12 +1576,11 @@ async def get_events(
         source_type: Filter by source type
         max_records: Maximum number of records to return
         order_by: Sort field
+        backends: Names of the Unified Manager backends to query (default: all)
 
     Returns:
         JSON string containing event information
     """
-    client = get_client()
-
     params = {
         "max_records": max_records,
         "order_by": order_by
@@ -591,15 +1593,16 @@ async def get_events(
     if source_type:
         params["source_type"] = source_type
 
-    result = await client._make_request("GET", "/management-server/events", params)
-    return json.dumps(result, indent=2)
+    result = await fan_out("/management-server/events", params, backends)
+    return dumps_json(result)
 
 @mcp.tool()
 async def get_jobs(
     state: Optional[str] = None,
     type_filter: Optional[str] = None,
     max_records: int = 100,
-    order_by: str = "create_time desc"
+    order_by: str = "create_time desc",
+    backends: Optional[List[str]] = None
 ) -> str:
     """
     Retrieve job information.
@@ -609,12 +1612,11 @@ async def get_jobs(
         type_filter: Filter by job type
         max_records: Maximum number of records to return
         order_by: Sort field
+        backends: Names of the Unified Manager backends to query (default: all)
 
     Returns:
         JSON string containing job information
     """
-    client = get_client()
-
     params = {
         "max_records": max_records,
         "order_by": order_by
@@ -625,28 +1627,110 @@ async def get_jobs(
     if type_filter:
         params["type"] = type_filter
 
-    result = await client._make_request("GET", "/management-server/jobs", params)
-    return json.dumps(result, indent=2)
+    result = await fan_out("/management-server/jobs", params, backends)
+    return dumps_json(result)
 
 @mcp.tool()
-async def get_system_info() -> str:
+async def get_system_info(backend: Optional[str] = None) -> str:
     """
     Get system information about NetApp ActiveIQ Unified Manager.
 
+    Args:
+        backend: Unified Manager backend to ask (see list_netapp_backends)
+
     Returns:
         JSON string containing system information
     """
-    client = get_client()
+    client = get_client(backend)
 
     result = await client._make_request("GET", "/admin/system")
-    return json.dumps(result, indent=2)
+    return dumps_json(result)
 
-if __name__ == "__main__":
-    # Run the MCP server
-    import mcp.server.stdio
+@mcp.tool()
+async def aggregate_records(
+    resource: str,
+    metric: Optional[str] = None,
+    group_by: Optional[str] = None,
+    top_n: int = 10,
+    ascending: bool = False,
+    percentiles: Optional[List[float]] = None,
+    fields: Optional[List[str]] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    max_groups: int = 50,
+    max_records: Optional[int] = None,
+    backend: Optional[str] = None
+) -> str:
+    """
+    Aggregate a whole collection inside the server and return only the result.
+
+    Use this instead of the get_* tools for questions such as "the 10 volumes
+    using the most space per cluster" or "p95 latency per SVM": every page is
+    read here and only counts, sums, percentiles and the top records come back.
 
-    async def main():
-        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-            await mcp.run(read_stream, write_stream, mcp.create_initialization_options())
+    Args:
+        resource: Collection to read (clusters, nodes, svms, volumes, volume_analytics, aggregates, workloads, events, jobs)
+        metric: Dotted numeric field to sum and rank by (e.g. space.size, iops); only counts when unset
+        group_by: Dotted field to group by (e.g. cluster.name, svm.name, state)
+        top_n: Records to return per group, ranked by metric (0 for none)
+        ascending: Rank the smallest values first instead of the largest
+        percentiles: Percentiles of the metric to estimate per group (e.g. [50, 95, 99])
+        fields: Fields to show for the top records (default: name, the group_by field and the metric)
+        filters: API query filters, e.g. {"state": "online", "cluster.name": "cluster1"}
+        max_groups: Maximum groups to return, largest sum (or count) first
+        max_records: Stop after reading this many records (default: all)
+        backend: Unified Manager backend to read (see list_netapp_backends)
 
-    asyncio.run(main())
+    Returns:
+        JSON string with count, sum, min, max, mean, percentiles and top records per group
+    """
+    if resource not in AGGREGATE_RESOURCES:
+        raise ValueError(f"Unknown resource {resource!r}; expected one of {', '.join(AGGREGATE_RESOURCES)}")
+    percentiles = percentiles or []
+    if any(not 0 <= p <= 100 for p in percentiles):
+        raise ValueError("Percentiles must be between 0 and 100")
+    if not metric:
+        top_n, percentiles = 0, []
+    fields = fields or [*dict.fromkeys(["name", *([group_by] if group_by else []), metric])]
+
+    client = get_client(backend)
+    groups: Dict[Any, GroupStats] = {}
+    scanned = missing = 0
+
+    async with aclosing(client.iter_records(AGGREGATE_RESOURCES[resource], filters)) as records:
+        async for record in records:
+            key = field_value(record, group_by) if group_by else None
+            if isinstance(key, (dict, list)):
+                key = dumps_json(key)
+            stats = groups.get(key)
+            if stats is None:
+                stats = groups[key] = GroupStats(top_n, not ascending, bool(percentiles))
+
+            value = numeric_value(field_value(record, metric)) if metric else None
+            if metric and value is None:
+                missing += 1
+            stats.add(value)
+            if value is not None and stats.top.accepts(value):
+                stats.top.push(value, {field: field_value(record, field) for field in fields})
+
+            scanned += 1
+            if max_records and scanned >= max_records:
+                break
+
+    result: Dict[str, Any] = {"resource": resource, "records": scanned}
+    if metric:
+        result.update(metric=metric, missing_metric=missing)
+    if group_by:
+        ranked = sorted(groups.items(), key=lambda item: item[1].total if metric else item[1].count, reverse=True)
+        result.update(
+            group_by=group_by,
+            group_count=len(groups),
+            groups=[{"group": key, **stats.summary(percentiles)} for key, stats in ranked[:max(0, max_groups)]]
+        )
+    else:
+        stats = groups.get(None) or GroupStats(top_n, not ascending, bool(percentiles))
+        result.update(stats.summary(percentiles))
+    return dumps_json(result)
+
+if __name__ == "__main__":
+    # Run the MCP server (stdio; start_mcp_server.py also serves HTTP)
+    mcp.run(transport="stdio")
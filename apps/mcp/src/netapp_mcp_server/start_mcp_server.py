@@ -3,11 +3,15 @@
 Startup script for NetApp ActiveIQ MCP Server
 
 This script provides an easy way to start the MCP server with proper configuration.
+It serves stdio for local assistants, or streamable HTTP/SSE so one process can
+handle many concurrent sessions (the Knative deployment).
 """
 
+import argparse
 import asyncio
 import os
 import sys
+import time
 import logging
 from pathlib import Path
 
@@ -15,6 +19,9 @@ from pathlib import Path
 current_dir = Path(__file__).parent
 sys.path.insert(0, str(current_dir))
 
+TRANSPORTS = ("stdio", "streamable-http", "sse")
+LOCAL_HOSTS = ("127.0.0.1", "localhost", "::1")
+
 def setup_logging():
     """Setup logging configuration"""
     log_level = os.getenv("LOG_LEVEL", "INFO").upper()
@@ -25,6 +32,9 @@ def setup_logging():
 
 def check_environment():
     """Check if required environment variables are set"""
+    # stdout carries the protocol on the stdio transport, so report on stderr
+    if os.getenv("NETAPP_BACKENDS"):
+        return
     required_vars = ["NETAPP_BASE_URL", "NETAPP_USERNAME", "NETAPP_PASSWORD"]
     missing_vars = []
 
@@ -33,42 +43,204 @@ def check_environment():
             missing_vars.append(var)
 
     if missing_vars:
-        print(f"Warning: Missing environment variables: {', '.join(missing_vars)}")
-        print("The server will require manual configuration via configure_netapp_connection tool.")
-        print("\nTo set them:")
+        print(f"Warning: Missing environment variables: {', '.join(missing_vars)}", file=sys.stderr)
+        print("The server will require manual configuration via configure_netapp_connection tool.", file=sys.stderr)
+        print("\nTo set them:", file=sys.stderr)
         for var in missing_vars:
             if var == "NETAPP_BASE_URL":
-                print(f"export {var}=\"https://your-netapp-aiqum.example.com/api\"")
+                print(f"export {var}=\"https://your-netapp-aiqum.example.com/api\"", file=sys.stderr)
             elif var == "NETAPP_USERNAME":
-                print(f"export {var}=\"your-username\"")
+                print(f"export {var}=\"your-username\"", file=sys.stderr)
             elif var == "NETAPP_PASSWORD":
-                print(f"export {var}=\"your-password\"")
-        print()
+                print(f"export {var}=\"your-password\"", file=sys.stderr)
+        print(file=sys.stderr)
+
+def env_flag(name: str, default: bool = False) -> bool:
+    value = os.getenv(name)
+    return default if value is None else value.strip().lower() in ("1", "true", "yes", "on")
+
+def split_list(value: str) -> list:
+    return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="NetApp ActiveIQ MCP Server")
+    parser.add_argument(
+        "--transport", choices=TRANSPORTS, default=os.getenv("MCP_TRANSPORT", "stdio"),
+        help="MCP transport (default: $MCP_TRANSPORT or stdio)"
+    )
+    parser.add_argument("--host", default=os.getenv("HOST", "0.0.0.0"), help="HTTP bind address")
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "8080")), help="HTTP port (default: $PORT or 8080)")
+    parser.add_argument(
+        "--max-concurrent-requests", type=int, default=int(os.getenv("MCP_MAX_CONCURRENT_REQUESTS", "100")),
+        help="MCP messages handled at once; match the Knative autoscaling target (default: 100)"
+    )
+    parser.add_argument(
+        "--stateless", action=argparse.BooleanOptionalAction, default=env_flag("MCP_STATELESS_HTTP"),
+        help="Keep no session state between HTTP requests, so any replica can serve any request; "
+             "configure_netapp_connection is then refused (default: off)"
+    )
+    parser.add_argument(
+        "--allowed-hosts", type=split_list, default=split_list(os.getenv("MCP_ALLOWED_HOSTS")),
+        help="Comma-separated Host headers accepted besides localhost, any port; '*' turns the check off (default: $MCP_ALLOWED_HOSTS)"
+    )
+    parser.add_argument(
+        "--allowed-origins", type=split_list, default=split_list(os.getenv("MCP_ALLOWED_ORIGINS")),
+        help="Comma-separated Origin headers accepted (default: $MCP_ALLOWED_ORIGINS, else http(s) on the allowed hosts)"
+    )
+    parser.add_argument(
+        "--json-response", action=argparse.BooleanOptionalAction, default=env_flag("MCP_JSON_RESPONSE"),
+        help="Answer streamable HTTP requests with plain JSON instead of an SSE stream"
+    )
+    parser.add_argument(
+        "--warm-up", action=argparse.BooleanOptionalAction, default=env_flag("NETAPP_WARMUP", True),
+        help="Connect to Unified Manager and prime caches before /readyz reports ready (default: on)"
+    )
+    parser.add_argument(
+        "--warm-up-timeout", type=float, default=float(os.getenv("NETAPP_WARMUP_TIMEOUT", "10")),
+        help="Seconds to wait for each backend during warm-up (default: 10)"
+    )
+    return parser.parse_args(argv)
+
+def load_server_module():
+    """Import mcp_server, installed or next to this script (container image)"""
+    try:
+        from netapp_mcp_server import mcp_server
+    except ImportError:
+        import mcp_server
+    return mcp_server
+
+class ConcurrencyLimitMiddleware:
+    """ASGI middleware capping the MCP messages handled at once.
+
+    Requests over the limit wait for a slot, so a pod never takes on more
+    tool calls than the autoscaler sized it for. Only POSTs count: they carry
+    the JSON-RPC messages, while a GET may hold an SSE stream open for the
+    whole session.
+    """
+
+    def __init__(self, app, limit: int):
+        self.app = app
+        self.limit = max(1, limit)
+        self._semaphore = asyncio.Semaphore(self.limit)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+        async with self._semaphore:
+            await self.app(scope, receive, send)
 
-async def main():
+class Readiness:
+    """Startup state behind /readyz: ready once the warm-up has finished"""
+
+    def __init__(self):
+        self.ready = False
+        self.started = time.monotonic()
+        self.warm_up: dict = {}
+
+    async def run(self, warm_up, timeout: float):
+        try:
+            if warm_up:
+                self.warm_up = await warm_up(timeout)
+                logging.getLogger(__name__).info(
+                    f"Warm-up finished in {time.monotonic() - self.started:.2f}s: {self.warm_up or 'no backend configured'}"
+                )
+        finally:
+            self.ready = True
+
+def add_health_routes(server, readiness: Readiness):
+    """/healthz for liveness and /readyz, which waits for the warm-up"""
+    from starlette.responses import JSONResponse
+
+    @server.custom_route("/healthz", methods=["GET"])
+    async def healthz(request):
+        return JSONResponse({"status": "ok"})
+
+    @server.custom_route("/readyz", methods=["GET"])
+    async def readyz(request):
+        return JSONResponse(
+            {"status": "ready" if readiness.ready else "warming up", "backends": readiness.warm_up},
+            status_code=200 if readiness.ready else 503
+        )
+
+def transport_security(args: argparse.Namespace):
+    """DNS rebinding protection admitting localhost and the allowed hosts.
+
+    Behind an ingress the Host header is the service's domain, so that
+    domain has to be listed in --allowed-hosts (MCP_ALLOWED_HOSTS).
+    """
+    from mcp.server.transport_security import TransportSecuritySettings
+
+    if "*" in args.allowed_hosts:
+        return TransportSecuritySettings(enable_dns_rebinding_protection=False)
+    if args.host not in LOCAL_HOSTS and not args.allowed_hosts:
+        logging.getLogger(__name__).warning(
+            "Only localhost Host headers are accepted; set MCP_ALLOWED_HOSTS to the names clients connect to"
+        )
+
+    hosts = []
+    for name in ["127.0.0.1", "localhost", "[::1]", *args.allowed_hosts]:
+        hosts.append(name)
+        if ":" not in name.rsplit("]", 1)[-1]:
+            hosts.append(f"{name}:*")  # No port given: any port
+    origins = args.allowed_origins or [f"{scheme}://{host}" for host in hosts for scheme in ("http", "https")]
+    return TransportSecuritySettings(enable_dns_rebinding_protection=True, allowed_hosts=hosts, allowed_origins=origins)
+
+def create_http_app(server, args: argparse.Namespace):
+    """ASGI app for the HTTP transports, sharing one process and connection pool"""
+    server.settings.stateless_http = args.stateless
+    server.settings.json_response = args.json_response
+    server.settings.transport_security = transport_security(args)
+
+    app = server.streamable_http_app() if args.transport == "streamable-http" else server.sse_app()
+    return ConcurrencyLimitMiddleware(app, args.max_concurrent_requests)
+
+async def serve_http(module, args: argparse.Namespace):
+    """Serve HTTP while warming up the backends in the same event loop"""
+    # Deferred: the stdio transport never needs the HTTP stack
+    import uvicorn
+
+    readiness = Readiness()
+    add_health_routes(module.mcp, readiness)
+    config = uvicorn.Config(
+        create_http_app(module.mcp, args),
+        host=args.host,
+        port=args.port,
+        log_level=os.getenv("LOG_LEVEL", "INFO").lower(),
+        # Knative's queue-proxy keeps connections open between requests
+        timeout_keep_alive=75
+    )
+    warm_up = asyncio.create_task(readiness.run(module.warm_up if args.warm_up else None, args.warm_up_timeout))
+    try:
+        await uvicorn.Server(config).serve()
+    finally:
+        warm_up.cancel()
+
+def main(argv=None):
     """Main function to start the MCP server"""
     setup_logging()
     check_environment()
+    args = parse_args(argv)
 
-    print("Starting NetApp ActiveIQ MCP Server...")
-    print("=" * 50)
+    print(f"Starting NetApp ActiveIQ MCP Server ({args.transport})...", file=sys.stderr)
+    print("=" * 50, file=sys.stderr)
 
     # Import and run the MCP server
     try:
-        from .mcp_server import mcp
-        import mcp.server.stdio
-
-        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-            await mcp.run(read_stream, write_stream, mcp.create_initialization_options())
+        module = load_server_module()
+        if args.transport == "stdio":
+            module.mcp.run(transport="stdio")
+        else:
+            asyncio.run(serve_http(module, args))
 
     except ImportError as e:
-        print(f"Error importing MCP dependencies: {e}")
-        print("Please install the required dependencies:")
-        print("pip install -r mcp_requirements.txt")
+        print(f"Error importing MCP dependencies: {e}", file=sys.stderr)
+        print("Please install the required dependencies:", file=sys.stderr)
+        print("uv pip install -e .", file=sys.stderr)
         sys.exit(1)
     except Exception as e:
-        print(f"Error starting MCP server: {e}")
+        print(f"Error starting MCP server: {e}", file=sys.stderr)
         sys.exit(1)
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
@@ -0,0 +1,31 @@
+"""Shared test fixtures and utilities."""
+
+import weakref
+
+import httpx
+import pytest
+
+from netapp_mcp_server import mcp_server
+from netapp_mcp_server.mcp_server import NetAppClient, NetAppConfig
+
+
+@pytest.fixture(autouse=True)
+def isolated_connections(monkeypatch):
+    """Start every test without configured clients or backends, backing off for milliseconds."""
+    for name in ("NETAPP_BASE_URL", "NETAPP_USERNAME", "NETAPP_PASSWORD", "NETAPP_BACKENDS"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setattr(mcp_server, "registry", mcp_server.ClientRegistry())
+    monkeypatch.setattr(mcp_server, "_session_clients", weakref.WeakKeyDictionary())
+    monkeypatch.setattr(mcp_server, "_env_client", None)
+    monkeypatch.setattr(mcp_server, "_backends", None)
+    monkeypatch.setattr(mcp_server, "BACKOFF_BASE", 0.002)
+
+
+@pytest.fixture
+def make_client():
+    """Build NetAppClients whose requests are answered by a handler function."""
+    def factory(handler, base_url="https://um.example.com/api", username="monitor", **settings):
+        client = NetAppClient(NetAppConfig(base_url=base_url, username=username, password="secret", **settings))
+        client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return client
+    return factory
@@ -0,0 +1,112 @@
+"""Tests for the streaming aggregates behind aggregate_records."""
+
+import random
+
+import pytest
+
+from netapp_mcp_server.mcp_server import GroupStats, TDigest, TopK
+
+
+class TestTDigest:
+    """Tests for TDigest."""
+
+    def test_empty(self):
+        assert TDigest().quantile(0.5) is None
+
+    def test_single_value(self):
+        digest = TDigest()
+        digest.add(42)
+
+        assert digest.quantile(0) == digest.quantile(0.5) == digest.quantile(1) == 42
+
+    def test_exact_extremes(self):
+        digest = TDigest()
+        for value in range(1, 1001):
+            digest.add(value)
+
+        assert digest.quantile(0) == 1
+        assert digest.quantile(1) == 1000
+
+    @pytest.mark.parametrize("q", [0.5, 0.9, 0.99])
+    def test_quantiles_close_to_exact(self, q):
+        """Test the estimate against the exact quantile of a skewed distribution."""
+        rng = random.Random(7)
+        values = [rng.expovariate(1 / 50) for _ in range(20000)]
+        digest = TDigest()
+        for value in values:
+            digest.add(value)
+        exact = sorted(values)[int(q * len(values))]
+
+        assert digest.quantile(q) == pytest.approx(exact, rel=0.03)
+
+    def test_memory_is_bounded(self):
+        digest = TDigest(compression=50)
+        for value in range(100000):
+            digest.add(value)
+        digest.quantile(0.5)
+
+        assert digest.count == 100000
+        assert len(digest._centroids) < 500
+
+
+class TestTopK:
+    """Tests for TopK."""
+
+    def test_largest(self):
+        top = TopK(3)
+        for value in [5, 1, 9, 7, 3, 8]:
+            top.push(value, f"item{value}")
+
+        assert top.items() == ["item9", "item8", "item7"]
+
+    def test_smallest(self):
+        top = TopK(2, largest=False)
+        for value in [5, 1, 9, 3]:
+            top.push(value, value)
+
+        assert top.items() == [1, 3]
+
+    def test_first_of_equal_values_is_kept(self):
+        """Test ties without comparing the (unorderable) items."""
+        top = TopK(2)
+        for name in ["a", "b", "c"]:
+            top.push(1, {"name": name})
+
+        assert top.items() == [{"name": "a"}, {"name": "b"}]
+
+    def test_accepts(self):
+        top = TopK(1)
+        top.push(5, "five")
+
+        assert top.accepts(6)
+        assert not top.accepts(5)
+        assert not TopK(0).accepts(100)
+
+
+class TestGroupStats:
+    """Tests for GroupStats."""
+
+    def test_summary(self):
+        stats = GroupStats(top_n=2, largest=True, track_percentiles=True)
+        for value in [10, None, 30, 20]:
+            stats.add(value)
+            stats.top.push(value or 0, value)
+
+        summary = stats.summary([50])
+
+        assert summary["count"] == 4
+        assert (summary["sum"], summary["min"], summary["max"], summary["mean"]) == (60, 10, 30, 20)
+        assert summary["percentiles"] == {"p50": 20}
+        assert summary["top"] == [30, 20]
+
+    def test_without_values(self):
+        stats = GroupStats(top_n=0, largest=True, track_percentiles=True)
+        stats.add(None)
+
+        assert stats.summary([50]) == {"count": 1}
+
+    def test_percentiles_are_optional(self):
+        stats = GroupStats(top_n=0, largest=True, track_percentiles=False)
+        stats.add(1)
+
+        assert "percentiles" not in stats.summary([50])
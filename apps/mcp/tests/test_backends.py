@@ -0,0 +1,129 @@
+"""Tests for session connections and named backends."""
+
+import gc
+
+import httpx
+import pytest
+
+from netapp_mcp_server import mcp_server
+from netapp_mcp_server.mcp_server import (
+    STATELESS_REFUSAL, NetAppClient, bind_client, configure_netapp_connection, get_backends, get_client,
+    register_netapp_backend
+)
+
+
+class Session:
+    """Stands in for an MCP session."""
+
+
+@pytest.fixture
+def session(monkeypatch):
+    """Make tool calls run in a session the test can switch."""
+    state = {"session": Session()}
+    monkeypatch.setattr(mcp_server, "current_session", lambda: state["session"])
+    return state
+
+
+@pytest.fixture
+def api(monkeypatch):
+    """Answer the requests of every client with a cluster list."""
+    def http(self):
+        if self._http is None:
+            self._http = httpx.AsyncClient(transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, json={"records": [], "num_records": 0})
+            ))
+        return self._http
+
+    monkeypatch.setattr(NetAppClient, "http", property(http))
+
+
+@pytest.fixture
+def federation(make_client, monkeypatch):
+    """Two backends configured with NETAPP_BACKENDS."""
+    clients = {name: make_client(None, base_url=f"https://{name}.example.com/api") for name in ("emea", "us")}
+    monkeypatch.setattr(mcp_server, "_backends", clients)
+    return clients
+
+
+class TestSessionConnection:
+    """Tests for the connection a session binds."""
+
+    def test_bound_connection_joins_named_backends(self, session, federation, make_client):
+        own = make_client(None, base_url="https://own.example.com/api")
+        bind_client(own)
+
+        assert get_backends() == {**federation, "default": own}
+        assert get_client() is own
+
+    def test_single_object_tools_need_a_backend_name(self, session, federation):
+        with pytest.raises(ValueError, match="emea, us"):
+            get_client()
+
+        assert get_client("us") is federation["us"]
+
+    def test_single_backend_needs_no_name(self, session, federation):
+        del federation["us"]
+
+        assert get_client() is federation["emea"]
+
+    def test_environment_connection(self, session, monkeypatch):
+        monkeypatch.setenv("NETAPP_BASE_URL", "https://um.example.com/api")
+        monkeypatch.setenv("NETAPP_USERNAME", "monitor")
+        monkeypatch.setenv("NETAPP_PASSWORD", "secret")
+
+        client = get_client()
+
+        assert get_backends() == {"default": client}
+        assert client.base_url == "https://um.example.com/api"
+
+    def test_not_configured(self, session):
+        with pytest.raises(RuntimeError, match="not configured"):
+            get_client()
+
+
+class TestRegisterBackend:
+    """Tests for register_netapp_backend."""
+
+    @pytest.mark.asyncio
+    async def test_backend_is_scoped_to_the_session(self, session, api, federation):
+        result = await register_netapp_backend("lab", "https://lab.example.com/api", "admin", "secret")
+        lab = get_backends(["lab"])["lab"]
+
+        assert result == "Registered backend lab at https://lab.example.com/api for this session"
+        assert [*get_backends()] == ["emea", "us", "lab"]
+
+        session["session"] = Session()
+        assert [*get_backends()] == ["emea", "us"]
+        with pytest.raises(ValueError, match="lab"):
+            get_backends(["lab"])
+
+        gc.collect()
+        assert mcp_server.registry._refs[mcp_server.registry.key_for(lab.config)] == 0
+
+    @pytest.mark.asyncio
+    async def test_configured_names_are_reserved(self, session, api, federation):
+        for name in ("default", "emea"):
+            result = await register_netapp_backend(name, "https://lab.example.com/api", "admin", "secret")
+
+            assert result == f"Backend name {name} is reserved by the server configuration"
+        assert get_backends() == federation
+
+
+class TestStatelessHttp:
+    """Tests for the session tools on a stateless server."""
+
+    @pytest.mark.asyncio
+    async def test_session_connections_are_refused(self, session, api, monkeypatch):
+        monkeypatch.setattr(mcp_server.mcp.settings, "stateless_http", True)
+
+        assert await configure_netapp_connection("https://um.example.com/api", "admin", "secret") == STATELESS_REFUSAL
+        assert await register_netapp_backend("lab", "https://lab.example.com/api", "admin", "secret") == STATELESS_REFUSAL
+        with pytest.raises(RuntimeError, match="not configured"):
+            get_backends()
+
+    @pytest.mark.asyncio
+    async def test_stateful_connection(self, session, api):
+        result = await configure_netapp_connection("https://um.example.com/api", "admin", "secret")
+
+        assert result == "Successfully connected to NetApp ActiveIQ at https://um.example.com/api"
+        assert get_client().config.username == "admin"
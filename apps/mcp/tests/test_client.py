@@ -0,0 +1,226 @@
+"""Tests for NetAppClient paging, the client registry and fan-out."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from netapp_mcp_server import mcp_server
+from netapp_mcp_server.mcp_server import ClientRegistry, NetAppConfig, fan_out
+
+
+def _config(**settings):
+    return NetAppConfig(**{"base_url": "https://um.example.com/api", "username": "monitor", "password": "secret", **settings})
+
+
+async def _collect(client, endpoint, page_size):
+    return [record async for record in client.iter_records(endpoint, page_size=page_size)]
+
+
+class TestIterRecords:
+    """Tests for NetAppClient.iter_records."""
+
+    TOTAL = 25
+
+    def _page(self, request, page_cap, meta):
+        """At most ``page_cap`` records per page, whatever max_records asked for."""
+        offset = int(request.url.params["offset"])
+        limit = min(int(request.url.params["max_records"]), page_cap)
+        records = [{"id": i} for i in range(offset, min(offset + limit, self.TOTAL))]
+        return httpx.Response(200, json={"records": records, "num_records": len(records), **meta(offset + len(records))})
+
+    @pytest.mark.asyncio
+    async def test_short_pages_before_total_records(self, make_client):
+        """Test that a page capped below max_records does not end the collection."""
+        client = make_client(lambda request: self._page(request, 4, lambda end: {"total_records": self.TOTAL}))
+
+        records = await _collect(client, "/datacenter/storage/volumes", page_size=10)
+
+        assert [r["id"] for r in records] == list(range(self.TOTAL))
+
+    @pytest.mark.asyncio
+    async def test_short_pages_with_next_links(self, make_client):
+        def meta(end):
+            return {"_links": {"next": {"href": f"/api/x?offset={end}"}}} if end < self.TOTAL else {"_links": {"self": {}}}
+
+        client = make_client(lambda request: self._page(request, 4, meta))
+
+        records = await _collect(client, "/datacenter/storage/volumes", page_size=10)
+
+        assert [r["id"] for r in records] == list(range(self.TOTAL))
+
+    @pytest.mark.asyncio
+    async def test_short_page_ends_without_total_or_links(self, make_client):
+        offsets = []
+
+        def handler(request):
+            offsets.append(int(request.url.params["offset"]))
+            return self._page(request, 100, lambda end: {})
+
+        records = await _collect(make_client(handler), "/datacenter/storage/volumes", page_size=10)
+
+        assert len(records) == self.TOTAL
+        assert offsets == [0, 10, 20]
+
+    @pytest.mark.asyncio
+    async def test_stops_at_total_records(self, make_client):
+        offsets = []
+
+        def handler(request):
+            offsets.append(int(request.url.params["offset"]))
+            return self._page(request, 100, lambda end: {"total_records": 20})
+
+        records = await _collect(make_client(handler), "/datacenter/storage/volumes", page_size=10)
+
+        assert len(records) == 20
+        assert offsets == [0, 10]
+
+
+class TestThrottling:
+    """Tests for throttled responses in NetAppClient."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("headers", [{}, {"Retry-After": "0"}])
+    async def test_retries_back_off_without_retry_after(self, make_client, headers):
+        """Test that retries after a 429 without a usable Retry-After are spaced out."""
+        sent = []
+
+        def handler(request):
+            sent.append(time.monotonic())
+            return httpx.Response(429, headers=headers) if len(sent) < 4 else httpx.Response(200, json={"ok": True})
+
+        assert await make_client(handler)._make_request("GET", "/admin/system") == {"ok": True}
+        gaps = [later - earlier for earlier, later in zip(sent, sent[1:])]
+        assert len(gaps) == 3
+        assert all(gap >= mcp_server.BACKOFF_BASE / 2 for gap in gaps)
+
+
+class TestClientRegistry:
+    """Tests for ClientRegistry."""
+
+    def test_same_connection_is_shared(self):
+        registry = ClientRegistry()
+
+        first = registry.acquire(_config())
+        second = registry.acquire(_config())
+
+        assert first is second
+
+    def test_users_get_their_own_client(self):
+        registry = ClientRegistry()
+
+        assert registry.acquire(_config()) is not registry.acquire(_config(username="admin"))
+
+    def test_idle_client_is_closed(self):
+        registry = ClientRegistry(idle_timeout=0)
+        client = registry.acquire(_config())
+
+        registry.release(client)
+        registry.evict_idle()
+
+        assert registry.acquire(_config()) is not client
+
+    def test_held_client_is_kept(self):
+        registry = ClientRegistry(idle_timeout=0)
+        client = registry.acquire(_config())
+        registry.acquire(_config())
+
+        registry.release(client)
+        registry.evict_idle()
+
+        assert registry.acquire(_config()) is client
+
+    def test_trailing_slash_is_the_same_connection(self):
+        registry = ClientRegistry()
+
+        assert registry.acquire(_config()) is registry.acquire(_config(base_url="https://um.example.com/api/"))
+
+    @pytest.mark.parametrize("settings", [{"timeout": 60}, {"verify_ssl": False}, {"password": "rotated"}])
+    def test_other_settings_get_their_own_client(self, settings):
+        """Test that a session is not refused when the shared client is in use."""
+        registry = ClientRegistry()
+        shared = registry.acquire(_config())
+
+        own = registry.acquire(_config(**settings))
+
+        assert own is not shared
+        assert own.config == _config(**settings)
+        assert shared.config == _config()
+        assert registry.acquire(_config()) is shared
+
+    def test_unshared_client_is_closed_on_release(self):
+        async def main():
+            registry = ClientRegistry()
+            registry.acquire(_config())
+            own = registry.acquire(_config(password="rotated"))
+            http = own.http
+
+            registry.release(own)
+            await asyncio.gather(*registry._closing)
+            return http
+
+        assert asyncio.run(main()).is_closed
+
+    def test_new_password_applies_to_idle_client(self):
+        registry = ClientRegistry()
+        client = registry.acquire(_config())
+        registry.release(client)
+
+        assert registry.acquire(_config(password="rotated")) is client
+        assert client.auth == ("monitor", "rotated")
+
+
+class TestFanOut:
+    """Tests for fan_out."""
+
+    @pytest.fixture
+    def backends(self, make_client, monkeypatch):
+        def answer(name, total):
+            def handler(request):
+                if name == "apac":
+                    return httpx.Response(500, json={"error": "down"})
+                return httpx.Response(200, json={
+                    "records": [{"name": f"{name}-{i}", "size": i * 10 + len(name)} for i in range(3)],
+                    "total_records": total,
+                })
+            return handler
+
+        clients = {name: make_client(answer(name, total), base_url=f"https://{name}.example.com/api")
+                   for name, total in [("emea", 3), ("us", 30), ("apac", 0)]}
+        monkeypatch.setattr(mcp_server, "_backends", clients)
+        return clients
+
+    @pytest.mark.asyncio
+    async def test_records_are_merged_and_sorted(self, backends):
+        result = await fan_out("/datacenter/storage/volumes", {"order_by": "size desc", "max_records": 4})
+
+        assert [r["name"] for r in result["records"]] == ["emea-2", "us-2", "emea-1", "us-1"]
+        assert result["records"][0]["source"] == "emea"
+        assert result["sources"]["us"]["total_records"] == 30
+        assert result["errors"] == {"apac": "HTTP 500"}
+
+    @pytest.mark.asyncio
+    async def test_backends_can_be_selected(self, backends):
+        result = await fan_out("/datacenter/storage/volumes", backends=["us"])
+
+        assert {r["source"] for r in result["records"]} == {"us"}
+        assert "errors" not in result
+
+    @pytest.mark.asyncio
+    async def test_unknown_backend(self, backends):
+        with pytest.raises(ValueError, match="nowhere"):
+            await fan_out("/datacenter/storage/volumes", backends=["nowhere"])
+
+    @pytest.mark.asyncio
+    async def test_slow_backend_times_out(self, backends, make_client):
+        async def slow(request):
+            await asyncio.sleep(1)
+            return httpx.Response(200, json={"records": []})
+
+        backends["apac"] = make_client(slow)
+
+        result = await fan_out("/datacenter/storage/volumes", timeout=0.05)
+
+        assert result["errors"] == {"apac": "timed out after 0.05s"}
+        assert {r["source"] for r in result["records"]} == {"emea", "us"}
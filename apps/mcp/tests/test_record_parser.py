@@ -0,0 +1,57 @@
+"""Tests for incremental parsing of list responses."""
+
+import json
+
+import pytest
+
+from netapp_mcp_server.mcp_server import RecordParser
+
+
+def _chunks(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestRecordParser:
+    """Tests for RecordParser."""
+
+    DOCUMENT = {
+        "records": [{"name": f"vol{i}", "size": i * 1.5, "comment": "é ] } \""} for i in range(50)],
+        "total_records": 12345,
+        "_links": {"next": {"href": "/api/next"}},
+    }
+
+    @pytest.mark.parametrize("size", [1, 7, 64, 100000])
+    def test_any_chunking(self, size):
+        """Test that records and metadata survive arbitrary chunk boundaries."""
+        parser = RecordParser()
+        records = []
+        for chunk in _chunks(json.dumps(self.DOCUMENT).encode(), size):
+            records.extend(parser.feed(chunk))
+        records.extend(parser.close())
+
+        assert records == self.DOCUMENT["records"]
+        assert parser.meta == {"total_records": 12345, "_links": {"next": {"href": "/api/next"}}}
+
+    @pytest.mark.parametrize("chunks", [
+        [b'{"records": [1.5, 12.', b'5, 3]}'],
+        [b'{"records": [2, 1e', b'3]}'],
+        [b'{"records": [], "ratio": 0.', b'25}'],
+    ])
+    def test_number_split_across_chunks(self, chunks):
+        """Test that a number is not taken before its last digit arrived."""
+        parser = RecordParser()
+        records = []
+        for chunk in chunks:
+            records.extend(parser.feed(chunk))
+        records.extend(parser.close())
+        expected = json.loads(b"".join(chunks))
+
+        assert records == expected.pop("records")
+        assert parser.meta == expected
+
+    def test_truncated(self):
+        parser = RecordParser()
+        parser.feed(b'{"records": [{"name": "a"}')
+
+        with pytest.raises(ValueError):
+            parser.close()
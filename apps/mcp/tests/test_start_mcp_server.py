@@ -0,0 +1,158 @@
+"""Tests for the HTTP server settings and startup of start_mcp_server."""
+
+import asyncio
+
+import httpx
+import pytest
+from mcp.server.fastmcp import FastMCP
+from mcp.server.transport_security import TransportSecurityMiddleware
+
+from netapp_mcp_server import mcp_server
+from netapp_mcp_server.start_mcp_server import (
+    ConcurrencyLimitMiddleware, Readiness, add_health_routes, parse_args, transport_security
+)
+
+
+def _middleware(*argv):
+    return TransportSecurityMiddleware(transport_security(parse_args(["--transport", "streamable-http", *argv])))
+
+
+class TestTransportSecurity:
+    """Tests for DNS rebinding protection."""
+
+    def test_localhost_only_by_default(self):
+        middleware = _middleware("--host", "0.0.0.0")
+
+        assert middleware.settings.enable_dns_rebinding_protection
+        assert middleware._validate_host("localhost:8080")
+        assert middleware._validate_host("[::1]:8080")
+        assert not middleware._validate_host("attacker.example.com")
+
+    def test_allowed_hosts(self, monkeypatch):
+        monkeypatch.setenv("MCP_ALLOWED_HOSTS", "netapp-mcp.example.com, mcp.internal:8443")
+        middleware = _middleware()
+
+        assert middleware._validate_host("netapp-mcp.example.com")
+        assert middleware._validate_host("netapp-mcp.example.com:443")
+        assert middleware._validate_host("mcp.internal:8443")
+        assert not middleware._validate_host("mcp.internal:9000")
+        assert not middleware._validate_host("attacker.example.com")
+
+    def test_origins_follow_hosts(self):
+        middleware = _middleware("--allowed-hosts", "netapp-mcp.example.com")
+
+        assert middleware._validate_origin("https://netapp-mcp.example.com")
+        assert middleware._validate_origin("http://localhost:3000")
+        assert not middleware._validate_origin("https://attacker.example.com")
+
+    def test_explicit_origins(self):
+        middleware = _middleware("--allowed-hosts", "netapp-mcp.example.com", "--allowed-origins", "https://console.example.com")
+
+        assert middleware._validate_origin("https://console.example.com")
+        assert not middleware._validate_origin("https://netapp-mcp.example.com")
+
+    def test_check_can_be_turned_off(self):
+        assert not transport_security(parse_args(["--allowed-hosts", "*"])).enable_dns_rebinding_protection
+
+
+def test_sessions_are_stateful_by_default(monkeypatch):
+    monkeypatch.delenv("MCP_STATELESS_HTTP", raising=False)
+
+    assert not parse_args([]).stateless
+
+
+class TestReadiness:
+    """Tests for /readyz and the warm-up behind it."""
+
+    @pytest.mark.asyncio
+    async def test_ready_after_warm_up(self):
+        server = FastMCP("test")
+        readiness = Readiness()
+        add_health_routes(server, readiness)
+        release = asyncio.Event()
+
+        async def warm_up(timeout):
+            await release.wait()
+            return {"default": "ok"}
+
+        task = asyncio.create_task(readiness.run(warm_up, 1))
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(server.streamable_http_app()), base_url="http://localhost") as http:
+            warming = await http.get("/readyz")
+            assert (await http.get("/healthz")).status_code == 200
+            release.set()
+            await task
+            ready = await http.get("/readyz")
+
+        assert warming.status_code == 503
+        assert warming.json()["status"] == "warming up"
+        assert ready.status_code == 200
+        assert ready.json() == {"status": "ready", "backends": {"default": "ok"}}
+
+    @pytest.mark.asyncio
+    async def test_failed_warm_up_still_becomes_ready(self):
+        readiness = Readiness()
+
+        async def warm_up(timeout):
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await readiness.run(warm_up, 1)
+
+        assert readiness.ready
+
+    @pytest.mark.asyncio
+    async def test_warm_up_reports_failing_backends(self, monkeypatch, make_client):
+        async def slow(request):
+            await asyncio.sleep(1)
+            return httpx.Response(200, json={})
+
+        clients = {
+            "up": make_client(lambda request: httpx.Response(200, json={"records": [], "num_records": 0})),
+            "denied": make_client(lambda request: httpx.Response(401, json={"error": {"message": "bad credentials"}})),
+            "slow": make_client(slow),
+        }
+        monkeypatch.setattr(mcp_server, "_backends", clients)
+
+        status = await mcp_server.warm_up(timeout=0.05)
+
+        assert status["up"] == "ok"
+        assert "401" in status["denied"]
+        assert status["slow"] == "timed out after 0.05s"
+
+    @pytest.mark.asyncio
+    async def test_warm_up_without_backends(self):
+        assert await mcp_server.warm_up() == {}
+
+
+class TestConcurrencyLimit:
+    """Tests for ConcurrencyLimitMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_posts_wait_for_a_slot_and_gets_do_not(self):
+        release = asyncio.Event()
+        active = {"POST": 0, "GET": 0}
+        peak = 0
+
+        async def app(scope, receive, send):
+            nonlocal peak
+            active[scope["method"]] += 1
+            peak = max(peak, active["POST"])
+            if scope["method"] == "POST":
+                await release.wait()
+            active[scope["method"]] -= 1
+
+        middleware = ConcurrencyLimitMiddleware(app, limit=2)
+
+        def call(method):
+            return asyncio.create_task(middleware({"type": "http", "method": method}, None, None))
+
+        posts = [call("POST") for _ in range(5)]
+        await asyncio.sleep(0.01)
+        assert active["POST"] == 2
+
+        await asyncio.wait_for(call("GET"), 1)
+        release.set()
+        await asyncio.gather(*posts)
+
+        assert peak == 2
+        assert active == {"POST": 0, "GET": 0}
@@ -0,0 +1,128 @@
+"""Decode throughput of the JSON backends on realistic list responses.
+
+Usage:
+    python benchmarks/bench_json.py [--records 1000 10000] [--repeat 5]
+
+Every available backend decodes the same /datacenter/storage/volumes and
+/management-server/events pages; missing optional backends are skipped.
+"""
+
+import argparse
+import json
+import random
+import time
+
+from netapp_cli.utils.jsonstream import RecordParser
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+    import structs
+except ImportError:
+    msgspec = None
+
+
+def make_volume(i: int) -> dict:
+    """A volume record shaped like ActiveIQ Unified Manager returns it."""
+    cluster = i % 8
+    size = random.randint(1, 1024) * 1024 ** 3
+    used = int(size * random.random())
+    return {
+        "key": f"4c6bf721-2e3f-11e9-a3e2-00a0985badbb:type=volume,uuid={i:08x}-1111-2222-3333-444455556666",
+        "uuid": f"{i:08x}-1111-2222-3333-444455556666",
+        "name": f"vol_prod_app{i % 50:02d}_data_{i:05d}",
+        "state": "online",
+        "style": "flexvol",
+        "type": "rw",
+        "size": size,
+        "space": {"size": size, "used": used, "available": size - used},
+        "svm": {"key": f"svm-key-{i % 40}", "uuid": f"svm-uuid-{i % 40}", "name": f"svm{i % 40}",
+                "_links": {"self": {"href": f"/api/datacenter/svm/svms/svm-key-{i % 40}"}}},
+        "cluster": {"key": f"cluster-key-{cluster}", "uuid": f"cluster-uuid-{cluster}", "name": f"cluster{cluster}",
+                    "_links": {"self": {"href": f"/api/datacenter/cluster/clusters/cluster-key-{cluster}"}}},
+        "aggregates": [{"key": f"aggr-key-{i % 16}", "uuid": f"aggr-uuid-{i % 16}", "name": f"aggr{i % 16}"}],
+        "qos": {"policy": {"name": "extreme", "key": "qos-key-1"}},
+        "language": "c.utf_8",
+        "snapshot_policy": {"name": "default", "key": "policy-key-1"},
+        "_links": {"self": {"href": f"/api/datacenter/storage/volumes/{i:08x}"}},
+    }
+
+
+def make_event(i: int) -> dict:
+    """An event record shaped like /management-server/events returns it."""
+    return {
+        "key": str(100000 + i),
+        "name": random.choice(["Volume Space Nearly Full", "Aggregate Space Full", "Node Down", "Volume Offline"]),
+        "severity": random.choice(["critical", "error", "warning", "information"]),
+        "state": random.choice(["new", "acknowledged", "resolved"]),
+        "impact_level": "incident",
+        "impact_area": "capacity",
+        "message": f"Volume vol_{i:05d} is {random.randint(80, 99)}% full. Threshold of 80% breached.",
+        "create_time": "2024-05-01T10:%02d:%02d+00:00" % (i % 60, i % 60),
+        "source": {"key": f"vol-key-{i}", "name": f"vol_{i:05d}", "resource_type": "volume"},
+        "cluster": {"key": f"cluster-key-{i % 8}", "name": f"cluster{i % 8}"},
+        "_links": {"self": {"href": f"/api/management-server/events/{100000 + i}"}},
+    }
+
+
+def make_page(factory, count: int) -> bytes:
+    records = [factory(i) for i in range(count)]
+    return json.dumps({"records": records, "num_records": count, "total_records": count}).encode()
+
+
+def stream_decode(data: bytes):
+    parser = RecordParser()
+    records = []
+    for offset in range(0, len(data), 64 * 1024):
+        records.extend(parser.feed(data[offset:offset + 64 * 1024]))
+    records.extend(parser.close())
+    return records
+
+
+def decoders(record_type):
+    yield "json.loads", json.loads
+    yield "jsonstream", stream_decode
+    if orjson is not None:
+        yield "orjson.loads", orjson.loads
+    if msgspec is not None:
+        yield "msgspec (dict)", msgspec.json.decode
+        yield "msgspec (structs)", lambda data: structs.decode_page(data, record_type)
+
+
+def bench(func, data: bytes, repeat: int) -> float:
+    """Best time of ``repeat`` runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(data)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    random.seed(0)
+    kinds = [("volumes", make_volume, "Volume"), ("events", make_event, "Event")]
+    print(f"{'fixture':<16} {'backend':<20} {'ms':>9} {'MB/s':>8} {'records/s':>12}")
+    for count in args.records:
+        for kind, factory, type_name in kinds:
+            data = make_page(factory, count)
+            record_type = getattr(structs, type_name) if msgspec is not None else None
+            for name, func in decoders(record_type):
+                seconds = bench(func, data, args.repeat)
+                print(
+                    f"{kind + ' ' + str(count):<16} {name:<20} {seconds * 1000:>9.2f} "
+                    f"{len(data) / seconds / 1e6:>8.1f} {count / seconds:>12,.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
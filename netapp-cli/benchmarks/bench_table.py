@@ -0,0 +1,91 @@
+"""Table rendering throughput of OutputFormatter.
+
+Usage:
+    python benchmarks/bench_table.py [--records 10000 100000] [--repeat 3] [--no-render]
+
+Measures cell extraction alone (per-cell dotted lookup as before, compiled
+accessors on dicts, compiled accessors on compact records) and a full rich
+table render into memory.
+"""
+
+import argparse
+import io
+import random
+import time
+
+from bench_json import make_volume
+
+from netapp_cli.models.records import Volume
+from netapp_cli.utils import output
+from netapp_cli.utils.output import OutputFormatter
+
+HEADERS = ["name", "svm.name", "uuid", "size", "state", "style", "cluster.name", "space.used"]
+
+
+def split_per_cell(records, headers):
+    """Cell extraction as _output_table did it before accessors were compiled."""
+    rows = []
+    for item in records:
+        row = []
+        for header in headers:
+            value = item
+            for key in header.split("."):
+                if isinstance(value, dict) and key in value:
+                    value = value[key]
+                else:
+                    value = None
+                    break
+            row.append(str(value) if value is not None else "")
+        rows.append(row)
+    return rows
+
+
+def compiled(records, headers):
+    return list(OutputFormatter("table")._table_rows(records, headers))
+
+
+def render(records, headers):
+    OutputFormatter("table").format_output(records, title="Volumes", headers=headers)
+
+
+def bench(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-render", action="store_true", help="Skip the full rich render")
+    args = parser.parse_args()
+
+    random.seed(0)
+    # Render into memory instead of the terminal
+    output.console.file = io.StringIO()
+    output.console.width = 200
+
+    print(f"{'records':>8} {'method':<28} {'ms':>10} {'rows/s':>12}")
+    for count in args.records:
+        dicts = [make_volume(i) for i in range(count)]
+        records = Volume.from_records(dicts)
+        cases = [
+            ("split per cell (dicts)", lambda: split_per_cell(dicts, HEADERS)),
+            ("compiled accessors (dicts)", lambda: compiled(dicts, HEADERS)),
+            ("compiled accessors (records)", lambda: compiled(records, HEADERS)),
+        ]
+        if not args.no_render:
+            cases.append(("rich render (records)", lambda: render(records, HEADERS)))
+
+        for name, func in cases:
+            seconds = bench(func, args.repeat)
+            output.console.file = io.StringIO()
+            print(f"{count:>8} {name:<28} {seconds * 1000:>10.1f} {count / seconds:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
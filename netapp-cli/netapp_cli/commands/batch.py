@@ -0,0 +1,151 @@
+"""Batch execution of CLI commands."""
+
+import shlex
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import click
+
+from netapp_cli.utils.api_client import enable_shared_sessions
+from netapp_cli.utils.output import OutputFormatter
+
+# Lines consisting of this word separate groups that must not overlap
+# when running with --parallel.
+BARRIER = "wait"
+
+
+def parse_batch(lines):
+    """Parse batch lines into ``(line_number, args)`` groups.
+
+    Blank lines and ``#`` comments are ignored and a leading ``netapp`` is
+    optional. A line containing only ``wait`` ends the current group.
+    Raises click.BadParameter on lines that cannot be tokenized.
+    """
+    groups = [[]]
+    for number, line in enumerate(lines, start=1):
+        try:
+            args = shlex.split(line, comments=True)
+        except ValueError as e:
+            raise click.BadParameter(f"line {number}: {e}")
+        if not args:
+            continue
+        if args == [BARRIER]:
+            if groups[-1]:
+                groups.append([])
+            continue
+        if args[0] == "netapp":
+            args = args[1:]
+        if args and args[0] == "batch":
+            raise click.BadParameter(f"line {number}: nested batch is not supported")
+        if args:
+            groups[-1].append((number, args))
+    return [group for group in groups if group]
+
+
+def _run_line(cli, number, args, global_args, shared_obj):
+    """Run one command line, returning its report row."""
+    started = time.time()
+    status, message = "ok", ""
+    try:
+        result = cli.main(
+            global_args + args,
+            prog_name="netapp",
+            standalone_mode=False,
+            obj=dict(shared_obj)
+        )
+        if isinstance(result, int) and result != 0:
+            status, message = "failed", f"exit code {result}"
+    except click.Abort:
+        status, message = "failed", "aborted"
+    except click.ClickException as e:
+        e.show()
+        status, message = "failed", e.format_message()
+    except Exception as e:  # Keep going: one broken line must not end the batch
+        status, message = "failed", f"{type(e).__name__}: {e}"
+
+    return {
+        "line": number,
+        "command": shlex.join(args),
+        "status": status,
+        "duration": f"{time.time() - started:.2f}s",
+        "message": message,
+    }
+
+
+@click.command()
+@click.argument("script", type=click.File("r"), default="-")
+@click.option("--parallel", default=1, type=click.IntRange(1, 32), help="Run up to N lines of a group concurrently")
+@click.option("--stop-on-error", is_flag=True, help="Stop at the first failing line (or group with --parallel)")
+@click.pass_context
+def batch(ctx, script, parallel, stop_on_error):
+    """Run CLI commands from SCRIPT (or stdin) in one process.
+
+    Each line is a CLI invocation, with or without the leading 'netapp'.
+    All lines share the configuration, API sessions and caches, avoiding
+    interpreter startup and TLS setup per line. Global options given to
+    batch (-o, -v) apply to every line.
+
+    With --parallel, lines run concurrently; put 'wait' on its own line to
+    make later lines wait until everything above has finished. Output of
+    concurrent lines may interleave.
+
+    Example:
+    netapp batch nightly.txt --parallel 4
+    """
+    from netapp_cli.main import cli
+
+    formatter = OutputFormatter(ctx.obj["output_format"], ctx.obj["verbose"])
+    config = ctx.obj["config"]
+
+    try:
+        groups = parse_batch(script)
+    except click.BadParameter as e:
+        formatter.error(f"Invalid batch script: {e.message}")
+        raise click.Abort()
+
+    total = sum(len(group) for group in groups)
+    if not total:
+        formatter.warning("No commands to run")
+        return
+
+    enable_shared_sessions(pool_size=max(10, parallel))
+    shared_obj = {"config": config}
+    global_args = ["-o", ctx.obj["output_format"]] + (["-v"] if ctx.obj["verbose"] else [])
+
+    report = []
+    started = time.time()
+    for group in groups:
+        if parallel > 1 and len(group) > 1:
+            with ThreadPoolExecutor(max_workers=parallel) as executor:
+                rows = executor.map(lambda item: _run_line(cli, item[0], item[1], global_args, shared_obj), group)
+                report.extend(rows)
+        else:
+            for number, args in group:
+                report.append(_run_line(cli, number, args, global_args, shared_obj))
+                if stop_on_error and report[-1]["status"] != "ok":
+                    break
+
+        if stop_on_error and any(row["status"] != "ok" for row in report):
+            break
+
+    sys.stdout.flush()
+    failed = [row for row in report if row["status"] != "ok"]
+    skipped = total - len(report)
+
+    if failed or ctx.obj["verbose"]:
+        formatter.format_output(
+            report if ctx.obj["verbose"] else failed,
+            title="Batch Report",
+            headers=["line", "command", "status", "duration", "message"]
+        )
+
+    summary = f"{len(report) - len(failed)} succeeded, {len(failed)} failed"
+    if skipped:
+        summary += f", {skipped} skipped"
+    summary += f" in {time.time() - started:.1f}s"
+
+    if failed:
+        formatter.error(f"Batch finished: {summary}")
+        ctx.exit(1)
+    formatter.success(f"Batch finished: {summary}")
@@ -3,7 +3,9 @@
 import click
 from rich.console import Console
 
+from netapp_cli.models.records import Aggregate, Cluster, Svm
 from netapp_cli.utils.api_client import NetAppAPIClient, NetAppAPIError
+from netapp_cli.utils.inventory import InventoryError, inventory_records, offline_options
 from netapp_cli.utils.output import OutputFormatter
 
 console = Console()
@@ -19,8 +21,9 @@ def cluster():
 @click.option("--name", help="Filter by cluster name")
 @click.option("--uuid", help="Filter by cluster UUID")
 @click.option("--max-records", default=100, help="Maximum number of clusters to return")
+@offline_options
 @click.pass_context
-def list(ctx, name, uuid, max_records):
+def list(ctx, name, uuid, max_records, offline, max_age):
     """List clusters in the datacenter."""
     formatter = OutputFormatter(ctx.obj["output_format"], ctx.obj["verbose"])
     config = ctx.obj["config"]
@@ -38,8 +41,14 @@ def list(ctx, name, uuid, max_records):
         if uuid:
             params["uuid"] = uuid
 
-        formatter.info("Retrieving clusters...")
-        clusters = client.paginate("/datacenter/cluster/clusters", params, max_records)
+        clusters = inventory_records(config, "clusters", offline, max_age, max_records, name=name, uuid=uuid)
+        if clusters is None:
+            formatter.info("Retrieving clusters...")
+            clusters = client.paginate("/datacenter/cluster/clusters", params, max_records)
+
+        if clusters and formatter.format_type == "table":
+            # Tables show a few fields; keep only those, in compact records
+            clusters = Cluster.from_records(clusters)
 
         if clusters:
             formatter.format_output(
@@ -51,6 +60,9 @@ def list(ctx, name, uuid, max_records):
         else:
             formatter.warning("No clusters found matching the criteria")
 
+    except InventoryError as e:
+        formatter.error(str(e))
+        raise click.Abort()
     except NetAppAPIError as e:
         formatter.error(f"API Error: {e}")
         raise click.Abort()
@@ -121,8 +133,9 @@ def performance(ctx, cluster, max_records):
 
 @cluster.command()
 @click.option("--max-records", default=100, help="Maximum number of SVMs to return")
+@offline_options
 @click.pass_context
-def svms(ctx, max_records):
+def svms(ctx, max_records, offline, max_age):
     """List SVMs across all clusters."""
     formatter = OutputFormatter(ctx.obj["output_format"], ctx.obj["verbose"])
     config = ctx.obj["config"]
@@ -134,8 +147,14 @@ def svms(ctx, max_records):
     client = NetAppAPIClient(config.netapp, verbose=ctx.obj["verbose"])
 
     try:
-        formatter.info("Retrieving SVMs...")
-        svms = client.paginate("/storage-provider/svms", {"max_records": max_records}, max_records)
+        svms = inventory_records(config, "svms", offline, max_age, max_records)
+        if svms is None:
+            formatter.info("Retrieving SVMs...")
+            svms = client.paginate("/storage-provider/svms", {"max_records": max_records}, max_records)
+
+        if svms and formatter.format_type == "table":
+            # Tables show a few fields; keep only those, in compact records
+            svms = Svm.from_records(svms)
 
         if svms:
             formatter.format_output(
@@ -147,6 +166,9 @@ def svms(ctx, max_records):
         else:
             formatter.warning("No SVMs found")
 
+    except InventoryError as e:
+        formatter.error(str(e))
+        raise click.Abort()
     except NetAppAPIError as e:
         formatter.error(f"API Error: {e}")
         raise click.Abort()
@@ -155,8 +177,9 @@ def svms(ctx, max_records):
 @cluster.command()
 @click.option("--cluster", help="Filter by cluster name")
 @click.option("--max-records", default=100, help="Maximum number of aggregates to return")
+@offline_options
 @click.pass_context
-def aggregates(ctx, cluster, max_records):
+def aggregates(ctx, cluster, max_records, offline, max_age):
     """List aggregates across clusters."""
     formatter = OutputFormatter(ctx.obj["output_format"], ctx.obj["verbose"])
     config = ctx.obj["config"]
@@ -172,8 +195,14 @@ def aggregates(ctx, cluster, max_records):
         if cluster:
             params["cluster.name"] = cluster
 
-        formatter.info("Retrieving aggregates...")
-        aggregates = client.paginate("/datacenter/storage/aggregates", params, max_records)
+        aggregates = inventory_records(config, "aggregates", offline, max_age, max_records, cluster=cluster)
+        if aggregates is None:
+            formatter.info("Retrieving aggregates...")
+            aggregates = client.paginate("/datacenter/storage/aggregates", params, max_records)
+
+        if aggregates and formatter.format_type == "table":
+            # Tables show a few fields; keep only those, in compact records
+            aggregates = Aggregate.from_records(aggregates)
 
         if aggregates:
             formatter.format_output(
@@ -185,6 +214,9 @@ def aggregates(ctx, cluster, max_records):
         else:
             formatter.warning("No aggregates found")
 
+    except InventoryError as e:
+        formatter.error(str(e))
+        raise click.Abort()
     except NetAppAPIError as e:
         formatter.error(f"API Error: {e}")
         raise click.Abort()
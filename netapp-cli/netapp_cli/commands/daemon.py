@@ -0,0 +1,138 @@
+"""Background daemon commands."""
+
+import subprocess
+import sys
+import time
+
+import click
+
+from netapp_cli.utils.daemon import (
+    DEFAULT_IDLE_TIMEOUT,
+    DaemonClient,
+    DaemonUnavailableError,
+    NetAppDaemon,
+    daemon_dir,
+    ping,
+    remove_socket,
+    socket_path,
+)
+from netapp_cli.utils.output import OutputFormatter
+
+SOCKET_OPTION_HELP = "Socket path (default: ~/.netapp-cli/daemon.sock or $NETAPP_DAEMON_SOCKET)"
+
+
+@click.group()
+def daemon():
+    """Background daemon keeping warm API sessions."""
+    pass
+
+
+@daemon.command()
+@click.option("--socket", "socket_file", type=click.Path(dir_okay=False), help=SOCKET_OPTION_HELP)
+@click.option("--idle-timeout", default=DEFAULT_IDLE_TIMEOUT, type=click.IntRange(min=0), help="Exit after this many idle seconds (0 = never)")
+@click.pass_context
+def start(ctx, socket_file, idle_timeout):
+    """Start the daemon in the background.
+
+    While it runs, CLI commands send their API requests through it and reuse
+    its pooled TLS connections. Commands fall back to direct connections
+    when no daemon is running. Set NETAPP_DAEMON=0 to bypass it.
+    """
+    formatter = OutputFormatter(ctx.obj["output_format"], ctx.obj["verbose"])
+    path = click.format_filename(socket_file) if socket_file else str(socket_path())
+
+    status = ping(path)
+    if status:
+        formatter.warning(f"Daemon already running (pid {status.get('pid')})")
+        return
+
+    log_dir = daemon_dir()
+    log_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
+    command = [
+        sys.executable, "-m", "netapp_cli.main", "daemon", "run",
+        "--socket", path, "--idle-timeout", str(idle_timeout)
+    ]
+    with open(log_dir / "daemon.log", "a") as log:
+        subprocess.Popen(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            start_new_session=True,
+            close_fds=True
+        )
+
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        status = ping(path)
+        if status:
+            formatter.success(f"Daemon started (pid {status.get('pid')}, socket {path})")
+            return
+        time.sleep(0.1)
+
+    formatter.error(f"Daemon did not start; see {log_dir / 'daemon.log'}")
+    raise click.Abort()
+
+
+@daemon.command()
+@click.option("--socket", "socket_file", type=click.Path(dir_okay=False), help=SOCKET_OPTION_HELP)
+@click.option("--idle-timeout", default=DEFAULT_IDLE_TIMEOUT, type=click.IntRange(min=0), help="Exit after this many idle seconds (0 = never)")
+@click.pass_context
+def run(ctx, socket_file, idle_timeout):
+    """Run the daemon in the foreground (e.g. under systemd)."""
+    formatter = OutputFormatter(ctx.obj["output_format"], ctx.obj["verbose"])
+    server = NetAppDaemon(socket_file, idle_timeout=idle_timeout)
+
+    formatter.info(f"Daemon listening on {server.path}")
+    try:
+        server.serve()
+    except KeyboardInterrupt:
+        pass
+    except FileExistsError as e:
+        formatter.error(str(e))
+        raise click.Abort()
+    formatter.info("Daemon stopped")
+
+
+@daemon.command()
+@click.option("--socket", "socket_file", type=click.Path(dir_okay=False), help=SOCKET_OPTION_HELP)
+@click.pass_context
+def stop(ctx, socket_file):
+    """Stop the background daemon."""
+    formatter = OutputFormatter(ctx.obj["output_format"], ctx.obj["verbose"])
+    client = DaemonClient(socket_file, timeout=5)
+
+    if not ping(client.path):
+        formatter.warning("Daemon is not running")
+        try:
+            remove_socket(client.path)
+        except FileExistsError as e:
+            formatter.error(str(e))
+            raise click.Abort()
+        return
+
+    try:
+        client.call({"op": "shutdown"})
+    except DaemonUnavailableError:
+        formatter.warning("Daemon is not running")
+        return
+    finally:
+        client.close()
+
+    formatter.success("Daemon stopped")
+
+
+@daemon.command()
+@click.option("--socket", "socket_file", type=click.Path(dir_okay=False), help=SOCKET_OPTION_HELP)
+@click.pass_context
+def status(ctx, socket_file):
+    """Show daemon status."""
+    formatter = OutputFormatter(ctx.obj["output_format"], ctx.obj["verbose"])
+
+    info = ping(socket_file)
+    if not info:
+        formatter.warning("Daemon is not running")
+        ctx.exit(1)
+
+    info.pop("ok", None)
+    formatter.format_output(info, title="NetApp CLI Daemon")
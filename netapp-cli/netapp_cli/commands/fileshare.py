@@ -4,6 +4,7 @@ import click
 from rich.console import Console
 
 from netapp_cli.utils.api_client import NetAppAPIClient, NetAppAPIError
+from netapp_cli.utils.inventory import InventoryError, inventory_records, offline_options
 from netapp_cli.utils.output import OutputFormatter
 
 console = Console()
@@ -19,8 +20,9 @@ def fileshare():
 @click.option("--svm", help="Filter by SVM name")
 @click.option("--name", help="Filter by file share name")
 @click.option("--max-records", default=100, help="Maximum number of file shares to return")
+@offline_options
 @click.pass_context
-def list(ctx, svm, name, max_records):
+def list(ctx, svm, name, max_records, offline, max_age):
     """List file shares in the storage provider."""
     formatter = OutputFormatter(ctx.obj["output_format"], ctx.obj["verbose"])
     config = ctx.obj["config"]
@@ -38,8 +40,10 @@ def list(ctx, svm, name, max_records):
         if name:
             params["name"] = name
 
-        formatter.info("Retrieving file shares...")
-        fileshares = client.paginate("/storage-provider/file-shares", params, max_records)
+        fileshares = inventory_records(config, "fileshares", offline, max_age, max_records, svm=svm, name=name)
+        if fileshares is None:
+            formatter.info("Retrieving file shares...")
+            fileshares = client.paginate("/storage-provider/file-shares", params, max_records)
 
         if fileshares:
             formatter.format_output(
@@ -51,6 +55,9 @@ def list(ctx, svm, name, max_records):
         else:
             formatter.warning("No file shares found matching the criteria")
 
+    except InventoryError as e:
+        formatter.error(str(e))
+        raise click.Abort()
     except NetAppAPIError as e:
         formatter.error(f"API Error: {e}")
         raise click.Abort()
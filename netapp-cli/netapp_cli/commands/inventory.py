@@ -0,0 +1,104 @@
+"""Local inventory snapshot commands."""
+
+import time
+
+import click
+
+from netapp_cli.utils.api_client import NetAppAPIClient, NetAppAPIError
+from netapp_cli.utils.inventory import KINDS, Inventory
+from netapp_cli.utils.output import OutputFormatter, format_duration
+
+
+@click.group()
+def inventory():
+    """Local inventory snapshot for offline queries."""
+    pass
+
+
+@inventory.command()
+@click.option("--kind", "kinds", multiple=True, type=click.Choice(list(KINDS)), help="Object kind to sync (repeatable; default: all)")
+@click.option("--max-age", type=click.IntRange(min=0), help="Skip kinds synced less than SECONDS ago")
+@click.pass_context
+def sync(ctx, kinds, max_age):
+    """Copy the storage inventory into the local database.
+
+    Only changed records are written and records that disappeared are
+    removed, so syncing again is cheap. List commands answer from the
+    snapshot with --offline or --max-age.
+    """
+    formatter = OutputFormatter(ctx.obj["output_format"], ctx.obj["verbose"])
+    config = ctx.obj["config"]
+
+    if not config.is_configured():
+        formatter.error("No NetApp configuration found. Run 'netapp auth configure' first.")
+        raise click.Abort()
+
+    client = NetAppAPIClient(config.netapp, verbose=ctx.obj["verbose"])
+    store = Inventory.for_config(config)
+
+    def report(result):
+        if result.skipped:
+            formatter.progress_update(f"{KINDS[result.kind].title}: up to date, skipped")
+        else:
+            formatter.progress_update(
+                f"{KINDS[result.kind].title}: {result.count} in {result.duration:.1f}s"
+            )
+
+    try:
+        formatter.info(f"Syncing inventory of {config.netapp.host}...")
+        results = store.sync(client, kinds or None, max_age=max_age, on_result=report)
+    except NetAppAPIError as e:
+        formatter.error(f"API Error: {e}")
+        raise click.Abort()
+
+    formatter.format_output(
+        [
+            {
+                "kind": result.kind,
+                "records": result.count,
+                "added": result.added,
+                "updated": result.updated,
+                "removed": result.removed,
+                "status": "skipped" if result.skipped else "synced",
+            }
+            for result in results
+        ],
+        title="Inventory Sync",
+        headers=["kind", "records", "added", "updated", "removed", "status"]
+    )
+    formatter.success(f"Inventory synced to {store.path}")
+
+
+@inventory.command()
+@click.pass_context
+def status(ctx):
+    """Show when each kind was last synced."""
+    formatter = OutputFormatter(ctx.obj["output_format"], ctx.obj["verbose"])
+    config = ctx.obj["config"]
+
+    if not config.is_configured():
+        formatter.error("No NetApp configuration found. Run 'netapp auth configure' first.")
+        raise click.Abort()
+
+    rows = Inventory.for_config(config).status(config.netapp.host)
+    for row in rows:
+        row["synced_at"] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(row["synced_at"])) if row["synced_at"] else "never"
+        row["age"] = format_duration(int(row["age"])) if row["age"] is not None else ""
+
+    formatter.format_output(rows, title=f"Inventory of {config.netapp.host}", headers=["kind", "count", "synced_at", "age"])
+
+
+@inventory.command()
+@click.option("--all-hosts", is_flag=True, help="Clear the records of every host")
+@click.pass_context
+def clear(ctx, all_hosts):
+    """Delete the local inventory snapshot."""
+    formatter = OutputFormatter(ctx.obj["output_format"], ctx.obj["verbose"])
+    config = ctx.obj["config"]
+
+    if not all_hosts and not config.is_configured():
+        formatter.error("No NetApp configuration found. Run 'netapp auth configure' first.")
+        raise click.Abort()
+
+    Inventory.for_config(config).clear(None if all_hosts else config.netapp.host)
+    formatter.success("Inventory cleared")
@@ -2,8 +2,11 @@
 
 import click
 from rich.console import Console
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn, TimeElapsedColumn
 
 from netapp_cli.utils.api_client import NetAppAPIClient, NetAppAPIError
+from netapp_cli.utils.inventory import InventoryError, inventory_records, offline_options
+from netapp_cli.utils.bulk import DEFAULT_CONCURRENCY, run_bulk
 from netapp_cli.utils.output import OutputFormatter
 
 console = Console()
@@ -19,8 +22,9 @@ def lun():
 @click.option("--svm", help="Filter by SVM name")
 @click.option("--name", help="Filter by LUN name")
 @click.option("--max-records", default=100, help="Maximum number of LUNs to return")
+@offline_options
 @click.pass_context
-def list(ctx, svm, name, max_records):
+def list(ctx, svm, name, max_records, offline, max_age):
     """List LUNs in the storage provider."""
     formatter = OutputFormatter(ctx.obj["output_format"], ctx.obj["verbose"])
     config = ctx.obj["config"]
@@ -38,8 +42,10 @@ def list(ctx, svm, name, max_records):
         if name:
             params["name"] = name
 
-        formatter.info("Retrieving LUNs...")
-        luns = client.paginate("/storage-provider/luns", params, max_records)
+        luns = inventory_records(config, "luns", offline, max_age, max_records, svm=svm, name=name)
+        if luns is None:
+            formatter.info("Retrieving LUNs...")
+            luns = client.paginate("/storage-provider/luns", params, max_records)
 
         if luns:
             formatter.format_output(
@@ -51,6 +57,9 @@ def list(ctx, svm, name, max_records):
         else:
             formatter.warning("No LUNs found matching the criteria")
 
+    except InventoryError as e:
+        formatter.error(str(e))
+        raise click.Abort()
     except NetAppAPIError as e:
         formatter.error(f"API Error: {e}")
         raise click.Abort()
@@ -299,3 +308,230 @@ def delete(ctx, lun_key, force, wait):
     except NetAppAPIError as e:
         formatter.error(f"API Error: {e}")
         raise click.Abort()
+
+
+@lun.command()
+@click.argument("lun_keys", nargs=-1)
+@click.option("--svm", help="Expand every LUN of this SVM (when no keys are given)")
+@click.option("--name", help="LUN name filter, wildcards allowed (when no keys are given)")
+@click.option("--size", "size_spec", required=True, help="Target size (2TB), relative growth (+20%) or increment (+10GB)")
+@click.option("--concurrency", default=DEFAULT_CONCURRENCY, type=click.IntRange(1, 64), help="Maximum number of requests in flight")
+@click.option("--wait", is_flag=True, help="Wait for all expansion jobs to complete")
+@click.option("--timeout", default=600, type=click.IntRange(min=1), help="Seconds to wait for jobs with --wait")
+@click.option("--dry-run", is_flag=True, help="Show the planned sizes without expanding")
+@click.pass_context
+def expand_many(ctx, lun_keys, svm, name, size_spec, concurrency, wait, timeout, dry_run):
+    """Expand many LUNs at once.
+
+    LUNs are given as keys or selected with --svm/--name. Expansion requests
+    are sent concurrently and, with --wait, the resulting jobs are tracked
+    together in one progress display. LUNs that would not grow are skipped.
+
+    Example:
+    netapp lun expand-many --svm svm1 --name 'lun-db-*' --size +20% --wait
+    """
+    formatter = OutputFormatter(ctx.obj["output_format"], ctx.obj["verbose"])
+    config = ctx.obj["config"]
+
+    if not config.is_configured():
+        formatter.error("No NetApp configuration found. Run 'netapp auth configure' first.")
+        raise click.Abort()
+
+    if not lun_keys and not svm and not name:
+        formatter.error("Provide LUN keys or select LUNs with --svm/--name")
+        raise click.Abort()
+
+    grow = _parse_growth(size_spec)
+    if grow is None:
+        formatter.error(f"Invalid size format: {size_spec}. Use formats like '2TB', '+20%' or '+10GB'")
+        raise click.Abort()
+
+    client = NetAppAPIClient(config.netapp, verbose=ctx.obj["verbose"], pool_size=concurrency)
+
+    try:
+        if lun_keys:
+            formatter.info(f"Retrieving {len(lun_keys)} LUN(s)...")
+            fetched = run_bulk(lun_keys, lambda key: client.get(f"/storage-provider/luns/{key}"), concurrency, "Retrieving LUNs")
+            luns = []
+            for key, outcome in zip(lun_keys, fetched):
+                luns.append(outcome["result"] if outcome["status"] == "ok" else {"key": key, "error": outcome["message"]})
+        else:
+            params = {}
+            if svm:
+                params["svm.name"] = svm
+            if name:
+                params["name"] = name
+            formatter.info("Retrieving LUNs...")
+            luns = client.paginate("/storage-provider/luns", params)
+
+        if not luns:
+            formatter.warning("No LUNs found matching the criteria")
+            return
+
+        plan = []
+        for item in luns:
+            current = _lun_size(item)
+            row = {
+                "key": item.get("key", ""),
+                "name": item.get("name", ""),
+                "svm": (item.get("svm") or {}).get("name", ""),
+                "current_size": current,
+                "new_size": None,
+                "status": "pending",
+                "message": item.get("error", ""),
+            }
+            if row["message"]:
+                row["status"] = "failed"
+            elif current is None:
+                row["status"], row["message"] = "failed", "Current size unknown"
+            else:
+                row["new_size"] = grow(current)
+                if row["new_size"] <= current:
+                    row["status"], row["message"] = "skipped", "Target size is not larger than current size"
+            plan.append(row)
+
+        targets = [row for row in plan if row["status"] == "pending"]
+
+        if dry_run:
+            formatter.format_output(
+                plan,
+                title="LUN Expansion Plan (dry run)",
+                headers=["key", "name", "svm", "current_size", "new_size", "status", "message"]
+            )
+            formatter.info(f"Dry run: {len(targets)} LUN(s) would be expanded")
+            return
+
+        def expand_lun(row):
+            return client.patch(f"/storage-provider/luns/{row['key']}", {"space": {"size": row["new_size"]}})
+
+        formatter.info(f"Expanding {len(targets)} LUN(s) with concurrency {concurrency}...")
+        results = run_bulk(targets, expand_lun, concurrency, "Expanding LUNs")
+
+        jobs = {}
+        for row, outcome in zip(targets, results):
+            if outcome["status"] != "ok":
+                row["status"], row["message"] = "failed", outcome["message"]
+                continue
+            job_key = _job_key(outcome["result"])
+            row["status"] = "submitted"
+            if job_key:
+                row["job"] = job_key
+                jobs[job_key] = row
+
+        if wait and jobs:
+            formatter.info(f"Waiting for {len(jobs)} expansion job(s) to complete...")
+            final = _wait_with_progress(client, jobs, timeout)
+            for job_key, status in final.items():
+                state = status.get("state")
+                jobs[job_key]["status"] = "completed" if state == "COMPLETED" else "failed"
+                if state != "COMPLETED":
+                    jobs[job_key]["message"] = status.get("message") or state
+
+        formatter.format_output(
+            plan,
+            title="LUN Expansion",
+            headers=["key", "name", "svm", "current_size", "new_size", "status", "message"]
+        )
+
+        failed = len([row for row in plan if row["status"] == "failed"])
+        if failed:
+            formatter.error(f"{failed} of {len(plan)} LUN expansion(s) failed")
+            ctx.exit(1)
+        formatter.success(_expansion_summary(plan, wait))
+
+    except NetAppAPIError as e:
+        formatter.error(f"API Error: {e}")
+        raise click.Abort()
+
+
+def _wait_with_progress(client, jobs, timeout):
+    """Wait for all jobs with a single aggregated progress bar."""
+    progress = Progress(
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeElapsedColumn(),
+        console=console,
+        transient=True,
+        disable=not console.is_terminal,
+    )
+
+    with progress:
+        task = progress.add_task("Expansion jobs", total=len(jobs))
+
+        def on_update(statuses):
+            states = [status.get("state") for status in statuses.values()]
+            done = len([s for s in states if s in ("COMPLETED", "FAILED", "CANCELLED", "NOT_FOUND")])
+            failed = len([s for s in states if s in ("FAILED", "CANCELLED", "NOT_FOUND")])
+            progress.update(
+                task,
+                completed=done,
+                description=f"Expansion jobs ({len(states) - done} running, {failed} failed)"
+            )
+
+        return client.wait_for_jobs(jobs.keys(), timeout=timeout, on_update=on_update)
+
+
+def _expansion_summary(plan, wait):
+    """Success message counting only the expansions whose outcome is known.
+
+    Without a job key in the modify response there is nothing to wait for,
+    so those rows stay ``submitted`` and are not reported as completed.
+    """
+    completed = len([row for row in plan if row["status"] == "completed"])
+    submitted = len([row for row in plan if row["status"] == "submitted"])
+    if not wait:
+        return f"{submitted} LUN expansion(s) initiated!"
+    message = f"{completed} LUN expansion(s) completed"
+    if submitted:
+        message += f", {submitted} submitted without a job to wait for"
+    return message + "!"
+
+
+def _lun_size(lun_record):
+    """Return the LUN size in bytes from a LUN record, if present."""
+    size = (lun_record.get("space") or {}).get("size", lun_record.get("size"))
+    try:
+        return int(size) if size is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _job_key(result):
+    """Extract the job key from a modify response, if the operation is asynchronous."""
+    if not isinstance(result, dict):
+        return None
+    if isinstance(result.get("job"), dict) and result["job"].get("key"):
+        return result["job"]["key"]
+    return result.get("key")
+
+
+def _parse_growth(size_spec):
+    """Parse a size spec into a function mapping the current size to the new size.
+
+    Accepts an absolute size ('2TB'), a relative growth ('+20%') or an
+    increment ('+10GB'). Returns None for invalid specs.
+    """
+    from netapp_cli.commands.volume import _parse_size
+
+    spec = size_spec.strip()
+    if spec.startswith("+"):
+        spec = spec[1:].strip()
+        if spec.endswith("%"):
+            try:
+                percent = float(spec[:-1])
+            except ValueError:
+                return None
+            if percent <= 0:
+                return None
+            return lambda current: int(current * (1 + percent / 100))
+
+        increment = _parse_size(spec)
+        if not increment:
+            return None
+        return lambda current: current + increment
+
+    target = _parse_size(spec)
+    if not target:
+        return None
+    return lambda current: target
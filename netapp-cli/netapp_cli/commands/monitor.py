@@ -3,11 +3,62 @@
 import click
 from rich.console import Console
 
+from netapp_cli.models.records import Event, Job
 from netapp_cli.utils.api_client import NetAppAPIClient, NetAppAPIError
 from netapp_cli.utils.output import OutputFormatter
+from netapp_cli.utils.watch import WatchTable, run_watch
 
 console = Console()
 
+WATCH_OPTION_HELP = "Refresh every SECONDS in a live display instead of printing once"
+
+
+def _check_watch(ctx, formatter, watch):
+    """Validate that watch mode can be used with the selected output format."""
+    if watch and ctx.obj["output_format"] != "table":
+        formatter.error("--watch is only supported with table output")
+        raise click.Abort()
+
+
+def _volume_stats(volumes):
+    """Extract performance-related fields from volume records."""
+    volume_stats = []
+    for vol in volumes:
+        stats = {
+            "name": vol.get("name", ""),
+            "svm.name": vol.get("svm", {}).get("name", ""),
+            "uuid": vol.get("uuid", ""),
+            "size": vol.get("space", {}).get("size", 0),
+            "used": vol.get("space", {}).get("used", 0),
+            "available": vol.get("space", {}).get("available", 0),
+            "utilization": f"{(vol.get('space', {}).get('used', 0) / max(vol.get('space', {}).get('size', 1), 1) * 100):.1f}%",
+            "state": vol.get("state", "")
+        }
+        volume_stats.append(stats)
+    return volume_stats
+
+
+def _event_poller(client, params, max_records):
+    """Build a poll function that only fetches events newer than the last seen.
+
+    The first call returns the latest ``max_records`` events; later calls add
+    a ``timestamp`` range filter so the server only returns new events.
+    """
+    last_seen = {"timestamp": None}
+
+    def poll():
+        page_params = dict(params)
+        if last_seen["timestamp"]:
+            page_params["timestamp"] = f">{last_seen['timestamp']}"
+
+        events = client.paginate("/management-server/events", page_params, max_records)
+        # Events are ordered newest first
+        if events and events[0].get("timestamp"):
+            last_seen["timestamp"] = events[0]["timestamp"]
+        return events
+
+    return poll
+
 
 @click.group()
 def monitor():
@@ -19,8 +70,9 @@ def monitor():
 @click.option("--cluster", help="Filter by cluster name")
 @click.option("--interval", default="1h", help="Time interval for metrics")
 @click.option("--max-records", default=100, help="Maximum number of records to return")
+@click.option("--watch", type=click.FloatRange(min=0.5), metavar="SECONDS", help=WATCH_OPTION_HELP)
 @click.pass_context
-def cluster_performance(ctx, cluster, interval, max_records):
+def cluster_performance(ctx, cluster, interval, max_records, watch):
     """Monitor cluster performance metrics."""
     formatter = OutputFormatter(ctx.obj["output_format"], ctx.obj["verbose"])
     config = ctx.obj["config"]
@@ -29,6 +81,7 @@ def cluster_performance(ctx, cluster, interval, max_records):
         formatter.error("No NetApp configuration found. Run 'netapp auth configure' first.")
         raise click.Abort()
 
+    _check_watch(ctx, formatter, watch)
     client = NetAppAPIClient(config.netapp, verbose=ctx.obj["verbose"])
 
     try:
@@ -36,6 +89,19 @@ def cluster_performance(ctx, cluster, interval, max_records):
         if cluster:
             params["cluster.name"] = cluster
 
+        if watch:
+            table = WatchTable(
+                f"Cluster Performance Metrics ({interval})",
+                ["cluster.name", "management_ip", "iops", "throughput", "latency"],
+                key="cluster.name",
+            )
+            run_watch(
+                table,
+                lambda: client.paginate("/datacenter/cluster/clusters/analytics", params, max_records),
+                watch,
+            )
+            return
+
         formatter.info(f"Retrieving cluster performance metrics (interval: {interval})...")
 
         # Try to get cluster analytics data
@@ -74,8 +140,9 @@ def cluster_performance(ctx, cluster, interval, max_records):
 @click.option("--svm", help="Filter by SVM name")
 @click.option("--volume", help="Filter by volume name")
 @click.option("--max-records", default=100, help="Maximum number of records to return")
+@click.option("--watch", type=click.FloatRange(min=0.5), metavar="SECONDS", help=WATCH_OPTION_HELP)
 @click.pass_context
-def volume_performance(ctx, svm, volume, max_records):
+def volume_performance(ctx, svm, volume, max_records, watch):
     """Monitor volume performance and usage."""
     formatter = OutputFormatter(ctx.obj["output_format"], ctx.obj["verbose"])
     config = ctx.obj["config"]
@@ -84,7 +151,9 @@ def volume_performance(ctx, svm, volume, max_records):
         formatter.error("No NetApp configuration found. Run 'netapp auth configure' first.")
         raise click.Abort()
 
+    _check_watch(ctx, formatter, watch)
     client = NetAppAPIClient(config.netapp, verbose=ctx.obj["verbose"])
+    headers = ["name", "svm.name", "size", "used", "available", "utilization", "state"]
 
     try:
         params = {"max_records": max_records}
@@ -93,29 +162,25 @@ def volume_performance(ctx, svm, volume, max_records):
         if volume:
             params["name"] = volume
 
+        if watch:
+            table = WatchTable("Volume Performance & Usage", headers, key="uuid")
+            run_watch(
+                table,
+                lambda: _volume_stats(client.paginate("/api/storage/volumes", params, max_records)),
+                watch,
+            )
+            return
+
         formatter.info("Retrieving volume performance data...")
         volumes = client.paginate("/api/storage/volumes", params, max_records)
 
         if volumes:
-            # Extract performance-related fields
-            volume_stats = []
-            for vol in volumes:
-                stats = {
-                    "name": vol.get("name", ""),
-                    "svm.name": vol.get("svm", {}).get("name", ""),
-                    "uuid": vol.get("uuid", ""),
-                    "size": vol.get("space", {}).get("size", 0),
-                    "used": vol.get("space", {}).get("used", 0),
-                    "available": vol.get("space", {}).get("available", 0),
-                    "utilization": f"{(vol.get('space', {}).get('used', 0) / max(vol.get('space', {}).get('size', 1), 1) * 100):.1f}%",
-                    "state": vol.get("state", "")
-                }
-                volume_stats.append(stats)
+            volume_stats = _volume_stats(volumes)
 
             formatter.format_output(
                 volume_stats,
                 title="Volume Performance & Usage",
-                headers=["name", "svm.name", "size", "used", "available", "utilization", "state"]
+                headers=headers
             )
             formatter.info(f"Found {len(volume_stats)} volume(s)")
         else:
@@ -129,9 +194,14 @@ def volume_performance(ctx, svm, volume, max_records):
 @monitor.command()
 @click.option("--max-records", default=50, help="Maximum number of events to return")
 @click.option("--severity", type=click.Choice(["error", "warning", "information"]), help="Filter by severity")
+@click.option("--watch", type=click.FloatRange(min=0.5), metavar="SECONDS", help=WATCH_OPTION_HELP)
 @click.pass_context
-def events(ctx, max_records, severity):
-    """Monitor system events and alerts."""
+def events(ctx, max_records, severity, watch):
+    """Monitor system events and alerts.
+
+    With --watch, only events newer than the last one seen are fetched on
+    each refresh and prepended to the display.
+    """
     formatter = OutputFormatter(ctx.obj["output_format"], ctx.obj["verbose"])
     config = ctx.obj["config"]
 
@@ -139,6 +209,7 @@ def events(ctx, max_records, severity):
         formatter.error("No NetApp configuration found. Run 'netapp auth configure' first.")
         raise click.Abort()
 
+    _check_watch(ctx, formatter, watch)
     client = NetAppAPIClient(config.netapp, verbose=ctx.obj["verbose"])
 
     try:
@@ -146,9 +217,24 @@ def events(ctx, max_records, severity):
         if severity:
             params["severity"] = severity
 
+        if watch:
+            table = WatchTable(
+                "System Events",
+                ["name", "severity", "timestamp", "source.name", "message"],
+                key="key",
+                max_rows=max_records,
+                incremental=True,
+            )
+            run_watch(table, _event_poller(client, params, max_records), watch)
+            return
+
         formatter.info("Retrieving system events...")
         events = client.paginate("/management-server/events", params, max_records)
 
+        if events and formatter.format_type == "table":
+            # Tables show a few fields; keep only those, in compact records
+            events = Event.from_records(events)
+
         if events:
             formatter.format_output(
                 events,
@@ -167,8 +253,9 @@ def events(ctx, max_records, severity):
 @monitor.command()
 @click.option("--max-records", default=50, help="Maximum number of jobs to return")
 @click.option("--state", type=click.Choice(["running", "completed", "failed"]), help="Filter by job state")
+@click.option("--watch", type=click.FloatRange(min=0.5), metavar="SECONDS", help=WATCH_OPTION_HELP)
 @click.pass_context
-def jobs(ctx, max_records, state):
+def jobs(ctx, max_records, state, watch):
     """Monitor background jobs."""
     formatter = OutputFormatter(ctx.obj["output_format"], ctx.obj["verbose"])
     config = ctx.obj["config"]
@@ -177,6 +264,7 @@ def jobs(ctx, max_records, state):
         formatter.error("No NetApp configuration found. Run 'netapp auth configure' first.")
         raise click.Abort()
 
+    _check_watch(ctx, formatter, watch)
     client = NetAppAPIClient(config.netapp, verbose=ctx.obj["verbose"])
 
     try:
@@ -184,9 +272,26 @@ def jobs(ctx, max_records, state):
         if state:
             params["state"] = state.upper()
 
+        if watch:
+            table = WatchTable(
+                "Background Jobs",
+                ["uuid", "description", "state", "start_time", "end_time", "message"],
+                key="uuid",
+            )
+            run_watch(
+                table,
+                lambda: client.paginate("/management-server/jobs", params, max_records),
+                watch,
+            )
+            return
+
         formatter.info("Retrieving background jobs...")
         jobs = client.paginate("/management-server/jobs", params, max_records)
 
+        if jobs and formatter.format_type == "table":
+            # Tables show a few fields; keep only those, in compact records
+            jobs = Job.from_records(jobs)
+
         if jobs:
             formatter.format_output(
                 jobs,
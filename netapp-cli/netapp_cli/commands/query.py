@@ -0,0 +1,95 @@
+"""Ad-hoc queries over the local inventory."""
+
+import time
+
+import click
+
+from netapp_cli.utils.inventory import KINDS, Inventory, InventoryError
+from netapp_cli.utils.output import OutputFormatter
+from netapp_cli.utils.query import REFERENCES, Query, QueryEngine, QueryError
+
+# Shown before the fields the expression refers to when --columns is not given
+DEFAULT_COLUMNS = {
+    "clusters": ["name", "version", "management_ip"],
+    "nodes": ["name", "cluster.name", "state"],
+    "svms": ["name", "cluster.name", "state"],
+    "aggregates": ["name", "cluster.name", "state", "utilization"],
+    "volumes": ["name", "svm.name", "state", "utilization"],
+    "luns": ["name", "svm.name", "volume.name", "state"],
+    "fileshares": ["name", "svm.name", "path"],
+}
+
+
+@click.command()
+@click.argument("kind", type=click.Choice(list(KINDS)))
+@click.argument("expression", required=False)
+@click.option("--columns", help="Comma-separated fields to show (default: a few plus those in the expression)")
+@click.option("--sort", "sort_field", help="Sort by field; prefix with - for descending order")
+@click.option("--limit", type=click.IntRange(min=1), help="Show at most this many records")
+@click.pass_context
+def query(ctx, kind, expression, columns, sort_field, limit):
+    """Query the local inventory without calling the API.
+
+    EXPRESSION filters the records of KIND, for example:
+
+    \b
+      netapp query volumes "utilization > 90 and cluster.version = 9.12"
+      netapp query luns "volume.aggregate.free_percent < 10"
+      netapp query volumes "svm in (svm1, svm2) and name ~ vol_prod*" --sort -utilization
+
+    Run 'netapp inventory sync' first to take the snapshot.
+    """
+    formatter = OutputFormatter(ctx.obj["output_format"], ctx.obj["verbose"])
+    config = ctx.obj["config"]
+
+    if not config.is_configured():
+        formatter.error("No NetApp configuration found. Run 'netapp auth configure' first.")
+        raise click.Abort()
+
+    try:
+        parsed = Query(expression) if expression else None
+    except QueryError as e:
+        formatter.error(f"Invalid expression: {e}")
+        raise click.Abort()
+
+    engine = QueryEngine.from_inventory(Inventory.for_config(config), config.netapp.host)
+    started = time.perf_counter()
+    try:
+        matches = engine.run(kind, parsed, sort=sort_field)
+    except InventoryError as e:
+        formatter.error(str(e))
+        raise click.Abort()
+
+    formatter.progress_update(
+        f"Evaluated {engine.scanned} of {len(engine.records(kind))} {kind} "
+        f"in {(time.perf_counter() - started) * 1000:.1f}ms"
+    )
+
+    if not matches:
+        formatter.warning(f"No {kind} match the query")
+        return
+
+    records = matches[:limit] if limit else matches
+    if columns:
+        fields = [column.strip() for column in columns.split(",") if column.strip()]
+    elif formatter.format_type == "table":
+        extra = [*(parsed.fields() if parsed else []), *([sort_field.lstrip("-")] if sort_field else [])]
+        # A reference compares by name; show it as that column
+        extra = [f"{field}.name" if field in REFERENCES else field for field in extra]
+        fields = [*dict.fromkeys(DEFAULT_COLUMNS[kind] + extra)]
+    else:
+        fields = None
+
+    try:
+        rows = engine.project(kind, records, fields) if fields else records
+    except InventoryError as e:
+        formatter.error(str(e))
+        raise click.Abort()
+
+    formatter.format_output(
+        rows,
+        title=f"{KINDS[kind].title} matching: {expression}" if expression else KINDS[kind].title,
+        headers=fields
+    )
+    shown = f", showing {len(records)}" if len(records) < len(matches) else ""
+    formatter.info(f"Found {len(matches)} of {len(engine.records(kind))} {kind}{shown}")
@@ -1,10 +1,16 @@
 """Snapshot related commands."""
 
+import re
+from datetime import datetime, timedelta, timezone
+
 import click
 from rich.console import Console
 
 from netapp_cli.utils.api_client import NetAppAPIClient, NetAppAPIError
+from netapp_cli.utils.bulk import DEFAULT_CONCURRENCY, ManifestError, load_manifest, run_bulk
+from netapp_cli.utils.cache import ResolutionCache
 from netapp_cli.utils.output import OutputFormatter
+from netapp_cli.utils.resolver import ResolutionError, Resolver
 
 console = Console()
 
@@ -31,36 +37,25 @@ def list(ctx, volume_name, svm, max_records, order_by):
         raise click.Abort()
 
     client = NetAppAPIClient(config.netapp, verbose=ctx.obj["verbose"])
+    resolver = Resolver(client, ResolutionCache.for_config(config), formatter)
 
     try:
-        # First find the volume UUID
-        params = {"name": volume_name}
-        if svm:
-            params["svm.name"] = svm
-
-        formatter.info(f"Looking up volume: {volume_name}")
-        response = client.get("/api/storage/volumes", params)
-        volumes = response.get("records", [])
-
-        if not volumes:
-            formatter.error(f"Volume '{volume_name}' not found")
-            raise click.Abort()
-
-        volume_uuid = volumes[0]["uuid"]
-        formatter.progress_update(f"Found volume UUID: {volume_uuid}")
-
-        # Get snapshots for the volume
-        formatter.info(f"Retrieving snapshots for volume: {volume_name}")
+        # Get snapshots for the volume, resolving its UUID through the cache
         snapshots_params = {
             "max_records": max_records,
             "order_by": order_by
         }
 
-        snapshots = client.paginate(
-            f"/api/storage/volumes/{volume_uuid}/snapshots",
-            snapshots_params,
-            max_records
-        )
+        def list_snapshots(volume_uuid):
+            formatter.info(f"Retrieving snapshots for volume: {volume_name}")
+            return client.paginate(
+                f"/api/storage/volumes/{volume_uuid}/snapshots",
+                snapshots_params,
+                max_records
+            )
+
+        formatter.info(f"Looking up volume: {volume_name}")
+        snapshots = resolver.with_volume(volume_name, svm, list_snapshots)
 
         if snapshots:
             formatter.format_output(
@@ -72,6 +67,9 @@ def list(ctx, volume_name, svm, max_records, order_by):
         else:
             formatter.warning(f"No snapshots found for volume: {volume_name}")
 
+    except ResolutionError as e:
+        formatter.error(str(e))
+        raise click.Abort()
     except NetAppAPIError as e:
         formatter.error(f"API Error: {e}")
         raise click.Abort()
@@ -93,23 +91,9 @@ def create(ctx, volume_name, snapshot_name, svm, comment):
         raise click.Abort()
 
     client = NetAppAPIClient(config.netapp, verbose=ctx.obj["verbose"])
+    resolver = Resolver(client, ResolutionCache.for_config(config), formatter)
 
     try:
-        # First find the volume UUID
-        params = {"name": volume_name}
-        if svm:
-            params["svm.name"] = svm
-
-        formatter.info(f"Looking up volume: {volume_name}")
-        response = client.get("/api/storage/volumes", params)
-        volumes = response.get("records", [])
-
-        if not volumes:
-            formatter.error(f"Volume '{volume_name}' not found")
-            raise click.Abort()
-
-        volume_uuid = volumes[0]["uuid"]
-
         # Create snapshot
         snapshot_data = {
             "name": snapshot_name
@@ -118,12 +102,19 @@ def create(ctx, volume_name, snapshot_name, svm, comment):
             snapshot_data["comment"] = comment
 
         formatter.info(f"Creating snapshot '{snapshot_name}' for volume '{volume_name}'")
-        result = client.post(f"/api/storage/volumes/{volume_uuid}/snapshots", snapshot_data)
+        result = resolver.with_volume(
+            volume_name,
+            svm,
+            lambda volume_uuid: client.post(f"/api/storage/volumes/{volume_uuid}/snapshots", snapshot_data)
+        )
 
         formatter.success(f"Snapshot '{snapshot_name}' created successfully!")
         if ctx.obj["output_format"] != "table":
             formatter.format_output(result)
 
+    except ResolutionError as e:
+        formatter.error(str(e))
+        raise click.Abort()
     except NetAppAPIError as e:
         formatter.error(f"API Error: {e}")
         raise click.Abort()
@@ -150,43 +141,26 @@ def delete(ctx, volume_name, snapshot_name, svm, force):
             return
 
     client = NetAppAPIClient(config.netapp, verbose=ctx.obj["verbose"])
+    resolver = Resolver(client, ResolutionCache.for_config(config), formatter)
 
     try:
-        # First find the volume UUID
-        params = {"name": volume_name}
-        if svm:
-            params["svm.name"] = svm
-
-        formatter.info(f"Looking up volume: {volume_name}")
-        response = client.get("/api/storage/volumes", params)
-        volumes = response.get("records", [])
-
-        if not volumes:
-            formatter.error(f"Volume '{volume_name}' not found")
-            raise click.Abort()
-
-        volume_uuid = volumes[0]["uuid"]
-
-        # Find the snapshot UUID
-        formatter.info(f"Looking up snapshot: {snapshot_name}")
-        snapshot_response = client.get(
-            f"/api/storage/volumes/{volume_uuid}/snapshots",
-            {"name": snapshot_name}
-        )
-        snapshots = snapshot_response.get("records", [])
-
-        if not snapshots:
-            formatter.error(f"Snapshot '{snapshot_name}' not found")
-            raise click.Abort()
-
-        snapshot_uuid = snapshots[0]["uuid"]
+        def delete_snapshot(volume_uuid):
+            formatter.info(f"Looking up snapshot: {snapshot_name}")
+            resolver.with_snapshot(
+                volume_uuid,
+                snapshot_name,
+                lambda snapshot_uuid: client.delete(f"/api/storage/volumes/{volume_uuid}/snapshots/{snapshot_uuid}")
+            )
+            resolver.forget_snapshot(volume_uuid, snapshot_name)
 
-        # Delete snapshot
         formatter.info(f"Deleting snapshot '{snapshot_name}' from volume '{volume_name}'")
-        client.delete(f"/api/storage/volumes/{volume_uuid}/snapshots/{snapshot_uuid}")
+        resolver.with_volume(volume_name, svm, delete_snapshot)
 
         formatter.success(f"Snapshot '{snapshot_name}' deleted successfully!")
 
+    except ResolutionError as e:
+        formatter.error(str(e))
+        raise click.Abort()
     except NetAppAPIError as e:
         formatter.error(f"API Error: {e}")
         raise click.Abort()
@@ -431,37 +405,9 @@ def update(ctx, volume_name, snapshot_name, svm, new_comment):
         raise click.Abort()
 
     client = NetAppAPIClient(config.netapp, verbose=ctx.obj["verbose"])
+    resolver = Resolver(client, ResolutionCache.for_config(config), formatter)
 
     try:
-        # First find the volume UUID
-        params = {"name": volume_name}
-        if svm:
-            params["svm.name"] = svm
-
-        formatter.info(f"Looking up volume: {volume_name}")
-        response = client.get("/api/storage/volumes", params)
-        volumes = response.get("records", [])
-
-        if not volumes:
-            formatter.error(f"Volume '{volume_name}' not found")
-            raise click.Abort()
-
-        volume_uuid = volumes[0]["uuid"]
-
-        # Find the snapshot UUID
-        formatter.info(f"Looking up snapshot: {snapshot_name}")
-        snapshot_response = client.get(
-            f"/api/storage/volumes/{volume_uuid}/snapshots",
-            {"name": snapshot_name}
-        )
-        snapshots = snapshot_response.get("records", [])
-
-        if not snapshots:
-            formatter.error(f"Snapshot '{snapshot_name}' not found")
-            raise click.Abort()
-
-        snapshot_uuid = snapshots[0]["uuid"]
-
         # Build update data
         update_data = {}
         if new_comment is not None:  # Allow empty string to clear comment
@@ -471,13 +417,464 @@ def update(ctx, volume_name, snapshot_name, svm, new_comment):
             formatter.error("No update parameters provided. Use --help for available options.")
             raise click.Abort()
 
+        def update_snapshot(volume_uuid):
+            formatter.info(f"Looking up snapshot: {snapshot_name}")
+            return resolver.with_snapshot(
+                volume_uuid,
+                snapshot_name,
+                lambda snapshot_uuid: client.patch(
+                    f"/api/storage/volumes/{volume_uuid}/snapshots/{snapshot_uuid}", update_data
+                )
+            )
+
         formatter.info(f"Updating snapshot '{snapshot_name}' on volume '{volume_name}'...")
-        result = client.patch(f"/api/storage/volumes/{volume_uuid}/snapshots/{snapshot_uuid}", update_data)
+        result = resolver.with_volume(volume_name, svm, update_snapshot)
 
         formatter.success(f"Snapshot '{snapshot_name}' updated successfully!")
         if ctx.obj["output_format"] != "table":
             formatter.format_output(result)
 
+    except ResolutionError as e:
+        formatter.error(str(e))
+        raise click.Abort()
+    except NetAppAPIError as e:
+        formatter.error(f"API Error: {e}")
+        raise click.Abort()
+
+
+def _render_snapshot_name(template, volume, svm):
+    """Expand {volume}, {svm}, {date} and {time} in a snapshot name template."""
+    now = datetime.now()
+    try:
+        return template.format(
+            volume=volume,
+            svm=svm or "",
+            date=now.strftime("%Y%m%d"),
+            time=now.strftime("%H%M%S")
+        )
+    except (KeyError, IndexError, ValueError) as e:
+        raise click.BadParameter(f"Invalid snapshot name template '{template}': {e}")
+
+
+def _bulk_targets(ctx, client, resolver, formatter, manifest, svm, volume_filter, snapshot_name, comment):
+    """Build bulk work items from a manifest or a volume filter.
+
+    All volumes are resolved from a single paginated listing, which also
+    seeds the resolution cache for later commands.
+    """
+    if manifest:
+        try:
+            entries = load_manifest(manifest)
+        except ManifestError as e:
+            formatter.error(str(e))
+            raise click.Abort()
+    elif svm or volume_filter:
+        entries = None
+    else:
+        formatter.error("Provide --manifest or select volumes with --svm/--volume-filter")
+        raise click.Abort()
+
+    params = {"fields": "name,uuid,svm.name"}
+    if entries is None:
+        if svm:
+            params["svm.name"] = svm
+        if volume_filter:
+            params["name"] = volume_filter
+    else:
+        manifest_svms = {entry.get("svm") for entry in entries}
+        if len(manifest_svms) == 1 and None not in manifest_svms:
+            params["svm.name"] = manifest_svms.pop()
+
+    formatter.info("Resolving volumes...")
+    volumes = client.paginate("/api/storage/volumes", params)
+    resolver.remember_volumes(volumes)
+
+    by_svm_and_name = {}
+    by_name = {}
+    for vol in volumes:
+        vol_svm = (vol.get("svm") or {}).get("name")
+        by_svm_and_name[(vol_svm, vol.get("name"))] = vol.get("uuid")
+        by_name.setdefault(vol.get("name"), []).append((vol_svm, vol.get("uuid")))
+
+    if entries is None:
+        entries = [
+            {"volume": vol.get("name"), "svm": (vol.get("svm") or {}).get("name")}
+            for vol in volumes
+        ]
+
+    targets = []
+    for entry in entries:
+        volume_name = entry.get("volume")
+        entry_svm = entry.get("svm")
+        target = {
+            "volume": volume_name,
+            "svm": entry_svm,
+            "snapshot": entry.get("snapshot") or (
+                _render_snapshot_name(snapshot_name, volume_name, entry_svm) if snapshot_name else None
+            ),
+            "comment": entry.get("comment") or comment,
+            "uuid": None,
+            "error": None,
+        }
+
+        if not volume_name:
+            target["error"] = "Manifest entry has no volume"
+        elif not target["snapshot"]:
+            target["error"] = "No snapshot name (set a 'snapshot' column or --snapshot-name)"
+        elif entry_svm:
+            target["uuid"] = by_svm_and_name.get((entry_svm, volume_name))
+        else:
+            matches = by_name.get(volume_name, [])
+            if len(matches) > 1:
+                target["error"] = f"Volume name is ambiguous across SVMs: {', '.join(m[0] or '' for m in matches)}"
+            elif matches:
+                target["svm"], target["uuid"] = matches[0]
+
+        if not target["uuid"] and not target["error"]:
+            target["error"] = f"Volume '{volume_name}' not found"
+        targets.append(target)
+
+    return targets
+
+
+def _bulk_report(ctx, formatter, targets, results, title):
+    """Display the per-item report and exit non-zero if anything failed."""
+    report = []
+    for target, result in zip(targets, results):
+        report.append({
+            "volume": target["volume"],
+            "svm": target["svm"] or "",
+            "snapshot": target["snapshot"] or "",
+            "status": result.get("status", "failed"),
+            "message": result.get("message", ""),
+        })
+
+    formatter.format_output(report, title=title, headers=["volume", "svm", "snapshot", "status", "message"])
+
+    failed = len([row for row in report if row["status"] != "ok"])
+    if failed:
+        formatter.error(f"{failed} of {len(report)} operation(s) failed")
+        ctx.exit(1)
+    formatter.success(f"{len(report)} operation(s) completed successfully!")
+
+
+def _run_targets(targets, action, concurrency, description):
+    """Run ``action`` on resolvable targets and fill in failures for the rest."""
+    runnable = [target for target in targets if not target["error"]]
+    outcomes = iter(run_bulk(runnable, action, concurrency, description))
+
+    results = []
+    for target in targets:
+        if target["error"]:
+            results.append({"status": "failed", "message": target["error"]})
+        else:
+            results.append(next(outcomes))
+    return results
+
+
+@snapshot.command()
+@click.option("--manifest", type=click.Path(exists=True, dir_okay=False), help="CSV, YAML or JSON file with volume, svm, snapshot and comment entries")
+@click.option("--svm", help="Snapshot every volume of this SVM (ignored with --manifest)")
+@click.option("--volume-filter", help="Volume name filter, wildcards allowed (e.g. 'vol-prod-*')")
+@click.option("--snapshot-name", help="Snapshot name template; {volume}, {svm}, {date} and {time} are expanded")
+@click.option("--comment", help="Snapshot comment")
+@click.option("--concurrency", default=DEFAULT_CONCURRENCY, type=click.IntRange(1, 64), help="Maximum number of requests in flight")
+@click.pass_context
+def bulk_create(ctx, manifest, svm, volume_filter, snapshot_name, comment, concurrency):
+    """Create snapshots on many volumes at once.
+
+    Volumes come from a manifest or from --svm/--volume-filter and are
+    resolved with a single listing. Snapshot requests run concurrently.
+
+    Example:
+    netapp snapshot bulk-create --svm svm1 --volume-filter 'vol-prod-*' --snapshot-name 'snap-prod-{volume}-{date}'
+    """
+    formatter = OutputFormatter(ctx.obj["output_format"], ctx.obj["verbose"])
+    config = ctx.obj["config"]
+
+    if not config.is_configured():
+        formatter.error("No NetApp configuration found. Run 'netapp auth configure' first.")
+        raise click.Abort()
+
+    client = NetAppAPIClient(config.netapp, verbose=ctx.obj["verbose"], pool_size=concurrency)
+    resolver = Resolver(client, ResolutionCache.for_config(config), formatter)
+
+    try:
+        targets = _bulk_targets(ctx, client, resolver, formatter, manifest, svm, volume_filter, snapshot_name, comment)
+        if not targets:
+            formatter.warning("No volumes matched")
+            return
+
+        def create_snapshot(target):
+            snapshot_data = {"name": target["snapshot"]}
+            if target["comment"]:
+                snapshot_data["comment"] = target["comment"]
+            return client.post(f"/api/storage/volumes/{target['uuid']}/snapshots", snapshot_data)
+
+        formatter.info(f"Creating {len(targets)} snapshot(s) with concurrency {concurrency}...")
+        results = _run_targets(targets, create_snapshot, concurrency, "Creating snapshots")
+        _bulk_report(ctx, formatter, targets, results, "Bulk Snapshot Create")
+
+    except NetAppAPIError as e:
+        formatter.error(f"API Error: {e}")
+        raise click.Abort()
+
+
+@snapshot.command()
+@click.option("--manifest", type=click.Path(exists=True, dir_okay=False), help="CSV, YAML or JSON file with volume, svm and snapshot entries")
+@click.option("--svm", help="Delete from every volume of this SVM (ignored with --manifest)")
+@click.option("--volume-filter", help="Volume name filter, wildcards allowed (e.g. 'vol-prod-*')")
+@click.option("--snapshot-name", help="Snapshot name (template) to delete when not given by the manifest")
+@click.option("--concurrency", default=DEFAULT_CONCURRENCY, type=click.IntRange(1, 64), help="Maximum number of requests in flight")
+@click.option("--force", is_flag=True, help="Force deletion without confirmation")
+@click.pass_context
+def bulk_delete(ctx, manifest, svm, volume_filter, snapshot_name, concurrency, force):
+    """Delete snapshots from many volumes at once.
+
+    Example:
+    netapp snapshot bulk-delete --manifest nightly.csv --force
+    """
+    formatter = OutputFormatter(ctx.obj["output_format"], ctx.obj["verbose"])
+    config = ctx.obj["config"]
+
+    if not config.is_configured():
+        formatter.error("No NetApp configuration found. Run 'netapp auth configure' first.")
+        raise click.Abort()
+
+    client = NetAppAPIClient(config.netapp, verbose=ctx.obj["verbose"], pool_size=concurrency)
+    resolver = Resolver(client, ResolutionCache.for_config(config), formatter)
+
+    try:
+        targets = _bulk_targets(ctx, client, resolver, formatter, manifest, svm, volume_filter, snapshot_name, None)
+        if not targets:
+            formatter.warning("No volumes matched")
+            return
+
+        if not force:
+            if not click.confirm(f"Are you sure you want to delete {len(targets)} snapshot(s)?"):
+                formatter.info("Deletion cancelled.")
+                return
+
+        def delete_snapshot(target):
+            volume_uuid = target["uuid"]
+            # Nothing is written to the resolution cache per item: each write
+            # rewrites the whole file, and the entries are dropped below anyway
+            return resolver.with_snapshot(
+                volume_uuid,
+                target["snapshot"],
+                lambda snapshot_uuid: client.delete(f"/api/storage/volumes/{volume_uuid}/snapshots/{snapshot_uuid}"),
+                remember=False
+            )
+
+        formatter.info(f"Deleting {len(targets)} snapshot(s) with concurrency {concurrency}...")
+        try:
+            results = _run_targets(targets, delete_snapshot, concurrency, "Deleting snapshots")
+        finally:
+            resolver.forget_snapshots(
+                (target["uuid"], target["snapshot"]) for target in targets if not target["error"]
+            )
+        _bulk_report(ctx, formatter, targets, results, "Bulk Snapshot Delete")
+
+    except NetAppAPIError as e:
+        formatter.error(f"API Error: {e}")
+        raise click.Abort()
+
+
+def compute_prune_set(candidates, keep_last=None, newer_count=0):
+    """Return the snapshots to delete from ``candidates``.
+
+    ``candidates`` must be ordered newest first and already limited to the
+    age window (if any). ``newer_count`` is the number of snapshots on the
+    volume that are newer than that window; they count towards
+    ``keep_last`` so the N most recent snapshots overall are retained.
+    """
+    if keep_last is None:
+        return candidates[:]
+    keep_from_candidates = max(0, keep_last - newer_count)
+    return candidates[keep_from_candidates:]
+
+
+@snapshot.command()
+@click.option("--svm", help="Only prune volumes of this SVM")
+@click.option("--volume-filter", help="Volume name filter, wildcards allowed (e.g. 'vol-prod-*')")
+@click.option("--name", "snapshot_filter", help="Only consider snapshots matching this name filter (e.g. 'daily.*')")
+@click.option("--keep-last", type=click.IntRange(min=0), help="Always keep the N most recent snapshots per volume")
+@click.option("--older-than", help="Only delete snapshots older than this age (e.g. 30d, 12h, 2w)")
+@click.option("--dry-run", is_flag=True, help="Show what would be deleted without deleting")
+@click.option("--concurrency", default=DEFAULT_CONCURRENCY, type=click.IntRange(1, 64), help="Maximum number of requests in flight")
+@click.option("--force", is_flag=True, help="Force deletion without confirmation")
+@click.pass_context
+def prune(ctx, svm, volume_filter, snapshot_filter, keep_last, older_than, dry_run, concurrency, force):
+    """Delete snapshots by age and/or count retention.
+
+    Age filtering runs on the cluster through create_time range queries, so
+    only deletion candidates are transferred. With both --keep-last and
+    --older-than a snapshot is deleted only if it is older than the cutoff
+    and not among the N most recent ones.
+
+    Example:
+    netapp snapshot prune --svm svm1 --volume-filter 'vol-prod-*' --older-than 30d --keep-last 7 --dry-run
+    """
+    formatter = OutputFormatter(ctx.obj["output_format"], ctx.obj["verbose"])
+    config = ctx.obj["config"]
+
+    if not config.is_configured():
+        formatter.error("No NetApp configuration found. Run 'netapp auth configure' first.")
+        raise click.Abort()
+
+    if keep_last is None and not older_than:
+        formatter.error("Specify a retention rule with --keep-last and/or --older-than")
+        raise click.Abort()
+
+    if not svm and not volume_filter:
+        formatter.error("Select volumes with --svm and/or --volume-filter")
+        raise click.Abort()
+
+    cutoff = None
+    if older_than:
+        age = _parse_age(older_than)
+        if age is None:
+            formatter.error(f"Invalid age format: {older_than}. Use a number followed by m, h, d or w (e.g. 30d)")
+            raise click.Abort()
+        cutoff = (datetime.now(timezone.utc) - age).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    client = NetAppAPIClient(config.netapp, verbose=ctx.obj["verbose"], pool_size=concurrency)
+    resolver = Resolver(client, ResolutionCache.for_config(config), formatter)
+
+    try:
+        params = {"fields": "name,uuid,svm.name"}
+        if svm:
+            params["svm.name"] = svm
+        if volume_filter:
+            params["name"] = volume_filter
+
+        formatter.info("Resolving volumes...")
+        volumes = client.paginate("/api/storage/volumes", params)
+        resolver.remember_volumes(volumes)
+
+        if not volumes:
+            formatter.warning("No volumes matched")
+            return
+
+        def plan_volume(volume):
+            """Fetch deletion candidates for one volume and apply retention."""
+            endpoint = f"/api/storage/volumes/{volume['uuid']}/snapshots"
+            snapshot_params = {"fields": "name,uuid,create_time", "order_by": "create_time desc"}
+            if snapshot_filter:
+                snapshot_params["name"] = snapshot_filter
+
+            newer_count = 0
+            if cutoff:
+                if keep_last:
+                    count_params = dict(snapshot_params, create_time=f">={cutoff}", return_records="false")
+                    newer_count = client.get(endpoint, count_params).get("num_records", 0)
+                snapshot_params["create_time"] = f"<{cutoff}"
+
+            candidates = client.paginate(endpoint, snapshot_params)
+            return compute_prune_set(candidates, keep_last, newer_count)
+
+        formatter.info(f"Computing deletion set for {len(volumes)} volume(s)...")
+        plans = run_bulk(volumes, plan_volume, concurrency, "Scanning volumes")
+
+        deletions = []
+        summary = []
+        for volume, plan in zip(volumes, plans):
+            svm_name = (volume.get("svm") or {}).get("name", "")
+            doomed = plan["result"] if plan["status"] == "ok" else []
+            summary.append({
+                "volume": volume.get("name"),
+                "svm": svm_name,
+                "to_delete": len(doomed),
+                "oldest": doomed[-1].get("create_time", "") if doomed else "",
+                "newest": doomed[0].get("create_time", "") if doomed else "",
+                "status": plan["status"],
+                "message": plan["message"],
+            })
+            for snap in doomed:
+                deletions.append({
+                    "volume": volume.get("name"),
+                    "volume_uuid": volume["uuid"],
+                    "svm": svm_name,
+                    "snapshot": snap.get("name"),
+                    "uuid": snap.get("uuid"),
+                    "create_time": snap.get("create_time", ""),
+                })
+
+        scan_failed = len([row for row in summary if row["status"] != "ok"])
+
+        if dry_run:
+            formatter.format_output(
+                summary,
+                title="Snapshot Prune Plan (dry run)",
+                headers=["volume", "svm", "to_delete", "oldest", "newest", "status", "message"]
+            )
+            if ctx.obj["verbose"] and deletions:
+                formatter.format_output(
+                    deletions,
+                    title="Snapshots To Delete",
+                    headers=["volume", "svm", "snapshot", "create_time"]
+                )
+            formatter.info(f"Dry run: {len(deletions)} snapshot(s) on {len(volumes)} volume(s) would be deleted")
+            if scan_failed:
+                ctx.exit(1)
+            return
+
+        if not deletions:
+            formatter.info("Nothing to prune")
+            if scan_failed:
+                formatter.error(f"{scan_failed} volume(s) could not be scanned")
+                ctx.exit(1)
+            return
+
+        if not force:
+            if not click.confirm(f"Delete {len(deletions)} snapshot(s) from {len(volumes)} volume(s)?"):
+                formatter.info("Deletion cancelled.")
+                return
+
+        def delete_snapshot(item):
+            return client.delete(f"/api/storage/volumes/{item['volume_uuid']}/snapshots/{item['uuid']}")
+
+        formatter.info(f"Deleting {len(deletions)} snapshot(s) with concurrency {concurrency}...")
+        try:
+            results = run_bulk(deletions, delete_snapshot, concurrency, "Pruning snapshots")
+        finally:
+            resolver.forget_snapshots((item["volume_uuid"], item["snapshot"]) for item in deletions)
+
+        failures = [
+            dict(item, message=result["message"])
+            for item, result in zip(deletions, results)
+            if result["status"] != "ok"
+        ]
+        if failures:
+            formatter.format_output(
+                failures,
+                title="Failed Deletions",
+                headers=["volume", "svm", "snapshot", "message"]
+            )
+            formatter.error(f"{len(failures)} of {len(deletions)} deletion(s) failed")
+            ctx.exit(1)
+        if scan_failed:
+            formatter.error(f"{scan_failed} volume(s) could not be scanned")
+            ctx.exit(1)
+
+        formatter.success(f"Pruned {len(deletions)} snapshot(s) from {len(volumes)} volume(s)")
+
     except NetAppAPIError as e:
         formatter.error(f"API Error: {e}")
         raise click.Abort()
+
+
+def _parse_age(age_str):
+    """Parse an age such as '30d', '12h', '2w' or '45m' to a timedelta."""
+    match = re.match(r'^(\d+)\s*([mhdw])$', age_str.strip().lower())
+    if not match:
+        return None
+
+    value = int(match.group(1))
+    units = {
+        'm': timedelta(minutes=1),
+        'h': timedelta(hours=1),
+        'd': timedelta(days=1),
+        'w': timedelta(weeks=1)
+    }
+    return value * units[match.group(2)]
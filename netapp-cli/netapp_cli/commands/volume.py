@@ -3,8 +3,12 @@
 import click
 from rich.console import Console
 
+from netapp_cli.models.records import Volume
 from netapp_cli.utils.api_client import NetAppAPIClient, NetAppAPIError
+from netapp_cli.utils.cache import ResolutionCache
+from netapp_cli.utils.inventory import InventoryError, inventory_records, offline_options
 from netapp_cli.utils.output import OutputFormatter
+from netapp_cli.utils.resolver import ResolutionError, Resolver
 
 console = Console()
 
@@ -41,8 +45,9 @@ def list(ctx, svm):
 @click.option("--svm", help="SVM name (optional)")
 @click.option("--name", help="Volume name filter")
 @click.option("--max-records", default=100, help="Maximum number of records to return")
+@offline_options
 @click.pass_context
-def list_volumes(ctx, svm, name, max_records):
+def list_volumes(ctx, svm, name, max_records, offline, max_age):
     """List volumes with optional filtering."""
     formatter = OutputFormatter(ctx.obj["output_format"], ctx.obj["verbose"])
     config = ctx.obj["config"]
@@ -60,19 +65,29 @@ def list_volumes(ctx, svm, name, max_records):
         if name:
             params["name"] = name
 
-        formatter.info("Retrieving volumes...")
-        volumes = client.paginate("/api/storage/volumes", params, max_records)
-
-        if volumes:
-            formatter.format_output(
-                volumes,
-                title="Volumes",
-                headers=["name", "svm.name", "uuid", "size", "state", "style"]
-            )
-            formatter.info(f"Found {len(volumes)} volume(s)")
+        volumes = inventory_records(config, "volumes", offline, max_age, max_records, svm=svm, name=name)
+        if volumes is None:
+            formatter.info("Retrieving volumes...")
+            volumes = client.iter_records("/api/storage/volumes", params, max_records)
+
+        # Rows are printed page by page; closing the output (`| head`, quitting
+        # the pager) stops the pagination. Tables keep only the displayed
+        # fields, in compact records.
+        count = formatter.format_stream(
+            volumes,
+            title="Volumes",
+            headers=["name", "svm.name", "uuid", "size", "state", "style"],
+            record_type=Volume
+        )
+
+        if count:
+            formatter.info(f"Found {count} volume(s)")
         else:
             formatter.warning("No volumes found matching the criteria")
 
+    except InventoryError as e:
+        formatter.error(str(e))
+        raise click.Abort()
     except NetAppAPIError as e:
         formatter.error(f"API Error: {e}")
         raise click.Abort()
@@ -104,29 +119,22 @@ def show(ctx, volume_name, svm, skip_naming_validation):
         raise click.Abort()
 
     client = NetAppAPIClient(config.netapp, verbose=ctx.obj["verbose"])
+    resolver = Resolver(client, ResolutionCache.for_config(config), formatter)
 
     try:
-        # First find the volume
-        params = {"name": volume_name}
-        if svm:
-            params["svm.name"] = svm
-
-        formatter.info(f"Looking up volume: {volume_name}")
-        response = client.get("/api/storage/volumes", params)
-        volumes = response.get("records", [])
-
-        if not volumes:
-            formatter.error(f"Volume '{volume_name}' not found")
-            raise click.Abort()
-
-        volume = volumes[0]
-        volume_uuid = volume["uuid"]
-
         # Get detailed volume information
-        detailed_volume = client.get(f"/api/storage/volumes/{volume_uuid}")
+        formatter.info(f"Looking up volume: {volume_name}")
+        detailed_volume = resolver.with_volume(
+            volume_name,
+            svm,
+            lambda volume_uuid: client.get(f"/api/storage/volumes/{volume_uuid}")
+        )
 
         formatter.format_output(detailed_volume, title=f"Volume Details: {volume_name}")
 
+    except ResolutionError as e:
+        formatter.error(str(e))
+        raise click.Abort()
     except NetAppAPIError as e:
         formatter.error(f"API Error: {e}")
         raise click.Abort()
@@ -230,23 +238,9 @@ def update(ctx, volume_name, svm, new_size, new_comment, new_junction_path, snap
         raise click.Abort()
 
     client = NetAppAPIClient(config.netapp, verbose=ctx.obj["verbose"])
+    resolver = Resolver(client, ResolutionCache.for_config(config), formatter)
 
     try:
-        # First find the volume
-        params = {"name": volume_name}
-        if svm:
-            params["svm.name"] = svm
-
-        formatter.info(f"Looking up volume: {volume_name}")
-        response = client.get("/api/storage/volumes", params)
-        volumes = response.get("records", [])
-
-        if not volumes:
-            formatter.error(f"Volume '{volume_name}' not found")
-            raise click.Abort()
-
-        volume_uuid = volumes[0]["uuid"]
-
         # Build update data
         update_data = {}
 
@@ -271,7 +265,11 @@ def update(ctx, volume_name, svm, new_size, new_comment, new_junction_path, snap
             raise click.Abort()
 
         formatter.info(f"Updating volume '{volume_name}'...")
-        result = client.patch(f"/api/storage/volumes/{volume_uuid}", update_data)
+        result = resolver.with_volume(
+            volume_name,
+            svm,
+            lambda volume_uuid: client.patch(f"/api/storage/volumes/{volume_uuid}", update_data)
+        )
 
         if wait and "job" in result and "uuid" in result["job"]:
             job_uuid = result["job"]["uuid"]
@@ -285,6 +283,9 @@ def update(ctx, volume_name, svm, new_size, new_comment, new_junction_path, snap
             if ctx.obj["output_format"] != "table":
                 formatter.format_output(result)
 
+    except ResolutionError as e:
+        formatter.error(str(e))
+        raise click.Abort()
     except NetAppAPIError as e:
         formatter.error(f"API Error: {e}")
         raise click.Abort()
@@ -311,25 +312,16 @@ def delete(ctx, volume_name, svm, force, wait):
             return
 
     client = NetAppAPIClient(config.netapp, verbose=ctx.obj["verbose"])
+    resolver = Resolver(client, ResolutionCache.for_config(config), formatter)
 
     try:
-        # First find the volume
-        params = {"name": volume_name}
-        if svm:
-            params["svm.name"] = svm
-
-        formatter.info(f"Looking up volume: {volume_name}")
-        response = client.get("/api/storage/volumes", params)
-        volumes = response.get("records", [])
-
-        if not volumes:
-            formatter.error(f"Volume '{volume_name}' not found")
-            raise click.Abort()
-
-        volume_uuid = volumes[0]["uuid"]
-
         formatter.info(f"Deleting volume '{volume_name}'...")
-        result = client.delete(f"/api/storage/volumes/{volume_uuid}")
+        result = resolver.with_volume(
+            volume_name,
+            svm,
+            lambda volume_uuid: client.delete(f"/api/storage/volumes/{volume_uuid}")
+        )
+        resolver.forget_volume(volume_name, svm)
 
         if wait and "job" in result and "uuid" in result["job"]:
             job_uuid = result["job"]["uuid"]
@@ -343,6 +335,9 @@ def delete(ctx, volume_name, svm, force, wait):
             if ctx.obj["output_format"] != "table":
                 formatter.format_output(result)
 
+    except ResolutionError as e:
+        formatter.error(str(e))
+        raise click.Abort()
     except NetAppAPIError as e:
         formatter.error(f"API Error: {e}")
         raise click.Abort()
@@ -4,17 +4,78 @@ NetApp ActiveIQ CLI Tool
 Main entry point for the NetApp API CLI commands.
 """
 
-import click
-from rich.console import Console
-from rich.table import Table
-
-from netapp_cli.commands import auth, cluster, volume, snapshot, lun, fileshare, monitor
-from netapp_cli.utils.config import Config
-
-console = Console()
+import importlib
+import os
+import sys
 
+import click
 
-@click.group()
+# Command groups are imported on first use so that `--help`, `version` and
+# single-group invocations do not pay for every module's dependencies.
+# Maps command name -> (module, attribute, short help shown by --help).
+LAZY_COMMANDS = {
+    "auth": ("netapp_cli.commands.auth", "auth", "Authentication management commands."),
+    "cluster": ("netapp_cli.commands.cluster", "cluster", "Cluster management commands."),
+    "volume": ("netapp_cli.commands.volume", "volume", "Volume management commands."),
+    "snapshot": ("netapp_cli.commands.snapshot", "snapshot", "Snapshot management commands."),
+    "lun": ("netapp_cli.commands.lun", "lun", "LUN management commands."),
+    "fileshare": ("netapp_cli.commands.fileshare", "fileshare", "File share management commands."),
+    "monitor": ("netapp_cli.commands.monitor", "monitor", "Monitoring and performance commands."),
+    "daemon": ("netapp_cli.commands.daemon", "daemon", "Background daemon keeping warm API sessions."),
+    "batch": ("netapp_cli.commands.batch", "batch", "Run many CLI commands from a file in one process."),
+    "inventory": ("netapp_cli.commands.inventory", "inventory", "Local inventory snapshot for offline queries."),
+    "query": ("netapp_cli.commands.query", "query", "Query the local inventory without calling the API."),
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules only when they are invoked."""
+
+    def __init__(self, *args, lazy_commands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_commands and cmd_name not in self.commands:
+            module_name, attr, _ = self.lazy_commands[cmd_name]
+            self.add_command(getattr(importlib.import_module(module_name), attr), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def invoke(self, ctx):
+        try:
+            return super().invoke(ctx)
+        except BrokenPipeError:
+            from netapp_cli.utils.output import OutputFormatter
+
+            if not OutputFormatter.output_closed():
+                raise
+            # The reader of stdout is gone (`| head`). Stop quietly and
+            # successfully, so `set -o pipefail` scripts do not fail, and
+            # point stdout at /dev/null so the final flush cannot fail again.
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            ctx.exit(0)
+
+    def format_commands(self, ctx, formatter):
+        """List commands using static help so --help imports nothing."""
+        rows = []
+        for name in self.list_commands(ctx):
+            if name in self.commands:
+                command = self.commands[name]
+                if command.hidden:
+                    continue
+                rows.append((name, command.get_short_help_str(formatter.width - 6 - len(name))))
+            else:
+                rows.append((name, self.lazy_commands[name][2]))
+
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+
+@click.group(cls=LazyGroup, lazy_commands=LAZY_COMMANDS)
 @click.option(
     "--config",
     "-c",
@@ -23,8 +84,9 @@ console = Console()
 )
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
 @click.option("--output", "-o", type=click.Choice(["table", "json", "yaml"]), default="table", help="Output format")
+@click.option("--pager/--no-pager", default=None, help="Page output through $PAGER (default: output.pager setting)")
 @click.pass_context
-def cli(ctx, config, verbose, output):
+def cli(ctx, config, verbose, output, pager):
     """NetApp ActiveIQ API CLI Tool.
 
     A comprehensive command-line interface to interact with ActiveIQ Server.
@@ -32,18 +94,40 @@ def cli(ctx, config, verbose, output):
     Includes features like storage provisioning, monitoring, snapshot management, and more.
     """
     ctx.ensure_object(dict)
-    ctx.obj["config"] = Config(config_file=config) if config else Config()
     ctx.obj["verbose"] = verbose
     ctx.obj["output_format"] = output
 
+    # `version` needs no configuration; skip loading it (and pydantic/yaml).
+    # A configuration already in obj (e.g. shared by `netapp batch`) is reused
+    # unless --config asks for another file.
+    if ctx.invoked_subcommand != "version" and (config or ctx.obj.get("config") is None):
+        from netapp_cli.utils.config import Config
+        ctx.obj["config"] = Config(config_file=config) if config else Config()
+
+        output_settings = ctx.obj["config"].get("output") or {}
+        if "header_sample" in output_settings or "max_columns" in output_settings:
+            from netapp_cli.utils.output import OutputFormatter
+            OutputFormatter.configure(output_settings)
+
+    if pager is None and ctx.obj.get("config") is not None:
+        output_settings = ctx.obj["config"].get("output")
+        pager = isinstance(output_settings, dict) and bool(output_settings.get("pager"))
+    if pager:
+        from netapp_cli.utils.pager import Pager
+        Pager.start()
+
     if verbose:
+        from netapp_cli.utils.output import console
         console.print("[dim]NetApp CLI initialized with verbose output[/dim]")
 
 
 @cli.command()
 def version():
     """Show version information."""
+    from rich.table import Table
+
     from netapp_cli import __version__
+    from netapp_cli.utils.output import console
 
     table = Table(title="NetApp CLI Version")
     table.add_column("Component", style="cyan")
@@ -55,15 +139,5 @@ def version():
     console.print(table)
 
 
-# Register command groups
-cli.add_command(auth.auth)
-cli.add_command(cluster.cluster)
-cli.add_command(volume.volume)
-cli.add_command(snapshot.snapshot)
-cli.add_command(lun.lun)
-cli.add_command(fileshare.fileshare)
-cli.add_command(monitor.monitor)
-
-
 if __name__ == "__main__":
     cli()
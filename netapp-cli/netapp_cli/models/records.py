@@ -0,0 +1,157 @@
+"""Compact record models for the most frequently listed resources.
+
+API records are deeply nested dicts of which a table shows a handful of
+fields. These models keep only the commonly displayed fields, flattened
+into ``__slots__`` attributes: a record takes a fraction of the memory of
+the dict it was built from, and reading a dotted column such as
+``svm.name`` is a single attribute lookup.
+
+Records support the read-only mapping operations the formatters use
+(``record["name"]``, ``record.get("svm.name")``, ``"uuid" in record``)
+and convert back to nested dicts with to_dict() for JSON/YAML output.
+Fields not listed in ``FIELDS`` are dropped, so use records for table
+output and keep the dicts when the full object is needed.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+_MISSING = object()
+
+
+def _attribute(path: str) -> str:
+    return path.replace(".", "_")
+
+
+class Record:
+    """Base class; subclasses are created with define()."""
+
+    __slots__ = ()
+
+    FIELDS: Tuple[str, ...] = ()
+    # Precomputed by define(): dotted path -> attribute, and (attribute, keys)
+    _ATTRIBUTES: Dict[str, str] = {}
+    _PATHS: Tuple[Tuple[str, Tuple[str, ...]], ...] = ()
+
+    def __init__(self, **values):
+        for attribute, _ in self._PATHS:
+            object.__setattr__(self, attribute, values.get(attribute))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Record":
+        """Build a record from an API dict."""
+        record = object.__new__(cls)
+        for attribute, keys in cls._PATHS:
+            value = data
+            for key in keys:
+                if value.__class__ is not dict:
+                    value = None
+                    break
+                value = value.get(key)
+            object.__setattr__(record, attribute, value)
+        return record
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> List["Record"]:
+        """Convert API dicts one by one, so an iterator never needs to be held in full."""
+        from_dict = cls.from_dict
+        return [from_dict(record) for record in records]
+
+    def get(self, path: str, default: Any = None) -> Any:
+        """Return the field at dotted ``path`` (``default`` if unknown or unset)."""
+        attribute = self._ATTRIBUTES.get(path)
+        if attribute is None:
+            return default
+        value = getattr(self, attribute)
+        return default if value is None else value
+
+    def __getitem__(self, path: str) -> Any:
+        value = self.get(path, _MISSING)
+        if value is _MISSING:
+            raise KeyError(path)
+        return value
+
+    def __contains__(self, path: str) -> bool:
+        return self.get(path, _MISSING) is not _MISSING
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} records are read-only")
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, attribute) == getattr(other, attribute) for attribute, _ in self._PATHS)
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            f"{path}={getattr(self, attribute)!r}"
+            for path, attribute in self._ATTRIBUTES.items()
+            if getattr(self, attribute) is not None
+        )
+        return f"{type(self).__name__}({values})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Nested dict of the fields that are set."""
+        result: Dict[str, Any] = {}
+        for attribute, keys in self._PATHS:
+            value = getattr(self, attribute)
+            if value is None:
+                continue
+            target = result
+            for key in keys[:-1]:
+                target = target.setdefault(key, {})
+            target[keys[-1]] = value
+        return result
+
+
+def define(name: str, fields: Iterable[str], doc: Optional[str] = None) -> type:
+    """Create a Record subclass storing the dotted ``fields``."""
+    fields = tuple(fields)
+    attributes = {path: _attribute(path) for path in fields}
+    if len(set(attributes.values())) != len(fields):
+        raise ValueError(f"{name}: fields map to clashing attribute names")
+
+    return type(name, (Record,), {
+        "__slots__": tuple(attributes.values()),
+        "__doc__": doc,
+        "FIELDS": fields,
+        "_ATTRIBUTES": attributes,
+        "_PATHS": tuple((attributes[path], tuple(path.split("."))) for path in fields),
+    })
+
+
+Volume = define("Volume", [
+    "key", "uuid", "name", "state", "style", "type", "size",
+    "space.size", "space.used", "space.available",
+    "svm.key", "svm.uuid", "svm.name",
+    "cluster.key", "cluster.uuid", "cluster.name",
+], "Volume of /datacenter/storage/volumes or /api/storage/volumes.")
+
+Aggregate = define("Aggregate", [
+    "key", "uuid", "name", "state", "type",
+    "space.size", "space.used", "space.available",
+    "space.block_storage.size", "space.block_storage.used", "space.block_storage.available",
+    "node.name", "node.uuid",
+    "cluster.key", "cluster.uuid", "cluster.name",
+], "Aggregate of /datacenter/storage/aggregates.")
+
+Cluster = define("Cluster", [
+    "key", "uuid", "name", "management_ip", "location", "contact",
+    "version.full", "version.generation", "version.major", "version.minor",
+], "Cluster of /datacenter/cluster/clusters.")
+
+Svm = define("Svm", [
+    "key", "uuid", "name", "state", "subtype",
+    "cluster.key", "cluster.uuid", "cluster.name",
+], "SVM of /storage-provider/svms or /datacenter/svm/svms.")
+
+Event = define("Event", [
+    "key", "name", "severity", "state", "impact_level", "impact_area",
+    "timestamp", "create_time", "message",
+    "source.key", "source.name", "source.resource_type",
+    "cluster.name",
+], "Event of /management-server/events.")
+
+Job = define("Job", [
+    "key", "uuid", "description", "state", "code", "message",
+    "start_time", "end_time", "progress",
+], "Job of /management-server/jobs.")
@@ -1,15 +1,21 @@
 """NetApp ActiveIQ API client."""
 
 import base64
+import importlib.util
 import json
+import threading
 import time
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Callable, Iterable, Iterator, Optional, List
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from rich.console import Console
 
+from netapp_cli.utils import jsonlib
+from netapp_cli.utils.cache import ResponseCache
 from netapp_cli.utils.config import NetAppConfig
+from netapp_cli.utils.jsonstream import RecordParser, StreamError
+from netapp_cli.utils.ratelimit import THROTTLE_STATUSES, get_throttle, parse_retry_after
 
 console = Console()
 
@@ -23,55 +29,303 @@ class NetAppAPIError(Exception):
         self.response = response
 
 
-class NetAppAPIClient:
-    """NetApp ActiveIQ API client."""
+# Retry policy shared by the sync and async clients. 429 and 503 are not
+# retried by the transport: the throttle (see ratelimit.py) handles them.
+RETRY_TOTAL = 3
+RETRY_STATUSES = [500, 502, 504]
+RETRY_METHODS = ["HEAD", "GET", "OPTIONS"]
+RETRY_BACKOFF = 1
+THROTTLE_RETRIES = 5
+
+PAGE_SIZE = 100
+JOB_POLL_INTERVAL = 2
+FINAL_JOB_STATES = ("COMPLETED", "FAILED", "CANCELLED", "NOT_FOUND")
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def accept_encoding() -> str:
+    """Content codings the HTTP stack can decode.
+
+    Brotli is only advertised when a brotli module is installed (the
+    ``compression`` extra); both urllib3 and httpx decode it then.
+    """
+    codings = ["gzip", "deflate"]
+    if importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi"):
+        codings.insert(0, "br")
+    return ", ".join(codings)
+
+
+class TransferStats:
+    """Bytes received on the wire versus after content decoding."""
+
+    def __init__(self):
+        self.responses = 0
+        self.wire_bytes = 0
+        self.decoded_bytes = 0
+        self._lock = threading.Lock()
+
+    def record(self, wire_bytes: int, decoded_bytes: int):
+        with self._lock:
+            self.responses += 1
+            self.wire_bytes += wire_bytes
+            self.decoded_bytes += decoded_bytes
+
+    @property
+    def ratio(self) -> Optional[float]:
+        """Decoded size divided by wire size (compression ratio)."""
+        return self.decoded_bytes / self.wire_bytes if self.wire_bytes else None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "responses": self.responses,
+            "wire_bytes": self.wire_bytes,
+            "decoded_bytes": self.decoded_bytes,
+            "ratio": round(self.ratio, 2) if self.ratio else None,
+        }
+
+
+class APIClientBase:
+    """Request building and response handling shared by the sync and async clients."""
 
     def __init__(self, config: NetAppConfig, verbose: bool = False):
         self.config = config
         self.verbose = verbose
         self.base_url = f"https://{config.host}"
-        self.session = requests.Session()
+        self.stats = TransferStats()
 
-        # Set up authentication
-        auth_string = f"{config.username}:{config.password}"
+    def _default_headers(self) -> Dict[str, str]:
+        """Authentication and content negotiation headers."""
+        auth_string = f"{self.config.username}:{self.config.password}"
         auth_bytes = auth_string.encode('ascii')
         auth_header = base64.b64encode(auth_bytes).decode('ascii')
 
-        self.session.headers.update({
+        return {
             "Authorization": f"Basic {auth_header}",
             "Content-Type": "application/json",
-            "Accept": "application/json"
-        })
+            "Accept": "application/json",
+            "Accept-Encoding": accept_encoding()
+        }
+
+    def _build_url(self, endpoint: str) -> str:
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
+
+    def _log_request(self, method: str, url: str, params: Optional[Dict], data: Optional[Dict]):
+        if self.verbose:
+            console.print(f"[dim]{method.upper()} {url}[/dim]")
+            if params:
+                console.print(f"[dim]Params: {params}[/dim]")
+            if data:
+                console.print(f"[dim]Data: {json.dumps(data, indent=2)}[/dim]")
+
+    def _record_transfer(self, response, wire_bytes, decoded_bytes: Optional[int] = None):
+        """Add a response to the transfer stats and log its sizes.
+
+        ``decoded_bytes`` defaults to the size of the (already read) body.
+        """
+        if decoded_bytes is None and isinstance(response.content, bytes):
+            decoded_bytes = len(response.content)
+        if not isinstance(wire_bytes, int) or not isinstance(decoded_bytes, int):
+            return
+        self.stats.record(wire_bytes, decoded_bytes)
+        if self.verbose:
+            encoding = response.headers.get("Content-Encoding") or "identity"
+            console.print(f"[dim]Transfer: {wire_bytes} bytes on the wire, {decoded_bytes} decoded ({encoding})[/dim]")
+
+    @staticmethod
+    def _page_done(page_count: int, offset: int, meta: Dict[str, Any]) -> bool:
+        """Whether a page of ``page_count`` records at ``offset`` was the last one.
+
+        ``num_records`` only counts the records of the page, so this goes by
+        ``total_records``, else by the absence of a ``_links.next`` link, and
+        only without either by a page shorter than requested.
+        """
+        total = meta.get("total_records")
+        if isinstance(total, int):
+            return offset + page_count >= total
+        links = meta.get("_links")
+        if isinstance(links, dict):
+            return not links.get("next")
+        return page_count < PAGE_SIZE
+
+    def _handle_response(self, response) -> Dict[str, Any]:
+        """Decode a response, raising NetAppAPIError for error statuses.
+
+        Works with both requests and httpx responses.
+        """
+        if self.verbose:
+            console.print(f"[dim]Response: {response.status_code}[/dim]")
+
+        # Handle different response types
+        if response.status_code == 204:  # No Content
+            return {"success": True}
+
+        try:
+            response_data = self._decode_json(response)
+        except ValueError:
+            response_data = {"text": response.text}
+
+        if response.status_code >= 400:
+            error_message = self._extract_error_message(response_data, response.status_code)
+            raise NetAppAPIError(
+                error_message,
+                status_code=response.status_code,
+                response=response_data
+            )
+
+        return response_data
+
+    @staticmethod
+    def _decode_json(response) -> Any:
+        """Decode a response body with the fastest available JSON backend."""
+        content = response.content
+        if not isinstance(content, (bytes, bytearray)):
+            return response.json()
+        return jsonlib.loads(content)
+
+    def _extract_error_message(self, response_data: Dict, status_code: int) -> str:
+        """Extract error message from API response."""
+        if isinstance(response_data, dict):
+            # Common error message fields
+            error_fields = ["message", "error", "detail", "description"]
+            for field in error_fields:
+                if field in response_data:
+                    return response_data[field]
+
+            # Check for nested error objects
+            if "error" in response_data and isinstance(response_data["error"], dict):
+                for field in error_fields:
+                    if field in response_data["error"]:
+                        return response_data["error"][field]
+
+        return f"HTTP {status_code}: {response_data}"
+
+    @staticmethod
+    def _validators(response) -> tuple:
+        """Return the ``(ETag, Last-Modified)`` headers of a response, if any."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        return (
+            etag if isinstance(etag, str) else None,
+            last_modified if isinstance(last_modified, str) else None
+        )
+
+    @staticmethod
+    def _should_retry_throttled(method: str, status_code: int, attempt: int) -> bool:
+        """429 is always safe to retry; 503 only for idempotent methods."""
+        if status_code not in THROTTLE_STATUSES or attempt >= THROTTLE_RETRIES:
+            return False
+        return status_code == 429 or method.upper() in RETRY_METHODS
+
+    @staticmethod
+    def _job_state(job_status: Dict[str, Any]) -> Optional[str]:
+        """Return ``COMPLETED`` or None for a running job; raise if it failed."""
+        state = job_status.get("state")
+        if state in ["FAILED", "CANCELLED"]:
+            error_msg = job_status.get("message", "Job failed")
+            raise NetAppAPIError(f"Job failed: {error_msg}", response=job_status)
+        return state if state == "COMPLETED" else None
+
+
+# Sessions shared by all clients of this process once enable_shared_sessions()
+# has been called, keyed by connection settings. None means sharing is off.
+_shared_sessions: Optional[Dict[tuple, requests.Session]] = None
+_shared_pool_size = 10
+_shared_lock = threading.Lock()
+
+
+def enable_shared_sessions(pool_size: int = 10):
+    """Let every NetAppAPIClient in this process reuse one pooled session per host and user.
+
+    Used by `netapp batch`, where many commands run in one process and should
+    share TLS connections instead of opening new ones.
+    """
+    global _shared_sessions, _shared_pool_size
+    with _shared_lock:
+        if _shared_sessions is None:
+            _shared_sessions = {}
+        _shared_pool_size = max(_shared_pool_size, pool_size)
+
+
+def disable_shared_sessions():
+    """Close shared sessions and go back to one session per client."""
+    global _shared_sessions
+    with _shared_lock:
+        sessions, _shared_sessions = _shared_sessions or {}, None
+    for session in sessions.values():
+        session.close()
+
+
+class NetAppAPIClient(APIClientBase):
+    """NetApp ActiveIQ API client."""
+
+    def __init__(self, config: NetAppConfig, verbose: bool = False, pool_size: int = 10, use_daemon: bool = True):
+        super().__init__(config, verbose)
+
+        self.throttle = get_throttle(config.host, config.rate_limit, config.max_concurrency)
+        self.response_cache = ResponseCache.default() if config.http_cache else None
+
+        with _shared_lock:
+            if _shared_sessions is None:
+                self.session = self._create_session(pool_size)
+            else:
+                key = (config.host, config.username, config.password, config.verify_ssl)
+                self.session = _shared_sessions.get(key)
+                if self.session is None:
+                    self.session = self._create_session(max(pool_size, _shared_pool_size))
+                    _shared_sessions[key] = self.session
+
+        # Route requests through `netapp daemon` when one is running
+        self.daemon = None
+        if use_daemon:
+            from netapp_cli.utils.daemon import DaemonClient, daemon_enabled
+            if daemon_enabled():
+                daemon = DaemonClient(timeout=config.timeout + 5)
+                if daemon.available():
+                    self.daemon = daemon
+
+    def _create_session(self, pool_size: int) -> requests.Session:
+        """Create an authenticated session with retries and a sized connection pool."""
+        config = self.config
+        session = requests.Session()
+
+        session.headers.update(self._default_headers())
 
         # Configure retry strategy
         try:
             # Try new parameter name first (urllib3 >= 1.26.0)
             retry_strategy = Retry(
-                total=3,
-                status_forcelist=[429, 500, 502, 503, 504],
-                allowed_methods=["HEAD", "GET", "OPTIONS"],
-                backoff_factor=1
+                total=RETRY_TOTAL,
+                status_forcelist=RETRY_STATUSES,
+                allowed_methods=RETRY_METHODS,
+                backoff_factor=RETRY_BACKOFF
             )
         except TypeError:
             # Fallback to old parameter name for older urllib3 versions
             retry_strategy = Retry(
-                total=3,
-                status_forcelist=[429, 500, 502, 503, 504],
-                method_whitelist=["HEAD", "GET", "OPTIONS"],
-                backoff_factor=1
+                total=RETRY_TOTAL,
+                status_forcelist=RETRY_STATUSES,
+                method_whitelist=RETRY_METHODS,
+                backoff_factor=RETRY_BACKOFF
             )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        # Size the connection pool for concurrent bulk operations
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=pool_size,
+            pool_maxsize=pool_size
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
 
         # SSL verification
-        self.session.verify = config.verify_ssl
+        session.verify = config.verify_ssl
 
         if not config.verify_ssl:
             import urllib3
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+        return session
+
     def _make_request(
         self,
         method: str,
@@ -82,66 +336,143 @@ class NetAppAPIClient:
     ) -> Dict[str, Any]:
         """Make HTTP request to NetApp API."""
 
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-
-        if self.verbose:
-            console.print(f"[dim]{method.upper()} {url}[/dim]")
-            if params:
-                console.print(f"[dim]Params: {params}[/dim]")
-            if data:
-                console.print(f"[dim]Data: {json.dumps(data, indent=2)}[/dim]")
-
-        try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                params=params,
-                json=data,
-                timeout=self.config.timeout,
-                headers=headers or {}
-            )
-
-            if self.verbose:
-                console.print(f"[dim]Response: {response.status_code}[/dim]")
-
-            # Handle different response types
-            if response.status_code == 204:  # No Content
-                return {"success": True}
-
+        if self.daemon is not None:
+            from netapp_cli.utils.daemon import DaemonUnavailableError
             try:
-                response_data = response.json()
-            except ValueError:
-                response_data = {"text": response.text}
+                if self.verbose:
+                    console.print(f"[dim]{method.upper()} {endpoint} (via daemon)[/dim]")
+                return self.daemon.request(self.config, method, endpoint, params=params, data=data, headers=headers)
+            except DaemonUnavailableError as e:
+                if self.verbose:
+                    console.print(f"[dim]{e}; using direct connection[/dim]")
+                self.daemon = None
 
-            if response.status_code >= 400:
-                error_message = self._extract_error_message(response_data, response.status_code)
-                raise NetAppAPIError(
-                    error_message,
-                    status_code=response.status_code,
-                    response=response_data
-                )
+        url = self._build_url(endpoint)
+        self._log_request(method, url, params, data)
 
-            return response_data
+        # Revalidate cached GET responses instead of downloading them again
+        cache_key = cached = None
+        if self.response_cache is not None and method.upper() == "GET":
+            cache_key = self.response_cache.make_key(self.config.host, self.config.username, url, params)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                headers = dict(headers or {}, **self.response_cache.conditional_headers(cached))
 
-        except requests.exceptions.RequestException as e:
-            raise NetAppAPIError(f"Request failed: {str(e)}")
+        response = self._send(method, url, params=params, data=data, headers=headers)
 
-    def _extract_error_message(self, response_data: Dict, status_code: int) -> str:
-        """Extract error message from API response."""
-        if isinstance(response_data, dict):
-            # Common error message fields
-            error_fields = ["message", "error", "detail", "description"]
-            for field in error_fields:
-                if field in response_data:
-                    return response_data[field]
+        if cached is not None and response.status_code == 304:
+            if self.verbose:
+                console.print("[dim]Response: 304 (using cached body)[/dim]")
+            return self.response_cache.body(cached)
 
-            # Check for nested error objects
-            if "error" in response_data and isinstance(response_data["error"], dict):
-                for field in error_fields:
-                    if field in response_data["error"]:
-                        return response_data["error"][field]
+        result = self._handle_response(response)
+        if cache_key is not None and response.status_code == 200:
+            etag, last_modified = self._validators(response)
+            if etag or last_modified:
+                self.response_cache.store(cache_key, etag, last_modified, response.text)
+        return result
 
-        return f"HTTP {status_code}: {response_data}"
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        data: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        stream: bool = False
+    ) -> requests.Response:
+        """Send a request through the throttle, retrying throttled answers.
+
+        With ``stream``, the body is left unread for the caller to consume
+        and close.
+        """
+        kwargs = {"stream": True} if stream else {}
+        attempt = 0
+        while True:
+            with self.throttle.slot() as done:
+                try:
+                    response = self.session.request(
+                        method=method,
+                        url=url,
+                        params=params,
+                        json=data,
+                        timeout=self.config.timeout,
+                        headers=headers or {},
+                        **kwargs
+                    )
+                except requests.exceptions.RequestException as e:
+                    raise NetAppAPIError(f"Request failed: {str(e)}")
+
+                if not stream:
+                    # Reading the body decodes it chunk by chunk; tell() is the compressed size
+                    self._record_transfer(response, response.raw.tell() if response.raw else None)
+
+                retry_after = None
+                if response.status_code in THROTTLE_STATUSES:
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                done(response.status_code, retry_after)
+
+            if not self._should_retry_throttled(method, response.status_code, attempt):
+                return response
+
+            response.close()
+            attempt += 1
+            if self.verbose:
+                console.print(f"[dim]Throttled ({response.status_code}), retrying {method.upper()} {url}[/dim]")
+
+    def _stream_page(self, endpoint: str, params: Dict, parser: RecordParser) -> Iterator[Dict]:
+        """Yield the records of one list page while its body is downloaded."""
+        if self.daemon is not None:
+            # The daemon answers with complete documents
+            page = self._make_request("GET", endpoint, params=params)
+            parser.meta.update((key, value) for key, value in page.items() if key != parser.key)
+            yield from page.get(parser.key, [])
+            return
+
+        url = self._build_url(endpoint)
+        self._log_request("GET", url, params, None)
+
+        # Pages are revalidated like other GETs: an unchanged page is answered
+        # with 304 and replayed from the response cache
+        cache_key = cached = headers = None
+        if self.response_cache is not None:
+            cache_key = self.response_cache.make_key(self.config.host, self.config.username, url, params)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                headers = self.response_cache.conditional_headers(cached)
+
+        response = self._send("GET", url, params=params, headers=headers, stream=True)
+        try:
+            if cached is not None and response.status_code == 304:
+                if self.verbose:
+                    console.print("[dim]Response: 304 (using cached body)[/dim]")
+                page = self.response_cache.body(cached)
+            elif response.status_code != 200:
+                page = self._handle_response(response)
+            else:
+                page = None
+            if page is not None:
+                parser.meta.update((key, value) for key, value in page.items() if key != parser.key)
+                yield from page.get(parser.key, [])
+                return
+
+            etag, last_modified = self._validators(response) if cache_key else (None, None)
+            # Kept only when the page can be revalidated later
+            body = [] if etag or last_modified else None
+            decoded_bytes = 0
+            for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                decoded_bytes += len(chunk)
+                if body is not None:
+                    body.append(chunk)
+                yield from parser.feed(chunk)
+            yield from parser.close()
+            self._record_transfer(response, response.raw.tell(), decoded_bytes)
+            if body is not None:
+                self.response_cache.store(cache_key, etag, last_modified, b"".join(body).decode("utf-8"))
+        except StreamError as e:
+            raise NetAppAPIError(f"Invalid response from {url}: {e}", status_code=response.status_code)
+        finally:
+            response.close()
 
     def get(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """Make GET request."""
@@ -178,12 +509,8 @@ class NetAppAPIClient:
                 if self.verbose:
                     console.print(f"[dim]Job {job_key} status: {job_status.get('state', 'unknown')}[/dim]")
 
-                state = job_status.get("state")
-                if state == "COMPLETED":
+                if self._job_state(job_status) == "COMPLETED":
                     return job_status
-                elif state in ["FAILED", "CANCELLED"]:
-                    error_msg = job_status.get("message", "Job failed")
-                    raise NetAppAPIError(f"Job failed: {error_msg}", response=job_status)
 
                 time.sleep(2)  # Wait 2 seconds before next check
 
@@ -194,11 +521,97 @@ class NetAppAPIClient:
 
         raise NetAppAPIError(f"Job {job_key} timed out after {timeout} seconds")
 
-    def paginate(self, endpoint: str, params: Optional[Dict] = None, max_records: int = None) -> List[Dict]:
-        """Paginate through API results."""
+    def wait_for_jobs(
+        self,
+        job_keys: Iterable[str],
+        timeout: int = 300,
+        on_update: Optional[Callable[[Dict[str, Dict[str, Any]]], None]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Wait for several jobs together.
+
+        All pending jobs are polled in each round and ``on_update`` is called
+        with the latest status of every job after each round. Unlike
+        wait_for_job, failures do not raise: the final status of each job is
+        returned, with ``state`` set to ``TIMEOUT`` for jobs still running when
+        the timeout expires and ``NOT_FOUND`` for unknown job keys.
+        """
+        statuses: Dict[str, Dict[str, Any]] = {key: {"key": key, "state": "QUEUED"} for key in job_keys}
+        pending = [key for key in statuses]
+        start_time = time.time()
+
+        while pending:
+            for job_key in pending:
+                try:
+                    statuses[job_key] = self.get(f"/management-server/jobs/{job_key}")
+                except NetAppAPIError as e:
+                    if e.status_code != 404:
+                        raise
+                    statuses[job_key] = {"key": job_key, "state": "NOT_FOUND", "message": f"Job {job_key} not found"}
+
+            pending = [
+                key for key in pending
+                if statuses[key].get("state") not in FINAL_JOB_STATES
+            ]
+
+            if self.verbose:
+                console.print(f"[dim]Jobs: {len(statuses) - len(pending)}/{len(statuses)} finished[/dim]")
+            if on_update:
+                on_update(statuses)
+
+            if pending:
+                if time.time() - start_time >= timeout:
+                    for key in pending:
+                        statuses[key] = dict(statuses[key], state="TIMEOUT", message=f"Job {key} timed out after {timeout} seconds")
+                    break
+                time.sleep(JOB_POLL_INTERVAL)
+
+        return statuses
+
+    def iter_records(self, endpoint: str, params: Optional[Dict] = None, max_records: int = None) -> Iterator[Dict]:
+        """Yield the records of a list endpoint, page by page.
+
+        Each page is parsed while it downloads (see jsonstream.py), so the
+        first record is available early and no page is held in memory as a
+        whole. Stops at the same point as paginate(). Pages are revalidated
+        through the response cache, so an unchanged page is not downloaded
+        again.
+        """
+        params = params or {}
+        offset = 0
+        count = 0
+
+        while not (max_records and offset >= max_records):
+            parser = RecordParser()
+            page_count = 0
+            for record in self._stream_page(endpoint, dict(params, offset=offset, limit=PAGE_SIZE), parser):
+                yield record
+                page_count += 1
+                count += 1
+                if max_records and count >= max_records:
+                    return
+
+            if not page_count or self._page_done(page_count, offset, parser.meta):
+                return
+            offset += page_count
+
+    def paginate(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        max_records: int = None,
+        stream: bool = False
+    ) -> List[Dict]:
+        """Paginate through API results.
+
+        With ``stream``, pages are parsed incrementally by iter_records(),
+        which lowers peak memory for large pages.
+        """
+        if stream:
+            return list(self.iter_records(endpoint, params, max_records))
+
         all_records = []
         offset = 0
-        limit = 100  # Default page size
+        limit = PAGE_SIZE
 
         params = params or {}
 
@@ -221,11 +634,10 @@ class NetAppAPIClient:
             all_records.extend(records)
 
             # Check if we have more records
-            num_records = response.get("num_records", 0)
-            if len(records) < limit or offset + len(records) >= num_records:
+            if self._page_done(len(records), offset, response):
                 break
 
-            offset += limit
+            offset += len(records)
 
             if max_records and len(all_records) >= max_records:
                 all_records = all_records[:max_records]
@@ -0,0 +1,357 @@
+"""Asynchronous NetApp ActiveIQ API client (requires the ``async`` extra)."""
+
+import asyncio
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+from netapp_cli.utils.api_client import (
+    FINAL_JOB_STATES,
+    JOB_POLL_INTERVAL,
+    PAGE_SIZE,
+    RETRY_BACKOFF,
+    RETRY_METHODS,
+    RETRY_STATUSES,
+    RETRY_TOTAL,
+    STREAM_CHUNK_SIZE,
+    APIClientBase,
+    NetAppAPIError,
+    console,
+)
+from netapp_cli.utils.config import NetAppConfig
+from netapp_cli.utils.jsonstream import RecordParser, StreamError
+from netapp_cli.utils.ratelimit import THROTTLE_STATUSES, get_async_throttle, parse_retry_after
+
+
+class AsyncNetAppAPIClient(APIClientBase):
+    """httpx-based twin of NetAppAPIClient for fan-out on one event loop.
+
+    Offers the same get/post/patch/delete/paginate/wait_for_job surface,
+    retry policy and NetAppAPIError mapping. Use it as an async context
+    manager so the connection pool is closed::
+
+        async with AsyncNetAppAPIClient(config) as client:
+            volumes = await client.paginate("/api/storage/volumes")
+    """
+
+    def __init__(
+        self,
+        config: NetAppConfig,
+        verbose: bool = False,
+        max_connections: int = 100,
+        transport: Optional["httpx.AsyncBaseTransport"] = None
+    ):
+        if httpx is None:
+            raise ImportError("AsyncNetAppAPIClient requires httpx: pip install 'netapp-cli[async]'")
+
+        super().__init__(config, verbose)
+        self.client = httpx.AsyncClient(
+            headers=self._default_headers(),
+            verify=config.verify_ssl,
+            timeout=config.timeout,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            transport=transport
+        )
+
+    async def __aenter__(self) -> "AsyncNetAppAPIClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the connection pool."""
+        await self.client.aclose()
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        data: Optional[Dict] = None,
+        headers: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """Make HTTP request to NetApp API, retrying like the sync client."""
+        url = self._build_url(endpoint)
+        self._log_request(method, url, params, data)
+        response = await self._send(method, url, params=params, data=data, headers=headers)
+        return self._handle_response(response)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        data: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        stream: bool = False
+    ) -> "httpx.Response":
+        """Send a request through the throttle with the shared retry policy.
+
+        With ``stream``, the body is left unread for the caller to consume
+        and close.
+        """
+        retryable = method.upper() in RETRY_METHODS
+        throttle = get_async_throttle(self.config.host, self.config.rate_limit, self.config.max_concurrency)
+
+        attempt = 0
+        throttled_attempt = 0
+        while True:
+            async with throttle.slot() as done:
+                try:
+                    request = self.client.build_request(
+                        method,
+                        url,
+                        params=params,
+                        json=data,
+                        headers=headers or {}
+                    )
+                    response = await self.client.send(request, stream=stream)
+                except httpx.HTTPError as e:
+                    response = None
+                    if not retryable or attempt >= RETRY_TOTAL:
+                        raise NetAppAPIError(f"Request failed: {str(e)}")
+                else:
+                    if not stream:
+                        self._record_transfer(response, response.num_bytes_downloaded)
+                    retry_after = None
+                    if response.status_code in THROTTLE_STATUSES:
+                        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    done(response.status_code, retry_after)
+
+            if response is not None:
+                if self._should_retry_throttled(method, response.status_code, throttled_attempt):
+                    # The throttle delays the next attempt (Retry-After or backoff, lower concurrency)
+                    await response.aclose()
+                    throttled_attempt += 1
+                    if self.verbose:
+                        console.print(f"[dim]Throttled ({response.status_code}), retrying {method.upper()} {url}[/dim]")
+                    continue
+                if not (retryable and response.status_code in RETRY_STATUSES and attempt < RETRY_TOTAL):
+                    return response
+                await response.aclose()
+
+            attempt += 1
+            # Same schedule as urllib3: no wait before the first retry
+            delay = 0 if attempt == 1 else RETRY_BACKOFF * (2 ** (attempt - 1))
+            if self.verbose:
+                console.print(f"[dim]Retrying {method.upper()} {url} (attempt {attempt + 1})[/dim]")
+            await asyncio.sleep(delay)
+
+    async def _stream_page(self, endpoint: str, params: Dict, parser: RecordParser) -> AsyncIterator[Dict]:
+        """Yield the records of one list page while its body is downloaded."""
+        url = self._build_url(endpoint)
+        self._log_request("GET", url, params, None)
+        response = await self._send("GET", url, params=params, stream=True)
+        try:
+            if response.status_code != 200:
+                await response.aread()
+                page = self._handle_response(response)
+                parser.meta.update((key, value) for key, value in page.items() if key != parser.key)
+                for record in page.get(parser.key, []):
+                    yield record
+                return
+
+            decoded_bytes = 0
+            async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                decoded_bytes += len(chunk)
+                for record in parser.feed(chunk):
+                    yield record
+            for record in parser.close():
+                yield record
+            self._record_transfer(response, response.num_bytes_downloaded, decoded_bytes)
+        except StreamError as e:
+            raise NetAppAPIError(f"Invalid response from {url}: {e}", status_code=response.status_code)
+        finally:
+            await response.aclose()
+
+    async def get(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """Make GET request."""
+        return await self._make_request("GET", endpoint, params=params)
+
+    async def post(self, endpoint: str, data: Optional[Dict] = None) -> Dict[str, Any]:
+        """Make POST request."""
+        return await self._make_request("POST", endpoint, data=data)
+
+    async def patch(self, endpoint: str, data: Optional[Dict] = None) -> Dict[str, Any]:
+        """Make PATCH request."""
+        return await self._make_request("PATCH", endpoint, data=data)
+
+    async def delete(self, endpoint: str) -> Dict[str, Any]:
+        """Make DELETE request."""
+        return await self._make_request("DELETE", endpoint)
+
+    async def test_connection(self) -> bool:
+        """Test API connection."""
+        try:
+            await self.get("/api/cluster")
+            return True
+        except NetAppAPIError:
+            return False
+
+    async def wait_for_job(self, job_key: str, timeout: int = 300, interval: float = 2) -> Dict[str, Any]:
+        """Wait for a job to complete."""
+        start_time = time.monotonic()
+
+        while time.monotonic() - start_time < timeout:
+            try:
+                job_status = await self.get(f"/management-server/jobs/{job_key}")
+            except NetAppAPIError as e:
+                if e.status_code == 404:
+                    raise NetAppAPIError(f"Job {job_key} not found")
+                raise
+
+            if self.verbose:
+                console.print(f"[dim]Job {job_key} status: {job_status.get('state', 'unknown')}[/dim]")
+
+            if self._job_state(job_status) == "COMPLETED":
+                return job_status
+
+            await asyncio.sleep(interval)
+
+        raise NetAppAPIError(f"Job {job_key} timed out after {timeout} seconds")
+
+    async def wait_for_jobs(
+        self,
+        job_keys: Iterable[str],
+        timeout: int = 300,
+        on_update: Optional[Callable[[Dict[str, Dict[str, Any]]], None]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Wait for several jobs together, like NetAppAPIClient.wait_for_jobs.
+
+        The pending jobs of each round are polled concurrently. Failures do
+        not raise: the final status of each job is returned, with ``state``
+        set to ``TIMEOUT`` for jobs still running when the timeout expires and
+        ``NOT_FOUND`` for unknown job keys.
+        """
+        statuses: Dict[str, Dict[str, Any]] = {key: {"key": key, "state": "QUEUED"} for key in job_keys}
+        pending = [key for key in statuses]
+        start_time = time.monotonic()
+
+        async def poll(job_key: str) -> Dict[str, Any]:
+            try:
+                return await self.get(f"/management-server/jobs/{job_key}")
+            except NetAppAPIError as e:
+                if e.status_code != 404:
+                    raise
+                return {"key": job_key, "state": "NOT_FOUND", "message": f"Job {job_key} not found"}
+
+        while pending:
+            for job_key, status in zip(pending, await asyncio.gather(*(poll(key) for key in pending))):
+                statuses[job_key] = status
+
+            pending = [key for key in pending if statuses[key].get("state") not in FINAL_JOB_STATES]
+
+            if self.verbose:
+                console.print(f"[dim]Jobs: {len(statuses) - len(pending)}/{len(statuses)} finished[/dim]")
+            if on_update:
+                on_update(statuses)
+
+            if pending:
+                if time.monotonic() - start_time >= timeout:
+                    for key in pending:
+                        statuses[key] = dict(statuses[key], state="TIMEOUT", message=f"Job {key} timed out after {timeout} seconds")
+                    break
+                await asyncio.sleep(JOB_POLL_INTERVAL)
+
+        return statuses
+
+    async def iter_records(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        max_records: int = None
+    ) -> AsyncIterator[Dict]:
+        """Yield the records of a list endpoint, parsing each page as it downloads.
+
+        Pages are fetched one after the other; use paginate() to fetch them
+        concurrently when memory is not a concern.
+        """
+        params = params or {}
+        offset = 0
+        count = 0
+
+        while not (max_records and offset >= max_records):
+            parser = RecordParser()
+            page_count = 0
+            page = self._stream_page(endpoint, dict(params, offset=offset, limit=PAGE_SIZE), parser)
+            try:
+                async for record in page:
+                    yield record
+                    page_count += 1
+                    count += 1
+                    if max_records and count >= max_records:
+                        return
+            finally:
+                # Release the connection now rather than when the generator is collected
+                await page.aclose()
+
+            if not page_count or self._page_done(page_count, offset, parser.meta):
+                return
+            offset += page_count
+
+    async def paginate(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        max_records: int = None,
+        concurrency: int = 8
+    ) -> List[Dict]:
+        """Paginate through API results.
+
+        The first page's ``total_records`` tells how many records exist; the
+        remaining pages are then fetched concurrently (at most
+        ``concurrency`` at a time) and returned in order. Without it, pages
+        are fetched one after the other.
+        """
+        params = params or {}
+        limit = PAGE_SIZE
+
+        first = await self.get(endpoint, params=dict(params, offset=0, limit=limit))
+        records = first.get("records", [])
+        total = first.get("total_records")
+        if not isinstance(total, int):
+            return await self._paginate_sequential(endpoint, params, max_records, first)
+
+        if max_records:
+            total = min(total, max_records)
+        if not records or len(records) >= total:
+            return records[:total]
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        # The server may return fewer records per page than asked for
+        step = len(records)
+
+        async def fetch(offset: int) -> List[Dict]:
+            async with semaphore:
+                page = await self.get(endpoint, params=dict(params, offset=offset, limit=limit))
+                return page.get("records", [])[:step]
+
+        pages = await asyncio.gather(*(fetch(offset) for offset in range(step, total, step)))
+        for page in pages:
+            records.extend(page)
+
+        return records[:total]
+
+    async def _paginate_sequential(
+        self,
+        endpoint: str,
+        params: Dict,
+        max_records: Optional[int],
+        first: Dict[str, Any]
+    ) -> List[Dict]:
+        """Fetch pages one by one when the server does not report a total."""
+        records = list(first.get("records", []))
+        page, page_count, offset = first, len(records), 0
+        while page_count and not self._page_done(page_count, offset, page):
+            if max_records and len(records) >= max_records:
+                break
+            offset += page_count
+            page = await self.get(endpoint, params=dict(params, offset=offset, limit=PAGE_SIZE))
+            page_count = len(page.get("records", []))
+            records.extend(page.get("records", []))
+        return records[:max_records] if max_records else records
@@ -0,0 +1,100 @@
+"""Helpers for bulk operations: manifests and bounded concurrent execution."""
+
+import csv
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence
+
+import yaml
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn, TimeElapsedColumn
+
+from netapp_cli.utils.api_client import NetAppAPIError
+from netapp_cli.utils.output import console
+
+DEFAULT_CONCURRENCY = 8
+
+
+class ManifestError(Exception):
+    """Manifest file could not be read."""
+
+
+def load_manifest(path: str) -> List[Dict[str, Any]]:
+    """Load bulk operation entries from a CSV, YAML or JSON manifest.
+
+    CSV files need a header row. YAML and JSON files contain either a list
+    of mappings or a mapping with an ``items`` list. Keys are normalized to
+    lower case so ``Volume`` and ``volume`` are equivalent.
+    """
+    manifest_path = Path(path)
+    suffix = manifest_path.suffix.lower()
+
+    try:
+        with open(manifest_path, 'r', newline='') as f:
+            if suffix == ".csv":
+                entries = [row for row in csv.DictReader(f)]
+            elif suffix in (".yaml", ".yml"):
+                entries = yaml.safe_load(f) or []
+            elif suffix == ".json":
+                entries = json.load(f)
+            else:
+                raise ManifestError(f"Unsupported manifest format '{suffix}'. Use .csv, .yaml, .yml or .json")
+    except (OSError, ValueError, yaml.YAMLError) as e:
+        raise ManifestError(f"Cannot read manifest {path}: {e}")
+
+    if isinstance(entries, dict):
+        entries = entries.get("items", [])
+    if not isinstance(entries, (list, tuple)):
+        raise ManifestError(f"Manifest {path} must contain a list of entries")
+
+    normalized = []
+    for index, entry in enumerate(entries, start=1):
+        if not isinstance(entry, dict):
+            raise ManifestError(f"Manifest entry {index} is not a mapping")
+        normalized.append({
+            str(key).strip().lower(): value.strip() if isinstance(value, str) else value
+            for key, value in entry.items()
+            if key is not None
+        })
+    return normalized
+
+
+def run_bulk(
+    items: Sequence[Any],
+    action: Callable[[Any], Any],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    description: str = "Processing",
+) -> List[Dict[str, Any]]:
+    """Run ``action`` for every item with at most ``concurrency`` in flight.
+
+    Returns one result per item, in input order, with ``status`` set to
+    ``ok`` or ``failed``. API errors are recorded per item instead of
+    aborting the whole batch. A progress bar is shown on terminals.
+    """
+    results: List[Dict[str, Any]] = [{} for _ in items]
+    if not items:
+        return results
+
+    progress = Progress(
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeElapsedColumn(),
+        console=console,
+        transient=True,
+        disable=not console.is_terminal,
+    )
+
+    with progress:
+        task = progress.add_task(description, total=len(items))
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            futures = {executor.submit(action, item): index for index, item in enumerate(items)}
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    results[index] = {"status": "ok", "result": future.result(), "message": ""}
+                except NetAppAPIError as e:
+                    results[index] = {"status": "failed", "result": None, "message": str(e)}
+                progress.advance(task)
+
+    return results
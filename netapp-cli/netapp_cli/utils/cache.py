@@ -0,0 +1,289 @@
+"""On-disk caches shared across CLI invocations."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from netapp_cli.utils import jsonlib
+
+
+def cache_dir() -> Path:
+    """Directory holding CLI caches.
+
+    Defaults to ``~/.netapp-cli/cache`` and can be overridden with the
+    ``NETAPP_CLI_CACHE_DIR`` environment variable.
+    """
+    override = os.getenv("NETAPP_CLI_CACHE_DIR")
+    if override:
+        return Path(override).expanduser()
+    return Path.home() / ".netapp-cli" / "cache"
+
+
+def _write_json_atomic(path: Path, data: Any):
+    """Write JSON to ``path`` without leaving a partial file behind."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+class ResolutionCache:
+    """Persistent name to UUID cache with a time-to-live per entry.
+
+    Entries are keyed by host, object kind, scope (SVM name or parent UUID)
+    and name. The cache is loaded lazily from a JSON file and rewritten
+    atomically on every change so concurrent CLI processes never read a
+    partial file.
+    """
+
+    DEFAULT_TTL = 900
+    FILE_NAME = "resolution.json"
+
+    _instances: Dict[str, "ResolutionCache"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path: Optional[Path] = None, ttl: int = DEFAULT_TTL, enabled: bool = True):
+        self.path = Path(path) if path else cache_dir() / self.FILE_NAME
+        self.ttl = ttl
+        self.enabled = enabled
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._lock = threading.RLock()
+
+    @classmethod
+    def for_config(cls, config) -> "ResolutionCache":
+        """Return the process-wide cache configured by the ``cache`` section.
+
+        Example configuration::
+
+            cache:
+              enabled: true
+              ttl: 900
+        """
+        settings = config.get("cache") or {}
+        path = Path(settings["path"]).expanduser() if settings.get("path") else cache_dir() / cls.FILE_NAME
+        ttl = int(settings.get("ttl", cls.DEFAULT_TTL))
+        enabled = bool(settings.get("enabled", True))
+
+        with cls._instances_lock:
+            instance = cls._instances.get(str(path))
+            if instance is None:
+                instance = cls(path, ttl=ttl, enabled=enabled)
+                cls._instances[str(path)] = instance
+            else:
+                instance.ttl = ttl
+                instance.enabled = enabled
+            return instance
+
+    @staticmethod
+    def make_key(host: str, kind: str, name: str, scope: Optional[str] = None) -> str:
+        """Build the cache key for an object name."""
+        return "|".join([host, kind, scope or "", name])
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load entries from disk on first use."""
+        if self._entries is None:
+            try:
+                with open(self.path, 'r') as f:
+                    data = json.load(f)
+                self._entries = data if isinstance(data, dict) else {}
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def _save(self):
+        """Persist entries, dropping expired ones."""
+        now = time.time()
+        entries = {
+            key: entry for key, entry in self._load().items()
+            if entry.get("expires", 0) > now
+        }
+        self._entries = entries
+        try:
+            _write_json_atomic(self.path, entries)
+        except OSError:
+            pass  # The cache is an optimization; never fail a command over it
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached UUID for ``key`` or None if missing or expired."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._load().get(key)
+            if entry and entry.get("expires", 0) > time.time():
+                return entry.get("uuid")
+        return None
+
+    def set(self, key: str, uuid: str):
+        """Cache ``uuid`` for ``key``."""
+        self.set_many({key: uuid})
+
+    def set_many(self, mapping: Dict[str, str]):
+        """Cache several entries with a single write."""
+        if not self.enabled or not mapping:
+            return
+        with self._lock:
+            entries = self._load()
+            expires = time.time() + self.ttl
+            for key, uuid in mapping.items():
+                entries[key] = {"uuid": uuid, "expires": expires}
+            self._save()
+
+    def invalidate(self, key: str):
+        """Drop a single entry, e.g. after the API answered 404 for it."""
+        self.invalidate_many([key])
+
+    def invalidate_many(self, keys: Iterable[str]):
+        """Drop several entries with a single write."""
+        if not self.enabled:
+            return
+        with self._lock:
+            entries = self._load()
+            removed = [key for key in keys if entries.pop(key, None) is not None]
+            if removed:
+                self._save()
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries = {}
+            self._save()
+
+
+class ResponseCache:
+    """Persistent cache of GET responses for conditional requests.
+
+    Responses carrying an ``ETag`` or ``Last-Modified`` header are stored
+    one file per request under ``<cache dir>/responses``. The next request
+    for the same URL sends ``If-None-Match`` / ``If-Modified-Since`` and a
+    304 answer is served from the stored body, so unchanged payloads are
+    not downloaded again, across CLI invocations as well. Recently used
+    entries are also kept in memory.
+    """
+
+    DIR_NAME = "responses"
+    MAX_ENTRIES = 1000
+    MEMORY_ENTRIES = 128
+
+    _instances: Dict[str, "ResponseCache"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path: Optional[Path] = None, max_entries: int = MAX_ENTRIES):
+        self.path = Path(path) if path else cache_dir() / self.DIR_NAME
+        self.max_entries = max_entries
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    @classmethod
+    def default(cls) -> "ResponseCache":
+        """Return the process-wide cache in the current cache directory."""
+        path = cache_dir() / cls.DIR_NAME
+        with cls._instances_lock:
+            instance = cls._instances.get(str(path))
+            if instance is None:
+                instance = cls(path)
+                cls._instances[str(path)] = instance
+            return instance
+
+    @staticmethod
+    def make_key(host: str, username: str, url: str, params: Optional[Dict] = None) -> str:
+        """Build the cache key for a GET request.
+
+        The user is part of the key since different users may see different
+        objects.
+        """
+        query = json.dumps(params or {}, sort_keys=True, default=str)
+        return hashlib.sha256("|".join([host, username, url, query]).encode()).hexdigest()
+
+    def _file(self, key: str) -> Path:
+        return self.path / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored entry (validators and body) for ``key``."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+
+        try:
+            with open(self._file(key), 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or "body" not in entry:
+            return None
+
+        self._remember(key, entry)
+        return entry
+
+    @staticmethod
+    def conditional_headers(entry: Dict[str, Any]) -> Dict[str, str]:
+        """Request headers revalidating ``entry``."""
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    @staticmethod
+    def body(entry: Dict[str, Any]) -> Any:
+        """Decode the stored body; every call returns a fresh object."""
+        return jsonlib.loads(entry["body"])
+
+    def store(self, key: str, etag: Optional[str], last_modified: Optional[str], body: str):
+        """Store a response body with its validators.
+
+        Responses without validators cannot be revalidated and are ignored.
+        """
+        if not etag and not last_modified:
+            return
+        entry = {"etag": etag, "last_modified": last_modified, "body": body, "stored": time.time()}
+        self._remember(key, entry)
+        try:
+            _write_json_atomic(self._file(key), entry)
+        except OSError:
+            return  # The cache is an optimization; never fail a command over it
+
+        with self._lock:
+            self._writes += 1
+            prune = self._writes % 100 == 1
+        if prune:
+            self._prune()
+
+    def _remember(self, key: str, entry: Dict[str, Any]):
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.MEMORY_ENTRIES:
+                self._memory.popitem(last=False)
+
+    def _prune(self):
+        """Drop the least recently stored files beyond ``max_entries``."""
+        try:
+            files = [entry for entry in os.scandir(self.path) if entry.name.endswith(".json")]
+            if len(files) <= self.max_entries:
+                return
+            files.sort(key=lambda entry: entry.stat().st_mtime)
+            for entry in files[:len(files) - self.max_entries]:
+                os.unlink(entry.path)
+        except OSError:
+            pass
+
+    def clear(self):
+        """Remove all stored responses."""
+        with self._lock:
+            self._memory.clear()
+        try:
+            for entry in os.scandir(self.path):
+                if entry.name.endswith(".json"):
+                    os.unlink(entry.path)
+        except OSError:
+            pass
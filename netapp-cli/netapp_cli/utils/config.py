@@ -16,6 +16,9 @@ class NetAppConfig(BaseModel):
     verify_ssl: bool = Field(True, description="Verify SSL certificates")
     timeout: int = Field(30, description="Request timeout in seconds")
     api_version: str = Field("v1", description="API version")
+    rate_limit: Optional[float] = Field(None, description="Maximum requests per second (unlimited if not set)")
+    max_concurrency: int = Field(16, description="Upper bound for concurrent requests; lowered automatically on 429/503")
+    http_cache: bool = Field(True, description="Revalidate cached GET responses with ETag/Last-Modified")
 
 
 class Config:
@@ -67,6 +70,10 @@ class Config:
             netapp_config["verify_ssl"] = os.getenv("NETAPP_VERIFY_SSL").lower() == "true"
         if os.getenv("NETAPP_TIMEOUT"):
             netapp_config["timeout"] = int(os.getenv("NETAPP_TIMEOUT"))
+        if os.getenv("NETAPP_RATE_LIMIT"):
+            netapp_config["rate_limit"] = float(os.getenv("NETAPP_RATE_LIMIT"))
+        if os.getenv("NETAPP_MAX_CONCURRENCY"):
+            netapp_config["max_concurrency"] = int(os.getenv("NETAPP_MAX_CONCURRENCY"))
         if os.getenv("NETAPP_API_VERSION"):
             netapp_config["api_version"] = os.getenv("NETAPP_API_VERSION")
 
@@ -126,6 +133,10 @@ class Config:
             "logging": {
                 "level": "INFO",
                 "file": "netapp-cli.log"
+            },
+            "cache": {
+                "enabled": True,
+                "ttl": 900
             }
         }
 
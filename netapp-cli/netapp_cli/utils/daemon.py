@@ -0,0 +1,294 @@
+"""Background daemon holding warm API sessions, and the client side of its socket.
+
+The daemon listens on a Unix socket and proxies API requests through
+long-lived NetAppAPIClient instances, so TLS connections and the HTTP
+connection pool survive across CLI invocations. The protocol is one JSON
+object per line in each direction.
+"""
+
+import os
+import socket
+import socketserver
+import stat
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from netapp_cli.utils import jsonlib
+from netapp_cli.utils.api_client import NetAppAPIClient, NetAppAPIError
+from netapp_cli.utils.config import NetAppConfig
+
+DEFAULT_IDLE_TIMEOUT = 3600
+CONNECT_TIMEOUT = 0.5
+
+
+class DaemonUnavailableError(Exception):
+    """No daemon could be reached; the caller should talk to the API directly."""
+
+
+def daemon_dir() -> Path:
+    """Directory holding the daemon socket, pid and log files."""
+    return Path.home() / ".netapp-cli"
+
+
+def socket_path() -> Path:
+    """Socket path, overridable with the ``NETAPP_DAEMON_SOCKET`` environment variable."""
+    override = os.getenv("NETAPP_DAEMON_SOCKET")
+    if override:
+        return Path(override).expanduser()
+    return daemon_dir() / "daemon.sock"
+
+
+def daemon_enabled() -> bool:
+    """Whether API clients may use the daemon (disable with ``NETAPP_DAEMON=0``)."""
+    return hasattr(socket, "AF_UNIX") and os.getenv("NETAPP_DAEMON", "1").lower() not in ("0", "false", "no", "off")
+
+
+def remove_socket(path: Path) -> None:
+    """Remove a leftover daemon socket.
+
+    Raises FileExistsError if something other than a socket sits at ``path``,
+    so a mistyped ``--socket`` never deletes a regular file.
+    """
+    try:
+        mode = path.lstat().st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"{path} exists and is not a socket; refusing to remove it")
+    path.unlink()
+
+
+def _config_payload(config: NetAppConfig) -> Dict[str, Any]:
+    return config.model_dump()
+
+
+class DaemonClient:
+    """Send API requests to a running daemon.
+
+    Each thread keeps its own connection so concurrent bulk operations are
+    not serialized on a single socket.
+    """
+
+    def __init__(self, path: Optional[Path] = None, timeout: Optional[float] = None):
+        self.path = Path(path) if path else socket_path()
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def available(self) -> bool:
+        """Cheap check for a daemon socket, without connecting."""
+        return self.path.exists()
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(CONNECT_TIMEOUT)
+            try:
+                sock.connect(str(self.path))
+            except OSError as e:
+                sock.close()
+                raise DaemonUnavailableError(f"Cannot connect to daemon at {self.path}: {e}")
+            sock.settimeout(self.timeout)
+            conn = (sock, sock.makefile("rb"))
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn[1].close()
+            conn[0].close()
+            self._local.conn = None
+
+    def call(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Send one message and return the reply.
+
+        Raises DaemonUnavailableError only if the message could not be sent, so
+        callers can fall back to direct mode without risking a duplicate
+        non-idempotent request. Failures after sending raise NetAppAPIError.
+        """
+        sock, reader = self._connection()
+        payload = (jsonlib.dumps(message) + "\n").encode("utf-8")
+        try:
+            sock.sendall(payload)
+        except OSError as e:
+            self.close()
+            raise DaemonUnavailableError(f"Daemon connection lost: {e}")
+
+        try:
+            line = reader.readline()
+        except OSError as e:
+            self.close()
+            raise NetAppAPIError(f"Daemon connection lost: {e}")
+        if not line:
+            self.close()
+            raise NetAppAPIError("Daemon closed the connection")
+        return jsonlib.loads(line)
+
+    def request(
+        self,
+        config: NetAppConfig,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        data: Optional[Dict] = None,
+        headers: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """Proxy an API request through the daemon."""
+        reply = self.call({
+            "op": "request",
+            "config": _config_payload(config),
+            "method": method,
+            "endpoint": endpoint,
+            "params": params,
+            "data": data,
+            "headers": headers,
+        })
+        if not reply.get("ok"):
+            raise NetAppAPIError(
+                reply.get("error", "Daemon request failed"),
+                status_code=reply.get("status_code"),
+                response=reply.get("response")
+            )
+        return reply.get("data")
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Serve newline-delimited JSON messages on one connection."""
+
+    def handle(self):
+        for line in self.rfile:
+            message = {}
+            try:
+                message = jsonlib.loads(line)
+                reply = self.server.daemon.dispatch(message)
+            except ValueError as e:
+                reply = {"ok": False, "error": f"Invalid message: {e}"}
+            try:
+                self.wfile.write((jsonlib.dumps(reply) + "\n").encode("utf-8"))
+                self.wfile.flush()
+            except OSError:
+                return
+            if message.get("op") == "shutdown":
+                return
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class NetAppDaemon:
+    """Daemon keeping one warm NetAppAPIClient per configuration."""
+
+    def __init__(self, path: Optional[Path] = None, idle_timeout: int = DEFAULT_IDLE_TIMEOUT, pool_size: int = 16):
+        self.path = Path(path) if path else socket_path()
+        self.idle_timeout = idle_timeout
+        self.pool_size = pool_size
+        self.started = time.time()
+        self.last_activity = self.started
+        self.requests_served = 0
+        self._clients: Dict[Tuple, NetAppAPIClient] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[_Server] = None
+
+    def _client_for(self, config_data: Dict[str, Any]) -> NetAppAPIClient:
+        key = tuple(sorted(config_data.items()))
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = NetAppAPIClient(NetAppConfig(**config_data), pool_size=self.pool_size, use_daemon=False)
+                self._clients[key] = client
+            return client
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "socket": str(self.path),
+            "uptime": int(time.time() - self.started),
+            "clients": len(self._clients),
+            "requests": self.requests_served,
+            "idle_timeout": self.idle_timeout,
+        }
+
+    def dispatch(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle one protocol message."""
+        self.last_activity = time.time()
+        op = message.get("op")
+
+        if op == "ping":
+            return dict(self.status(), ok=True)
+
+        if op == "shutdown":
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {"ok": True}
+
+        if op == "request":
+            try:
+                client = self._client_for(message["config"])
+                data = client._make_request(
+                    message["method"],
+                    message["endpoint"],
+                    params=message.get("params"),
+                    data=message.get("data"),
+                    headers=message.get("headers")
+                )
+                return {"ok": True, "data": data}
+            except NetAppAPIError as e:
+                return {"ok": False, "error": str(e), "status_code": e.status_code, "response": e.response}
+            except (KeyError, TypeError, ValueError) as e:
+                return {"ok": False, "error": f"Invalid request: {e}"}
+            finally:
+                with self._lock:
+                    self.requests_served += 1
+
+        return {"ok": False, "error": f"Unknown operation: {op}"}
+
+    def _watch_idle(self):
+        while self._server is not None:
+            time.sleep(min(5, max(1, self.idle_timeout)))
+            if self.idle_timeout and time.time() - self.last_activity > self.idle_timeout:
+                self.shutdown()
+                return
+
+    def serve(self):
+        """Bind the socket (owner-only permissions) and serve until shut down."""
+        self.path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        remove_socket(self.path)
+
+        old_umask = os.umask(0o177)
+        try:
+            self._server = _Server(str(self.path), _Handler)
+        finally:
+            os.umask(old_umask)
+        os.chmod(self.path, 0o600)
+        self._server.daemon = self
+
+        threading.Thread(target=self._watch_idle, daemon=True).start()
+        try:
+            self._server.serve_forever(poll_interval=0.5)
+        finally:
+            server, self._server = self._server, None
+            server.server_close()
+            try:
+                remove_socket(self.path)
+            except OSError:
+                pass
+
+    def shutdown(self):
+        if self._server is not None:
+            self._server.shutdown()
+
+
+def ping(path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """Return the daemon status, or None if no daemon answers."""
+    client = DaemonClient(path, timeout=2)
+    if not client.available():
+        return None
+    try:
+        return client.call({"op": "ping"})
+    except (DaemonUnavailableError, NetAppAPIError, ValueError):
+        return None
+    finally:
+        client.close()
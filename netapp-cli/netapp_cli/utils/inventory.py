@@ -0,0 +1,381 @@
+"""Local SQLite snapshot of the storage inventory.
+
+``netapp inventory sync`` copies clusters, nodes, SVMs, aggregates,
+volumes, LUNs and file shares into ``inventory.db`` in the cache
+directory. List commands given ``--offline`` (or ``--max-age`` with a
+recent enough snapshot) answer from it instead of paging through the API.
+
+Objects of every kind share one table; the fields list commands filter on
+(name, uuid, SVM, cluster, aggregate) are stored in indexed columns next
+to the JSON record. Syncing is incremental: kinds synced more recently
+than ``max_age`` are skipped, unchanged records (same digest) are only
+marked as seen, and records no longer returned are deleted.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+import click
+
+from netapp_cli.utils import jsonlib
+from netapp_cli.utils.cache import cache_dir
+
+FILE_NAME = "inventory.db"
+
+
+@dataclass(frozen=True)
+class Kind:
+    """An object type kept in the inventory."""
+
+    name: str
+    endpoint: str
+    title: str
+
+
+# In dependency order, so a partial sync still has parents of children
+KINDS: Dict[str, Kind] = {kind.name: kind for kind in [
+    Kind("clusters", "/datacenter/cluster/clusters", "Clusters"),
+    Kind("nodes", "/datacenter/cluster/nodes", "Nodes"),
+    Kind("svms", "/storage-provider/svms", "SVMs"),
+    Kind("aggregates", "/datacenter/storage/aggregates", "Aggregates"),
+    Kind("volumes", "/api/storage/volumes", "Volumes"),
+    Kind("luns", "/storage-provider/luns", "LUNs"),
+    Kind("fileshares", "/storage-provider/file-shares", "File shares"),
+]}
+
+# Filters accepted by Inventory.find() -> indexed column
+FILTER_COLUMNS = ("name", "uuid", "svm", "cluster", "aggregate")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    host TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    uuid TEXT,
+    name TEXT,
+    svm TEXT,
+    cluster TEXT,
+    aggregate TEXT,
+    digest TEXT NOT NULL,
+    generation INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (host, kind, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS objects_name ON objects (host, kind, name);
+CREATE INDEX IF NOT EXISTS objects_uuid ON objects (host, kind, uuid);
+CREATE INDEX IF NOT EXISTS objects_svm ON objects (host, kind, svm);
+CREATE INDEX IF NOT EXISTS objects_cluster ON objects (host, kind, cluster);
+CREATE INDEX IF NOT EXISTS objects_aggregate ON objects (host, kind, aggregate);
+CREATE TABLE IF NOT EXISTS syncs (
+    host TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    generation INTEGER NOT NULL,
+    synced_at REAL NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (host, kind)
+);
+"""
+
+
+class InventoryError(Exception):
+    """The inventory cannot answer a query (never synced, or too old)."""
+
+
+def _name(value: Any) -> Optional[str]:
+    """Name of a reference such as ``{"name": "svm1", "uuid": ...}``."""
+    if isinstance(value, dict):
+        return value.get("name")
+    if isinstance(value, list) and value and isinstance(value[0], dict):
+        return value[0].get("name")
+    return None
+
+
+def _columns(record: Dict[str, Any]) -> Dict[str, Optional[str]]:
+    """Indexed column values of an API record."""
+    aggregate = _name(record.get("aggregate")) or _name(record.get("aggregates"))
+    return {
+        "key": record.get("key") or record.get("uuid") or record.get("name"),
+        "uuid": record.get("uuid"),
+        "name": record.get("name"),
+        "svm": _name(record.get("svm")),
+        "cluster": _name(record.get("cluster")),
+        "aggregate": aggregate,
+    }
+
+
+@dataclass
+class SyncResult:
+    """Outcome of syncing one kind."""
+
+    kind: str
+    added: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    skipped: bool = False
+    duration: float = 0.0
+
+    @property
+    def count(self) -> int:
+        return self.added + self.updated + self.unchanged
+
+
+class Inventory:
+    """SQLite store of inventory records for one or more ActiveIQ hosts."""
+
+    BATCH_SIZE = 500
+
+    _instances: Dict[str, "Inventory"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else cache_dir() / FILE_NAME
+        self._local = threading.local()
+
+    @classmethod
+    def for_config(cls, config) -> "Inventory":
+        """Return the process-wide inventory configured by the ``inventory`` section.
+
+        Example configuration::
+
+            inventory:
+              path: ~/.netapp-cli/inventory.db
+        """
+        settings = config.get("inventory") or {}
+        path = Path(settings["path"]).expanduser() if settings.get("path") else cache_dir() / FILE_NAME
+
+        with cls._instances_lock:
+            instance = cls._instances.get(str(path))
+            if instance is None:
+                instance = cls._instances[str(path)] = cls(path)
+        return instance
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        """Connection of the current thread, creating the database on first use."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._local.connection = connection
+        return connection
+
+    def close(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def status(self, host: str) -> List[Dict[str, Any]]:
+        """Sync time and record count per kind, in KINDS order."""
+        rows = self.db.execute(
+            "SELECT kind, synced_at, count FROM syncs WHERE host = ?", (host,)
+        ).fetchall()
+        synced = {kind: (synced_at, count) for kind, synced_at, count in rows}
+        now = time.time()
+        return [
+            {
+                "kind": kind,
+                "count": synced[kind][1] if kind in synced else None,
+                "synced_at": synced[kind][0] if kind in synced else None,
+                "age": now - synced[kind][0] if kind in synced else None,
+            }
+            for kind in KINDS
+        ]
+
+    def age(self, host: str, kind: str) -> Optional[float]:
+        """Seconds since ``kind`` was last synced, None if it never was."""
+        row = self.db.execute(
+            "SELECT synced_at FROM syncs WHERE host = ? AND kind = ?", (host, kind)
+        ).fetchone()
+        return None if row is None else time.time() - row[0]
+
+    def _count(self, host: str, kind: str) -> int:
+        row = self.db.execute("SELECT count FROM syncs WHERE host = ? AND kind = ?", (host, kind)).fetchone()
+        return row[0] if row else 0
+
+    def find(self, host: str, kind: str, limit: Optional[int] = None, **filters: Optional[str]) -> List[Dict[str, Any]]:
+        """Records of ``kind`` matching all ``filters`` (see FILTER_COLUMNS).
+
+        Values containing ``*`` or ``?`` are matched as globs, like the
+        API's name filters.
+        """
+        clauses, args = ["host = ?", "kind = ?"], [host, kind]
+        for column, value in filters.items():
+            if column not in FILTER_COLUMNS:
+                raise ValueError(f"Unknown inventory filter: {column}")
+            if value is None:
+                continue
+            clauses.append(f"{column} {'GLOB' if '*' in value or '?' in value else '='} ?")
+            args.append(value)
+
+        sql = f"SELECT data FROM objects WHERE {' AND '.join(clauses)} ORDER BY name, key"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        return [jsonlib.loads(data) for (data,) in self.db.execute(sql, args)]
+
+    def records(self, host: str, kind: str) -> Iterator[Dict[str, Any]]:
+        """All records of ``kind``, decoded lazily."""
+        cursor = self.db.execute("SELECT data FROM objects WHERE host = ? AND kind = ?", (host, kind))
+        for (data,) in cursor:
+            yield jsonlib.loads(data)
+
+    def sync_kind(self, host: str, kind: str, records: Iterable[Dict[str, Any]]) -> SyncResult:
+        """Replace the stored records of ``kind`` with ``records``.
+
+        Only new and changed records are written; records not in
+        ``records`` are deleted. The previous snapshot stays readable by
+        other processes until the sync is committed.
+        """
+        started = time.time()
+        result = SyncResult(kind)
+        db = self.db
+
+        row = db.execute("SELECT generation FROM syncs WHERE host = ? AND kind = ?", (host, kind)).fetchone()
+        generation = (row[0] if row else 0) + 1
+        digests = dict(db.execute("SELECT key, digest FROM objects WHERE host = ? AND kind = ?", (host, kind)))
+
+        upserts: List[tuple] = []
+        touched: List[tuple] = []
+
+        def flush():
+            db.executemany(
+                "INSERT OR REPLACE INTO objects "
+                "(host, kind, key, uuid, name, svm, cluster, aggregate, digest, generation, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                upserts
+            )
+            db.executemany(
+                "UPDATE objects SET generation = ? WHERE host = ? AND kind = ? AND key = ?", touched
+            )
+            upserts.clear()
+            touched.clear()
+
+        with db:
+            for record in records:
+                columns = _columns(record)
+                if columns["key"] is None:
+                    continue
+                data = jsonlib.dumps(record, sort_keys=True)
+                digest = hashlib.blake2b(data.encode("utf-8"), digest_size=16).hexdigest()
+
+                previous = digests.get(columns["key"])
+                if previous == digest:
+                    touched.append((generation, host, kind, columns["key"]))
+                    result.unchanged += 1
+                else:
+                    upserts.append((
+                        host, kind, columns["key"], columns["uuid"], columns["name"], columns["svm"],
+                        columns["cluster"], columns["aggregate"], digest, generation, data
+                    ))
+                    if previous is None:
+                        result.added += 1
+                    else:
+                        result.updated += 1
+                if len(upserts) + len(touched) >= self.BATCH_SIZE:
+                    flush()
+            flush()
+
+            result.removed = db.execute(
+                "DELETE FROM objects WHERE host = ? AND kind = ? AND generation != ?", (host, kind, generation)
+            ).rowcount
+            db.execute(
+                "INSERT OR REPLACE INTO syncs (host, kind, generation, synced_at, count) VALUES (?, ?, ?, ?, ?)",
+                (host, kind, generation, time.time(), result.count)
+            )
+
+        result.duration = time.time() - started
+        return result
+
+    def sync(
+        self,
+        client,
+        kinds: Optional[Iterable[str]] = None,
+        max_age: Optional[float] = None,
+        on_result: Optional[Callable[[SyncResult], None]] = None
+    ) -> List[SyncResult]:
+        """Sync ``kinds`` (default: all) from the API through ``client``.
+
+        Kinds synced less than ``max_age`` seconds ago are skipped. Records
+        are streamed page by page into the database. Pages are fetched with
+        conditional GETs (see NetAppAPIClient.iter_records), so unchanged
+        pages are answered with 304 and not downloaded again.
+        """
+        host = client.config.host
+        results = []
+        for name in kinds or KINDS:
+            kind = KINDS[name]
+            age = self.age(host, name)
+            if max_age is not None and age is not None and age < max_age:
+                result = SyncResult(name, unchanged=self._count(host, name), skipped=True)
+            else:
+                result = self.sync_kind(host, name, client.iter_records(kind.endpoint))
+            results.append(result)
+            if on_result:
+                on_result(result)
+        return results
+
+    def clear(self, host: Optional[str] = None):
+        """Delete the records of ``host``, or everything."""
+        with self.db:
+            if host is None:
+                self.db.execute("DELETE FROM objects")
+                self.db.execute("DELETE FROM syncs")
+            else:
+                self.db.execute("DELETE FROM objects WHERE host = ?", (host,))
+                self.db.execute("DELETE FROM syncs WHERE host = ?", (host,))
+
+
+def offline_options(command):
+    """Add ``--offline`` and ``--max-age`` to a list command."""
+    command = click.option(
+        "--max-age",
+        type=click.IntRange(min=0),
+        help="Answer from the local inventory if it was synced less than SECONDS ago"
+    )(command)
+    command = click.option(
+        "--offline",
+        is_flag=True,
+        help="Answer from the local inventory only (see 'netapp inventory sync')"
+    )(command)
+    return command
+
+
+def inventory_records(
+    config,
+    kind: str,
+    offline: bool,
+    max_age: Optional[int],
+    limit: Optional[int] = None,
+    **filters: Optional[str]
+) -> Optional[List[Dict[str, Any]]]:
+    """Answer a list command from the inventory when it was asked to.
+
+    Returns None when the command should query the API instead. Raises
+    InventoryError when ``offline`` is set but the inventory cannot answer.
+    """
+    if not offline and max_age is None:
+        return None
+
+    inventory = Inventory.for_config(config)
+    host = config.netapp.host
+    age = inventory.age(host, kind)
+    if age is None:
+        if offline:
+            raise InventoryError(f"No {kind} in the inventory for {host}. Run 'netapp inventory sync' first.")
+        return None
+    if max_age is not None and age > max_age:
+        if offline:
+            raise InventoryError(
+                f"Inventory of {kind} is {int(age)}s old (--max-age {max_age}). Run 'netapp inventory sync'."
+            )
+        return None
+    return inventory.find(host, kind, limit=limit, **filters)
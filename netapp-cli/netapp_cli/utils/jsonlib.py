@@ -0,0 +1,75 @@
+"""JSON encoding and decoding with an optional fast backend.
+
+orjson is used when installed (the ``fast-json`` extra), then msgspec,
+then the standard library. Set ``NETAPP_JSON_BACKEND=json`` to force the
+standard library, e.g. to compare results. A requested backend that is not
+installed falls back to the standard library with a warning.
+
+All backends produce the same text for the data the CLI handles: UTF-8
+without ASCII escaping, two-space indentation and ``str()`` for values
+JSON cannot represent (including datetimes).
+"""
+
+import json
+import os
+import warnings
+from typing import Any, Union
+
+orjson = None
+msgspec = None
+
+_requested = os.getenv("NETAPP_JSON_BACKEND", "auto").lower()
+BACKEND = "json"
+if _requested in ("auto", "orjson"):
+    try:
+        import orjson
+        BACKEND = "orjson"
+    except ImportError:  # pragma: no cover - optional dependency
+        pass
+if BACKEND == "json" and _requested in ("auto", "msgspec"):
+    try:
+        import msgspec.json
+        BACKEND = "msgspec"
+    except ImportError:  # pragma: no cover - optional dependency
+        pass
+if _requested in ("orjson", "msgspec") and BACKEND != _requested:
+    warnings.warn(
+        f"NETAPP_JSON_BACKEND={_requested} is not installed; using the standard json module",
+        RuntimeWarning
+    )
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """Decode a JSON document; raises ValueError on invalid input."""
+    if BACKEND == "orjson":
+        return orjson.loads(data)
+    if BACKEND == "msgspec":
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from None
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> str:
+    """Encode ``obj`` as JSON text, indented by two spaces if ``indent``."""
+    if BACKEND == "orjson":
+        option = _ORJSON_OPTIONS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=str, option=option).decode("utf-8")
+    # msgspec has no default=str equivalent for datetimes; keep its output
+    # identical by encoding with the standard library
+    return json.dumps(
+        obj,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        sort_keys=sort_keys,
+        ensure_ascii=False,
+        default=str
+    )
@@ -0,0 +1,161 @@
+"""Incremental parsing of ``records`` arrays in API list responses.
+
+List endpoints answer ``{"records": [...], "num_records": N, "_links": ...}``.
+RecordParser is fed the body chunk by chunk as it arrives and returns each
+record as soon as it is complete, so a 10k record page never exists as one
+string or one object graph, and the first record is available after the
+first chunk.
+"""
+
+import codecs
+import json
+from typing import Any, Dict, Iterable, Iterator, List
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]}"
+_decoder = json.JSONDecoder()
+
+
+class StreamError(ValueError):
+    """The body is not a JSON object or is truncated."""
+
+
+class RecordParser:
+    """Push parser yielding the elements of one top-level array.
+
+    Every other top-level member is decoded normally and collected in
+    ``meta`` (e.g. ``num_records``, ``_links``); it is complete once
+    close() has returned.
+    """
+
+    def __init__(self, key: str = "records"):
+        self.key = key
+        self.meta: Dict[str, Any] = {}
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        # start -> key -> colon -> value -> (comma -> key | end); in_array
+        # replaces value while the records array is being read
+        self._state = "start"
+        self._member = None
+        self._first = True
+        self._eof = False
+
+    def feed(self, chunk: bytes) -> List[Dict[str, Any]]:
+        """Add a chunk of the body; return the records completed by it."""
+        self._buffer = self._buffer[self._pos:] + self._text_decoder.decode(chunk)
+        self._pos = 0
+        return self._parse()
+
+    def close(self) -> List[Dict[str, Any]]:
+        """Signal the end of the body; return any remaining records."""
+        self._buffer = self._buffer[self._pos:] + self._text_decoder.decode(b"", final=True)
+        self._pos = 0
+        self._eof = True
+        records = self._parse()
+        if self._state != "end":
+            raise StreamError("Truncated JSON response")
+        return records
+
+    def _skip_whitespace(self) -> bool:
+        """Advance to the next token; False if the buffer is exhausted."""
+        buffer, pos = self._buffer, self._pos
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        return pos < len(buffer)
+
+    def _decode_value(self):
+        """Decode the JSON value at the current position.
+
+        Returns ``(True, value)`` or ``(False, None)`` when more input is
+        needed. A number cut by a chunk boundary still decodes (``12`` of
+        ``12345``, ``12`` of ``12.5``), so a scalar only counts once a
+        delimiter follows it or the body has ended.
+        """
+        try:
+            value, end = _decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError as e:
+            if self._eof:
+                raise StreamError(f"Invalid JSON response: {e}") from None
+            return False, None
+        if (
+            not self._eof
+            and not isinstance(value, (str, dict, list))
+            and (end == len(self._buffer) or self._buffer[end] not in _DELIMITERS)
+        ):
+            return False, None
+        self._pos = end
+        return True, value
+
+    def _expect(self, char: str):
+        if self._buffer[self._pos] != char:
+            raise StreamError(f"Expected {char!r} at offset {self._pos}, found {self._buffer[self._pos]!r}")
+        self._pos += 1
+
+    def _parse(self) -> List[Dict[str, Any]]:
+        records = []
+        while self._skip_whitespace():
+            char = self._buffer[self._pos]
+            state = self._state
+
+            if state == "start":
+                self._expect("{")
+                self._state = "key"
+            elif state == "key":
+                if char == "}":
+                    self._pos += 1
+                    self._state = "end"
+                    continue
+                complete, member = self._decode_value()
+                if not complete:
+                    break
+                if not isinstance(member, str):
+                    raise StreamError("Expected an object member name")
+                self._member = member
+                self._state = "colon"
+            elif state == "colon":
+                self._expect(":")
+                self._state = "value"
+            elif state == "value":
+                if self._member == self.key and char == "[":
+                    self._pos += 1
+                    self._state = "in_array"
+                    continue
+                complete, value = self._decode_value()
+                if not complete:
+                    break
+                self.meta[self._member] = value
+                self._state = "comma"
+            elif state == "in_array":
+                if char == "]":
+                    self._pos += 1
+                    self._state = "comma"
+                    continue
+                if not self._first:
+                    self._expect(",")
+                    # The separator is consumed; the next element may be in a later chunk
+                    self._first = True
+                    continue
+                complete, record = self._decode_value()
+                if not complete:
+                    break
+                records.append(record)
+                self._first = False
+            elif state == "comma":
+                if char == "}":
+                    self._pos += 1
+                    self._state = "end"
+                    continue
+                self._expect(",")
+                self._state = "key"
+            else:
+                raise StreamError(f"Unexpected data after JSON object at offset {self._pos}")
+        return records
+
+
+def iter_records(chunks: Iterable[bytes], parser: RecordParser) -> Iterator[Dict[str, Any]]:
+    """Yield records from body chunks; ``parser.meta`` is complete afterwards."""
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
@@ -1,26 +1,73 @@
 """Output formatting utilities."""
 
+import errno
 import json
-import yaml
-from typing import Any, Dict, List, Optional
+import operator
+import os
+import select
+import sys
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
-from tabulate import tabulate
 
-console = Console()
+from netapp_cli.models.records import Record
+
+# yaml and the rich renderables are imported where they are used to keep
+# CLI startup fast; most invocations only print one output format.
+
+
+class _Console(Console):
+    def on_broken_pipe(self):
+        # rich exits with status 1 here; raise instead, so the CLI can stop
+        # quietly when the reader has gone away (see LazyGroup.invoke)
+        raise BrokenPipeError(errno.EPIPE, os.strerror(errno.EPIPE))
+
+
+console = _Console()
 
 
 class OutputFormatter:
     """Handle different output formats."""
 
+    # Header inference for tables without explicit headers; see configure()
+    HEADER_SAMPLE_SIZE = 200
+    MAX_COLUMNS = 10
+    # format_stream() prints tables in batches of this many rows (one API page)
+    STREAM_BATCH_SIZE = 100
+
     def __init__(self, format_type: str = "table", verbose: bool = False):
         self.format_type = format_type
         self.verbose = verbose
 
-    def format_output(self, data: Any, title: Optional[str] = None, headers: Optional[List[str]] = None):
-        """Format and display output based on the specified format."""
+    @classmethod
+    def configure(cls, settings: Optional[Dict[str, Any]]):
+        """Apply the ``output`` configuration section.
+
+        Example configuration::
+
+            output:
+              header_sample: 200   # records inspected to choose columns
+              max_columns: 10
+        """
+        settings = settings or {}
+        if settings.get("header_sample"):
+            cls.HEADER_SAMPLE_SIZE = int(settings["header_sample"])
+        if settings.get("max_columns"):
+            cls.MAX_COLUMNS = int(settings["max_columns"])
+
+    def format_output(
+        self,
+        data: Any,
+        title: Optional[str] = None,
+        headers: Optional[List[str]] = None
+    ):
+        """Format and display output based on the specified format.
+
+        ``data`` may contain compact Record objects as well as dicts. Without
+        ``headers``, table columns are inferred from the data.
+        """
+        if isinstance(data, Record):
+            data = data.to_dict()
 
         if self.format_type == "json":
             self._output_json(data)
@@ -34,16 +81,159 @@ class OutputFormatter:
             else:
                 console.print(str(data))
 
+    def format_stream(
+        self,
+        records: Iterable[Any],
+        title: Optional[str] = None,
+        headers: Optional[List[str]] = None,
+        record_type: Optional[type] = None
+    ) -> int:
+        """Display records while they are still being fetched.
+
+        Tables are printed every STREAM_BATCH_SIZE rows, and JSON sent to a
+        pipe element by element, so the start of a long listing shows up
+        after the first page. When the reader goes away (``| head``, the
+        pager quits) iteration stops and ``records`` is closed, which ends
+        the pagination behind it. Tables convert records to ``record_type``
+        (a Record class) one at a time. Returns the number of records shown.
+        """
+        # The paginating generator itself, not a map() over it, must be closed
+        source = records
+        try:
+            if self.format_type == "table":
+                if record_type is not None:
+                    records = map(record_type.from_dict, records)
+                return self._stream_table(records, title, headers)
+            if self.format_type == "json" and not console.is_terminal:
+                return self._stream_json(records)
+            data = [*records]
+            if data:
+                self.format_output(data, title, headers)
+            return len(data)
+        finally:
+            close = getattr(source, "close", None)
+            if close is not None:
+                close()
+
+    def _stream_table(
+        self,
+        records: Iterable[Any],
+        title: Optional[str],
+        headers: Optional[List[str]]
+    ) -> int:
+        count = 0
+        widths: List[int] = []
+        batch: List[Any] = []
+        for record in records:
+            batch.append(record)
+            if len(batch) < self.STREAM_BATCH_SIZE:
+                continue
+            headers = headers or self._extract_headers(batch)
+            widths = self._print_batch(batch, headers, widths, title, first=not count)
+            count += len(batch)
+            batch = []
+            if self.output_closed():
+                return count
+        if batch:
+            headers = headers or self._extract_headers(batch)
+            self._print_batch(batch, headers, widths, title, first=not count)
+            count += len(batch)
+        return count
+
+    def _print_batch(
+        self,
+        batch: List[Any],
+        headers: List[str],
+        widths: List[int],
+        title: Optional[str],
+        first: bool
+    ) -> List[int]:
+        """Print one batch of table rows; returns the column widths used.
+
+        Later batches leave out the header and keep at least the widths of
+        the earlier ones, so columns line up across batches.
+        """
+        from rich.table import Table
+
+        labels = [header.replace("_", " ").title() for header in headers]
+        rows = [*self._table_rows(batch, headers)]
+        widths = [
+            max([len(label), *(len(row[i]) for row in rows), *widths[i:i + 1]])
+            for i, label in enumerate(labels)
+        ]
+
+        table = Table(title=title if first else None, show_header=first)
+        for label, width in zip(labels, widths):
+            table.add_column(label, style="cyan", no_wrap=True, min_width=width)
+        for row in rows:
+            table.add_row(*row)
+
+        console.print(table)
+        return widths
+
+    def _stream_json(self, records: Iterable[Any]) -> int:
+        """Write a JSON array element by element, as _output_json() would print it."""
+        from netapp_cli.utils import jsonlib
+
+        out = console.file
+        count = 0
+        for record in records:
+            if isinstance(record, Record):
+                record = record.to_dict()
+            text = jsonlib.dumps(record, indent=True).replace("\n", "\n  ")
+            out.write(("[\n  " if not count else ",\n  ") + text)
+            count += 1
+            if self.output_closed():
+                return count
+        out.write("\n]\n" if count else "[]\n")
+        out.flush()
+        return count
+
+    @staticmethod
+    def output_closed() -> bool:
+        """Whether the reader of the output (a pager, ``head``) has gone away.
+
+        Checked between pages so that fetching stops even before the next
+        write would fail.
+        """
+        out = console.file
+        if getattr(out, "reader_gone", False):
+            return True
+        try:
+            poller = select.poll()
+            poller.register(out.fileno(), select.POLLOUT)
+        except (AttributeError, OSError, ValueError):  # no poll() or no real file
+            return False
+        # A pipe whose reader has exited reports POLLERR to the writer
+        return any(events & (select.POLLERR | select.POLLHUP) for _, events in poller.poll(0))
+
     def _output_json(self, data: Any):
-        """Output data as JSON."""
-        console.print_json(json.dumps(data, indent=2, default=str))
+        """Output data as JSON.
+
+        Terminals get rich's highlighting; pipes get the encoded text as is,
+        which avoids decoding and re-encoding large documents.
+        """
+        from netapp_cli.utils import jsonlib
+
+        text = jsonlib.dumps(self._plain(data), indent=True)
+        if console.is_terminal:
+            console.print_json(text)
+        else:
+            sys.stdout.write(text + "\n")
 
     def _output_yaml(self, data: Any):
         """Output data as YAML."""
-        yaml_output = yaml.dump(data, default_flow_style=False, default=str)
+        import yaml
+
+        yaml_output = yaml.dump(self._plain(data), default_flow_style=False, default=str)
         console.print(yaml_output)
 
-    def _output_table(self, data: List[Dict], title: Optional[str] = None, headers: Optional[List[str]] = None):
+    def _output_table(
+        self,
+        data: List[Dict],
+        title: Optional[str] = None,
+        headers: Optional[List[str]] = None
+    ):
         """Output data as a rich table."""
         if not data:
             console.print("No data to display")
@@ -53,6 +243,8 @@ class OutputFormatter:
         if not headers:
             headers = self._extract_headers(data)
 
+        from rich.table import Table
+
         # Create Rich table
         table = Table(title=title)
 
@@ -60,18 +252,15 @@ class OutputFormatter:
         for header in headers:
             table.add_column(header.replace("_", " ").title(), style="cyan", no_wrap=True)
 
-        # Add rows
-        for item in data:
-            row = []
-            for header in headers:
-                value = self._get_nested_value(item, header)
-                row.append(str(value) if value is not None else "")
+        for row in self._table_rows(data, headers):
             table.add_row(*row)
 
         console.print(table)
 
     def _output_dict(self, data: Dict, title: Optional[str] = None):
         """Output dictionary as key-value table."""
+        from rich.table import Table
+
         table = Table(title=title or "Details")
         table.add_column("Property", style="cyan")
         table.add_column("Value", style="green")
@@ -83,17 +272,42 @@ class OutputFormatter:
 
         console.print(table)
 
+    @staticmethod
+    def _plain(data: Any) -> Any:
+        """Convert Record objects back to dicts for serialization."""
+        if isinstance(data, list) and any(isinstance(item, Record) for item in data):
+            return [item.to_dict() if isinstance(item, Record) else item for item in data]
+        return data
+
     def _extract_headers(self, data: List[Dict]) -> List[str]:
-        """Extract headers from list of dictionaries."""
-        headers = set()
-        for item in data:
-            headers.update(self._flatten_keys(item))
-        return sorted(list(headers))
+        """Choose table columns from a sample of the records.
+
+        The first HEADER_SAMPLE_SIZE records are flattened; fields are ranked
+        by how many records have a value for them (ties keep the order of
+        first appearance) and the top MAX_COLUMNS are shown. Hypermedia
+        fields (``_links``) are never shown.
+        """
+        presence: Dict[str, int] = {}
+        for item in data[:self.HEADER_SAMPLE_SIZE]:
+            if isinstance(item, Record):
+                keys = [path for path in item.FIELDS if item.get(path) is not None]
+            else:
+                keys = self._flatten_keys(item)
+            for key in keys:
+                presence[key] = presence.get(key, 0) + 1
+
+        # dicts keep insertion order and sorted() is stable
+        ranked = sorted(presence, key=presence.get, reverse=True)
+        if self.verbose and len(ranked) > self.MAX_COLUMNS:
+            console.print(f"[dim]Showing {self.MAX_COLUMNS} of {len(ranked)} fields; use -o json to see all[/dim]")
+        return ranked[:self.MAX_COLUMNS]
 
     def _flatten_keys(self, obj: Dict, parent_key: str = "", sep: str = ".") -> List[str]:
         """Flatten nested dictionary keys."""
         keys = []
         for key, value in obj.items():
+            if key.startswith("_") or value is None:
+                continue
             new_key = f"{parent_key}{sep}{key}" if parent_key else key
             if isinstance(value, dict) and value:
                 keys.extend(self._flatten_keys(value, new_key, sep))
@@ -101,18 +315,55 @@ class OutputFormatter:
                 keys.append(new_key)
         return keys
 
-    def _get_nested_value(self, obj: Dict, key: str, sep: str = ".") -> Any:
-        """Get value from nested dictionary using dot notation."""
-        keys = key.split(sep)
-        value = obj
+    def _table_rows(self, data: Iterable[Any], headers: List[str]) -> Iterator[List[str]]:
+        """Yield the cell strings of each record.
 
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return None
+        Headers are compiled into accessors once, not parsed again per cell.
+        """
+        accessors = [self._accessor(header) for header in headers]
+        for item in data:
+            yield ["" if (value := accessor(item)) is None else str(value) for accessor in accessors]
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _accessor(key: str, sep: str = ".") -> Callable[[Any], Any]:
+        """Compile a dotted key into a function reading it from a dict or Record.
 
-        return value
+        The function returns None when any level is missing or not a dict.
+        Dicts with the dotted key itself (e.g. projected rows) are read as is.
+        """
+        keys = key.split(sep)
+        if len(keys) == 1:
+            get = operator.itemgetter(key)
+        elif len(keys) == 2:
+            first, second = keys
+
+            def get(obj):
+                return obj[first][second]
+        else:
+            def get(obj):
+                for k in keys:
+                    obj = obj[k]
+                return obj
+
+        # Records store nested fields flat, as attributes named after the path
+        attribute = key.replace(sep, "_")
+
+        def accessor(obj):
+            if isinstance(obj, dict):
+                try:
+                    return get(obj)
+                except (KeyError, TypeError, IndexError):
+                    return obj.get(key)
+            if isinstance(obj, Record) and key in obj._ATTRIBUTES:
+                return getattr(obj, attribute)
+            return None
+
+        return accessor
+
+    def _get_nested_value(self, obj: Dict, key: str, sep: str = ".") -> Any:
+        """Get value from nested dictionary using dot notation."""
+        return self._accessor(key, sep)(obj)
 
     def success(self, message: str):
         """Display success message."""
@@ -132,6 +383,8 @@ class OutputFormatter:
 
     def panel(self, content: str, title: str = None, style: str = "blue"):
         """Display content in a panel."""
+        from rich.panel import Panel
+
         console.print(Panel(content, title=title, border_style=style))
 
     def progress_update(self, message: str):
@@ -0,0 +1,120 @@
+"""Page console output through ``less`` (or ``$PAGER``) as it is produced.
+
+rich's own ``console.pager()`` collects everything and shows it at the end;
+here the console writes straight into the pager's stdin, so the first page
+of a long listing is on screen while the rest is still being fetched.
+
+When the pager quits, writes are dropped instead of raising and
+OutputFormatter.output_closed() turns true, which list commands check
+between pages to stop fetching.
+"""
+
+import atexit
+import os
+import shlex
+import subprocess
+import sys
+from typing import Optional
+
+DEFAULT_PAGER = "less -FRX"
+
+
+class PagerInput:
+    """File object writing to the pager; goes quiet once the pager has exited."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self.reader_gone = False
+
+    def write(self, text: str) -> int:
+        if not self.reader_gone:
+            try:
+                self._stream.write(text)
+            except (BrokenPipeError, ValueError):  # ValueError: closed by close()
+                self.reader_gone = True
+        return len(text)
+
+    def flush(self):
+        if not self.reader_gone:
+            try:
+                self._stream.flush()
+            except (BrokenPipeError, ValueError):
+                self.reader_gone = True
+
+    def isatty(self) -> bool:
+        return True
+
+    def fileno(self) -> int:
+        return self._stream.fileno()
+
+    def close(self):
+        try:
+            self._stream.close()
+        except BrokenPipeError:
+            pass
+        self.reader_gone = True
+
+
+class Pager:
+    """A pager process receiving the output of the rich console."""
+
+    _active: Optional["Pager"] = None
+
+    def __init__(self, command: Optional[str] = None):
+        self.command = command or os.getenv("NETAPP_PAGER") or os.getenv("PAGER") or DEFAULT_PAGER
+        self.process = None
+        self.input = None
+
+    @classmethod
+    def start(cls, command: Optional[str] = None) -> Optional["Pager"]:
+        """Start paging output, once per process and only on a terminal.
+
+        Returns the pager, or None when output is not a terminal or the
+        pager cannot be started. The pager is closed when the process exits.
+        """
+        if cls._active is not None:
+            return cls._active
+        if not sys.stdout.isatty():
+            return None
+
+        pager = cls(command)
+        if pager.command.strip() in ("", "cat"):
+            return None
+        env = dict(os.environ)
+        env.setdefault("LESS", "FRX")
+        try:
+            pager.process = subprocess.Popen(
+                shlex.split(pager.command),
+                stdin=subprocess.PIPE,
+                encoding="utf-8",
+                errors="replace",
+                env=env
+            )
+        except OSError:
+            return None
+
+        from netapp_cli.utils.output import console
+
+        pager.input = PagerInput(pager.process.stdin)
+        console.file = pager.input
+        cls._active = pager
+        atexit.register(pager.close)
+        return pager
+
+    def close(self):
+        """Wait for the user to leave the pager and restore the console."""
+        if self.process is None:
+            return
+
+        from netapp_cli.utils.output import console
+
+        console.file = None
+        self.input.close()
+        try:
+            self.process.wait()
+        except KeyboardInterrupt:
+            # less handles ^C itself; keep waiting so the terminal is restored
+            self.process.wait()
+        self.process = None
+        if Pager._active is self:
+            Pager._active = None
@@ -0,0 +1,541 @@
+"""Filter expressions evaluated over the local inventory.
+
+``netapp query`` answers ad-hoc questions from the snapshot taken by
+``netapp inventory sync``, without calling the API::
+
+    netapp query volumes "utilization > 90 and cluster.version = 9.12"
+    netapp query luns "volume.aggregate.free_percent < 10"
+
+Expression language:
+
+- ``field op value`` with ``=``, ``!=``, ``<``, ``<=``, ``>``, ``>=``,
+  ``~`` (glob, e.g. ``name ~ vol_prod*``) and ``field in (a, b, c)``;
+  combined with ``and``, ``or``, ``not`` and parentheses.
+- Fields are dotted paths into the API record (``svm.name``,
+  ``space.used``). A reference (``cluster``, ``svm``, ``node``,
+  ``aggregate``, ``volume``) that the record only names is followed into
+  the referenced record, so ``cluster.version`` works for a volume.
+  Comparing a reference itself compares its name (``svm = svm1``).
+- Computed fields: ``utilization`` and ``free_percent`` (percent of
+  space used / available) and ``version`` (``9.12.1`` for clusters and
+  nodes).
+- Values are numbers (with ``%`` or ``KB``..``PB`` suffixes), versions,
+  quoted strings or bare words. ``version = 9.12`` matches 9.12.x.
+
+Hash indexes (for ``=``/``in``) and sorted indexes (for ranges) are built
+on first use per field and narrow the records the full expression is
+evaluated on.
+"""
+
+import bisect
+import fnmatch
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from netapp_cli.utils.inventory import KINDS, Inventory, InventoryError
+
+# Reference name -> (kind, keys tried in the record, first found wins)
+REFERENCES: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "cluster": ("clusters", ("cluster",)),
+    "node": ("nodes", ("node", "home_node")),
+    "svm": ("svms", ("svm",)),
+    "aggregate": ("aggregates", ("aggregate", "aggregates")),
+    "volume": ("volumes", ("volume",)),
+}
+
+_UNITS = {"": 1, "b": 1, "kb": 1024, "mb": 1024 ** 2, "gb": 1024 ** 3, "tb": 1024 ** 4, "pb": 1024 ** 5, "%": 1}
+_NUMBER = re.compile(r"^(-?\d+(?:\.\d+)?)\s*(%|[kmgtp]?b)?$", re.IGNORECASE)
+_VERSION = re.compile(r"^\d+(?:\.\d+)+$")
+_TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+      | (?P<op><=|>=|!=|==|=|<|>|~)
+      | (?P<punct>[(),])
+      | (?P<word>[^\s()<>=!~,"']+)
+    )""", re.VERBOSE)
+_KEYWORDS = ("and", "or", "not", "in")
+
+
+class QueryError(ValueError):
+    """The expression cannot be parsed."""
+
+
+class Literal:
+    """A value in an expression, with its numeric reading if it has one."""
+
+    __slots__ = ("text", "number", "version")
+
+    def __init__(self, text: str, quoted: bool = False):
+        self.text = text
+        self.number = None
+        self.version = None
+        if not quoted:
+            match = _NUMBER.match(text)
+            if match:
+                self.number = float(match.group(1)) * _UNITS[(match.group(2) or "").lower()]
+            if _VERSION.match(text):
+                self.version = tuple(int(part) for part in text.split("."))
+
+    def __repr__(self) -> str:
+        return repr(self.text)
+
+
+def _as_version(value: str) -> Optional[Tuple[int, ...]]:
+    return tuple(int(part) for part in value.split(".")) if _VERSION.match(value) else None
+
+
+def _as_number(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+
+def compare(op: str, actual: Any, literal: Literal) -> bool:
+    """Apply ``op`` to a record value and an expression value."""
+    if isinstance(actual, dict):
+        actual = actual.get("name")
+    if actual is None:
+        return op == "!="
+
+    if op == "~":
+        return fnmatch.fnmatchcase(str(actual).lower(), literal.text.lower())
+    if isinstance(actual, bool):
+        actual, literal_value = str(actual).lower(), literal.text.lower()
+    elif isinstance(actual, str) and literal.version is not None and _as_version(actual) is not None:
+        actual = _as_version(actual)
+        literal_value = literal.version
+        if op in ("=", "!="):
+            # 9.12 matches 9.12.x
+            return (actual[:len(literal_value)] == literal_value) == (op == "=")
+    elif literal.number is not None and _as_number(actual) is not None:
+        actual, literal_value = _as_number(actual), literal.number
+    else:
+        actual, literal_value = str(actual), literal.text
+
+    if op == "=":
+        return actual == literal_value
+    if op == "!=":
+        return actual != literal_value
+    if op == "<":
+        return actual < literal_value
+    if op == "<=":
+        return actual <= literal_value
+    if op == ">":
+        return actual > literal_value
+    return actual >= literal_value
+
+
+class Comparison:
+    """``field op value`` or ``field in (values)``."""
+
+    def __init__(self, field: str, op: str, values: List[Literal]):
+        self.field = field
+        self.op = op
+        self.values = values
+
+    def matches(self, engine: "QueryEngine", kind: str, record: Dict[str, Any]) -> bool:
+        actual = engine.value(record, kind, self.field)
+        if self.op == "in":
+            return any(compare("=", actual, value) for value in self.values)
+        return compare(self.op, actual, self.values[0])
+
+    def candidates(self, engine: "QueryEngine", kind: str) -> Optional[Set[int]]:
+        if self.op == "in":
+            found: Set[int] = set()
+            for value in self.values:
+                ids = engine.lookup(kind, self.field, "=", value)
+                if ids is None:
+                    return None
+                found |= ids
+            return found
+        return engine.lookup(kind, self.field, self.op, self.values[0])
+
+    def fields(self) -> List[str]:
+        return [self.field]
+
+
+class And:
+    def __init__(self, items: List[Any]):
+        self.items = items
+
+    def matches(self, engine, kind, record) -> bool:
+        return all(item.matches(engine, kind, record) for item in self.items)
+
+    def candidates(self, engine, kind) -> Optional[Set[int]]:
+        result = None
+        for ids in sorted(
+            (ids for ids in (item.candidates(engine, kind) for item in self.items) if ids is not None), key=len
+        ):
+            result = ids if result is None else result & ids
+        return result
+
+    def fields(self) -> List[str]:
+        return [field for item in self.items for field in item.fields()]
+
+
+class Or(And):
+    def matches(self, engine, kind, record) -> bool:
+        return any(item.matches(engine, kind, record) for item in self.items)
+
+    def candidates(self, engine, kind) -> Optional[Set[int]]:
+        result: Set[int] = set()
+        for item in self.items:
+            ids = item.candidates(engine, kind)
+            if ids is None:
+                return None
+            result |= ids
+        return result
+
+
+class Not:
+    def __init__(self, item):
+        self.item = item
+
+    def matches(self, engine, kind, record) -> bool:
+        return not self.item.matches(engine, kind, record)
+
+    def candidates(self, engine, kind) -> Optional[Set[int]]:
+        return None
+
+    def fields(self) -> List[str]:
+        return self.item.fields()
+
+
+class _Parser:
+    """Recursive descent parser: or > and > not > comparison."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens: List[Tuple[str, str, int]] = []
+        pos = 0
+        while pos < len(text):
+            if text[pos:].strip() == "":
+                break
+            match = _TOKEN.match(text, pos)
+            if match is None or match.end() == pos:
+                raise QueryError(f"Unexpected character at position {pos}: {text[pos:pos + 10]!r}")
+            token_type = match.lastgroup
+            self.tokens.append((token_type, match.group(token_type), match.start(token_type)))
+            pos = match.end()
+        self.index = 0
+
+    def peek(self) -> Optional[Tuple[str, str, int]]:
+        return self.tokens[self.index] if self.index < len(self.tokens) else None
+
+    def next(self, expected: str) -> Tuple[str, str, int]:
+        token = self.peek()
+        if token is None:
+            raise QueryError(f"Expected {expected} at end of expression")
+        self.index += 1
+        return token
+
+    def keyword(self, word: str) -> bool:
+        token = self.peek()
+        if token and token[0] == "word" and token[1].lower() == word:
+            self.index += 1
+            return True
+        return False
+
+    def parse(self):
+        if not self.tokens:
+            raise QueryError("Empty expression")
+        node = self.parse_or()
+        token = self.peek()
+        if token is not None:
+            raise QueryError(f"Unexpected {token[1]!r} at position {token[2]}")
+        return node
+
+    def parse_or(self):
+        items = [self.parse_and()]
+        while self.keyword("or"):
+            items.append(self.parse_and())
+        return items[0] if len(items) == 1 else Or(items)
+
+    def parse_and(self):
+        items = [self.parse_not()]
+        while self.keyword("and"):
+            items.append(self.parse_not())
+        return items[0] if len(items) == 1 else And(items)
+
+    def parse_not(self):
+        if self.keyword("not"):
+            return Not(self.parse_not())
+        token = self.peek()
+        if token and token[1] == "(":
+            self.index += 1
+            node = self.parse_or()
+            self.expect(")")
+            return node
+        return self.parse_comparison()
+
+    def expect(self, text: str):
+        token = self.next(repr(text))
+        if token[1] != text:
+            raise QueryError(f"Expected {text!r} at position {token[2]}, found {token[1]!r}")
+
+    def parse_comparison(self):
+        token_type, field, pos = self.next("a field name")
+        if token_type != "word" or field.lower() in _KEYWORDS:
+            raise QueryError(f"Expected a field name at position {pos}, found {field!r}")
+
+        if self.keyword("in"):
+            self.expect("(")
+            values = [self.parse_value()]
+            while self.peek() and self.peek()[1] == ",":
+                self.index += 1
+                values.append(self.parse_value())
+            self.expect(")")
+            return Comparison(field, "in", values)
+
+        token_type, op, pos = self.next("an operator")
+        if token_type != "op":
+            raise QueryError(f"Expected an operator after {field!r} at position {pos}, found {op!r}")
+        return Comparison(field, "=" if op == "==" else op, [self.parse_value()])
+
+    def parse_value(self) -> Literal:
+        token_type, text, pos = self.next("a value")
+        if token_type == "string":
+            return Literal(re.sub(r"\\(.)", r"\1", text[1:-1]), quoted=True)
+        if token_type != "word":
+            raise QueryError(f"Expected a value at position {pos}, found {text!r}")
+        return Literal(text)
+
+
+class Query:
+    """A parsed filter expression."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.root = _Parser(text).parse()
+
+    def fields(self) -> List[str]:
+        """Fields the expression refers to, in order, without duplicates."""
+        return [*dict.fromkeys(self.root.fields())]
+
+
+def _utilization(record: Dict[str, Any]) -> Optional[float]:
+    """Percent of space used, from whichever space block the record has."""
+    space = record.get("space")
+    candidates = []
+    if isinstance(space, dict):
+        candidates = [space.get("block_storage"), space]
+    size = record.get("size")
+    if isinstance(size, dict):
+        candidates.append({"size": size.get("total"), "used": size.get("used")})
+    for block in candidates:
+        if isinstance(block, dict):
+            total, used = _as_number(block.get("size")), _as_number(block.get("used"))
+            if total and used is not None:
+                return round(used * 100.0 / total, 2)
+    return None
+
+
+def _version(record: Dict[str, Any]) -> Optional[str]:
+    version = record.get("version")
+    if isinstance(version, dict) and version.get("generation") is not None:
+        return ".".join(str(version.get(part, 0)) for part in ("generation", "major", "minor"))
+    return version if isinstance(version, str) else None
+
+
+COMPUTED: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "utilization": _utilization,
+    "free_percent": lambda record: None if _utilization(record) is None else round(100 - _utilization(record), 2),
+    "version": _version,
+}
+
+
+def _index_key(value: Any) -> Any:
+    if isinstance(value, dict):
+        value = value.get("name")
+    if isinstance(value, bool):
+        return str(value).lower()
+    number = _as_number(value)
+    return number if number is not None else value
+
+
+class QueryEngine:
+    """Evaluates queries over records loaded per kind.
+
+    ``loader(kind)`` returns the records of a kind; it is called at most
+    once per kind, when a query or a reference first needs it.
+    """
+
+    def __init__(self, loader: Callable[[str], Iterable[Dict[str, Any]]]):
+        self._loader = loader
+        self._records: Dict[str, List[Dict[str, Any]]] = {}
+        self._hash: Dict[Tuple[str, str], Dict[Any, List[int]]] = {}
+        self._sorted: Dict[Tuple[str, str], Optional[Tuple[List[float], List[int]]]] = {}
+        self.scanned = 0
+
+    @classmethod
+    def from_inventory(cls, inventory: Inventory, host: str) -> "QueryEngine":
+        def load(kind):
+            if inventory.age(host, kind) is None:
+                raise InventoryError(
+                    f"No {kind} in the inventory for {host}. Run 'netapp inventory sync --kind {kind}' first."
+                )
+            return inventory.records(host, kind)
+
+        return cls(load)
+
+    def records(self, kind: str) -> List[Dict[str, Any]]:
+        records = self._records.get(kind)
+        if records is None:
+            if kind not in KINDS:
+                raise QueryError(f"Unknown kind {kind!r}; expected one of {', '.join(KINDS)}")
+            records = self._records[kind] = [*self._loader(kind)]
+        return records
+
+    def value(self, record: Dict[str, Any], kind: str, field: str) -> Any:
+        """Value of the dotted ``field`` for a record, following references."""
+        keys = field.split(".")
+        obj = record
+        for position, key in enumerate(keys):
+            if key in COMPUTED and position == len(keys) - 1:
+                return COMPUTED[key](obj)
+            value = obj.get(key) if isinstance(obj, dict) else None
+            if value is None and key in REFERENCES:
+                value = next((obj[name] for name in REFERENCES[key][1] if obj.get(name) is not None), None)
+            if isinstance(value, list):
+                value = value[0] if value else None
+            if value is None:
+                return None
+            rest = keys[position + 1:]
+            if rest and key in REFERENCES and isinstance(value, dict) and rest[0] not in value:
+                # Only a reference: continue in the referenced record
+                target_kind = REFERENCES[key][0]
+                target = self.resolve(target_kind, value)
+                return None if target is None else self.value(target, target_kind, ".".join(rest))
+            obj = value
+        return obj
+
+    def resolve(self, kind: str, reference: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """The record of ``kind`` a reference points to (by key, uuid, then name)."""
+        records = self.records(kind)
+        for field in ("key", "uuid", "name"):
+            if reference.get(field) is not None:
+                ids = self._hash_index(kind, field).get(_index_key(reference[field]))
+                if ids:
+                    return records[ids[0]]
+        return None
+
+    def _hash_index(self, kind: str, field: str) -> Dict[Any, List[int]]:
+        index = self._hash.get((kind, field))
+        if index is None:
+            index = self._hash[(kind, field)] = {}
+            for i, record in enumerate(self.records(kind)):
+                key = _index_key(self.value(record, kind, field))
+                if key is not None:
+                    index.setdefault(key, []).append(i)
+        return index
+
+    def _sorted_index(self, kind: str, field: str) -> Optional[Tuple[List[float], List[int], bool]]:
+        """Numeric values of ``field`` in order, or None if some are not numbers.
+
+        The last item tells whether some values are version strings such as
+        ``"9.13"``: compare() orders those as versions against a version
+        literal, which their float reading (9.13 < 9.2) does not.
+        """
+        if (kind, field) not in self._sorted:
+            entries = []
+            versions = False
+            for i, record in enumerate(self.records(kind)):
+                value = self.value(record, kind, field)
+                if isinstance(value, dict):
+                    value = value.get("name")
+                if value is None:
+                    continue
+                number = _as_number(value)
+                if number is None:
+                    entries = None
+                    break
+                versions = versions or (isinstance(value, str) and _as_version(value) is not None)
+                entries.append((number, i))
+            if entries is not None:
+                entries.sort()
+                entries = ([number for number, _ in entries], [i for _, i in entries], versions)
+            self._sorted[(kind, field)] = entries
+        return self._sorted[(kind, field)]
+
+    def lookup(self, kind: str, field: str, op: str, literal: Literal) -> Optional[Set[int]]:
+        """Records that may satisfy ``field op literal``, or None for all of them.
+
+        The result may include non-matching records (the full expression
+        is evaluated on them afterwards), but never misses a match.
+        """
+        if op == "=":
+            if literal.version is not None and "." in literal.text:
+                return None  # version prefix matching is not an equality
+            # Every key compare() could consider equal to the literal
+            keys = {literal.number, literal.text, _index_key(literal.text)}
+            if literal.text.lower() in ("true", "false"):
+                keys.add(literal.text.lower())
+            index = self._hash_index(kind, field)
+            return {i for key in keys if key is not None for i in index.get(key, ())}
+        if op in ("<", "<=", ">", ">=") and literal.number is not None:
+            index = self._sorted_index(kind, field)
+            if index is None:
+                return None
+            keys, ids, versions = index
+            if versions and literal.version is not None:
+                return None  # compared as versions, not in float order
+            if op == "<":
+                return set(ids[:bisect.bisect_left(keys, literal.number)])
+            if op == "<=":
+                return set(ids[:bisect.bisect_right(keys, literal.number)])
+            if op == ">":
+                return set(ids[bisect.bisect_right(keys, literal.number):])
+            return set(ids[bisect.bisect_left(keys, literal.number):])
+        return None
+
+    def run(
+        self,
+        kind: str,
+        query: Optional[Query] = None,
+        sort: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Records of ``kind`` matching ``query``.
+
+        ``sort`` is a field, prefixed with ``-`` for descending order;
+        records without a value sort last.
+        """
+        records = self.records(kind)
+        if query is None:
+            matches = records
+            self.scanned = 0
+        else:
+            ids = query.root.candidates(self, kind)
+            rows = records if ids is None else [records[i] for i in sorted(ids)]
+            self.scanned = len(rows)
+            matches = [record for record in rows if query.root.matches(self, kind, record)]
+
+        if sort:
+            descending = sort.startswith("-")
+            field = sort.lstrip("-")
+            present = [r for r in matches if _index_key(self.value(r, kind, field)) is not None]
+            missing = [r for r in matches if _index_key(self.value(r, kind, field)) is None]
+            try:
+                present.sort(key=lambda r: _index_key(self.value(r, kind, field)), reverse=descending)
+            except TypeError:  # numbers and strings mixed
+                present.sort(key=lambda r: str(_index_key(self.value(r, kind, field))), reverse=descending)
+            matches = present + missing
+        return matches[:limit] if limit else matches
+
+    def project(self, kind: str, records: Iterable[Dict[str, Any]], columns: List[str]) -> List[Dict[str, Any]]:
+        """Flat rows with the value of each column (references shown by name)."""
+        rows = []
+        for record in records:
+            row = {}
+            for column in columns:
+                value = self.value(record, kind, column)
+                row[column] = value.get("name") if isinstance(value, dict) else value
+            rows.append(row)
+        return rows
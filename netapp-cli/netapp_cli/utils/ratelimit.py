@@ -0,0 +1,223 @@
+"""Adaptive client-side rate limiting shared by all API clients of a process.
+
+Each server host gets one throttle combining:
+
+- a token bucket capping the request rate (optional, ``rate_limit``
+  requests per second), and
+- an AIMD concurrency governor: the number of requests in flight grows by
+  roughly one per round trip while the server answers normally and is
+  halved when it answers 429 or 503. ``Retry-After`` pauses all new
+  requests until the server asks to be contacted again; without a usable
+  one they pause for a capped exponential backoff with jitter.
+
+Bulk operations therefore settle at the highest throughput the server
+tolerates instead of hammering it with fixed retries.
+"""
+
+import asyncio
+import email.utils
+import random
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, Optional
+
+THROTTLE_STATUSES = (429, 503)
+DEFAULT_MAX_CONCURRENCY = 16
+MAX_RETRY_AFTER = 120
+BACKOFF_BASE = 0.5
+MAX_BACKOFF = 30
+
+
+def parse_retry_after(value) -> Optional[float]:
+    """Parse a Retry-After header (delta seconds or HTTP date) into seconds."""
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        seconds = when.timestamp() - time.time()
+    return min(max(0.0, seconds), MAX_RETRY_AFTER)
+
+
+class ThrottleState:
+    """Token bucket and AIMD bookkeeping, without any locking.
+
+    All times come from ``time.monotonic``. Callers serialize access.
+    """
+
+    def __init__(self, rate_limit: Optional[float] = None, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        self.rate_limit = rate_limit if rate_limit and rate_limit > 0 else None
+        self.max_concurrency = max(1, max_concurrency)
+        self.limit = float(self.max_concurrency)
+        self.in_flight = 0
+        self.epoch = 0
+        self.blocked_until = 0.0
+        self.throttled = 0
+        self.backoffs = 0
+        self._tokens = float(self._burst)
+        self._refilled = time.monotonic()
+
+    @property
+    def _burst(self) -> float:
+        return max(1.0, self.rate_limit or 1.0)
+
+    def wait_time(self, now: float) -> float:
+        """Seconds to wait before a request may start (0 if it may start now)."""
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if self.rate_limit:
+            self._tokens = min(self._burst, self._tokens + (now - self._refilled) * self.rate_limit)
+            self._refilled = now
+            if self._tokens < 1:
+                return (1 - self._tokens) / self.rate_limit
+        return 0.0
+
+    def backoff(self) -> float:
+        """Pause after a throttle without Retry-After: half the cap plus jitter.
+
+        The cap doubles with every consecutive throttle window, up to
+        ``MAX_BACKOFF`` seconds.
+        """
+        cap = min(MAX_BACKOFF, BACKOFF_BASE * 2 ** self.backoffs)
+        return cap / 2 + random.uniform(0, cap / 2)
+
+    def has_slot(self) -> bool:
+        return self.in_flight < int(self.limit)
+
+    def start(self) -> int:
+        """Take a concurrency slot and a token; return the current epoch."""
+        self.in_flight += 1
+        if self.rate_limit:
+            self._tokens -= 1
+        return self.epoch
+
+    def finish(self, epoch: int, status_code: Optional[int], retry_after: Optional[float], now: float):
+        """Release a slot and adapt the limit to the response."""
+        self.in_flight -= 1
+        if status_code in THROTTLE_STATUSES:
+            self.throttled += 1
+            self.blocked_until = max(self.blocked_until, now + (retry_after or self.backoff()))
+            # Decrease once per window: ignore throttles from requests that
+            # started before the previous decrease
+            if epoch == self.epoch:
+                self.limit = max(1.0, self.limit / 2)
+                self.epoch += 1
+                if not retry_after:
+                    self.backoffs += 1
+        elif status_code is not None and status_code < 500:
+            self.limit = min(float(self.max_concurrency), self.limit + 1 / self.limit)
+            self.backoffs = 0
+
+
+class Throttle:
+    """Thread-safe throttle used by NetAppAPIClient."""
+
+    def __init__(self, rate_limit: Optional[float] = None, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        self.state = ThrottleState(rate_limit, max_concurrency)
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def slot(self):
+        """Wait for permission to send a request.
+
+        Yields a callback ``done(status_code, retry_after)`` that must be
+        called with the outcome; a request leaving without calling it counts
+        as neither success nor throttle.
+        """
+        with self._cond:
+            while True:
+                delay = self.state.wait_time(time.monotonic())
+                if delay <= 0 and self.state.has_slot():
+                    epoch = self.state.start()
+                    break
+                self._cond.wait(timeout=delay if delay > 0 else None)
+
+        outcome = {}
+
+        def done(status_code: Optional[int], retry_after: Optional[float] = None):
+            outcome["status_code"], outcome["retry_after"] = status_code, retry_after
+
+        try:
+            yield done
+        finally:
+            with self._cond:
+                self.state.finish(epoch, outcome.get("status_code"), outcome.get("retry_after"), time.monotonic())
+                self._cond.notify_all()
+
+
+class AsyncThrottle:
+    """asyncio throttle used by AsyncNetAppAPIClient."""
+
+    def __init__(self, rate_limit: Optional[float] = None, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        self.state = ThrottleState(rate_limit, max_concurrency)
+        self._cond = asyncio.Condition()
+
+    @asynccontextmanager
+    async def slot(self):
+        """Async counterpart of Throttle.slot."""
+        async with self._cond:
+            while True:
+                delay = self.state.wait_time(time.monotonic())
+                if delay <= 0 and self.state.has_slot():
+                    epoch = self.state.start()
+                    break
+                try:
+                    await asyncio.wait_for(self._cond.wait(), timeout=delay if delay > 0 else None)
+                except asyncio.TimeoutError:
+                    pass
+
+        outcome = {}
+
+        def done(status_code: Optional[int], retry_after: Optional[float] = None):
+            outcome["status_code"], outcome["retry_after"] = status_code, retry_after
+
+        try:
+            yield done
+        finally:
+            async with self._cond:
+                self.state.finish(epoch, outcome.get("status_code"), outcome.get("retry_after"), time.monotonic())
+                self._cond.notify_all()
+
+
+_throttles: Dict[str, Throttle] = {}
+_async_throttles: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, AsyncThrottle]]" = weakref.WeakKeyDictionary()
+_throttles_lock = threading.Lock()
+
+
+def get_throttle(host: str, rate_limit: Optional[float] = None, max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> Throttle:
+    """Return the process-wide throttle for ``host``."""
+    with _throttles_lock:
+        throttle = _throttles.get(host)
+        if throttle is None:
+            throttle = Throttle(rate_limit, max_concurrency)
+            _throttles[host] = throttle
+        return throttle
+
+
+def get_async_throttle(host: str, rate_limit: Optional[float] = None, max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> AsyncThrottle:
+    """Return the async throttle for ``host`` on the running event loop.
+
+    asyncio primitives belong to one loop, so each loop gets its own.
+    """
+    loop = asyncio.get_running_loop()
+    with _throttles_lock:
+        per_loop = _async_throttles.setdefault(loop, {})
+        throttle = per_loop.get(host)
+        if throttle is None:
+            throttle = AsyncThrottle(rate_limit, max_concurrency)
+            per_loop[host] = throttle
+        return throttle
+
+
+def reset_throttles():
+    """Forget all throttles (used by tests)."""
+    with _throttles_lock:
+        _throttles.clear()
+        _async_throttles.clear()
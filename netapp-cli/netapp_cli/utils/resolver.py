@@ -0,0 +1,148 @@
+"""Name to UUID resolution for volumes and snapshots."""
+
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from netapp_cli.utils.api_client import NetAppAPIClient, NetAppAPIError
+from netapp_cli.utils.cache import ResolutionCache
+
+
+class ResolutionError(NetAppAPIError):
+    """Raised when a name does not match any object."""
+
+    def __init__(self, message: str):
+        super().__init__(message, status_code=404)
+
+
+class Resolver:
+    """Resolve volume and snapshot names to UUIDs through a ResolutionCache.
+
+    Lookups hit the cache first and only query the API on a miss. When an
+    operation using a cached UUID fails with 404 the entry is treated as
+    stale: it is invalidated, the name is resolved again from the API and
+    the operation is retried once.
+    """
+
+    def __init__(self, client: NetAppAPIClient, cache: ResolutionCache, formatter=None):
+        self.client = client
+        self.cache = cache
+        self.formatter = formatter
+        self.host = client.config.host
+
+    def _progress(self, message: str):
+        if self.formatter:
+            self.formatter.progress_update(message)
+
+    def _volume_key(self, name: str, svm: Optional[str]) -> str:
+        return ResolutionCache.make_key(self.host, "volume", name, svm)
+
+    def _snapshot_key(self, volume_uuid: str, name: str) -> str:
+        return ResolutionCache.make_key(self.host, "snapshot", name, volume_uuid)
+
+    def _lookup_volume(self, name: str, svm: Optional[str], use_cache: bool = True) -> Tuple[str, bool]:
+        """Return ``(uuid, from_cache)`` for a volume name."""
+        key = self._volume_key(name, svm)
+        if use_cache:
+            uuid = self.cache.get(key)
+            if uuid:
+                self._progress(f"Resolved volume {name} -> {uuid} (cached)")
+                return uuid, True
+
+        params = {"name": name}
+        if svm:
+            params["svm.name"] = svm
+        response = self.client.get("/api/storage/volumes", params)
+        volumes = response.get("records", [])
+        if not volumes:
+            raise ResolutionError(f"Volume '{name}' not found")
+
+        uuid = volumes[0]["uuid"]
+        self.cache.set(key, uuid)
+        self._progress(f"Found volume UUID: {uuid}")
+        return uuid, False
+
+    def _lookup_snapshot(
+        self, volume_uuid: str, name: str, use_cache: bool = True, remember: bool = True
+    ) -> Tuple[str, bool]:
+        """Return ``(uuid, from_cache)`` for a snapshot name on a volume.
+
+        With ``remember=False`` a UUID fetched from the API is not written to
+        the cache, for callers about to delete the snapshot anyway.
+        """
+        key = self._snapshot_key(volume_uuid, name)
+        if use_cache:
+            uuid = self.cache.get(key)
+            if uuid:
+                self._progress(f"Resolved snapshot {name} -> {uuid} (cached)")
+                return uuid, True
+
+        response = self.client.get(f"/api/storage/volumes/{volume_uuid}/snapshots", {"name": name})
+        snapshots = response.get("records", [])
+        if not snapshots:
+            raise ResolutionError(f"Snapshot '{name}' not found")
+
+        uuid = snapshots[0]["uuid"]
+        if remember:
+            self.cache.set(key, uuid)
+        self._progress(f"Found snapshot UUID: {uuid}")
+        return uuid, False
+
+    def volume_uuid(self, name: str, svm: Optional[str] = None) -> str:
+        """Resolve a volume name, raising ResolutionError if it does not exist."""
+        return self._lookup_volume(name, svm)[0]
+
+    def snapshot_uuid(self, volume_uuid: str, name: str) -> str:
+        """Resolve a snapshot name, raising ResolutionError if it does not exist."""
+        return self._lookup_snapshot(volume_uuid, name)[0]
+
+    def remember_volumes(self, volumes: Iterable[Dict[str, Any]]):
+        """Seed the cache from a volume listing with name, svm.name and uuid fields."""
+        mapping = {}
+        for volume in volumes:
+            if volume.get("name") and volume.get("uuid"):
+                svm_name = (volume.get("svm") or {}).get("name")
+                mapping[self._volume_key(volume["name"], svm_name)] = volume["uuid"]
+        self.cache.set_many(mapping)
+
+    def forget_volume(self, name: str, svm: Optional[str] = None):
+        """Invalidate a cached volume, e.g. after deleting it."""
+        self.cache.invalidate(self._volume_key(name, svm))
+
+    def forget_snapshot(self, volume_uuid: str, name: str):
+        """Invalidate a cached snapshot, e.g. after deleting it."""
+        self.cache.invalidate(self._snapshot_key(volume_uuid, name))
+
+    def forget_snapshots(self, snapshots: Iterable[Tuple[str, str]]):
+        """Invalidate several ``(volume_uuid, name)`` snapshots with a single write."""
+        self.cache.invalidate_many([self._snapshot_key(volume_uuid, name) for volume_uuid, name in snapshots])
+
+    def with_volume(self, name: str, svm: Optional[str], action: Callable[[str], Any]) -> Any:
+        """Call ``action(volume_uuid)``, re-resolving once if a cached UUID is stale."""
+        uuid, cached = self._lookup_volume(name, svm)
+        try:
+            return action(uuid)
+        except ResolutionError:
+            raise
+        except NetAppAPIError as e:
+            if e.status_code != 404 or not cached:
+                raise
+            self._progress(f"Cached UUID for volume {name} is stale, resolving again")
+            self.forget_volume(name, svm)
+            uuid, _ = self._lookup_volume(name, svm, use_cache=False)
+            return action(uuid)
+
+    def with_snapshot(
+        self, volume_uuid: str, name: str, action: Callable[[str], Any], remember: bool = True
+    ) -> Any:
+        """Call ``action(snapshot_uuid)``, re-resolving once if a cached UUID is stale."""
+        uuid, cached = self._lookup_snapshot(volume_uuid, name, remember=remember)
+        try:
+            return action(uuid)
+        except ResolutionError:
+            raise
+        except NetAppAPIError as e:
+            if e.status_code != 404 or not cached:
+                raise
+            self._progress(f"Cached UUID for snapshot {name} is stale, resolving again")
+            self.forget_snapshot(volume_uuid, name)
+            uuid, _ = self._lookup_snapshot(volume_uuid, name, use_cache=False, remember=remember)
+            return action(uuid)
@@ -0,0 +1,137 @@
+"""Live watch mode for monitoring commands."""
+
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from rich.live import Live
+from rich.table import Table
+
+from netapp_cli.utils.api_client import NetAppAPIError
+from netapp_cli.utils.output import OutputFormatter, console
+
+
+class WatchTable:
+    """Table state kept across refreshes of a watch loop.
+
+    Rows are keyed by the ``key`` field so each refresh only rebuilds the
+    cells of records whose displayed values changed; unchanged rows reuse
+    their previously rendered cells. Changed rows are highlighted until the
+    next refresh.
+    """
+
+    def __init__(
+        self,
+        title: str,
+        headers: List[str],
+        key: str = "uuid",
+        max_rows: Optional[int] = None,
+        incremental: bool = False,
+    ):
+        self.title = title
+        self.headers = headers
+        self.key = key
+        self.max_rows = max_rows
+        self.incremental = incremental
+        self.refreshes = 0
+        self.status: Optional[str] = None
+        self._formatter = OutputFormatter()
+        self._rows: Dict[Any, Tuple[str, ...]] = {}
+        self._order: List[Any] = []
+        self._changed: set = set()
+        self._removed = 0
+
+    def _cells(self, record: Dict) -> Tuple[str, ...]:
+        """Render the displayed cells of a record."""
+        cells = []
+        for header in self.headers:
+            value = self._formatter._get_nested_value(record, header)
+            cells.append(str(value) if value is not None else "")
+        return tuple(cells)
+
+    def _row_key(self, record: Dict, cells: Tuple[str, ...]) -> Any:
+        """Identify a row; records without the key field are keyed by content."""
+        value = self._formatter._get_nested_value(record, self.key)
+        return value if value is not None else cells
+
+    def update(self, records: Iterable[Dict]) -> int:
+        """Apply the result of a poll and return the number of changed rows.
+
+        In incremental mode the records are treated as new arrivals that are
+        prepended to the existing rows (e.g. events newer than the last one
+        seen); otherwise they replace the current view.
+        """
+        fresh_order = []
+        seen = set()
+        changed = set()
+        rows = dict(self._rows) if self.incremental else {}
+
+        for record in records:
+            cells = self._cells(record)
+            key = self._row_key(record, cells)
+            if key in seen:
+                continue
+            seen.add(key)
+            if self._rows.get(key) != cells:
+                changed.add(key)
+            rows[key] = cells
+            fresh_order.append(key)
+
+        if self.incremental:
+            order = fresh_order + [key for key in self._order if key not in seen]
+        else:
+            order = fresh_order
+
+        if self.max_rows is not None:
+            order = order[:self.max_rows]
+
+        kept = set(order)
+        self._removed = len([key for key in self._order if key not in kept])
+        self._rows = {key: rows[key] for key in order}
+        self._order = order
+        # Nothing is "changed" on the first refresh, every row is new
+        self._changed = changed if self.refreshes else set()
+        self.refreshes += 1
+        return len(changed)
+
+    def render(self, interval: Optional[float] = None) -> Table:
+        """Build the Rich table for the current state."""
+        table = Table(title=self.title)
+        for header in self.headers:
+            table.add_column(header.replace("_", " ").title(), style="cyan", no_wrap=True)
+
+        for key in self._order:
+            style = "bold yellow" if key in self._changed else None
+            table.add_row(*self._rows[key], style=style)
+
+        caption = [f"Updated {datetime.now().strftime('%H:%M:%S')}"]
+        if self.refreshes > 1:
+            caption.append(f"{len(self._changed)} changed, {self._removed} removed")
+        if interval:
+            caption.append(f"every {interval:g}s")
+        caption.append("Ctrl+C to stop")
+        if self.status:
+            caption.append(self.status)
+        table.caption = " | ".join(caption)
+        return table
+
+
+def run_watch(table: WatchTable, poll: Callable[[], Iterable[Dict]], interval: float):
+    """Poll and re-render ``table`` every ``interval`` seconds until interrupted.
+
+    The caller keeps a single API client (and its pooled session) open for
+    the whole loop. API errors are shown in the table caption instead of
+    ending the watch, so a transient failure does not drop the display.
+    """
+    with Live(table.render(interval), console=console, auto_refresh=False) as live:
+        try:
+            while True:
+                try:
+                    table.update(poll())
+                    table.status = None
+                except NetAppAPIError as e:
+                    table.status = f"API Error: {e}"
+                live.update(table.render(interval), refresh=True)
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
@@ -184,6 +184,34 @@ def mock_requests():
         yield mock_req, mock_session, mock_response
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep on-disk CLI caches out of the user's home directory."""
+    cache_path = tmp_path / "netapp-cli-cache"
+    monkeypatch.setenv("NETAPP_CLI_CACHE_DIR", str(cache_path))
+    return cache_path
+
+
+@pytest.fixture(autouse=True)
+def no_daemon(monkeypatch):
+    """Never route test requests through a developer's running daemon."""
+    monkeypatch.setenv("NETAPP_DAEMON", "0")
+
+
+@pytest.fixture(autouse=True)
+def fresh_throttles(monkeypatch):
+    """Start every test with unthrottled, process-wide rate limiters.
+
+    Backoff after a throttle without Retry-After is shortened to milliseconds.
+    """
+    from netapp_cli.utils import ratelimit
+    from netapp_cli.utils.ratelimit import reset_throttles
+    monkeypatch.setattr(ratelimit, "BACKOFF_BASE", 0.002)
+    reset_throttles()
+    yield
+    reset_throttles()
+
+
 @pytest.fixture(autouse=True)
 def disable_ssl_warnings():
     """Disable SSL warnings during testing."""
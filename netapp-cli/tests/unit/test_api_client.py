@@ -1,12 +1,15 @@
 """Tests for NetApp API client."""
 
+import gzip
+import io
 import pytest
 import json
 import time
 from unittest.mock import Mock, patch, MagicMock
 import requests
+import urllib3
 
-from netapp_cli.utils.api_client import NetAppAPIClient, NetAppAPIError
+from netapp_cli.utils.api_client import NetAppAPIClient, NetAppAPIError, TransferStats, accept_encoding
 from netapp_cli.utils.config import NetAppConfig
 
 
@@ -335,6 +338,59 @@ class TestNetAppAPIClient:
 
         assert "timed out" in str(exc_info.value)
 
+    @patch('netapp_cli.utils.api_client.requests.Session')
+    @patch('netapp_cli.utils.api_client.time.sleep')
+    def test_wait_for_jobs_fan_in(self, mock_sleep, MockSession, mock_netapp_config):
+        """Test waiting for several jobs - finished jobs are not polled again."""
+        mock_session = MockSession.return_value
+
+        def job_response(key, state):
+            response = Mock()
+            response.status_code = 200
+            response.json.return_value = {"key": key, "state": state, "message": f"{key} {state}"}
+            return response
+
+        missing = Mock()
+        missing.status_code = 404
+        missing.json.return_value = {"error": {"message": "Job not found"}}
+
+        mock_session.request.side_effect = [
+            job_response("a", "COMPLETED"),
+            job_response("b", "RUNNING"),
+            missing,
+            job_response("b", "FAILED"),
+        ]
+        updates = []
+
+        client = NetAppAPIClient(mock_netapp_config, verbose=False)
+        result = client.wait_for_jobs(["a", "b", "c"], on_update=lambda s: updates.append(dict(s)))
+
+        assert result["a"]["state"] == "COMPLETED"
+        assert result["b"]["state"] == "FAILED"
+        assert result["c"]["state"] == "NOT_FOUND"
+        assert mock_session.request.call_count == 4
+        assert len(updates) == 2
+        mock_sleep.assert_called_once_with(2)
+
+    @patch('netapp_cli.utils.api_client.requests.Session')
+    @patch('netapp_cli.utils.api_client.time.time')
+    @patch('netapp_cli.utils.api_client.time.sleep')
+    def test_wait_for_jobs_timeout(self, mock_sleep, mock_time, MockSession, mock_netapp_config):
+        """Test that jobs still running at the timeout are reported, not raised."""
+        mock_session = MockSession.return_value
+        mock_time.side_effect = [0, 301]
+
+        running_response = Mock()
+        running_response.status_code = 200
+        running_response.json.return_value = {"key": "a", "state": "RUNNING"}
+        mock_session.request.return_value = running_response
+
+        client = NetAppAPIClient(mock_netapp_config, verbose=False)
+        result = client.wait_for_jobs(["a"], timeout=300)
+
+        assert result["a"]["state"] == "TIMEOUT"
+        mock_sleep.assert_not_called()
+
     @patch('netapp_cli.utils.api_client.requests.Session')
     def test_paginate_single_page(self, MockSession, mock_netapp_config):
         """Test pagination with single page."""
@@ -430,3 +486,67 @@ class TestNetAppAPIClient:
                 client = NetAppAPIClient(mock_netapp_config, verbose=False)
                 # urllib3.disable_warnings should be called when verify_ssl is False
                 mock_disable_warnings.assert_called_once()
+
+
+def _gzip_response(payload):
+    """A real requests response whose body arrives gzip-encoded."""
+    body = gzip.compress(json.dumps(payload).encode())
+    response = requests.Response()
+    response.status_code = 200
+    response.headers.update({"Content-Type": "application/json", "Content-Encoding": "gzip"})
+    response.raw = urllib3.HTTPResponse(
+        body=io.BytesIO(body),
+        headers={"Content-Encoding": "gzip"},
+        status=200,
+        preload_content=False,
+        decode_content=True
+    )
+    return response, body
+
+
+class TestContentEncoding:
+    """Tests for compression negotiation and transfer accounting."""
+
+    def test_accept_encoding_without_brotli(self):
+        """Test that only gzip and deflate are offered without a brotli module."""
+        with patch('netapp_cli.utils.api_client.importlib.util.find_spec', return_value=None):
+            assert accept_encoding() == "gzip, deflate"
+
+    def test_accept_encoding_with_brotli(self):
+        """Test that Brotli is preferred when it can be decoded."""
+        with patch('netapp_cli.utils.api_client.importlib.util.find_spec', return_value=Mock()):
+            assert accept_encoding() == "br, gzip, deflate"
+
+    def test_transfer_stats_ratio(self):
+        """Test accumulated sizes and the compression ratio."""
+        stats = TransferStats()
+        assert stats.ratio is None
+
+        stats.record(100, 400)
+        stats.record(100, 200)
+
+        assert stats.as_dict() == {"responses": 2, "wire_bytes": 200, "decoded_bytes": 600, "ratio": 3.0}
+
+    @patch('netapp_cli.utils.api_client.requests.Session')
+    def test_gzip_response_records_wire_and_decoded_bytes(self, MockSession, mock_netapp_config):
+        """Test that a gzip body is decoded and counted at both sizes."""
+        payload = {"records": [{"name": f"vol{i}", "state": "online"} for i in range(200)]}
+        response, body = _gzip_response(payload)
+        decoded = json.dumps(payload).encode()
+        mock_session = MockSession.return_value
+        mock_session.headers = {}
+
+        def send(**kwargs):
+            response.content  # requests reads the body before returning unless streaming
+            return response
+
+        mock_session.request.side_effect = send
+
+        client = NetAppAPIClient(mock_netapp_config, verbose=False)
+        result = client.get("/api/storage/volumes")
+
+        assert result == payload
+        assert client.stats.responses == 1
+        assert client.stats.wire_bytes == len(body)
+        assert client.stats.decoded_bytes == len(decoded)
+        assert client.stats.wire_bytes < client.stats.decoded_bytes
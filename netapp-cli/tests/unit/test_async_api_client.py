@@ -0,0 +1,202 @@
+"""Tests for the asynchronous NetApp API client."""
+
+import asyncio
+import gzip
+import json
+
+import pytest
+from unittest.mock import patch
+
+httpx = pytest.importorskip("httpx")
+
+from netapp_cli.utils.api_client import NetAppAPIError
+from netapp_cli.utils.async_api_client import AsyncNetAppAPIClient
+
+
+def _run(config, handler, coro_factory):
+    """Run ``coro_factory(client)`` against a mock transport."""
+    async def main():
+        async with AsyncNetAppAPIClient(config, transport=httpx.MockTransport(handler)) as client:
+            return await coro_factory(client)
+    return asyncio.run(main())
+
+
+class TestAsyncNetAppAPIClient:
+    """Tests for AsyncNetAppAPIClient."""
+
+    def test_get_sends_auth_and_params(self, mock_netapp_config):
+        """Test URL, headers and query parameters."""
+        seen = {}
+
+        def handler(request):
+            seen["url"] = str(request.url)
+            seen["auth"] = request.headers["Authorization"]
+            return httpx.Response(200, json={"name": "cluster1"})
+
+        result = _run(mock_netapp_config, handler, lambda c: c.get("/api/cluster", {"fields": "name"}))
+
+        assert result == {"name": "cluster1"}
+        assert seen["url"] == "https://test-cluster.example.com/api/cluster?fields=name"
+        assert seen["auth"].startswith("Basic ")
+
+    def test_error_mapping(self, mock_netapp_config):
+        """Test that HTTP errors raise NetAppAPIError like the sync client."""
+        def handler(request):
+            return httpx.Response(404, json={"message": "Volume not found"})
+
+        with pytest.raises(NetAppAPIError) as exc_info:
+            _run(mock_netapp_config, handler, lambda c: c.get("/api/storage/volumes/x"))
+
+        assert exc_info.value.status_code == 404
+        assert str(exc_info.value) == "Volume not found"
+
+    def test_no_content(self, mock_netapp_config):
+        """Test 204 responses."""
+        result = _run(mock_netapp_config, lambda r: httpx.Response(204), lambda c: c.delete("/api/x"))
+
+        assert result == {"success": True}
+
+    @patch('netapp_cli.utils.async_api_client.asyncio.sleep')
+    def test_get_is_retried(self, mock_sleep, mock_netapp_config):
+        """Test that GETs are retried on retryable statuses."""
+        responses = iter([httpx.Response(502), httpx.Response(200, json={"ok": True})])
+
+        result = _run(mock_netapp_config, lambda r: next(responses), lambda c: c.get("/api/cluster"))
+
+        assert result == {"ok": True}
+        mock_sleep.assert_awaited_once_with(0)
+
+    def test_post_is_not_retried(self, mock_netapp_config):
+        """Test that non-idempotent requests are sent once."""
+        calls = []
+
+        def handler(request):
+            calls.append(json.loads(request.content))
+            return httpx.Response(502, json={"message": "bad gateway"})
+
+        with pytest.raises(NetAppAPIError):
+            _run(mock_netapp_config, handler, lambda c: c.post("/api/x", {"name": "a"}))
+
+        assert calls == [{"name": "a"}]
+
+    def test_paginate_fetches_pages_concurrently_in_order(self, mock_netapp_config):
+        """Test that pages after the first are fetched and kept in order."""
+        total = 250
+
+        def handler(request):
+            offset = int(request.url.params["offset"])
+            limit = int(request.url.params["limit"])
+            records = [{"id": i} for i in range(offset, min(offset + limit, total))]
+            return httpx.Response(200, json={"num_records": len(records), "total_records": total, "records": records})
+
+        result = _run(mock_netapp_config, handler, lambda c: c.paginate("/api/storage/volumes"))
+
+        assert [r["id"] for r in result] == list(range(total))
+
+    def test_paginate_respects_max_records(self, mock_netapp_config):
+        """Test that no pages beyond max_records are requested."""
+        offsets = []
+
+        def handler(request):
+            offset = int(request.url.params["offset"])
+            offsets.append(offset)
+            return httpx.Response(200, json={"num_records": 100, "total_records": 1000, "records": [{"id": offset + i} for i in range(100)]})
+
+        result = _run(mock_netapp_config, handler, lambda c: c.paginate("/api/x", max_records=150))
+
+        assert len(result) == 150
+        assert sorted(offsets) == [0, 100]
+
+    def test_paginate_with_capped_pages(self, mock_netapp_config):
+        """Test that pages shorter than asked for are planned from total_records."""
+        def handler(request):
+            offset = int(request.url.params["offset"])
+            records = [{"id": i} for i in range(offset, min(offset + 40, 250))]
+            return httpx.Response(200, json={"num_records": len(records), "total_records": 250, "records": records})
+
+        result = _run(mock_netapp_config, handler, lambda c: c.paginate("/api/x"))
+
+        assert [r["id"] for r in result] == list(range(250))
+
+    def test_paginate_follows_next_links(self, mock_netapp_config):
+        """Test the sequential fallback with num_records counting only the page."""
+        def handler(request):
+            offset = int(request.url.params["offset"])
+            records = [{"id": i} for i in range(offset, min(offset + 100, 250))]
+            links = {"next": {"href": "/api/x"}} if offset + len(records) < 250 else {}
+            return httpx.Response(200, json={"num_records": len(records), "records": records, "_links": links})
+
+        result = _run(mock_netapp_config, handler, lambda c: c.paginate("/api/x"))
+
+        assert [r["id"] for r in result] == list(range(250))
+
+    def test_paginate_without_total(self, mock_netapp_config):
+        """Test sequential fallback when total_records is missing."""
+        def handler(request):
+            offset = int(request.url.params["offset"])
+            count = 100 if offset == 0 else 20
+            return httpx.Response(200, json={"records": [{"id": offset + i} for i in range(count)]})
+
+        result = _run(mock_netapp_config, handler, lambda c: c.paginate("/api/x"))
+
+        assert len(result) == 120
+
+    def test_gzip_page_records_wire_and_decoded_bytes(self, mock_netapp_config):
+        """Test transfer stats for a streamed gzip-encoded page."""
+        payload = json.dumps({"num_records": 50, "records": [{"id": i, "state": "online"} for i in range(50)]}).encode()
+        body = gzip.compress(payload)
+        seen = {}
+
+        class NetworkStream(httpx.AsyncByteStream):
+            # content=bytes would be decoded up front, unlike a body read from a socket
+            async def __aiter__(self):
+                yield body[:100]
+                yield body[100:]
+
+        def handler(request):
+            seen["accept_encoding"] = request.headers["Accept-Encoding"]
+            return httpx.Response(200, stream=NetworkStream(), headers={"Content-Encoding": "gzip"})
+
+        async def paginate_with_stats(client):
+            records = await client.paginate("/api/x")
+            return records, client.stats
+
+        records, stats = _run(mock_netapp_config, handler, paginate_with_stats)
+
+        assert len(records) == 50
+        assert "gzip" in seen["accept_encoding"]
+        assert stats.wire_bytes == len(body)
+        assert stats.decoded_bytes == len(payload)
+
+    @patch('netapp_cli.utils.async_api_client.asyncio.sleep')
+    def test_wait_for_jobs(self, mock_sleep, mock_netapp_config):
+        """Test that every job gets a status, like with the sync client."""
+        polls = {}
+
+        def handler(request):
+            key = request.url.path.rsplit("/", 1)[1]
+            polls[key] = polls.get(key, 0) + 1
+            if key == "gone":
+                return httpx.Response(404, json={"message": "not found"})
+            state = {"bad": "FAILED", "slow": "RUNNING" if polls[key] < 2 else "COMPLETED"}.get(key, "COMPLETED")
+            return httpx.Response(200, json={"key": key, "state": state, "message": "disk full"})
+
+        updates = []
+        result = _run(mock_netapp_config, handler, lambda c: c.wait_for_jobs(
+            ["good", "bad", "gone", "slow"], on_update=lambda s: updates.append({k: v["state"] for k, v in s.items()})
+        ))
+
+        assert {key: status["state"] for key, status in result.items()} == {
+            "good": "COMPLETED", "bad": "FAILED", "gone": "NOT_FOUND", "slow": "COMPLETED"
+        }
+        assert updates[0]["slow"] == "RUNNING" and len(updates) == 2
+        assert polls == {"good": 1, "bad": 1, "gone": 1, "slow": 2}
+        mock_sleep.assert_awaited_once_with(2)
+
+    def test_wait_for_jobs_timeout(self, mock_netapp_config):
+        def handler(request):
+            return httpx.Response(200, json={"key": "a", "state": "RUNNING"})
+
+        result = _run(mock_netapp_config, handler, lambda c: c.wait_for_jobs(["a"], timeout=0))
+
+        assert result["a"]["state"] == "TIMEOUT"
@@ -0,0 +1,126 @@
+"""Tests for batch execution."""
+
+import click
+import pytest
+from click.testing import CliRunner
+from unittest.mock import Mock, patch
+
+from netapp_cli.commands.batch import parse_batch
+from netapp_cli.main import cli
+from netapp_cli.utils.api_client import NetAppAPIClient, NetAppAPIError, disable_shared_sessions, enable_shared_sessions
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_sessions():
+    yield
+    disable_shared_sessions()
+
+
+class TestParseBatch:
+    """Tests for batch script parsing."""
+
+    def test_comments_prefix_and_barriers(self):
+        """Test comment handling, optional 'netapp' and wait groups."""
+        groups = parse_batch([
+            "# nightly",
+            "netapp volume list --svm svm1",
+            "",
+            "snapshot list 'vol 1'  # quoted",
+            "wait",
+            "cluster list",
+        ])
+
+        assert groups == [
+            [(2, ["volume", "list", "--svm", "svm1"]), (4, ["snapshot", "list", "vol 1"])],
+            [(6, ["cluster", "list"])],
+        ]
+
+    def test_invalid_quoting(self):
+        """Test that unbalanced quotes are reported with the line number."""
+        with pytest.raises(click.BadParameter, match="line 1"):
+            parse_batch(["volume show 'vol1"])
+
+    def test_nested_batch_rejected(self):
+        """Test that a batch cannot invoke another batch."""
+        with pytest.raises(click.BadParameter):
+            parse_batch(["batch other.txt"])
+
+
+class TestBatchCommand:
+    """Tests for running a batch."""
+
+    @pytest.fixture(autouse=True)
+    def setup_method(self, mock_config):
+        self.runner = CliRunner()
+        self.obj = {"config": mock_config}
+
+    @patch('netapp_cli.commands.volume.NetAppAPIClient')
+    def test_lines_share_config_and_report(self, MockClient, mock_config):
+        """Test that every line runs with the shared configuration."""
+        MockClient.return_value.iter_records.return_value = [{"name": "vol1", "svm": {"name": "svm1"}}]
+        script = "volume list-volumes --svm svm1\nvolume list-volumes --svm svm2\n"
+
+        result = self.runner.invoke(cli, ['batch', '-'], input=script, obj=self.obj)
+
+        assert result.exit_code == 0, result.output
+        assert "2 succeeded, 0 failed" in result.output
+        assert MockClient.call_count == 2
+        assert all(c[0][0] is mock_config.netapp for c in MockClient.call_args_list)
+
+    @patch('netapp_cli.commands.volume.NetAppAPIClient')
+    def test_failures_are_summarized(self, MockClient):
+        """Test the exit code and report when a line fails."""
+        MockClient.return_value.iter_records.side_effect = [NetAppAPIError("boom"), []]
+        script = "volume list-volumes --svm svm1\nvolume list-volumes --svm svm2\n"
+
+        result = self.runner.invoke(cli, ['batch', '-'], input=script, obj=self.obj)
+
+        assert result.exit_code == 1
+        assert "1 succeeded, 1 failed" in result.output
+        assert "Batch Report" in result.output
+
+    @patch('netapp_cli.commands.volume.NetAppAPIClient')
+    def test_stop_on_error(self, MockClient):
+        """Test that remaining lines are skipped after a failure."""
+        MockClient.return_value.iter_records.side_effect = NetAppAPIError("boom")
+        script = "volume list-volumes\nvolume list-volumes\nvolume list-volumes\n"
+
+        result = self.runner.invoke(cli, ['batch', '-', '--stop-on-error'], input=script, obj=self.obj)
+
+        assert result.exit_code == 1
+        assert "0 succeeded, 1 failed, 2 skipped" in result.output
+
+    @patch('netapp_cli.commands.volume.NetAppAPIClient')
+    def test_parallel_groups(self, MockClient):
+        """Test parallel execution across wait barriers."""
+        MockClient.return_value.iter_records.return_value = []
+        script = "volume list-volumes\nvolume list-volumes\nwait\nvolume list-volumes\n"
+
+        result = self.runner.invoke(cli, ['batch', '-', '--parallel', '2'], input=script, obj=self.obj)
+
+        assert result.exit_code == 0, result.output
+        assert "3 succeeded, 0 failed" in result.output
+
+
+class TestSharedSessions:
+    """Tests for session sharing between clients."""
+
+    @patch('netapp_cli.utils.api_client.requests.Session')
+    def test_clients_share_session_when_enabled(self, MockSession, mock_netapp_config):
+        """Test that one session is created per host and user."""
+        MockSession.side_effect = lambda: Mock()
+
+        enable_shared_sessions()
+        first = NetAppAPIClient(mock_netapp_config)
+        second = NetAppAPIClient(mock_netapp_config)
+
+        assert first.session is second.session
+        assert MockSession.call_count == 1
+
+    @patch('netapp_cli.utils.api_client.requests.Session')
+    def test_sessions_are_separate_by_default(self, MockSession, mock_netapp_config):
+        """Test the default of one session per client."""
+        NetAppAPIClient(mock_netapp_config)
+        NetAppAPIClient(mock_netapp_config)
+
+        assert MockSession.call_count == 2
@@ -0,0 +1,193 @@
+"""Tests for bulk snapshot operations and retention pruning."""
+
+import json
+import threading
+import time
+from datetime import timedelta
+
+import click
+import pytest
+from unittest.mock import Mock
+
+from netapp_cli.commands.snapshot import _bulk_targets, _parse_age, _render_snapshot_name, compute_prune_set
+from netapp_cli.utils.api_client import NetAppAPIError
+from netapp_cli.utils.bulk import ManifestError, load_manifest, run_bulk
+from netapp_cli.utils.cache import ResolutionCache
+from netapp_cli.utils.resolver import Resolver
+
+
+class TestLoadManifest:
+    """Tests for manifest parsing."""
+
+    def test_csv_manifest(self, tmp_path):
+        """Test reading a CSV manifest with mixed-case headers."""
+        path = tmp_path / "manifest.csv"
+        path.write_text("Volume,SVM,snapshot\nvol1, svm1 ,snap1\nvol2,svm1,snap2\n")
+
+        entries = load_manifest(str(path))
+
+        assert entries == [
+            {"volume": "vol1", "svm": "svm1", "snapshot": "snap1"},
+            {"volume": "vol2", "svm": "svm1", "snapshot": "snap2"},
+        ]
+
+    def test_yaml_manifest_with_items(self, tmp_path):
+        """Test reading a YAML manifest wrapped in an items key."""
+        path = tmp_path / "manifest.yaml"
+        path.write_text("items:\n  - volume: vol1\n    svm: svm1\n")
+
+        assert load_manifest(str(path)) == [{"volume": "vol1", "svm": "svm1"}]
+
+    def test_json_manifest(self, tmp_path):
+        """Test reading a JSON list manifest."""
+        path = tmp_path / "manifest.json"
+        path.write_text(json.dumps([{"volume": "vol1"}]))
+
+        assert load_manifest(str(path)) == [{"volume": "vol1"}]
+
+    def test_unsupported_format(self, tmp_path):
+        """Test that unknown extensions are rejected."""
+        path = tmp_path / "manifest.txt"
+        path.write_text("vol1")
+
+        with pytest.raises(ManifestError):
+            load_manifest(str(path))
+
+    def test_entries_must_be_mappings(self, tmp_path):
+        """Test that scalar entries are rejected."""
+        path = tmp_path / "manifest.json"
+        path.write_text(json.dumps(["vol1"]))
+
+        with pytest.raises(ManifestError):
+            load_manifest(str(path))
+
+
+class TestRunBulk:
+    """Tests for bounded concurrent execution."""
+
+    def test_results_keep_input_order(self):
+        """Test that results line up with inputs regardless of completion order."""
+        def action(item):
+            time.sleep(0.01 * (3 - item))
+            return item * 10
+
+        results = run_bulk([0, 1, 2], action, concurrency=3)
+
+        assert [r["result"] for r in results] == [0, 10, 20]
+        assert all(r["status"] == "ok" for r in results)
+
+    def test_api_errors_are_recorded_per_item(self):
+        """Test that one failure does not abort the batch."""
+        def action(item):
+            if item == "bad":
+                raise NetAppAPIError("Volume is offline")
+            return item
+
+        results = run_bulk(["good", "bad", "good"], action, concurrency=2)
+
+        assert [r["status"] for r in results] == ["ok", "failed", "ok"]
+        assert results[1]["message"] == "Volume is offline"
+
+    def test_concurrency_is_bounded(self):
+        """Test that no more than ``concurrency`` actions run at once."""
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+
+        def action(item):
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(0.01)
+            with lock:
+                state["running"] -= 1
+
+        run_bulk(range(12), action, concurrency=3)
+
+        assert state["peak"] <= 3
+
+
+class TestBulkTargets:
+    """Tests for resolving bulk work items."""
+
+    @pytest.fixture
+    def client(self, mock_netapp_config):
+        client = Mock()
+        client.config = mock_netapp_config
+        client.paginate.return_value = [
+            {"name": "vol1", "uuid": "uuid-1", "svm": {"name": "svm1"}},
+            {"name": "vol2", "uuid": "uuid-2", "svm": {"name": "svm1"}},
+            {"name": "vol2", "uuid": "uuid-3", "svm": {"name": "svm2"}},
+        ]
+        return client
+
+    @pytest.fixture
+    def resolver(self, client, tmp_path):
+        return Resolver(client, ResolutionCache(tmp_path / "cache.json"))
+
+    def test_filter_selection_uses_one_listing(self, client, resolver):
+        """Test that all volumes are resolved with a single paginated call."""
+        targets = _bulk_targets(None, client, resolver, Mock(), None, "svm1", "vol*", "snap-{volume}", None)
+
+        client.paginate.assert_called_once_with(
+            "/api/storage/volumes", {"fields": "name,uuid,svm.name", "svm.name": "svm1", "name": "vol*"}
+        )
+        assert [t["snapshot"] for t in targets] == ["snap-vol1", "snap-vol2", "snap-vol2"]
+        assert resolver.volume_uuid("vol2", "svm2") == "uuid-3"
+        client.get.assert_not_called()
+
+    def test_manifest_entries_are_matched(self, client, resolver, tmp_path):
+        """Test manifest resolution including missing and ambiguous volumes."""
+        path = tmp_path / "manifest.csv"
+        path.write_text("volume,svm,snapshot\nvol1,,s1\nvol2,,s2\nvol2,svm2,s3\nvol9,,s4\n")
+
+        targets = _bulk_targets(None, client, resolver, Mock(), str(path), None, None, None, None)
+
+        assert targets[0]["uuid"] == "uuid-1" and targets[0]["svm"] == "svm1"
+        assert "ambiguous" in targets[1]["error"]
+        assert targets[2]["uuid"] == "uuid-3"
+        assert targets[3]["error"] == "Volume 'vol9' not found"
+
+    def test_selection_is_required(self, client, resolver):
+        """Test that bulk commands refuse to run on every volume implicitly."""
+        formatter = Mock()
+
+        with pytest.raises(click.Abort):
+            _bulk_targets(None, client, resolver, formatter, None, None, None, "snap", None)
+
+        client.paginate.assert_not_called()
+
+    def test_render_snapshot_name_template(self):
+        """Test template expansion and invalid placeholders."""
+        assert _render_snapshot_name("{svm}-{volume}", "vol1", "svm1") == "svm1-vol1"
+        with pytest.raises(click.BadParameter):
+            _render_snapshot_name("{unknown}", "vol1", "svm1")
+
+
+class TestPrune:
+    """Tests for snapshot retention helpers."""
+
+    SNAPSHOTS = [{"name": f"snap{i}"} for i in range(5, 0, -1)]  # newest first
+
+    def test_keep_last_only(self):
+        """Test count retention without an age window."""
+        assert [s["name"] for s in compute_prune_set(self.SNAPSHOTS, keep_last=2)] == ["snap3", "snap2", "snap1"]
+
+    def test_older_than_only(self):
+        """Test that every candidate in the age window is deleted."""
+        assert compute_prune_set(self.SNAPSHOTS) == self.SNAPSHOTS
+
+    def test_newer_snapshots_count_towards_keep_last(self):
+        """Test combined retention when recent snapshots already satisfy keep-last."""
+        assert compute_prune_set(self.SNAPSHOTS, keep_last=3, newer_count=3) == self.SNAPSHOTS
+        assert [s["name"] for s in compute_prune_set(self.SNAPSHOTS, keep_last=3, newer_count=1)] == ["snap3", "snap2", "snap1"]
+
+    def test_keep_last_larger_than_candidates(self):
+        """Test that nothing is deleted when fewer snapshots exist than kept."""
+        assert compute_prune_set(self.SNAPSHOTS, keep_last=10) == []
+
+    def test_parse_age(self):
+        """Test age parsing."""
+        assert _parse_age("30d") == timedelta(days=30)
+        assert _parse_age("12h") == timedelta(hours=12)
+        assert _parse_age("2W") == timedelta(weeks=2)
+        assert _parse_age("30 days") is None
@@ -0,0 +1,304 @@
+"""Tests for the resolution and response caches."""
+
+import json
+
+import pytest
+from unittest.mock import Mock, patch
+
+from netapp_cli.utils.api_client import NetAppAPIClient, NetAppAPIError
+from netapp_cli.utils.cache import ResolutionCache, ResponseCache
+from netapp_cli.utils.resolver import ResolutionError, Resolver
+
+
+class TestResolutionCache:
+    """Tests for ResolutionCache persistence and expiry."""
+
+    def test_set_and_get(self, tmp_path):
+        """Test storing and reading an entry."""
+        cache = ResolutionCache(tmp_path / "cache.json")
+        cache.set("host|volume||vol1", "uuid-1")
+
+        assert cache.get("host|volume||vol1") == "uuid-1"
+        assert cache.get("host|volume||vol2") is None
+
+    def test_entries_persist_across_instances(self, tmp_path):
+        """Test that a new process sees entries written by a previous one."""
+        path = tmp_path / "cache.json"
+        ResolutionCache(path).set("key", "uuid-1")
+
+        assert ResolutionCache(path).get("key") == "uuid-1"
+
+    def test_expired_entries_are_ignored(self, tmp_path):
+        """Test TTL expiry."""
+        cache = ResolutionCache(tmp_path / "cache.json", ttl=60)
+        with patch('netapp_cli.utils.cache.time.time', return_value=1000):
+            cache.set("key", "uuid-1")
+        with patch('netapp_cli.utils.cache.time.time', return_value=1061):
+            assert cache.get("key") is None
+
+    def test_invalidate(self, tmp_path):
+        """Test removing a single entry."""
+        path = tmp_path / "cache.json"
+        cache = ResolutionCache(path)
+        cache.set_many({"a": "1", "b": "2"})
+        cache.invalidate("a")
+
+        reloaded = ResolutionCache(path)
+        assert reloaded.get("a") is None
+        assert reloaded.get("b") == "2"
+
+    def test_invalidate_many_writes_once(self, tmp_path):
+        """Test removing several entries with a single write."""
+        cache = ResolutionCache(tmp_path / "cache.json")
+        cache.set_many({"a": "1", "b": "2", "c": "3"})
+
+        with patch.object(cache, "_save", wraps=cache._save) as save:
+            cache.invalidate_many(["a", "b", "missing"])
+
+        save.assert_called_once()
+        assert cache.get("a") is None and cache.get("b") is None
+        assert cache.get("c") == "3"
+
+    def test_disabled_cache(self, tmp_path):
+        """Test that a disabled cache never returns entries."""
+        cache = ResolutionCache(tmp_path / "cache.json", enabled=False)
+        cache.set("key", "uuid-1")
+
+        assert cache.get("key") is None
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        """Test that an unreadable cache file behaves like an empty cache."""
+        path = tmp_path / "cache.json"
+        path.write_text("{not json")
+
+        assert ResolutionCache(path).get("key") is None
+
+    def test_for_config_uses_settings(self, isolated_cache_dir):
+        """Test building the shared cache from the configuration."""
+        config = Mock()
+        config.get.return_value = {"ttl": 30, "enabled": True}
+
+        cache = ResolutionCache.for_config(config)
+
+        assert cache.ttl == 30
+        assert cache.path.parent == isolated_cache_dir
+        assert ResolutionCache.for_config(config) is cache
+
+    def test_for_config_without_section(self, isolated_cache_dir):
+        """Test defaults when the configuration has no cache section."""
+        config = Mock()
+        config.get.return_value = None
+
+        cache = ResolutionCache.for_config(config)
+
+        assert cache.ttl == ResolutionCache.DEFAULT_TTL
+        assert cache.enabled is True
+
+
+class TestResolver:
+    """Tests for cached volume and snapshot resolution."""
+
+    @pytest.fixture
+    def client(self, mock_netapp_config):
+        client = Mock()
+        client.config = mock_netapp_config
+        client.get.return_value = {"records": [{"uuid": "vol-uuid-1"}]}
+        return client
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return ResolutionCache(tmp_path / "cache.json")
+
+    def test_second_lookup_hits_cache(self, client, cache):
+        """Test that a resolved volume is not looked up again."""
+        resolver = Resolver(client, cache)
+
+        assert resolver.volume_uuid("vol1", "svm1") == "vol-uuid-1"
+        assert resolver.volume_uuid("vol1", "svm1") == "vol-uuid-1"
+        client.get.assert_called_once_with("/api/storage/volumes", {"name": "vol1", "svm.name": "svm1"})
+
+    def test_cache_is_scoped_by_svm(self, client, cache):
+        """Test that the same name on another SVM is resolved separately."""
+        resolver = Resolver(client, cache)
+        resolver.volume_uuid("vol1", "svm1")
+        resolver.volume_uuid("vol1", "svm2")
+
+        assert client.get.call_count == 2
+
+    def test_missing_volume_raises(self, client, cache):
+        """Test resolution of an unknown volume."""
+        client.get.return_value = {"records": []}
+        resolver = Resolver(client, cache)
+
+        with pytest.raises(ResolutionError) as exc_info:
+            resolver.volume_uuid("missing")
+
+        assert "Volume 'missing' not found" in str(exc_info.value)
+
+    def test_stale_entry_is_invalidated_on_404(self, client, cache):
+        """Test that a 404 on a cached UUID triggers one re-resolution."""
+        cache.set(ResolutionCache.make_key("test-cluster.example.com", "volume", "vol1", "svm1"), "old-uuid")
+        client.get.return_value = {"records": [{"uuid": "new-uuid"}]}
+        resolver = Resolver(client, cache)
+
+        action = Mock(side_effect=[NetAppAPIError("gone", status_code=404), {"ok": True}])
+        result = resolver.with_volume("vol1", "svm1", action)
+
+        assert result == {"ok": True}
+        assert [c[0][0] for c in action.call_args_list] == ["old-uuid", "new-uuid"]
+        assert resolver.volume_uuid("vol1", "svm1") == "new-uuid"
+
+    def test_404_on_fresh_lookup_is_not_retried(self, client, cache):
+        """Test that a 404 for a UUID just fetched from the API is raised."""
+        resolver = Resolver(client, cache)
+        action = Mock(side_effect=NetAppAPIError("gone", status_code=404))
+
+        with pytest.raises(NetAppAPIError):
+            resolver.with_volume("vol1", None, action)
+
+        action.assert_called_once()
+
+    def test_missing_snapshot_does_not_invalidate_volume(self, client, cache):
+        """Test that an unknown snapshot name is not mistaken for a stale volume."""
+        resolver = Resolver(client, cache)
+        resolver.volume_uuid("vol1")
+        client.get.reset_mock()
+        client.get.return_value = {"records": []}
+
+        with pytest.raises(ResolutionError):
+            resolver.with_volume(
+                "vol1", None,
+                lambda volume_uuid: resolver.with_snapshot(volume_uuid, "snap1", Mock())
+            )
+
+        # Only the snapshot lookup was sent, the volume stayed cached
+        client.get.assert_called_once_with("/api/storage/volumes/vol-uuid-1/snapshots", {"name": "snap1"})
+
+    def test_snapshot_lookup_without_remember(self, client, cache):
+        """Test that a snapshot about to be deleted is not written to the cache."""
+        client.get.return_value = {"records": [{"uuid": "snap-uuid-1"}]}
+        resolver = Resolver(client, cache)
+        action = Mock(return_value={"ok": True})
+
+        with patch.object(cache, "_save") as save:
+            assert resolver.with_snapshot("vol-uuid-1", "snap1", action, remember=False) == {"ok": True}
+
+        action.assert_called_once_with("snap-uuid-1")
+        save.assert_not_called()
+
+
+class TestResponseCache:
+    """Tests for ResponseCache storage."""
+
+    def test_entries_persist_across_instances(self, tmp_path):
+        """Test that a later CLI invocation can revalidate a stored response."""
+        ResponseCache(tmp_path).store("key", '"v1"', None, '{"name": "c1"}')
+
+        entry = ResponseCache(tmp_path).get("key")
+
+        assert ResponseCache.conditional_headers(entry) == {"If-None-Match": '"v1"'}
+        assert ResponseCache.body(entry) == {"name": "c1"}
+
+    def test_responses_without_validators_are_not_stored(self, tmp_path):
+        """Test that only revalidatable responses are cached."""
+        cache = ResponseCache(tmp_path)
+        cache.store("key", None, None, "{}")
+
+        assert cache.get("key") is None
+
+    def test_key_depends_on_params_and_user(self):
+        """Test that different queries and users get different entries."""
+        key = ResponseCache.make_key("host", "admin", "https://host/api/x", {"a": 1, "b": 2})
+
+        assert key == ResponseCache.make_key("host", "admin", "https://host/api/x", {"b": 2, "a": 1})
+        assert key != ResponseCache.make_key("host", "admin", "https://host/api/x", {"a": 2, "b": 2})
+        assert key != ResponseCache.make_key("host", "other", "https://host/api/x", {"a": 1, "b": 2})
+
+    def test_prune_keeps_newest_entries(self, tmp_path):
+        """Test that the number of stored files is bounded."""
+        cache = ResponseCache(tmp_path, max_entries=2)
+        for index in range(3):
+            cache.store(f"key{index}", "etag", None, "{}")
+            (tmp_path / f"key{index}.json").touch()
+        cache._prune()
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["key1.json", "key2.json"]
+
+
+class TestConditionalRequests:
+    """Tests for ETag revalidation in NetAppAPIClient."""
+
+    @staticmethod
+    def _response(status_code, text="", headers=None):
+        response = Mock()
+        response.status_code = status_code
+        response.text = text
+        response.json.side_effect = lambda: json.loads(text)
+        response.headers = headers or {}
+        return response
+
+    @patch('netapp_cli.utils.api_client.requests.Session')
+    def test_304_serves_cached_body(self, MockSession, mock_netapp_config):
+        """Test that an unchanged resource is not downloaded twice."""
+        session = MockSession.return_value
+        session.request.side_effect = [
+            self._response(200, '{"name": "c1"}', {"ETag": '"v1"'}),
+            self._response(304),
+        ]
+
+        client = NetAppAPIClient(mock_netapp_config)
+        first = client.get("/api/cluster")
+        second = client.get("/api/cluster")
+
+        assert first == second == {"name": "c1"}
+        assert session.request.call_args_list[0][1]["headers"] == {}
+        assert session.request.call_args_list[1][1]["headers"] == {"If-None-Match": '"v1"'}
+
+    @patch('netapp_cli.utils.api_client.requests.Session')
+    def test_changed_resource_replaces_entry(self, MockSession, mock_netapp_config):
+        """Test that a 200 answer to a conditional request is stored."""
+        session = MockSession.return_value
+        session.request.side_effect = [
+            self._response(200, '{"v": 1}', {"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}),
+            self._response(200, '{"v": 2}', {"ETag": '"v2"'}),
+            self._response(304),
+        ]
+
+        client = NetAppAPIClient(mock_netapp_config)
+        client.get("/api/cluster")
+
+        assert client.get("/api/cluster") == {"v": 2}
+        assert session.request.call_args_list[1][1]["headers"] == {
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"
+        }
+        assert client.get("/api/cluster") == {"v": 2}
+
+    @patch('netapp_cli.utils.api_client.requests.Session')
+    def test_disabled_by_config(self, MockSession, mock_netapp_config):
+        """Test the http_cache setting."""
+        session = MockSession.return_value
+        session.request.return_value = self._response(200, "{}", {"ETag": '"v1"'})
+        mock_netapp_config.http_cache = False
+
+        client = NetAppAPIClient(mock_netapp_config)
+        client.get("/api/cluster")
+        client.get("/api/cluster")
+
+        assert session.request.call_args_list[1][1]["headers"] == {}
+
+
+    @patch('netapp_cli.utils.api_client.requests.Session')
+    def test_streamed_pages_are_revalidated(self, MockSession, mock_netapp_config):
+        """Test that iter_records (inventory sync) sends conditional GETs too."""
+        body = '{"records": [{"name": "vol1"}], "num_records": 1}'
+        first = self._response(200, headers={"ETag": '"p1"'})
+        first.iter_content.return_value = [body[:20].encode(), body[20:].encode()]
+        first.raw.tell.return_value = len(body)
+        session = MockSession.return_value
+        session.request.side_effect = [first, self._response(304)]
+
+        client = NetAppAPIClient(mock_netapp_config)
+
+        assert list(client.iter_records("/api/storage/volumes")) == [{"name": "vol1"}]
+        assert list(client.iter_records("/api/storage/volumes")) == [{"name": "vol1"}]
+        assert session.request.call_args_list[1][1]["headers"] == {"If-None-Match": '"p1"'}
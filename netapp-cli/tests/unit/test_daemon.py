@@ -0,0 +1,128 @@
+"""Tests for the warm-session daemon."""
+
+import shutil
+import socket
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+from unittest.mock import Mock, patch
+
+from netapp_cli.main import cli
+from netapp_cli.utils.api_client import NetAppAPIClient, NetAppAPIError
+from netapp_cli.utils.daemon import NetAppDaemon, ping
+
+
+@pytest.fixture
+def socket_file(monkeypatch):
+    """Short socket path (AF_UNIX paths are limited to ~100 characters)."""
+    directory = tempfile.mkdtemp(prefix="nacd", dir="/tmp")
+    path = Path(directory) / "d.sock"
+    monkeypatch.setenv("NETAPP_DAEMON_SOCKET", str(path))
+    monkeypatch.setenv("NETAPP_DAEMON", "1")
+    yield path
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def running_daemon(socket_file):
+    server = NetAppDaemon(socket_file, idle_timeout=0)
+    thread = threading.Thread(target=server.serve, daemon=True)
+    thread.start()
+    for _ in range(50):
+        if ping(socket_file):
+            break
+        time.sleep(0.05)
+    yield server
+    server.shutdown()
+    thread.join(timeout=5)
+
+
+def _response(status_code, payload):
+    response = Mock()
+    response.status_code = status_code
+    response.json.return_value = payload
+    return response
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets not available")
+class TestDaemon:
+    """Tests for requests proxied through the daemon."""
+
+    @patch('netapp_cli.utils.api_client.requests.Session')
+    def test_requests_are_proxied(self, MockSession, running_daemon, mock_netapp_config):
+        """Test that the CLI client reuses the daemon's session."""
+        MockSession.return_value.request.return_value = _response(200, {"name": "cluster1"})
+
+        first = NetAppAPIClient(mock_netapp_config)
+        second = NetAppAPIClient(mock_netapp_config)
+
+        assert first.daemon is not None
+        assert first.get("/api/cluster") == {"name": "cluster1"}
+        assert second.get("/api/cluster") == {"name": "cluster1"}
+        assert running_daemon.requests_served == 2
+        assert len(running_daemon._clients) == 1
+
+    @patch('netapp_cli.utils.api_client.requests.Session')
+    def test_api_errors_keep_status_code(self, MockSession, running_daemon, mock_netapp_config):
+        """Test that API errors cross the socket intact."""
+        MockSession.return_value.request.return_value = _response(404, {"error": {"message": "Volume not found"}})
+
+        client = NetAppAPIClient(mock_netapp_config)
+
+        with pytest.raises(NetAppAPIError) as exc_info:
+            client.get("/api/storage/volumes/missing")
+
+        assert exc_info.value.status_code == 404
+        assert "Volume not found" in str(exc_info.value)
+
+    @patch('netapp_cli.utils.api_client.requests.Session')
+    def test_stale_socket_falls_back_to_direct(self, MockSession, socket_file, mock_netapp_config):
+        """Test direct mode when the socket exists but nothing listens."""
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(socket_file))
+        stale.close()
+        MockSession.return_value.request.return_value = _response(200, {"direct": True})
+
+        client = NetAppAPIClient(mock_netapp_config)
+
+        assert client.get("/api/cluster") == {"direct": True}
+        assert client.daemon is None
+
+    def test_disabled_by_environment(self, running_daemon, monkeypatch, mock_netapp_config):
+        """Test that NETAPP_DAEMON=0 bypasses a running daemon."""
+        monkeypatch.setenv("NETAPP_DAEMON", "0")
+
+        with patch('netapp_cli.utils.api_client.requests.Session'):
+            client = NetAppAPIClient(mock_netapp_config)
+
+        assert client.daemon is None
+
+    def test_socket_is_private(self, running_daemon, socket_file):
+        """Test that only the owner can connect."""
+        assert socket_file.stat().st_mode & 0o777 == 0o600
+
+    def test_stale_socket_is_replaced(self, socket_file):
+        """Test that a socket left by a crashed daemon does not block a new one."""
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(socket_file))
+        stale.close()
+
+        result = CliRunner().invoke(cli, ['daemon', 'stop', '--socket', str(socket_file)], obj={})
+
+        assert result.exit_code == 0
+        assert not socket_file.exists()
+
+    @pytest.mark.parametrize("command", [['daemon', 'stop'], ['daemon', 'run', '--idle-timeout', '0']])
+    def test_refuses_to_remove_other_files(self, socket_file, command):
+        """Test that a --socket pointing at a regular file leaves the file alone."""
+        socket_file.write_text("keep me")
+
+        result = CliRunner().invoke(cli, command + ['--socket', str(socket_file)], obj={})
+
+        assert result.exit_code != 0
+        assert "not a socket" in result.output
+        assert socket_file.read_text() == "keep me"
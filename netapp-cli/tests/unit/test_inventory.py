@@ -0,0 +1,125 @@
+"""Tests for the local inventory snapshot."""
+
+import json
+import time
+
+import pytest
+from click.testing import CliRunner
+from unittest.mock import Mock, patch
+
+from netapp_cli.main import cli
+from netapp_cli.utils.api_client import NetAppAPIClient
+from netapp_cli.utils.inventory import Inventory, InventoryError, inventory_records
+
+HOST = "test-cluster.example.com"
+
+
+def _volume(i, **extra):
+    return dict({
+        "uuid": f"uuid-{i}",
+        "name": f"vol{i}",
+        "svm": {"name": f"svm{i % 2}"},
+        "aggregates": [{"name": f"aggr{i % 3}"}],
+    }, **extra)
+
+
+@pytest.fixture
+def store(tmp_path):
+    inventory = Inventory(tmp_path / "inventory.db")
+    yield inventory
+    inventory.close()
+
+
+class TestInventory:
+    """Tests for Inventory storage and sync."""
+
+    def test_incremental_sync(self, store):
+        first = store.sync_kind(HOST, "volumes", [_volume(i) for i in range(5)])
+        second = store.sync_kind(HOST, "volumes", [_volume(0, state="offline")] + [_volume(i) for i in range(1, 4)] + [_volume(9)])
+
+        assert (first.added, first.updated, first.removed) == (5, 0, 0)
+        assert (second.added, second.updated, second.unchanged, second.removed) == (1, 1, 3, 1)
+        assert store.find(HOST, "volumes", name="vol0")[0]["state"] == "offline"
+        assert not store.find(HOST, "volumes", name="vol4")
+
+    def test_find_filters(self, store):
+        store.sync_kind(HOST, "volumes", [_volume(i) for i in range(12)])
+
+        assert [v["name"] for v in store.find(HOST, "volumes", svm="svm1", aggregate="aggr0")] == ["vol3", "vol9"]
+        assert [v["name"] for v in store.find(HOST, "volumes", name="vol1*")] == ["vol1", "vol10", "vol11"]
+        assert len(store.find(HOST, "volumes", limit=4)) == 4
+        assert store.find("other-host", "volumes") == []
+
+    def test_unknown_filter(self, store):
+        with pytest.raises(ValueError):
+            store.find(HOST, "volumes", size="1TB")
+
+    def test_sync_skips_fresh_kinds(self, store):
+        client = Mock()
+        client.config.host = HOST
+        client.iter_records.return_value = [_volume(1)]
+
+        store.sync(client, ["volumes"])
+        results = store.sync(client, ["volumes", "luns"], max_age=60)
+
+        assert [(r.kind, r.skipped, r.count) for r in results] == [("volumes", True, 1), ("luns", False, 1)]
+        assert [c[0][0] for c in client.iter_records.call_args_list] == ["/api/storage/volumes", "/storage-provider/luns"]
+
+    @pytest.mark.parametrize("paging", ["total_records", "_links"])
+    @patch('netapp_cli.utils.api_client.requests.Session')
+    def test_sync_reads_every_page(self, MockSession, paging, store, mock_netapp_config):
+        """Test that a full page whose num_records is its own size does not end the sync."""
+        volumes = [_volume(i) for i in range(250)]
+
+        def request(method, url, params, **kwargs):
+            offset = params["offset"]
+            records = volumes[offset:offset + params["limit"]]
+            page = {"records": records, "num_records": len(records)}
+            if paging == "total_records":
+                page["total_records"] = len(volumes)
+            else:
+                page["_links"] = {"next": {"href": "/api/next"}} if offset + len(records) < len(volumes) else {}
+            response = Mock(status_code=200, headers={})
+            response.iter_content.return_value = [json.dumps(page).encode()]
+            return response
+
+        MockSession.return_value.request.side_effect = request
+        store.sync_kind(HOST, "volumes", volumes)
+
+        result, = store.sync(NetAppAPIClient(mock_netapp_config), ["volumes"])
+
+        assert (result.unchanged, result.removed) == (250, 0)
+        assert MockSession.return_value.request.call_count == 3
+
+
+class TestInventoryRecords:
+    """Tests for answering list commands from the inventory."""
+
+    def test_live_unless_asked(self, mock_config):
+        assert inventory_records(mock_config, "volumes", offline=False, max_age=None) is None
+
+    def test_offline_requires_sync(self, mock_config):
+        with pytest.raises(InventoryError, match="inventory sync"):
+            inventory_records(mock_config, "volumes", offline=True, max_age=None)
+
+    def test_max_age(self, mock_config):
+        Inventory.for_config(mock_config).sync_kind(HOST, "volumes", [_volume(1)])
+
+        assert inventory_records(mock_config, "volumes", offline=False, max_age=60) == [_volume(1)]
+        with patch("netapp_cli.utils.inventory.time.time", return_value=time.time() + 120):
+            assert inventory_records(mock_config, "volumes", offline=False, max_age=60) is None
+            with pytest.raises(InventoryError, match="old"):
+                inventory_records(mock_config, "volumes", offline=True, max_age=60)
+
+    @patch('netapp_cli.commands.volume.NetAppAPIClient')
+    def test_list_volumes_offline(self, MockClient, mock_config):
+        Inventory.for_config(mock_config).sync_kind(HOST, "volumes", [_volume(i) for i in range(3)])
+
+        result = CliRunner().invoke(
+            cli, ['volume', 'list-volumes', '--offline', '--svm', 'svm0'], obj={"config": mock_config}
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "vol0" in result.output and "vol2" in result.output
+        assert "vol1" not in result.output
+        MockClient.return_value.iter_records.assert_not_called()
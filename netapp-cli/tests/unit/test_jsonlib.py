@@ -0,0 +1,64 @@
+"""Tests for the JSON backend selection."""
+
+import importlib
+import json
+import sys
+from datetime import datetime
+
+import pytest
+
+from netapp_cli.utils import jsonlib
+
+
+@pytest.fixture(params=["json", "orjson", "msgspec"])
+def backend(request, monkeypatch):
+    """jsonlib reloaded with each backend that is installed."""
+    if request.param != "json":
+        pytest.importorskip(request.param)
+    monkeypatch.setenv("NETAPP_JSON_BACKEND", request.param)
+    module = importlib.reload(jsonlib)
+    yield module
+    monkeypatch.delenv("NETAPP_JSON_BACKEND")
+    importlib.reload(jsonlib)
+
+
+class TestJsonlib:
+    """Tests for jsonlib loads/dumps."""
+
+    DATA = {"name": "vol1", "size": 1073741824, "ratio": 0.5, "tags": ["é", None, True], "nested": {"a": {}}}
+
+    def test_roundtrip(self, backend):
+        assert backend.loads(backend.dumps(self.DATA).encode()) == self.DATA
+        assert backend.loads(backend.dumps(self.DATA, indent=True)) == self.DATA
+
+    def test_output_matches_standard_library(self, backend):
+        """Test that the backend does not change the CLI's JSON output."""
+        expected = json.dumps(self.DATA, indent=2, ensure_ascii=False)
+
+        assert backend.dumps(self.DATA, indent=True) == expected
+        assert "\n" not in backend.dumps(self.DATA)
+
+    def test_unsupported_values_use_str(self, backend):
+        when = datetime(2024, 5, 1, 10, 30)
+
+        assert backend.loads(backend.dumps({"when": when, 1: "x"})) == {"when": str(when), "1": "x"}
+
+    def test_invalid_input_raises_value_error(self, backend):
+        with pytest.raises(ValueError):
+            backend.loads(b'{"records": [')
+
+    def test_selected_backend(self, backend):
+        assert backend.BACKEND in ("json", "orjson", "msgspec")
+
+    @pytest.mark.parametrize("name", ["orjson", "msgspec"])
+    def test_missing_backend_falls_back(self, monkeypatch, name):
+        """Test that a requested backend that is not installed falls back to json."""
+        with monkeypatch.context() as m:
+            m.setitem(sys.modules, name, None)
+            m.setenv("NETAPP_JSON_BACKEND", name)
+            with pytest.warns(RuntimeWarning, match=name):
+                module = importlib.reload(jsonlib)
+
+            assert module.BACKEND == "json"
+            assert module.loads(module.dumps(self.DATA)) == self.DATA
+        importlib.reload(jsonlib)
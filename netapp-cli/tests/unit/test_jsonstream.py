@@ -0,0 +1,147 @@
+"""Tests for incremental parsing of list responses."""
+
+import asyncio
+import json
+
+import pytest
+from unittest.mock import Mock, patch
+
+from netapp_cli.utils.api_client import NetAppAPIClient, NetAppAPIError
+from netapp_cli.utils.jsonstream import RecordParser, StreamError, iter_records
+
+
+def _chunks(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestRecordParser:
+    """Tests for RecordParser."""
+
+    DOCUMENT = {
+        "records": [{"name": f"vol{i}", "size": i * 1.5, "comment": "é ] } \""} for i in range(50)],
+        "num_records": 12345,
+        "_links": {"next": {"href": "/api/next"}},
+    }
+
+    @pytest.mark.parametrize("size", [1, 7, 64, 100000])
+    def test_any_chunking(self, size):
+        """Test that records and metadata survive arbitrary chunk boundaries."""
+        parser = RecordParser()
+        records = list(iter_records(_chunks(json.dumps(self.DOCUMENT).encode(), size), parser))
+
+        assert records == self.DOCUMENT["records"]
+        assert parser.meta == {"num_records": 12345, "_links": {"next": {"href": "/api/next"}}}
+
+    def test_records_are_returned_as_they_complete(self):
+        """Test that a record is available before the body has ended."""
+        parser = RecordParser()
+
+        assert parser.feed(b'{"records": [{"a": 1}, {"b"') == [{"a": 1}]
+        assert parser.feed(b': 2}]}') == [{"b": 2}]
+        assert parser.close() == []
+
+    def test_number_split_across_chunks(self):
+        """Test that a number cut by a chunk boundary is not truncated."""
+        parser = RecordParser()
+        list(iter_records([b'{"records": [], "num_records": 12', b'345}'], parser))
+
+        assert parser.meta["num_records"] == 12345
+
+        # Cut after the decimal point or the exponent marker
+        assert list(iter_records([b'{"records": [1.5, 12.', b'5, 3]}'], RecordParser())) == [1.5, 12.5, 3]
+        assert list(iter_records([b'{"records": [1.5, 1e', b'2, 3]}'], RecordParser())) == [1.5, 100.0, 3]
+        parser = RecordParser()
+        list(iter_records([b'{"records": [], "ratio": 0.', b'75}'], parser))
+        assert parser.meta["ratio"] == 0.75
+
+    def test_multibyte_character_split_across_chunks(self):
+        """Test UTF-8 sequences spanning two chunks."""
+        data = json.dumps({"records": [{"name": "é"}]}, ensure_ascii=False).encode()
+        split = data.index("é".encode()) + 1
+
+        assert list(iter_records([data[:split], data[split:]], RecordParser())) == [{"name": "é"}]
+
+    @pytest.mark.parametrize("data", [b'{"records": [{"a": 1}', b'[1, 2]', b'{"records": [1 2]}', b'{} {}'])
+    def test_invalid_documents(self, data):
+        """Test truncated and malformed bodies."""
+        with pytest.raises(StreamError):
+            list(iter_records([data], RecordParser()))
+
+
+class TestStreamingPagination:
+    """Tests for NetAppAPIClient.iter_records."""
+
+    @staticmethod
+    def _page(records, num_records):
+        response = Mock()
+        response.status_code = 200
+        body = json.dumps({"records": records, "num_records": num_records}).encode()
+        response.iter_content.return_value = _chunks(body, 10)
+        response.raw.tell.return_value = len(body)
+        response.headers = {}
+        return response
+
+    @patch('netapp_cli.utils.api_client.requests.Session')
+    def test_pages_are_streamed(self, MockSession, mock_netapp_config):
+        """Test paging and the stream flag."""
+        session = MockSession.return_value
+        session.request.side_effect = [
+            self._page([{"i": i} for i in range(100)], 150),
+            self._page([{"i": i} for i in range(100, 150)], 150),
+        ]
+
+        client = NetAppAPIClient(mock_netapp_config)
+        records = client.paginate("/api/storage/volumes", stream=True)
+
+        assert [record["i"] for record in records] == list(range(150))
+        assert session.request.call_args_list[1][1]["params"] == {"offset": 100, "limit": 100}
+        assert session.request.call_args_list[1][1]["stream"] is True
+        assert client.stats.responses == 2
+
+    @patch('netapp_cli.utils.api_client.requests.Session')
+    def test_max_records_stops_early(self, MockSession, mock_netapp_config):
+        """Test that reading stops once enough records were yielded."""
+        session = MockSession.return_value
+        page = self._page([{"i": i} for i in range(100)], 1000)
+        session.request.return_value = page
+
+        client = NetAppAPIClient(mock_netapp_config)
+
+        assert len(list(client.iter_records("/api/storage/volumes", max_records=10))) == 10
+        assert session.request.call_count == 1
+        page.close.assert_called_once()
+
+    @patch('netapp_cli.utils.api_client.requests.Session')
+    def test_error_status(self, MockSession, mock_netapp_config):
+        """Test that errors are raised like for regular requests."""
+        response = Mock()
+        response.status_code = 404
+        response.json.return_value = {"message": "not found"}
+        response.headers = {}
+        MockSession.return_value.request.return_value = response
+
+        client = NetAppAPIClient(mock_netapp_config)
+
+        with pytest.raises(NetAppAPIError) as exc_info:
+            list(client.iter_records("/api/storage/volumes"))
+
+        assert exc_info.value.status_code == 404
+
+
+class TestAsyncStreamingPagination:
+    """Tests for AsyncNetAppAPIClient.iter_records."""
+
+    def test_pages_are_streamed(self, mock_netapp_config):
+        httpx = pytest.importorskip("httpx")
+        from netapp_cli.utils.async_api_client import AsyncNetAppAPIClient
+
+        def handler(request):
+            offset = int(request.url.params["offset"])
+            records = [{"i": i} for i in range(offset, min(offset + 100, 130))]
+            return httpx.Response(200, json={"records": records, "num_records": 130})
+
+        async def main():
+            async with AsyncNetAppAPIClient(mock_netapp_config, transport=httpx.MockTransport(handler)) as client:
+                return [record["i"] async for record in client.iter_records("/api/storage/volumes")]
+
+        assert asyncio.run(main()) == list(range(130))
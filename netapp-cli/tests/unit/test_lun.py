@@ -0,0 +1,51 @@
+"""Tests for LUN batch expansion helpers."""
+
+from netapp_cli.commands.lun import _expansion_summary, _job_key, _lun_size, _parse_growth
+
+
+class TestParseGrowth:
+    """Tests for size specifications."""
+
+    def test_absolute_size(self):
+        """Test an absolute target size."""
+        assert _parse_growth("2TB")(1024) == 2 * 1024**4
+
+    def test_relative_growth(self):
+        """Test percentage growth."""
+        assert _parse_growth("+20%")(1000) == 1200
+
+    def test_increment(self):
+        """Test growth by a fixed amount."""
+        assert _parse_growth("+10GB")(1024**3) == 11 * 1024**3
+
+    def test_invalid_specs(self):
+        """Test rejected specifications."""
+        assert _parse_growth("+abc%") is None
+        assert _parse_growth("+0%") is None
+        assert _parse_growth("huge") is None
+
+
+class TestLunHelpers:
+    """Tests for LUN record helpers."""
+
+    def test_lun_size(self):
+        """Test reading the size from nested or flat records."""
+        assert _lun_size({"space": {"size": 2048}}) == 2048
+        assert _lun_size({"size": "4096"}) == 4096
+        assert _lun_size({}) is None
+
+    def test_job_key(self):
+        """Test extracting job keys from both response shapes."""
+        assert _job_key({"key": "job1"}) == "job1"
+        assert _job_key({"job": {"key": "job2"}}) == "job2"
+        assert _job_key({}) is None
+
+    def test_expansion_summary_counts_completed_jobs(self):
+        """Test that rows without a job are not reported as completed."""
+        plan = [{"status": "completed"}, {"status": "submitted"}, {"status": "skipped"}]
+
+        assert _expansion_summary(plan, wait=True) == (
+            "1 LUN expansion(s) completed, 1 submitted without a job to wait for!"
+        )
+        assert _expansion_summary(plan[:1], wait=True) == "1 LUN expansion(s) completed!"
+        assert _expansion_summary([{"status": "submitted"}] * 2, wait=False) == "2 LUN expansion(s) initiated!"
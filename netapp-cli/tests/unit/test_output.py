@@ -0,0 +1,183 @@
+"""Tests for OutputFormatter table rendering."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+from unittest.mock import Mock, patch
+
+from netapp_cli.models.records import Volume
+from netapp_cli.utils.output import OutputFormatter, console
+from netapp_cli.utils.pager import PagerInput
+
+
+class TestAccessors:
+    """Tests for compiled column accessors."""
+
+    @pytest.mark.parametrize("key,expected", [
+        ("name", "vol1"),
+        ("svm.name", "svm1"),
+        ("space.block.used", 5),
+        ("svm.missing", None),
+        ("missing.name", None),
+        ("aggregates.name", None),  # lists are not walked into
+        ("name.first", None),  # nor are strings
+    ])
+    def test_nested_lookup(self, key, expected):
+        item = {"name": "vol1", "svm": {"name": "svm1"}, "space": {"block": {"used": 5}}, "aggregates": [{"name": "a"}]}
+
+        assert OutputFormatter._accessor(key)(item) == expected
+
+    def test_records(self):
+        volume = Volume.from_dict({"name": "vol1", "svm": {"name": "svm1"}})
+
+        assert OutputFormatter._accessor("svm.name")(volume) == "svm1"
+        assert OutputFormatter._accessor("get")(volume) is None
+
+    def test_flat_dotted_keys(self):
+        assert OutputFormatter._accessor("svm.name")({"svm.name": "svm1"}) == "svm1"
+
+    def test_accessors_are_compiled_once(self):
+        assert OutputFormatter._accessor("svm.name") is OutputFormatter._accessor("svm.name")
+
+    def test_table_rows(self):
+        rows = OutputFormatter("table")._table_rows([{"name": "vol1", "size": 0}, {"svm": {"name": "svm1"}}], ["name", "svm.name", "size"])
+
+        assert list(rows) == [["vol1", "", "0"], ["", "svm1", ""]]
+
+
+class TestHeaderInference:
+    """Tests for sampling-based header inference."""
+
+    @pytest.fixture(autouse=True)
+    def restore_limits(self):
+        yield
+        OutputFormatter.HEADER_SAMPLE_SIZE = 200
+        OutputFormatter.MAX_COLUMNS = 10
+
+    def test_fields_ranked_by_presence(self):
+        data = [
+            {"name": "a", "rare": 1, "svm": {"name": "s"}},
+            {"name": "b", "svm": {"name": "s"}, "comment": None},
+            {"name": "c", "svm": {"name": "s"}},
+        ]
+
+        assert OutputFormatter("table")._extract_headers(data) == ["name", "svm.name", "rare"]
+
+    def test_links_are_ignored(self):
+        data = [{"name": "a", "_links": {"self": {"href": "/x"}}, "svm": {"_links": {}, "name": "s"}}]
+
+        assert OutputFormatter("table")._extract_headers(data) == ["name", "svm.name"]
+
+    def test_sample_and_column_cap(self):
+        OutputFormatter.configure({"header_sample": 2, "max_columns": 3})
+        data = [{"a": 1, "b": 2}, {"a": 1, "c": 3, "d": 4}] + [{"late": i} for i in range(100)]
+
+        assert OutputFormatter("table")._extract_headers(data) == ["a", "b", "c"]
+
+
+class TestStreamingOutput:
+    """Tests for format_stream and closed output detection."""
+
+    @staticmethod
+    def _records(count, state):
+        try:
+            for i in range(count):
+                state["yielded"] = i + 1
+                yield {"name": f"vol{i}", "svm": {"name": "svm1"}}
+        finally:
+            state["closed"] = True
+
+    def test_table_in_batches(self, capsys):
+        state = {}
+        with patch.object(OutputFormatter, "STREAM_BATCH_SIZE", 2):
+            count = OutputFormatter("table").format_stream(
+                self._records(5, state), title="Volumes", headers=["name", "svm.name"], record_type=Volume
+            )
+
+        out = capsys.readouterr().out
+        assert count == 5
+        assert out.count("Svm.Name") == 1
+        assert out.count("Volumes") == 1
+        assert all(f"vol{i}" in out for i in range(5))
+
+    def test_stops_when_output_closes(self, capsys):
+        state = {}
+        with patch.object(OutputFormatter, "STREAM_BATCH_SIZE", 2), \
+                patch.object(OutputFormatter, "output_closed", return_value=True):
+            count = OutputFormatter("table").format_stream(self._records(100, state), headers=["name"])
+
+        assert count == 2
+        assert state == {"yielded": 2, "closed": True}
+
+    def test_source_is_closed_when_converting_records(self, capsys):
+        state = {}
+        # Held here like a command holds it, so garbage collection cannot close it
+        records = self._records(100, state)
+        with patch.object(OutputFormatter, "STREAM_BATCH_SIZE", 2), \
+                patch.object(OutputFormatter, "output_closed", return_value=True):
+            count = OutputFormatter("table").format_stream(records, headers=["name"], record_type=Volume)
+
+        assert count == 2
+        assert state == {"yielded": 2, "closed": True}
+
+    @pytest.mark.parametrize("count", [0, 1, 3])
+    def test_json_matches_regular_output(self, capsys, count):
+        formatter = OutputFormatter("json")
+        formatter.format_output([*self._records(count, {})])
+        expected = capsys.readouterr().out
+
+        assert formatter.format_stream(self._records(count, {})) == count
+        assert capsys.readouterr().out == expected
+
+    @pytest.mark.parametrize("output", ["table", "json"])
+    def test_closed_pipe_exits_quietly(self, tmp_path, output):
+        """Test that `netapp ... | head` ends with status 0 and no traceback."""
+        code = (
+            "import click\n"
+            "from netapp_cli.main import cli\n"
+            "from netapp_cli.utils.output import OutputFormatter\n"
+            "@cli.command()\n"
+            "@click.pass_context\n"
+            "def spew(ctx):\n"
+            "    formatter = OutputFormatter(ctx.obj['output_format'])\n"
+            "    count = formatter.format_stream(({'name': f'vol{i}'} for i in range(10 ** 6)), headers=['name'])\n"
+            "    formatter.info(f'Found {count}')\n"
+            f"cli(['-o', '{output}', 'spew'])\n"
+        )
+        process = subprocess.Popen(
+            [sys.executable, "-c", code],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=dict(os.environ, HOME=str(tmp_path)),
+        )
+        process.stdout.readline()
+        process.stdout.close()
+        stderr = process.stderr.read()
+        process.stderr.close()
+
+        assert process.wait(timeout=60) == 0
+        assert stderr == b""
+
+    def test_closed_pipe_is_detected(self):
+        read_fd, write_fd = os.pipe()
+        with os.fdopen(write_fd, "w") as out:
+            console.file = out
+            try:
+                assert not OutputFormatter.output_closed()
+                os.close(read_fd)
+                assert OutputFormatter.output_closed()
+            finally:
+                console.file = None
+
+    def test_pager_input_goes_quiet(self):
+        stream = Mock()
+        stream.write.side_effect = BrokenPipeError()
+        pager_input = PagerInput(stream)
+
+        pager_input.write("page 1")
+        pager_input.write("page 2")
+
+        assert pager_input.reader_gone
+        assert stream.write.call_count == 1
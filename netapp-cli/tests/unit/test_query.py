@@ -0,0 +1,166 @@
+"""Tests for the inventory query engine."""
+
+import pytest
+from click.testing import CliRunner
+
+from netapp_cli.main import cli
+from netapp_cli.utils.inventory import Inventory, InventoryError
+from netapp_cli.utils.query import Literal, Query, QueryEngine, QueryError, compare
+
+DATA = {
+    "clusters": [
+        {"key": "c1", "name": "c1", "version": {"generation": 9, "major": 12, "minor": 1}},
+        {"key": "c2", "name": "c2", "version": {"generation": 9, "major": 11, "minor": 0}},
+    ],
+    "aggregates": [
+        {"key": "a1", "name": "aggr1", "space": {"block_storage": {"size": 100, "used": 95}}},
+        {"key": "a2", "name": "aggr2", "space": {"block_storage": {"size": 100, "used": 20}}},
+    ],
+    "volumes": [
+        {
+            "uuid": f"v{i}",
+            "name": f"vol{i}",
+            "state": "offline" if i == 3 else "online",
+            "svm": {"name": f"svm{i % 2}"},
+            "cluster": {"key": "c1" if i % 2 else "c2", "name": "c1" if i % 2 else "c2"},
+            "aggregates": [{"name": "aggr1" if i < 5 else "aggr2"}],
+            "space": {"size": 100, "used": 80 + i},
+        }
+        for i in range(20)
+    ],
+    "luns": [
+        {"key": "l1", "name": "lun1", "volume": {"uuid": "v1", "name": "vol1"}},
+        {"key": "l2", "name": "lun2", "volume": {"uuid": "v7", "name": "vol7"}},
+    ],
+}
+
+
+@pytest.fixture
+def engine():
+    return QueryEngine(lambda kind: DATA[kind])
+
+
+def _names(records):
+    return [record["name"] for record in records]
+
+
+class TestParser:
+    """Tests for expression parsing."""
+
+    def test_precedence(self, engine):
+        query = Query("name = vol1 or name = vol2 and state = offline")
+
+        assert _names(engine.run("volumes", query)) == ["vol1"]
+        assert query.fields() == ["name", "state"]
+
+    @pytest.mark.parametrize("text", ["", "name", "name =", "(name = a", "name = a b", "and = 1", "name in a"])
+    def test_invalid(self, text):
+        with pytest.raises(QueryError):
+            Query(text)
+
+    @pytest.mark.parametrize("op,actual,value,expected", [
+        ("=", "9.12.1", "9.12", True),
+        (">=", "9.11.0", "9.12", False),
+        (">", 2 * 1024 ** 4, "1TB", True),
+        ("<", 85.5, "90%", True),
+        ("~", "vol_PROD_1", "vol_prod*", True),
+        ("=", True, "true", True),
+        ("!=", None, "x", True),
+        ("=", {"name": "svm1"}, "svm1", True),
+        ("=", 100, '"100"', True),
+    ])
+    def test_compare(self, op, actual, value, expected):
+        quoted = value.startswith('"')
+        assert compare(op, actual, Literal(value.strip('"'), quoted=quoted)) is expected
+
+
+class TestQueryEngine:
+    """Tests for evaluation, references and indexes."""
+
+    def test_follows_references(self, engine):
+        query = Query("utilization > 90 and cluster.version = 9.12")
+
+        assert _names(engine.run("volumes", query, sort="-utilization")) == ["vol19", "vol17", "vol15", "vol13", "vol11"]
+
+    def test_multi_hop_reference(self, engine):
+        assert _names(engine.run("luns", Query("volume.aggregate.free_percent < 10"))) == ["lun1"]
+
+    def test_indexes_narrow_the_scan(self, engine):
+        records = engine.run("volumes", Query("utilization >= 98 and svm = svm1"))
+
+        assert _names(records) == ["vol19"]
+        assert engine.scanned == 1
+
+    def test_indexes_never_miss_matches(self, engine):
+        for text in ["state in (offline, online)", "utilization < 82", "name = vol1 or utilization > 98", "not svm = svm0"]:
+            query = Query(text)
+            expected = [r for r in DATA["volumes"] if query.root.matches(engine, "volumes", r)]
+
+            assert engine.run("volumes", query) == expected
+
+    def test_version_ranges_are_not_read_as_floats(self):
+        """Test that 9.2 < 9.10 < 9.13 although 9.13 < 9.2 as floats."""
+        clusters = [{"name": f"c{i}", "version": version} for i, version in enumerate(["9.2", "9.13", "9.9"])]
+        engine = QueryEngine(lambda kind: clusters)
+
+        for text in ["version < 9.10", "version >= 9.10", "version > 9.9.0"]:
+            query = Query(text)
+            expected = [r for r in clusters if query.root.matches(engine, "clusters", r)]
+
+            assert engine.run("clusters", query) == expected
+        assert _names(engine.run("clusters", Query("version < 9.10"))) == ["c0", "c2"]
+
+    def test_project(self, engine):
+        rows = engine.project("volumes", engine.run("volumes", Query("name = vol19")), ["name", "svm", "cluster.version", "aggregate.utilization"])
+
+        assert rows == [{"name": "vol19", "svm": "svm1", "cluster.version": "9.12.1", "aggregate.utilization": 20.0}]
+
+
+class TestQueryCommand:
+    """Tests for `netapp query`."""
+
+    def test_query_inventory(self, mock_config):
+        inventory = Inventory.for_config(mock_config)
+        for kind in ("volumes", "clusters"):
+            inventory.sync_kind(mock_config.netapp.host, kind, DATA[kind])
+
+        result = CliRunner().invoke(
+            cli, ['query', 'volumes', 'utilization > 97 and cluster.version = 9.12', '--limit', '1', '--sort', '-utilization'],
+            obj={"config": mock_config}
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "vol19" in result.output and "vol17" not in result.output
+        assert "Cluster.Version" in result.output
+
+    def test_limit_reports_all_matches(self, mock_config):
+        Inventory.for_config(mock_config).sync_kind(mock_config.netapp.host, "volumes", DATA["volumes"])
+
+        result = CliRunner().invoke(cli, ['query', 'volumes', 'utilization > 90', '--limit', '2'], obj={"config": mock_config})
+
+        assert result.exit_code == 0, result.output
+        assert "Found 9 of 20 volumes, showing 2" in result.output
+
+    def test_requires_sync(self, mock_config):
+        result = CliRunner().invoke(cli, ['query', 'luns', 'name = a'], obj={"config": mock_config})
+
+        assert result.exit_code != 0
+        assert "No luns in the inventory" in result.output
+
+    def test_columns_need_referenced_kind(self, mock_config):
+        """Test that a column from a kind that was never synced is an error, not a traceback."""
+        Inventory.for_config(mock_config).sync_kind(mock_config.netapp.host, "volumes", DATA["volumes"])
+
+        result = CliRunner().invoke(
+            cli, ['query', 'volumes', 'name = vol19', '--columns', 'name,cluster.version'], obj={"config": mock_config}
+        )
+
+        assert result.exit_code != 0
+        assert "No clusters in the inventory" in result.output
+        assert not isinstance(result.exception, InventoryError)
+
+    def test_invalid_expression(self, mock_config):
+        result = CliRunner().invoke(cli, ['query', 'volumes', 'name ='], obj={"config": mock_config})
+
+        assert result.exit_code != 0
+        assert "Invalid expression" in result.output
@@ -0,0 +1,238 @@
+"""Tests for the adaptive rate limiter."""
+
+import asyncio
+import threading
+import time
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from unittest.mock import Mock, patch
+
+from netapp_cli.utils import ratelimit
+from netapp_cli.utils.api_client import NetAppAPIClient, NetAppAPIError
+from netapp_cli.utils.ratelimit import Throttle, ThrottleState, get_throttle, parse_retry_after
+
+
+class TestParseRetryAfter:
+    """Tests for Retry-After parsing."""
+
+    def test_seconds(self):
+        assert parse_retry_after("3") == 3.0
+
+    def test_http_date(self):
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        assert 25 < parse_retry_after(format_datetime(when, usegmt=True)) <= 30
+
+    def test_invalid_values(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(Mock()) is None
+
+    def test_capped(self):
+        assert parse_retry_after("86400") == 120
+
+
+class TestThrottleState:
+    """Tests for the AIMD and token bucket bookkeeping."""
+
+    def test_throttle_halves_limit_once_per_window(self):
+        """Test multiplicative decrease, ignoring throttles from older requests."""
+        state = ThrottleState(max_concurrency=16)
+        epochs = [state.start() for _ in range(3)]
+
+        for epoch in epochs:
+            state.finish(epoch, 429, None, time.monotonic())
+
+        assert state.limit == 8
+        assert state.throttled == 3
+
+    def test_success_increases_limit_up_to_max(self):
+        """Test additive increase."""
+        state = ThrottleState(max_concurrency=4)
+        state.finish(state.start(), 503, None, time.monotonic())
+        assert state.limit == 2
+
+        for _ in range(50):
+            state.finish(state.start(), 200, None, time.monotonic())
+
+        assert state.limit == 4
+
+    def test_retry_after_blocks_new_requests(self):
+        """Test that Retry-After delays every new request."""
+        state = ThrottleState()
+        now = time.monotonic()
+        state.finish(state.start(), 429, 5, now)
+
+        assert state.wait_time(now + 1) == pytest.approx(4)
+        assert state.wait_time(now + 6) == 0
+
+    @pytest.mark.parametrize("retry_after", [None, 0])
+    def test_backoff_without_retry_after(self, retry_after):
+        """Test that a throttle without a usable Retry-After still pauses, longer each window."""
+        state = ThrottleState()
+        now = time.monotonic()
+        waits = []
+        for _ in range(4):
+            state.finish(state.start(), 429, retry_after, now)
+            waits.append(state.wait_time(now))
+            state.blocked_until = 0
+
+        assert all(wait > 0 for wait in waits)
+        assert waits[3] > waits[0]
+
+        state.finish(state.start(), 200, None, now)
+        assert state.backoffs == 0
+
+    def test_backoff_is_capped(self):
+        state = ThrottleState()
+        state.backoffs = 100
+
+        assert ratelimit.MAX_BACKOFF / 2 <= state.backoff() <= ratelimit.MAX_BACKOFF
+
+    def test_token_bucket(self):
+        """Test the rate cap."""
+        state = ThrottleState(rate_limit=2)
+        now = time.monotonic()
+        state.wait_time(now)
+        state.start()
+        state.start()
+
+        assert state.wait_time(now) == pytest.approx(0.5, abs=0.01)
+
+
+class TestThrottle:
+    """Tests for the thread-safe throttle."""
+
+    def test_concurrency_is_bounded(self):
+        """Test that no more than the limit run at once."""
+        throttle = Throttle(max_concurrency=2)
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+
+        def worker():
+            with throttle.slot() as done:
+                with lock:
+                    state["running"] += 1
+                    state["peak"] = max(state["peak"], state["running"])
+                time.sleep(0.01)
+                with lock:
+                    state["running"] -= 1
+                done(200)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert state["peak"] == 2
+
+    def test_shared_per_host(self):
+        """Test that all clients of a host share one throttle."""
+        assert get_throttle("a") is get_throttle("a")
+        assert get_throttle("a") is not get_throttle("b")
+
+
+class TestClientThrottling:
+    """Tests for throttled responses in NetAppAPIClient."""
+
+    @staticmethod
+    def _response(status_code, payload=None, retry_after=None):
+        response = Mock()
+        response.status_code = status_code
+        response.json.return_value = payload or {}
+        response.headers = {"Retry-After": retry_after} if retry_after else {}
+        return response
+
+    @patch('netapp_cli.utils.api_client.requests.Session')
+    def test_429_is_retried_for_any_method(self, MockSession, mock_netapp_config):
+        """Test that POSTs are retried after 429 (the request was not processed)."""
+        MockSession.return_value.request.side_effect = [
+            self._response(429, retry_after="0"),
+            self._response(201, {"job": {"key": "j1"}}),
+        ]
+
+        client = NetAppAPIClient(mock_netapp_config)
+        result = client.post("/api/storage/volumes", {"name": "vol1"})
+
+        assert result == {"job": {"key": "j1"}}
+        assert client.throttle.state.limit < mock_netapp_config.max_concurrency
+
+    @patch('netapp_cli.utils.api_client.requests.Session')
+    def test_503_is_not_retried_for_post(self, MockSession, mock_netapp_config):
+        """Test that non-idempotent requests fail on 503."""
+        MockSession.return_value.request.return_value = self._response(503, {"message": "busy"})
+
+        client = NetAppAPIClient(mock_netapp_config)
+
+        with pytest.raises(NetAppAPIError) as exc_info:
+            client.post("/api/storage/volumes", {"name": "vol1"})
+
+        assert exc_info.value.status_code == 503
+        assert MockSession.return_value.request.call_count == 1
+
+    @patch('netapp_cli.utils.api_client.requests.Session')
+    def test_retries_are_bounded(self, MockSession, mock_netapp_config):
+        """Test that a persistently throttling server eventually fails the request."""
+        MockSession.return_value.request.return_value = self._response(429, {"message": "slow down"})
+
+        client = NetAppAPIClient(mock_netapp_config)
+
+        with pytest.raises(NetAppAPIError):
+            client.get("/api/cluster")
+
+        assert MockSession.return_value.request.call_count == 6
+
+    @patch('netapp_cli.utils.api_client.requests.Session')
+    def test_retries_back_off_without_retry_after(self, MockSession, mock_netapp_config):
+        """Test that retries after a bare 429 are spaced out, not sent back to back."""
+        sent = []
+
+        def request(**kwargs):
+            sent.append(time.monotonic())
+            return self._response(429) if len(sent) < 4 else self._response(200, {"ok": True})
+
+        MockSession.return_value.request.side_effect = request
+
+        assert NetAppAPIClient(mock_netapp_config).get("/api/cluster") == {"ok": True}
+        gaps = [later - earlier for earlier, later in zip(sent, sent[1:])]
+        assert len(gaps) == 3
+        assert all(gap >= ratelimit.BACKOFF_BASE / 2 for gap in gaps)
+
+
+class TestAsyncClientThrottling:
+    """Tests for throttled responses in AsyncNetAppAPIClient."""
+
+    def test_429_is_retried(self, mock_netapp_config):
+        httpx = pytest.importorskip("httpx")
+        from netapp_cli.utils.async_api_client import AsyncNetAppAPIClient
+
+        responses = iter([
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"ok": True}),
+        ])
+
+        async def main():
+            transport = httpx.MockTransport(lambda request: next(responses))
+            async with AsyncNetAppAPIClient(mock_netapp_config, transport=transport) as client:
+                return await client.post("/api/x", {"a": 1})
+
+        assert asyncio.run(main()) == {"ok": True}
+
+    def test_retries_back_off_without_retry_after(self, mock_netapp_config):
+        httpx = pytest.importorskip("httpx")
+        from netapp_cli.utils.async_api_client import AsyncNetAppAPIClient
+
+        sent = []
+
+        def handler(request):
+            sent.append(time.monotonic())
+            return httpx.Response(503) if len(sent) < 3 else httpx.Response(200, json={"ok": True})
+
+        async def main():
+            async with AsyncNetAppAPIClient(mock_netapp_config, transport=httpx.MockTransport(handler)) as client:
+                return await client.get("/api/x")
+
+        assert asyncio.run(main()) == {"ok": True}
+        assert all(later - earlier >= ratelimit.BACKOFF_BASE / 2 for earlier, later in zip(sent, sent[1:]))
@@ -0,0 +1,90 @@
+"""Tests for the compact record models."""
+
+import sys
+
+import pytest
+
+from netapp_cli.models.records import Event, Volume, define
+from netapp_cli.utils.output import OutputFormatter
+
+
+VOLUME = {
+    "key": "cluster-key:type=volume,uuid=vol-uuid",
+    "uuid": "vol-uuid",
+    "name": "vol1",
+    "state": "online",
+    "size": 1073741824,
+    "space": {"size": 1073741824, "used": 536870912, "available": 536870912},
+    "svm": {"key": "svm-key", "uuid": "svm-uuid", "name": "svm1", "_links": {"self": {"href": "/x"}}},
+    "cluster": {"key": "cluster-key", "uuid": "cluster-uuid", "name": "cluster1"},
+    "aggregates": [{"name": "aggr1"}],
+    "language": "c.utf_8",
+    "_links": {"self": {"href": "/api/datacenter/storage/volumes/vol-uuid"}},
+}
+
+
+class TestRecord:
+    """Tests for Record behaviour."""
+
+    def test_nested_fields_are_flattened(self):
+        volume = Volume.from_dict(VOLUME)
+
+        assert volume.svm_name == "svm1"
+        assert volume.get("space.used") == 536870912
+        assert volume["name"] == "vol1"
+        assert "cluster.name" in volume
+
+    def test_missing_and_unknown_fields(self):
+        volume = Volume.from_dict({"name": "vol1", "svm": "not-a-dict"})
+
+        assert volume.get("svm.name") is None
+        assert volume.get("language", "n/a") == "n/a"
+        assert "style" not in volume
+        with pytest.raises(KeyError):
+            volume["style"]
+
+    def test_to_dict_keeps_listed_fields(self):
+        result = Volume.from_dict(VOLUME).to_dict()
+
+        assert result["svm"] == {"key": "svm-key", "uuid": "svm-uuid", "name": "svm1"}
+        assert "aggregates" not in result and "_links" not in result
+        assert Volume.from_dict(result) == Volume.from_dict(VOLUME)
+
+    def test_records_are_compact_and_read_only(self):
+        volume = Volume.from_dict(VOLUME)
+
+        assert not hasattr(volume, "__dict__")
+        assert sys.getsizeof(volume) < sys.getsizeof(VOLUME)
+        with pytest.raises(AttributeError):
+            volume.name = "other"
+
+    def test_from_records_accepts_iterators(self):
+        events = Event.from_records({"key": str(i), "source": {"name": f"vol{i}"}} for i in range(3))
+
+        assert [event["source.name"] for event in events] == ["vol0", "vol1", "vol2"]
+
+    def test_clashing_fields_are_rejected(self):
+        with pytest.raises(ValueError):
+            define("Broken", ["svm.name", "svm_name"])
+
+
+class TestFormatterWithRecords:
+    """Tests for OutputFormatter rendering records."""
+
+    def test_table_matches_dicts(self, capsys):
+        headers = ["name", "svm.name", "space.used"]
+        OutputFormatter("table").format_output([VOLUME], headers=headers)
+        from_dicts = capsys.readouterr().out
+        OutputFormatter("table").format_output([Volume.from_dict(VOLUME)], headers=headers)
+
+        assert capsys.readouterr().out == from_dicts
+
+    def test_json_output_serializes_records(self, capsys):
+        OutputFormatter("json").format_output([Volume.from_dict({"name": "vol1", "svm": {"name": "svm1"}})])
+
+        assert '"svm": {' in capsys.readouterr().out
+
+    def test_header_inference(self):
+        headers = OutputFormatter("table")._extract_headers([Volume.from_dict({"name": "vol1", "svm": {"name": "s"}})])
+
+        assert headers == ["name", "svm.name"]
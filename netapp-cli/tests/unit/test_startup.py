@@ -0,0 +1,84 @@
+"""Tests for CLI startup cost."""
+
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+# Cumulative import time budget for netapp_cli.main, in microseconds.
+# Eager loading of all command modules measured around 500ms; the lazy
+# group brings it down to roughly the cost of importing click.
+IMPORT_BUDGET_US = int(os.getenv("NETAPP_CLI_IMPORT_BUDGET_US", "200000"))
+
+HEAVY_MODULES = ["requests", "urllib3", "pydantic", "yaml", "rich.table", "tabulate"]
+
+
+def _run_python(*args, code):
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+class TestLazyLoading:
+    """Tests that help and version do not import command modules."""
+
+    @pytest.mark.parametrize("argv", [["--help"], ["version"], ["snapshot", "--help"]])
+    def test_heavy_modules_not_imported(self, argv):
+        """Test which modules are loaded for cheap invocations."""
+        code = (
+            "import sys\n"
+            "from netapp_cli.main import cli\n"
+            "try:\n"
+            f"    cli.main({argv!r}, standalone_mode=False)\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            f"watched = {HEAVY_MODULES!r}\n"
+            "print('LOADED:' + ','.join(sorted(m for m in sys.modules\n"
+            "                      if m.startswith('netapp_cli.commands.') or m in watched)))\n"
+        )
+        result = _run_python(code=code)
+        assert result.returncode == 0, result.stderr
+
+        marker = result.stdout.rsplit("LOADED:", 1)[1].strip()
+        loaded = set(filter(None, marker.split(",")))
+        if argv == ["snapshot", "--help"]:
+            assert "netapp_cli.commands.snapshot" in loaded
+            assert "netapp_cli.commands.volume" not in loaded
+        elif argv == ["version"]:
+            # version renders a rich table but needs neither config nor API
+            assert loaded == {"rich.table"}
+        else:
+            assert loaded == set()
+
+    def test_all_commands_listed(self):
+        """Test that lazy commands resolve to the right groups."""
+        from netapp_cli.main import LAZY_COMMANDS, cli
+
+        ctx = cli.make_context("netapp", ["version"], resilient_parsing=True)
+        for name in LAZY_COMMANDS:
+            command = cli.get_command(ctx, name)
+            assert command is not None
+            assert command.name == name
+
+
+class TestImportTime:
+    """Regression budget for `python -X importtime`."""
+
+    def test_main_import_within_budget(self):
+        """Test the cumulative import time of the CLI entry point."""
+        result = _run_python("-X", "importtime", code="import netapp_cli.main")
+        assert result.returncode == 0, result.stderr
+
+        cumulative = None
+        for line in result.stderr.splitlines():
+            match = re.match(r"import time:\s+\d+\s+\|\s+(\d+)\s+\|\s+netapp_cli\.main$", line)
+            if match:
+                cumulative = int(match.group(1))
+
+        assert cumulative is not None, result.stderr[-2000:]
+        assert cumulative < IMPORT_BUDGET_US, f"netapp_cli.main imported in {cumulative}us (budget {IMPORT_BUDGET_US}us)"
@@ -20,7 +20,7 @@ class TestVolumeCommands:
     def test_list_volumes_success(self, MockClient):
         """Test list volumes - success."""
         mock_client = MockClient.return_value
-        mock_client.paginate.return_value = [
+        mock_client.iter_records.return_value = [
             {
                 "name": "vol-test",
                 "svm": {"name": "svm1"},  # Correct nested structure
@@ -43,7 +43,7 @@ class TestVolumeCommands:
     def test_list_volumes_empty(self, MockClient):
         """Test list volumes - no volumes found."""
         mock_client = MockClient.return_value
-        mock_client.paginate.return_value = []
+        mock_client.iter_records.return_value = []
 
         result = self.runner.invoke(cli, ['volume', 'list-volumes', '--svm', 'svm1'], obj=self.mock_ctx.obj)
         assert result.exit_code == 0
@@ -53,7 +53,7 @@ class TestVolumeCommands:
     def test_list_volumes_api_error(self, MockClient):
         """Test list volumes - API error."""
         mock_client = MockClient.return_value
-        mock_client.paginate.side_effect = NetAppAPIError("API Failure")
+        mock_client.iter_records.side_effect = NetAppAPIError("API Failure")
 
         result = self.runner.invoke(cli, ['volume', 'list-volumes', '--svm', 'svm1'], obj=self.mock_ctx.obj)
         assert result.exit_code != 0
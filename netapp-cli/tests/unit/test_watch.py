@@ -0,0 +1,106 @@
+"""Tests for monitor watch mode."""
+
+from unittest.mock import Mock, patch
+
+from netapp_cli.commands.monitor import _event_poller, _volume_stats
+from netapp_cli.utils.api_client import NetAppAPIError
+from netapp_cli.utils.watch import WatchTable, run_watch
+
+
+class TestWatchTable:
+    """Tests for delta tracking in WatchTable."""
+
+    def test_first_update_marks_nothing_changed(self):
+        """Test that the initial refresh does not highlight rows."""
+        table = WatchTable("Volumes", ["name", "state"], key="uuid")
+        changed = table.update([{"uuid": "1", "name": "vol1", "state": "online"}])
+
+        assert changed == 1
+        assert table._changed == set()
+        assert table.render().row_count == 1
+
+    def test_only_changed_rows_are_flagged(self):
+        """Test that unchanged rows keep their cached cells."""
+        table = WatchTable("Volumes", ["name", "state"], key="uuid")
+        table.update([
+            {"uuid": "1", "name": "vol1", "state": "online"},
+            {"uuid": "2", "name": "vol2", "state": "online"},
+        ])
+        changed = table.update([
+            {"uuid": "1", "name": "vol1", "state": "online"},
+            {"uuid": "2", "name": "vol2", "state": "offline"},
+        ])
+
+        assert changed == 1
+        assert table._changed == {"2"}
+        assert table._rows["2"] == ("vol2", "offline")
+
+    def test_replace_mode_drops_missing_rows(self):
+        """Test that rows absent from a full poll are removed."""
+        table = WatchTable("Jobs", ["uuid", "state"], key="uuid")
+        table.update([{"uuid": "a", "state": "RUNNING"}, {"uuid": "b", "state": "RUNNING"}])
+        table.update([{"uuid": "a", "state": "COMPLETED"}])
+
+        assert table._order == ["a"]
+        assert table._removed == 1
+
+    def test_incremental_mode_prepends_and_trims(self):
+        """Test that new arrivals are prepended and trimmed to max_rows."""
+        table = WatchTable("Events", ["name"], key="key", max_rows=3, incremental=True)
+        table.update([{"key": "3", "name": "e3"}, {"key": "2", "name": "e2"}, {"key": "1", "name": "e1"}])
+        table.update([{"key": "4", "name": "e4"}])
+
+        assert table._order == ["4", "3", "2"]
+        assert table._changed == {"4"}
+
+    def test_records_without_key_use_content(self):
+        """Test that records missing the key field are still distinguished."""
+        table = WatchTable("Clusters", ["name"], key="uuid")
+        table.update([{"name": "c1"}, {"name": "c2"}])
+
+        assert len(table._order) == 2
+
+
+class TestRunWatch:
+    """Tests for the watch loop."""
+
+    @patch('netapp_cli.utils.watch.time.sleep')
+    def test_api_error_is_shown_and_loop_continues(self, mock_sleep):
+        """Test that a failing poll does not end the watch."""
+        table = WatchTable("Jobs", ["uuid"], key="uuid")
+        poll = Mock(side_effect=[NetAppAPIError("boom"), [{"uuid": "a"}]])
+        mock_sleep.side_effect = [None, KeyboardInterrupt()]
+
+        run_watch(table, poll, 1)
+
+        assert poll.call_count == 2
+        assert table.status is None
+        assert table._order == ["a"]
+
+
+class TestMonitorHelpers:
+    """Tests for monitor command helpers used by watch mode."""
+
+    def test_event_poller_requests_only_newer_events(self):
+        """Test that later polls filter on the newest timestamp seen."""
+        client = Mock()
+        client.paginate.side_effect = [
+            [{"key": "2", "timestamp": "2024-01-02T00:00:00Z"}, {"key": "1", "timestamp": "2024-01-01T00:00:00Z"}],
+            [],
+        ]
+        poll = _event_poller(client, {"order_by": "timestamp desc"}, 50)
+
+        poll()
+        poll()
+
+        first_params = client.paginate.call_args_list[0][0][1]
+        second_params = client.paginate.call_args_list[1][0][1]
+        assert "timestamp" not in first_params
+        assert second_params["timestamp"] == ">2024-01-02T00:00:00Z"
+
+    def test_volume_stats_utilization(self):
+        """Test utilization computation for volume stats."""
+        stats = _volume_stats([{"name": "vol1", "space": {"size": 200, "used": 50}}])
+
+        assert stats[0]["utilization"] == "25.0%"
+        assert stats[0]["svm.name"] == ""